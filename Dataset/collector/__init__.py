@@ -5,8 +5,11 @@ from collector.timing import (
     time_cpu,
     time_gpu_kernel,
     time_h2d,
-    time_d2h
+    time_d2h,
+    time_adaptive
 )
+from collector.registry import OPS, register_op, get_op
+from collector.harness import measure_op
 
 from collector.collect_matmul import collect_one_matmul
 from collector.collect_conv2d import collect_one_conv2d
@@ -25,6 +28,11 @@ __all__ = [
     "time_gpu_kernel",
     "time_h2d",
     "time_d2h",
+    "time_adaptive",
+    "OPS",
+    "register_op",
+    "get_op",
+    "measure_op",
     "collect_one_matmul",
     "collect_one_conv2d",
     "collect_one_elementwise",
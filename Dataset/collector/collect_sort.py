@@ -1,49 +1,16 @@
-import time
+import math
 import torch
-from collector.device_profile import get_device_profile
-from collector.sys_state import get_system_state
-
-def estimate_transfer_cost(tensor):
-    bytes_size = tensor.element_size() * tensor.nelement()
-    bandwidth = 12e9 if torch.cuda.is_available() else 1e9
-    return (bytes_size / bandwidth) * 1000
+from collector.harness import measure_op
+from collector.registry import register_op
+
+register_op(
+    "sort", "sort",
+    build=lambda N, dtype: (torch.randn(N, dtype=dtype),),
+    kernel=lambda A: torch.sort(A),
+    size=lambda N: N,
+    # values plus int64 indices out
+    cost=lambda N: (N * math.log2(max(N, 2)), 4 * N),
+)
 
 def collect_one_sort(N=1024, dtype=torch.float32):
-    A = torch.randn(N, dtype=dtype, device="cpu")
-
-    # CPU
-    start = time.perf_counter()
-    _ = torch.sort(A)
-    cpu_time = (time.perf_counter() - start) * 1000
-
-    # GPU
-    if torch.cuda.is_available():
-        A_gpu = A.cuda()
-        torch.cuda.synchronize()
-        start = time.perf_counter()
-        _ = torch.sort(A_gpu)
-        torch.cuda.synchronize()
-        gpu_time = (time.perf_counter() - start) * 1000
-
-        transfer_time = estimate_transfer_cost(A)
-    else:
-        gpu_time, transfer_time = float("inf"), float("inf")
-
-    winner = 0 if cpu_time < (gpu_time + transfer_time) else 1
-
-    dev = get_device_profile()
-    sys_state = get_system_state()
-
-    return {
-        "operation_type": "sort",
-        "log_size": float(round(torch.log10(torch.tensor(N+1.)).item(), 4)),
-        "dtype": str(dtype).replace("torch.", ""),
-        "cpu_runtime_ms": round(cpu_time, 4),
-        "gpu_runtime_ms": round(gpu_time, 4),
-        "transfer_time_ms": round(transfer_time, 4),
-        "data_transfer_cost_ms": round(transfer_time, 4),
-        "winner": winner,
-        **sys_state,
-        "device_name": dev["device_name"],
-        "is_edge": dev["is_edge"],
-    }
+    return measure_op("sort", N=N, dtype=dtype)
@@ -0,0 +1,95 @@
+"""
+Shared measurement harness for every registered op.
+
+- inputs are built once per point; CPU and GPU kernels get warmup runs and
+  adaptive repetitions until the median is known to TARGET_CI (timing.time_adaptive)
+- GPU kernels are timed with CUDA events; transfers are measured for real:
+  H2D of the inputs plus D2H of the outputs, each synchronized
+- the device profile is read once per process; system state once per point,
+  before timing starts
+"""
+import math
+import torch
+from collector.device_profile import get_device_profile
+from collector.op_costs import cost_fields, element_bytes, estimate
+from collector.registry import get_op
+from collector.sys_state import get_system_state
+from collector.timing import (
+    time_adaptive,
+    cpu_timer,
+    gpu_timer,
+    synced_timer,
+    cpu_parallel_fields,
+)
+
+_device_profile = None
+
+def device_profile():
+    global _device_profile
+    if _device_profile is None:
+        _device_profile = get_device_profile()
+    return _device_profile
+
+def _tensors(out):
+    if isinstance(out, torch.Tensor):
+        return [out]
+    return [t for t in out if isinstance(t, torch.Tensor)]
+
+def measure_op(name, dtype=torch.float32, **params):
+    """One dataset row for op `name` at `params` (same columns for every op)."""
+    spec = get_op(name)
+    if isinstance(dtype, str):
+        dtype = getattr(torch, dtype)
+
+    sys_state = get_system_state()
+    inputs = spec.build(dtype=dtype, **params)
+    cpu_fn = lambda: spec.kernel(*inputs)
+    cpu = time_adaptive(cpu_timer(cpu_fn))
+
+    if torch.cuda.is_available():
+        gpu_inputs = tuple(x.cuda() for x in inputs)
+        outputs = _tensors(spec.kernel(*gpu_inputs))
+        torch.cuda.synchronize()
+        h2d = time_adaptive(synced_timer(lambda: [x.to("cuda") for x in inputs]))
+        gpu = time_adaptive(gpu_timer(lambda: spec.kernel(*gpu_inputs)))
+        d2h = time_adaptive(synced_timer(lambda: [y.to("cpu") for y in outputs]))
+        gpu_time = gpu["median_ms"]
+        h2d_time, d2h_time = h2d["median_ms"], d2h["median_ms"]
+        del gpu_inputs, outputs
+    else:
+        gpu = {"median_ms": float("inf"), "ci_pct": float("inf"), "reps": 0}
+        gpu_time = h2d_time = d2h_time = float("inf")
+
+    cpu_time = cpu["median_ms"]
+    transfer_time = h2d_time + d2h_time
+    winner = 0 if cpu_time < (gpu_time + transfer_time) else 1
+    dev = device_profile()
+    log_size = float(round(math.log10(spec.size(**params) + 1), 4))
+    dtype_name = str(dtype).replace("torch.", "")
+    if spec.cost is not None:
+        flops, elements = spec.cost(**params)
+        costs = cost_fields(round(flops), elements * element_bytes(dtype_name))
+    else:
+        costs = estimate(spec.operation_type, log_size, dtype_name)
+
+    return {
+        "operation_type": spec.operation_type,
+        "log_size": log_size,
+        "dtype": dtype_name,
+        **costs,
+        "cpu_runtime_ms": round(cpu_time, 4),
+        "gpu_runtime_ms": round(gpu_time, 4),
+        "transfer_time_ms": round(transfer_time, 4),
+        "data_transfer_cost_ms": round(transfer_time, 4),
+        "h2d_time_ms": round(h2d_time, 4),
+        "d2h_time_ms": round(d2h_time, 4),
+        "winner": winner,
+        "cpu_reps": cpu["reps"],
+        "cpu_ci_pct": cpu["ci_pct"],
+        "gpu_reps": gpu["reps"],
+        "gpu_ci_pct": gpu["ci_pct"],
+        **cpu_parallel_fields(cpu_fn, gpu_time + transfer_time),
+        **sys_state,
+        "device_name": dev["device_name"],
+        "is_edge": dev["is_edge"],
+    }
@@ -0,0 +1,52 @@
+"""
+Floating-point work and memory traffic of the benchmarked ops, in the units
+the analyzer reports for source files (analyzer/ast_parser.py loop nests):
+flops, bytes_moved (compulsory reads + writes) and arithmetic_intensity.
+
+Each collect_*.py registers an exact `cost(**params) -> (flops, elements moved)`;
+estimate() recovers approximate values for rows collected before costs
+were recorded, from operation_type and log_size alone (square matrices,
+batch 1). Dependency-free, so the model side can load it too.
+"""
+import math
+
+DTYPE_BYTES = {"float16": 2, "bfloat16": 2, "float32": 4, "float64": 8, "int32": 4, "int64": 8}
+
+
+def element_bytes(dtype) -> int:
+    name = str(dtype).replace("torch.", "")
+    return next((b for d, b in DTYPE_BYTES.items() if d in name), 4)
+
+
+def cost_fields(flops, bytes_moved) -> dict:
+    return {
+        "flops": float(flops),
+        "bytes_moved": float(bytes_moved),
+        "arithmetic_intensity": round(flops / bytes_moved, 4) if bytes_moved else 0.0,
+    }
+
+
+def _log2(n):
+    return math.log2(n) if n > 1 else 0.0
+
+
+# operation_type -> size (elements behind log_size) -> (flops, elements moved)
+_FROM_SIZE = {
+    "matmul": lambda s: (2 * s, 3 * s ** (2 / 3)),
+    "conv2d": lambda s: (2 * s, 3 * s ** (2 / 3)),
+    "fft": lambda s: (5 * s * _log2(s), 3 * s),
+    "elementwise": lambda s: (s, 3 * s),
+    "reduce_sum": lambda s: (s, s),
+    "scan": lambda s: (s, 2 * s),
+    "sort": lambda s: (s * _log2(s), 4 * s),
+    "transpose": lambda s: (0, 2 * s),
+}
+
+
+def estimate(operation_type, log_size, dtype="float32") -> dict:
+    """cost_fields() of a legacy row; flops/bytes None for ops without a formula."""
+    fn = _FROM_SIZE.get(operation_type)
+    if fn is None or log_size is None or log_size != log_size:
+        return {"flops": None, "bytes_moved": None, "arithmetic_intensity": None}
+    flops, elements = fn(max(10 ** log_size - 1, 1))
+    return cost_fields(round(flops), round(elements * element_bytes(dtype)))
@@ -0,0 +1,35 @@
+"""
+Op registry for dataset collection. Each collect_*.py module declares its op
+once: how to build the CPU inputs of a point, the kernel to time, and the
+element count behind log_size. collector.harness.measure_op times them all
+the same way.
+"""
+import importlib
+
+OPS = {}
+
+class OpSpec:
+    """
+    build(dtype=..., **params) -> tuple of CPU tensors
+    kernel(*inputs) -> output tensor(s); must do the real work (no lazy views)
+    size(**params) -> number of elements for log_size
+    cost(**params) -> (floating-point ops, elements read + written), see collector/op_costs.py
+    """
+
+    def __init__(self, name, operation_type, build, kernel, size, cost=None):
+        self.name = name
+        self.operation_type = operation_type
+        self.build = build
+        self.kernel = kernel
+        self.size = size
+        self.cost = cost
+
+def register_op(name, operation_type, build, kernel, size, cost=None):
+    OPS[name] = OpSpec(name, operation_type, build, kernel, size, cost)
+    return OPS[name]
+
+def get_op(name):
+    """Registered op by name; collector.collect_<name> is imported on first use."""
+    if name not in OPS:
+        importlib.import_module(f"collector.collect_{name}")
+    return OPS[name]
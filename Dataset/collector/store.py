@@ -0,0 +1,285 @@
+"""
+Columnar benchmark store: one canonical, typed schema and a hive-partitioned
+Parquet dataset under datasets/store/device=<device>/op=<operation_type>/.
+
+- harmonize() maps any collector output or legacy CSV/parquet onto SCHEMA:
+  "float32'>" / "torch.float32" -> "float32", True/False strings -> 0/1,
+  power_mode kept as text ("0", "MAXN"), numbers coerced, missing columns null;
+  rows without flops/bytes_moved get them estimated (collector/op_costs.py)
+- append() adds rows incrementally; a content hash of the measurement
+  (every schema column except source_file and the costs) drops rows already stored
+- load() reads through a memory-mapped filesystem with column projection and
+  partition pruning (e.g. ops=["matmul"]), so training never goes via CSV
+
+Only pandas and pyarrow are needed (no torch), so the model side can load
+it too: utils.dataset_modules.load_dataset_module("collector/store.py").
+
+CLI, from Dataset/:
+    python -m collector.store append ../Final_dataset.csv ../jetson_nano_complete_benchmark.csv datasets/*.parquet
+    python -m collector.store stats
+    python -m collector.store export merged.csv
+"""
+import argparse
+import functools
+import logging
+import os
+import re
+import uuid
+
+log = logging.getLogger("store")
+log.setLevel(logging.INFO)
+
+STORE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "datasets", "store")
+HASH_COLUMN = "row_hash"
+PARTITION_COLUMNS = ("device", "op")
+
+# column -> arrow type name, in canonical order
+SCHEMA = {
+    "operation_type": "string",
+    "log_size": "float64",
+    "dtype": "string",
+    "flops": "float64",
+    "bytes_moved": "float64",
+    "arithmetic_intensity": "float64",
+    "cpu_runtime_ms": "float64",
+    "gpu_runtime_ms": "float64",
+    "transfer_time_ms": "float64",
+    "data_transfer_cost_ms": "float64",
+    "h2d_time_ms": "float64",
+    "d2h_time_ms": "float64",
+    "winner": "int8",
+    "cpu_reps": "int32",
+    "cpu_ci_pct": "float64",
+    "gpu_reps": "int32",
+    "gpu_ci_pct": "float64",
+    "cpu_threads": "int16",
+    "cpu_parallel_runtime_ms": "float64",
+    "best_target": "string",
+    "cpu_load_pct": "float64",
+    "is_battery_powered": "int8",
+    "power_mode": "string",
+    "gpu_load_pct": "float64",
+    "gpu_mem_used_mb": "float64",
+    "gpu_mem_total_mb": "float64",
+    "gpu_mem_free_mb": "float64",
+    "gpu_mem_pressure": "float64",
+    "gpu_temp_C": "float64",
+    "thermal_headroom": "float64",
+    "concurrent_gpu_tasks": "float64",
+    "device_name": "string",
+    "is_edge": "int8",
+    "source_file": "string",
+}
+FLAG_COLUMNS = ("winner", "is_battery_powered", "is_edge")
+COST_COLUMNS = ("flops", "bytes_moved", "arithmetic_intensity")
+# provenance and derived values, not content: the same measurement imported twice must hash the
+# same, whether or not its costs were recorded (older rows get them estimated, collector/op_costs.py)
+UNHASHED_COLUMNS = ("source_file",) + COST_COLUMNS
+
+
+def arrow_schema(with_partitions=False):
+    import pyarrow as pa
+    fields = [pa.field(name, getattr(pa, kind)()) for name, kind in SCHEMA.items()]
+    fields.append(pa.field(HASH_COLUMN, pa.uint64()))
+    if with_partitions:
+        fields += [pa.field(name, pa.string()) for name in PARTITION_COLUMNS]
+    return pa.schema(fields)
+
+
+def _partitioning():
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    return ds.partitioning(pa.schema([(c, pa.string()) for c in PARTITION_COLUMNS]), flavor="hive")
+
+
+def device_slug(name):
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", str(name or "")).strip("_").lower()
+    return slug or "unknown"
+
+
+def _flag(value):
+    if isinstance(value, str):
+        value = value.strip().lower()
+        return {"true": 1, "false": 0, "yes": 1, "no": 0}.get(value, value)
+    return value
+
+
+def harmonize(df, source_file=None):
+    """Copy of df with exactly the SCHEMA columns, typed, plus row_hash."""
+    import pandas as pd
+    out = pd.DataFrame(index=df.index)
+    extra = sorted(set(df.columns) - set(SCHEMA) - {HASH_COLUMN, *PARTITION_COLUMNS})
+    if extra:
+        log.info(f"Dropping columns outside the schema: {extra}")
+
+    for name, kind in SCHEMA.items():
+        col = df[name] if name in df.columns else pd.Series(None, index=df.index, dtype=object)
+        if name == "dtype":
+            col = col.astype("string").str.extract(r"((?:b?float|u?int|bool)\d*)", expand=False)
+        elif name == "power_mode":
+            # numeric modes from nvpmodel ("0", 0.0) and named ones ("MAXN") share one text column
+            col = col.map(lambda v: None if pd.isna(v) else (str(int(v)) if isinstance(v, (int, float)) else str(v)))
+            col = col.astype("string")
+        elif kind == "string":
+            col = col.astype("string")
+        else:
+            if name in FLAG_COLUMNS:
+                col = col.map(_flag)
+            col = pd.to_numeric(col, errors="coerce")
+            if kind.startswith("int"):
+                col = col.round().astype({"int8": "Int8", "int16": "Int16", "int32": "Int32"}[kind])
+        out[name] = col
+
+    if source_file is not None:
+        out["source_file"] = out["source_file"].fillna(source_file)
+    fill_costs(out)
+    hashed = [c for c in SCHEMA if c not in UNHASHED_COLUMNS]
+    out[HASH_COLUMN] = pd.util.hash_pandas_object(out[hashed], index=False).astype("uint64")
+    return out.reset_index(drop=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _op_costs():
+    # the sibling module, whether this one runs as collector.store or was loaded by file path
+    import importlib.util
+    spec = importlib.util.spec_from_file_location("hybridflow_op_costs", os.path.join(os.path.dirname(__file__), "op_costs.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def fill_costs(df):
+    """Estimate flops / bytes_moved / arithmetic_intensity in place where a row lacks them."""
+    missing = df["flops"].isna() if "flops" in df.columns else None
+    if missing is None or not missing.any():
+        return df
+    estimate = _op_costs().estimate
+    rows = df.loc[missing, ["operation_type", "log_size", "dtype"]]
+    estimates = [estimate(op, size, dtype if isinstance(dtype, str) else "float32")
+                 for op, size, dtype in rows.itertuples(index=False)]
+    for column in COST_COLUMNS:
+        df.loc[missing, column] = [e[column] for e in estimates]
+    return df
+
+
+def read_any(path):
+    """Legacy input: CSV or parquet, harmonized; source_file defaults to the file name."""
+    import pandas as pd
+    df = pd.read_csv(path) if path.endswith(".csv") else pd.read_parquet(path)
+    return harmonize(df, source_file=os.path.basename(path))
+
+
+class BenchmarkStore:
+    """The partitioned dataset at `root`."""
+
+    def __init__(self, root=STORE_DIR):
+        self.root = root
+
+    def _dataset(self):
+        import pyarrow.dataset as ds
+        from pyarrow import fs
+        return ds.dataset(self.root, format="parquet", partitioning=_partitioning(),
+                          schema=arrow_schema(with_partitions=True),
+                          filesystem=fs.LocalFileSystem(use_mmap=True))
+
+    def _exists(self):
+        return os.path.isdir(self.root) and any(files for _, _, files in os.walk(self.root))
+
+    def hashes(self, devices=None, ops=None):
+        """row_hash of every stored row in the given partitions."""
+        if not self._exists():
+            return set()
+        table = self._dataset().to_table(columns=[HASH_COLUMN], filter=self._filter(devices, ops))
+        return set(table.column(HASH_COLUMN).to_pylist())
+
+    @staticmethod
+    def _filter(devices=None, ops=None):
+        import pyarrow.dataset as ds
+        expr = None
+        for column, values in (("device", devices), ("op", ops)):
+            if values:
+                term = ds.field(column).isin(list(values))
+                expr = term if expr is None else expr & term
+        return expr
+
+    def append(self, df, harmonized=False):
+        """Add rows not already stored (by content hash); returns how many were written."""
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        df = df if harmonized else harmonize(df)
+        df = df.drop_duplicates(HASH_COLUMN).copy()
+        df["device"] = df["device_name"].map(device_slug)
+        df["op"] = df["operation_type"].fillna("unknown")
+        seen = self.hashes(devices=set(df["device"]), ops=set(df["op"]))
+        new = df[~df[HASH_COLUMN].isin(seen)]
+        if new.empty:
+            return 0
+        os.makedirs(self.root, exist_ok=True)
+        table = pa.Table.from_pandas(new, schema=arrow_schema(with_partitions=True), preserve_index=False)
+        ds.write_dataset(
+            table, self.root, format="parquet",
+            partitioning=_partitioning(),
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+        log.info(f"Appended {len(new)} rows ({len(df) - len(new)} already stored)")
+        return len(new)
+
+    def load_table(self, columns=None, devices=None, ops=None):
+        """pyarrow Table (memory-mapped reads) with only `columns`, pruned to devices/ops partitions."""
+        return self._dataset().to_table(columns=columns, filter=self._filter(devices, ops))
+
+    def load(self, columns=None, devices=None, ops=None):
+        """As load_table(), as a pandas DataFrame."""
+        if not self._exists():
+            import pandas as pd
+            return pd.DataFrame(columns=columns or list(SCHEMA))
+        return self.load_table(columns, devices, ops).to_pandas()
+
+    def batches(self, columns=None, devices=None, ops=None, batch_size=65536):
+        """DataFrames of at most batch_size rows each, streamed from disk (for data larger than memory)."""
+        if not self._exists():
+            return
+        for batch in self._dataset().to_batches(columns=columns, filter=self._filter(devices, ops),
+                                                batch_size=batch_size):
+            if batch.num_rows:
+                yield batch.to_pandas()
+
+    def stats(self):
+        table = self.load_table(columns=["device", "op"]) if self._exists() else None
+        if table is None or table.num_rows == 0:
+            return {"rows": 0}
+        counts = table.group_by(["device", "op"]).aggregate([([], "count_all")]).to_pylist()
+        return {"rows": table.num_rows, "partitions": {f"{c['device']}/{c['op']}": c["count_all"] for c in counts}}
+
+
+def load(columns=None, devices=None, ops=None, root=STORE_DIR):
+    return BenchmarkStore(root).load(columns, devices, ops)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    ap = argparse.ArgumentParser(description="HybridFlow benchmark store")
+    sub = ap.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("append", help="harmonize CSV/parquet files and add their new rows")
+    p.add_argument("files", nargs="+")
+    sub.add_parser("stats")
+    p = sub.add_parser("export", help="write the whole store to one CSV or parquet file")
+    p.add_argument("out")
+    ap.add_argument("--root", default=STORE_DIR)
+    args = ap.parse_args()
+
+    store = BenchmarkStore(args.root)
+    if args.command == "append":
+        for path in args.files:
+            print(f"{path}: {store.append(read_any(path), harmonized=True)} new rows")
+    elif args.command == "stats":
+        print(store.stats())
+    else:
+        df = store.load()
+        df.to_csv(args.out, index=False) if args.out.endswith(".csv") else df.to_parquet(args.out, index=False)
+        print(f"Exported {len(df)} rows to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import os
+import re
+
+_PARALLEL_RE = re.compile(r"^cpu-parallel\((\d+)\)$")
+
+
+def available_cores() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def choose_thread_count(cpu_load_pct, cores=None) -> int:
+    """Threads for a parallel CPU run: the cores the current load leaves idle, at least 1."""
+    cores = cores or available_cores()
+    load = min(max(cpu_load_pct or 0.0, 0.0), 100.0)
+    return max(1, min(cores, int(cores * (1 - load / 100) + 0.5)))
+
+
+def target_name(threads: int) -> str:
+    return "cpu" if threads <= 1 else f"cpu-parallel({threads})"
+
+
+def parse_target(target: str):
+    """"cpu-parallel(8)" -> ("cpu-parallel", 8); other targets -> (target, 1)."""
+    m = _PARALLEL_RE.match(target)
+    if m:
+        return "cpu-parallel", int(m.group(1))
+    return target, 1
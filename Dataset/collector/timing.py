@@ -1,4 +1,6 @@
 import time, torch, numpy as np
+import psutil
+from collector.threads import choose_thread_count, target_name
 
 def time_cpu(fn, warmup=3, reps=9):
     for _ in range(warmup): fn()
@@ -38,3 +40,84 @@ def time_d2h(t_gpu, warmup=2, reps=7):
         t0=time.perf_counter(); t_gpu.to("cpu"); torch.cuda.synchronize()
         t1=time.perf_counter(); ts.append((t1-t0)*1000)
     return float(np.median(ts))
+
+def time_cpu_threads(fn, threads, warmup=1, reps=5):
+    prev = torch.get_num_threads()
+    torch.set_num_threads(threads)
+    try:
+        return time_cpu(fn, warmup=warmup, reps=reps)
+    finally:
+        torch.set_num_threads(prev)
+
+def cpu_parallel_fields(fn, gpu_total_ms):
+    """
+    cpu_threads / cpu_parallel_runtime_ms for fn run with the thread count the
+    scheduler would pick under the current load, plus best_target: the fastest
+    of "cpu", "cpu-parallel(N)" and "gpu" (same vocabulary as the dispatcher).
+    "cpu" is timed single-threaded here, as the dispatcher runs it; torch's
+    default thread count would make it a parallel run too.
+    """
+    threads = choose_thread_count(psutil.cpu_percent(interval=None))
+    par_ms = time_cpu_threads(fn, threads)
+    candidates = {"cpu": time_cpu_threads(fn, 1), "gpu": gpu_total_ms}
+    if threads > 1:
+        candidates[target_name(threads)] = par_ms
+    return {
+        "cpu_threads": threads,
+        "cpu_parallel_runtime_ms": round(par_ms, 4),
+        "best_target": min(candidates, key=candidates.get),
+    }
+
+# adaptive repetition: stop once the 95% CI of the median is within TARGET_CI of it
+TARGET_CI = 0.05
+MIN_REPS, MAX_REPS = 5, 200
+TIME_BUDGET_MS = 2000.0
+
+def _median_ci(samples):
+    """Half-width of the 95% CI of the median, relative to it (normal approximation)."""
+    t = np.asarray(samples)
+    med = float(np.median(t))
+    if len(t) < 2 or med <= 0:
+        return med, float("inf")
+    return med, 1.96 * 1.2533 * float(np.std(t, ddof=1)) / np.sqrt(len(t)) / med
+
+def time_adaptive(run_once, warmup=3, target_ci=TARGET_CI, min_reps=MIN_REPS, max_reps=MAX_REPS,
+                  budget_ms=TIME_BUDGET_MS):
+    """
+    run_once() performs one timed repetition and returns its ms. Repeats until
+    the median's CI is within target_ci (relative), max_reps, or budget_ms of
+    measured time is spent. Returns {"median_ms", "ci_pct", "reps"}.
+    """
+    for _ in range(warmup): run_once()
+    t = []
+    while len(t) < max_reps:
+        t.append(run_once())
+        if len(t) >= min_reps:
+            med, ci = _median_ci(t)
+            if ci <= target_ci or sum(t) >= budget_ms:
+                break
+    med, ci = _median_ci(t)
+    return {"median_ms": med, "ci_pct": round(100 * ci, 2), "reps": len(t)}
+
+def cpu_timer(fn):
+    def run_once():
+        t0=time.perf_counter(); fn(); t1=time.perf_counter()
+        return (t1-t0)*1000
+    return run_once
+
+def gpu_timer(fn):
+    """CUDA-event timing of the kernel alone."""
+    def run_once():
+        start=torch.cuda.Event(enable_timing=True); end=torch.cuda.Event(enable_timing=True)
+        start.record(); fn(); end.record()
+        torch.cuda.synchronize()
+        return start.elapsed_time(end)
+    return run_once
+
+def synced_timer(fn):
+    """Wall-clock timing of fn through to device completion (copies)."""
+    def run_once():
+        torch.cuda.synchronize()
+        t0=time.perf_counter(); fn(); torch.cuda.synchronize()
+        return (time.perf_counter()-t0)*1000
+    return run_once
@@ -0,0 +1,113 @@
+"""
+Adaptive sweeps: spend the benchmark budget around the CPU/GPU crossover
+instead of on a dense grid.
+
+A config with an `adaptive` section searches one size axis per line, a line
+being every combination of the other grid values (e.g. each dtype x batch):
+
+    adaptive:
+      axis: N                 # size argument to search
+      range: [256, 65536]
+      multiple: 256           # sampled sizes are rounded to multiples of this
+      coarse: 5               # log-spaced sizes measured first, ends included
+      tolerance: 0.1          # stop refining once hi / lo <= 1 + tolerance
+      budget: 16              # at most this many measured sizes per line
+
+After the coarse pass, every interval whose measured winner flips is
+refined, widest first, by regula falsi on log(cpu_ms / gpu_total_ms): the
+next size is where the interpolated ratio crosses 1 (kept within the middle
+half of the interval, so the bracket always shrinks). Lines without a flip
+stop after the coarse pass. Measured points are checkpointed like any sweep,
+and the search replays them on resume.
+"""
+import logging
+import math
+from sweeps.sweep_runner import POINT_COLUMN, apply_same, expand_points, measure, point_key
+
+log = logging.getLogger("sweep_runner")
+
+
+def _log_ratio(row):
+    """log(cpu / gpu_total); None when either side is missing or infinite."""
+    cpu, gpu = row["cpu_runtime_ms"], row["gpu_runtime_ms"] + row["transfer_time_ms"]
+    if not (math.isfinite(cpu) and math.isfinite(gpu)) or cpu <= 0 or gpu <= 0:
+        return None
+    return math.log(cpu / gpu)
+
+
+def search_line(measure_point, axis_range, multiple=1, coarse=5, tolerance=0.1, budget=16):
+    """
+    Sizes to measure along one line, chosen online. measure_point(size) returns
+    the dataset row (or None if it failed). Returns {size: row} of what was measured.
+    """
+    lo, hi = axis_range
+    rows = {}
+
+    def rounded(x):
+        return min(max(int(round(x / multiple)) * multiple, lo), hi)
+
+    def sample(size):
+        if size not in rows and len(rows) < budget:
+            rows[size] = measure_point(size)
+
+    steps = max(coarse - 1, 1)
+    for i in range(steps + 1):
+        sample(rounded(lo * (hi / lo) ** (i / steps)))
+
+    exhausted = set()
+    while len(rows) < budget:
+        known = sorted((s, r) for s, r in rows.items() if r is not None)
+        flips = [(a, b) for a, b in zip(known, known[1:])
+                 if a[1]["winner"] != b[1]["winner"] and b[0] / a[0] > 1 + tolerance
+                 and (a[0], b[0]) not in exhausted]
+        if not flips:
+            break
+        (s0, r0), (s1, r1) = max(flips, key=lambda f: f[1][0] / f[0][0])
+        z0, z1 = _log_ratio(r0), _log_ratio(r1)
+        t = 0.5 if z0 is None or z1 is None or z0 == z1 else min(max(z0 / (z0 - z1), 0.25), 0.75)
+        size = rounded(math.exp(math.log(s0) + t * (math.log(s1) - math.log(s0))))
+        if size in rows:
+            # the size grid is too coarse to split this bracket further
+            exhausted.add((s0, s1))
+            continue
+        sample(size)
+    return rows
+
+
+def run_adaptive(cfg, checkpoint):
+    """Adaptive counterpart of run_sweep(); measures serially in this process."""
+    ad = cfg["adaptive"]
+    axis = ad["axis"]
+    if not cfg.get("gpu", True):
+        log.warning(f"{cfg['name']}: adaptive sweep without the GPU has no crossover to find")
+
+    lines_cfg = dict(cfg, grid={k: v for k, v in (cfg.get("grid") or {}).items() if k != axis}, same=None)
+    lines = expand_points(lines_cfg)
+    done = {r[POINT_COLUMN]: r for r in checkpoint.read().to_dict("records")}
+
+    measured, failed = set(), []
+    for li, base in enumerate(lines):
+        def measure_point(size):
+            kwargs = apply_same(cfg, {**base, axis: size})
+            key = point_key(kwargs)
+            measured.add((li, size, key))
+            if key in done:
+                return done[key]
+            _, row, error = measure(cfg["collector"], kwargs)
+            if error:
+                failed.append(key)
+                log.warning(f"{cfg['name']} {key} failed: {error}")
+                return None
+            checkpoint.write([{**row, POINT_COLUMN: key}])
+            return row
+
+        rows = search_line(measure_point, ad["range"], multiple=ad.get("multiple", 1), coarse=ad.get("coarse", 5),
+                           tolerance=ad.get("tolerance", 0.1), budget=ad.get("budget", 16))
+        winners = {s: r["winner"] for s, r in sorted(rows.items()) if r is not None}
+        log.info(f"{cfg['name']} {base}: {len(rows)} sizes measured, winner by {axis}: {winners}")
+
+    if failed:
+        log.warning(f"{cfg['name']}: {len(failed)} points failed; rerun to retry them")
+        return None
+    # one line after the other, sizes ascending within each
+    return checkpoint.compact([key for _, _, key in sorted(measured)])
@@ -1,42 +1,39 @@
-import pandas as pd
+import argparse
 import glob, os
+from collector.store import BenchmarkStore, read_any
 
-def merge_datasets(input_folder="datasets", output_file="datasets/merged_dataset.csv"):
-    # Find all parquet files inside datasets/
+def merge_datasets(input_folder="datasets", output_file=None):
+    """Add every sweep parquet in input_folder to the benchmark store (new rows only); optionally export a CSV."""
     parquet_files = glob.glob(os.path.join(input_folder, "*.parquet"))
 
     if not parquet_files:
         print("❌ No parquet files found in", input_folder)
         return
 
-    dfs = []
+    store = BenchmarkStore()
     for f in parquet_files:
         try:
-            df = pd.read_parquet(f)
-            df["source_file"] = os.path.basename(f)
-            dfs.append(df)
-            print(f"✅ Loaded {f} with {len(df)} rows")
+            added = store.append(read_any(f), harmonized=True)
+            print(f"✅ {f}: {added} new rows")
         except Exception as e:
             print(f"⚠️ Could not read {f}: {e}")
 
-    if not dfs:
-        print("❌ No datasets loaded.")
-        return
-
-    merged = pd.concat(dfs, ignore_index=True)
-
-    # Drop duplicates if run_id accidentally added twice
-    if "run_id" in merged.columns:
-        merged = merged.drop_duplicates(subset=["run_id"])
+    stats = store.stats()
+    print(f"\n🎉 Benchmark store at {store.root} holds {stats['rows']} rows")
 
-    # Save as CSV for accessibility
-    merged.to_csv(output_file, index=False)
-    print(f"\n🎉 Merged dataset saved at {output_file} with {len(merged)} rows")
+    # ✅ Print rows per device/operation partition
+    for partition, rows in sorted(stats.get("partitions", {}).items()):
+        print(f"   {partition}: {rows}")
 
-    # ✅ Print rows per operation_type
-    if "operation_type" in merged.columns:
-        print("\n📊 Rows per operation_type:")
-        print(merged["operation_type"].value_counts())
+    # CSV only for tools that still need it; training reads the store
+    if output_file:
+        merged = store.load()
+        merged.to_csv(output_file, index=False)
+        print(f"Exported {len(merged)} rows to {output_file}")
 
 if __name__ == "__main__":
-    merge_datasets()
+    ap = argparse.ArgumentParser(description="Merge sweep outputs into the benchmark store")
+    ap.add_argument("--input", default="datasets")
+    ap.add_argument("--csv", default=None, help="also export everything to this CSV")
+    args = ap.parse_args()
+    merge_datasets(args.input, args.csv)
@@ -0,0 +1,234 @@
+"""
+YAML-driven benchmark sweeps with incremental checkpoints.
+
+A sweep config names a collector and the points to measure:
+
+    name: fft
+    collector: collector.collect_fft:collect_one_fft
+    output: datasets/fft.parquet
+    gpu: true                 # false: never touch the GPU
+    grid:                     # cartesian product of every list, first key outermost
+      dtype: [float32]
+      N: [256, 512, 1024]
+      batch: [1, 4, 16]
+    same: {n: m, k: m}        # optional: arguments copied from another one
+    points:                   # optional: explicit argument tuples, crossed with grid
+      keys: [M, N]
+      values: [[128, 128], [1024, 2048]]
+    adaptive: {...}           # optional: search one axis instead, see sweeps/adaptive.py
+
+Every measured row is written straight away as its own parquet part under
+<output>.parts/ (atomically), so an interrupted sweep resumes with the points
+that have no row yet. Once every point is done the parts are compacted, in
+grid order, into <output>.
+
+Points that do not measure the GPU (gpu: false, or no CUDA device here) are
+sharded across --workers processes; GPU sweeps run serially in this process
+so no two measurements ever share the GPU.
+
+Run from Dataset/:  python -m sweeps.sweep_runner sweeps/configs/fft.yaml [--workers 4] [--fresh]
+"""
+import argparse
+import functools
+import glob
+import importlib
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+
+log = logging.getLogger("sweep_runner")
+log.setLevel(logging.INFO)
+
+POINT_COLUMN = "sweep_point"
+
+_collectors = {}
+
+
+def load_config(path):
+    import yaml
+    with open(path, encoding="utf-8") as f:
+        cfg = yaml.safe_load(f)
+    for key in ("name", "collector", "output"):
+        if key not in cfg:
+            raise ValueError(f"{path}: missing '{key}'")
+    cfg.setdefault("gpu", True)
+    cfg.setdefault("checkpoint_every", 1)
+    return cfg
+
+
+def expand_points(cfg):
+    """Collector kwargs for every point of the sweep, in measurement order."""
+    grid = cfg.get("grid") or {}
+    names = list(grid)
+    points = [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+    explicit = cfg.get("points")
+    if explicit:
+        rows = [dict(zip(explicit["keys"], values)) for values in explicit["values"]]
+        points = [{**p, **r} for p in points for r in rows]
+    return [apply_same(cfg, p) for p in points]
+
+
+def apply_same(cfg, kwargs):
+    for arg, source in (cfg.get("same") or {}).items():
+        kwargs[arg] = kwargs[source]
+    return kwargs
+
+
+def point_key(kwargs):
+    return json.dumps(kwargs, sort_keys=True)
+
+
+def _collector(spec):
+    if spec not in _collectors:
+        module, _, name = spec.partition(":")
+        _collectors[spec] = getattr(importlib.import_module(module), name)
+    return _collectors[spec]
+
+
+def measure(spec, kwargs):
+    """Run one point; returns (key, row or None, error or None)."""
+    key = point_key(kwargs)
+    call = dict(kwargs)
+    if isinstance(call.get("dtype"), str):
+        import torch
+        call["dtype"] = getattr(torch, call["dtype"])
+    try:
+        return key, _collector(spec)(**call), None
+    except Exception as e:
+        return key, None, f"{type(e).__name__}: {e}"
+
+
+def _cpu_only_worker(threads):
+    # must happen before torch is imported in this (spawned) process
+    os.environ["CUDA_VISIBLE_DEVICES"] = ""
+    import torch
+    torch.set_num_threads(threads)
+
+
+def _cuda_available():
+    import torch
+    return torch.cuda.is_available()
+
+
+class SweepCheckpoint:
+    """Parquet parts of one sweep: <output>.parts/part-NNNNN.parquet, one or more rows each."""
+
+    def __init__(self, output):
+        self.output = output
+        self.parts_dir = f"{output}.parts"
+        os.makedirs(self.parts_dir, exist_ok=True)
+        parts = self._parts()
+        self._next = int(os.path.basename(parts[-1])[5:10]) + 1 if parts else 0
+
+    def _parts(self):
+        return sorted(glob.glob(os.path.join(self.parts_dir, "part-*.parquet")))
+
+    def read(self):
+        import pandas as pd
+        parts = [pd.read_parquet(p) for p in self._parts()]
+        return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=[POINT_COLUMN])
+
+    def done_keys(self):
+        return set(self.read()[POINT_COLUMN])
+
+    def write(self, rows):
+        import pandas as pd
+        if not rows:
+            return
+        path = os.path.join(self.parts_dir, f"part-{self._next:05d}.parquet")
+        tmp = f"{path}.tmp"
+        pd.DataFrame(rows).to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+        self._next += 1
+
+    def compact(self, order):
+        """Write every row, in `order` of point keys and without the key column, to the output file."""
+        df = self.read()
+        rank = {key: i for i, key in enumerate(order)}
+        df = df[df[POINT_COLUMN].isin(rank)].drop_duplicates(POINT_COLUMN, keep="last")
+        df = df.sort_values(POINT_COLUMN, key=lambda s: s.map(rank)).drop(columns=[POINT_COLUMN])
+        df = df.reset_index(drop=True)
+        tmp = f"{self.output}.tmp"
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, self.output)
+        return df
+
+    def clear(self):
+        shutil.rmtree(self.parts_dir, ignore_errors=True)
+        os.makedirs(self.parts_dir, exist_ok=True)
+        self._next = 0
+
+
+def run_sweep(config_path, workers=1, fresh=False):
+    """
+    Measure every point of the sweep not already checkpointed. Returns the
+    compacted DataFrame, or None if some points failed (rerun to retry them).
+    """
+    cfg = load_config(config_path)
+    os.makedirs(os.path.dirname(cfg["output"]) or ".", exist_ok=True)
+    checkpoint = SweepCheckpoint(cfg["output"])
+    if fresh:
+        checkpoint.clear()
+    if cfg.get("adaptive"):
+        from sweeps.adaptive import run_adaptive
+        return run_adaptive(cfg, checkpoint)
+
+    points = expand_points(cfg)
+    done = checkpoint.done_keys()
+    todo = [p for p in points if point_key(p) not in done]
+    log.info(f"{cfg['name']}: {len(points)} points, {len(points) - len(todo)} already measured")
+
+    buffer, failed = [], []
+
+    def handle(key, row, error):
+        if error:
+            failed.append(key)
+            log.warning(f"{cfg['name']} {key} failed: {error}")
+            return
+        buffer.append({**row, POINT_COLUMN: key})
+        if len(buffer) >= cfg["checkpoint_every"]:
+            checkpoint.write(buffer)
+            buffer.clear()
+
+    measure_one = functools.partial(measure, cfg["collector"])
+    try:
+        if cfg["gpu"] and _cuda_available():
+            for kwargs in todo:
+                handle(*measure_one(kwargs))
+        elif todo:
+            # CPU-only: shard over processes that cannot see the GPU, splitting the cores between them
+            workers = max(1, min(workers, len(todo)))
+            threads = max(1, (os.cpu_count() or 1) // workers)
+            ctx = multiprocessing.get_context("spawn")
+            with ctx.Pool(workers, initializer=_cpu_only_worker, initargs=(threads,)) as pool:
+                for result in pool.imap_unordered(measure_one, todo):
+                    handle(*result)
+    finally:
+        checkpoint.write(buffer)
+
+    if failed:
+        log.warning(f"{cfg['name']}: {len(failed)} points failed; rerun to retry them")
+        return None
+    return checkpoint.compact([point_key(p) for p in points])
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    ap = argparse.ArgumentParser(description="Run a benchmark sweep from a YAML config")
+    ap.add_argument("configs", nargs="+", help="sweep config(s), e.g. sweeps/configs/fft.yaml")
+    ap.add_argument("--workers", type=int, default=1, help="processes for CPU-only points")
+    ap.add_argument("--fresh", action="store_true", help="discard checkpoints and measure everything again")
+    args = ap.parse_args()
+
+    for path in args.configs:
+        df = run_sweep(path, workers=args.workers, fresh=args.fresh)
+        if df is not None:
+            print(f"✅ Saved {load_config(path)['name']} dataset:", df.shape)
+            print(df[["cpu_runtime_ms", "gpu_runtime_ms"]])
+
+
+if __name__ == "__main__":
+    main()
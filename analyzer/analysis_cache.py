@@ -0,0 +1,153 @@
+import copy
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from utils.hashing import file_digest, include_dirs, local_headers
+from utils.paths import CACHE_DIR
+
+log = logging.getLogger("analysis_cache")
+log.setLevel(logging.INFO)
+
+DEFAULT_MEMORY_ENTRIES = 1024
+
+_libclang_version = None
+
+
+def libclang_version() -> str:
+    """clang_getClangVersion() of the loaded libclang, or its path/size/mtime when unavailable."""
+    global _libclang_version
+    if _libclang_version is not None:
+        return _libclang_version
+    from analyzer.ast_parser import load_clang
+    try:
+        cindex = load_clang()
+        fn = cindex.conf.lib.clang_getClangVersion
+        fn.restype = cindex._CXString
+        _libclang_version = cindex._CXString.from_result(fn())
+    except Exception:
+        try:
+            path = cindex.conf.get_filename()
+            st = os.stat(path)
+            _libclang_version = f"{path}:{st.st_size}:{int(st.st_mtime)}"
+        except Exception:
+            _libclang_version = "unknown"
+    return _libclang_version
+
+
+def _parser_digest() -> str:
+    # Results depend on the analyzer code itself, so any edit invalidates old entries.
+    from analyzer import ast_parser
+    with open(ast_parser.__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class AnalysisCache:
+    """
+    Two-level cache of ASTParser.parse_file results.
+
+    Keys combine the source content hash, the hashes of the local headers it
+    #includes "..." (recursively), the parser arguments, the libclang (or
+    Python) version and the analyzer code. Level one is an in-process LRU;
+    level two is a directory of pickles shared by every process on the host,
+    written with an atomic rename so concurrent writers never expose partial files.
+    """
+
+    def __init__(self, cache_dir: str = None, max_entries: int = DEFAULT_MEMORY_ENTRIES):
+        self.cache_dir = os.path.join(cache_dir or CACHE_DIR, "analysis")
+        self.max_entries = max_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._parser_digest = None
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def key(self, path: str, parser_args) -> str:
+        with open(path, "rb") as f:
+            content = hashlib.sha256(f.read()).hexdigest()
+        if self._parser_digest is None:
+            self._parser_digest = _parser_digest()
+
+        ext = os.path.splitext(path)[1].lower()
+        toolchain = f"python-{sys.version_info[0]}.{sys.version_info[1]}" if ext == ".py" else libclang_version()
+        headers = set()
+        if ext != ".py":
+            local_headers(path, include_dirs(parser_args), headers)
+        payload = {
+            "content": content,
+            "headers": sorted(file_digest(h) for h in headers),
+            "ext": ext,
+            "args": list(parser_args or []),
+            "toolchain": toolchain,
+            "parser": self._parser_digest,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(self._memory[key])
+
+        disk = os.path.join(self.cache_dir, key + ".pkl")
+        try:
+            with open(disk, "rb") as f:
+                result = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+            self._remember(key, result)
+        return copy.deepcopy(result)
+
+    def put(self, key: str, result: dict):
+        with self._lock:
+            self._remember(key, copy.deepcopy(result))
+
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-", suffix=".pkl")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, os.path.join(self.cache_dir, key + ".pkl"))
+        except OSError as e:
+            log.warning(f"Could not persist analysis {key[:12]}: {e}")
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+    def _remember(self, key, result):
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self, disk: bool = False):
+        with self._lock:
+            self._memory.clear()
+        if disk:
+            for name in os.listdir(self.cache_dir):
+                try:
+                    os.unlink(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_analysis_cache() -> AnalysisCache:
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = AnalysisCache()
+        return _default_cache
@@ -2,18 +2,96 @@ import os
 import math
 import logging
 from typing import Dict, List, Optional
-import clang.cindex as cindex
-from clang.cindex import CursorKind, TypeKind
 import ast   
+import threading
+from analyzer.analysis_cache import get_analysis_cache
 
 log = logging.getLogger("ast_parser")
 log.setLevel(logging.INFO)
 
-cindex.Config.set_library_file("/usr/lib/llvm-18/lib/libclang.so")
+LIBCLANG_PATH = "/usr/lib/llvm-18/lib/libclang.so"
+
+# Bound by load_clang() the first time a C/C++ file is parsed, so Python
+# kernels never pay for importing and configuring libclang.
+cindex = None
+CursorKind = None
+TypeKind = None
+
+
+def load_clang():
+    global cindex, CursorKind, TypeKind
+    if cindex is None:
+        import clang.cindex as _cindex
+        if not _cindex.Config.loaded:
+            _cindex.Config.set_library_file(LIBCLANG_PATH)
+        CursorKind, TypeKind = _cindex.CursorKind, _cindex.TypeKind
+        cindex = _cindex
+    return cindex
+
+
+_clang_fns = None
+
+
+def clang_fns():
+    """
+    (evaluate, binop_kind) from libclang's C API, which the Python bindings do not wrap:
+    evaluate(cursor) -> int value of a constant expression (macros expanded) or None;
+    binop_kind(cursor) -> CXBinaryOperatorKind of a (compound) binary operator.
+    Token spellings cannot be used for these: inside macro expansions they are wrong.
+    """
+    global _clang_fns
+    if _clang_fns is None:
+        import ctypes
+        ci = load_clang()
+        lib = ci.conf.lib
+        for name, argtypes, restype in (
+            ("clang_Cursor_Evaluate", [ci.Cursor], ctypes.c_void_p),
+            ("clang_EvalResult_getKind", [ctypes.c_void_p], ctypes.c_int),
+            ("clang_EvalResult_getAsLongLong", [ctypes.c_void_p], ctypes.c_longlong),
+            ("clang_EvalResult_dispose", [ctypes.c_void_p], None),
+            ("clang_getCursorBinaryOperatorKind", [ci.Cursor], ctypes.c_int),
+        ):
+            fn = getattr(lib, name)
+            fn.argtypes, fn.restype = argtypes, restype
+
+        def evaluate(cursor):
+            result = lib.clang_Cursor_Evaluate(cursor)
+            if not result:
+                return None
+            try:
+                return lib.clang_EvalResult_getAsLongLong(result) if lib.clang_EvalResult_getKind(result) == 1 else None
+            finally:
+                lib.clang_EvalResult_dispose(result)
+
+        _clang_fns = (evaluate, lib.clang_getCursorBinaryOperatorKind)
+    return _clang_fns
+
+
+# calls allowed inside a loop marked parallel (no side effects, thread safe)
+PURE_CALLS = {
+    'sqrt', 'sqrtf', 'exp', 'expf', 'log', 'logf', 'pow', 'powf', 'fabs', 'fabsf', 'abs',
+    'sin', 'sinf', 'cos', 'cosf', 'tan', 'tanf', 'tanh', 'tanhf', 'floor', 'floorf', 'ceil', 'ceilf',
+    'fmin', 'fminf', 'fmax', 'fmaxf', 'fma', 'fmaf',
+}
+ASSIGN_OPS = {'=', '+=', '-=', '*=', '/=', '%=', '<<=', '>>=', '&=', '|=', '^='}
+
+# CXBinaryOperatorKind values
+BO_MUL, BO_DIV, BO_REM, BO_ADD, BO_SUB = 3, 4, 5, 6, 7
+BO_LT, BO_GT, BO_LE, BO_GE, BO_NE = 11, 12, 13, 14, 16
+BO_ASSIGN, BO_MUL_ASSIGN, BO_DIV_ASSIGN, BO_ADD_ASSIGN, BO_SUB_ASSIGN, BO_OR_ASSIGN = 22, 23, 24, 26, 27, 32
+FLOP_BINOPS = {BO_MUL, BO_DIV, BO_ADD, BO_SUB, BO_MUL_ASSIGN, BO_DIV_ASSIGN, BO_ADD_ASSIGN, BO_SUB_ASSIGN}
+FLOAT_TYPE_KINDS = {'FLOAT', 'DOUBLE', 'LONGDOUBLE', 'HALF', 'FLOAT16', 'FLOAT128'}
+INT_TYPE_KINDS = {'SHORT', 'USHORT', 'INT', 'UINT', 'LONG', 'ULONG', 'LONGLONG', 'ULONGLONG'}
+ARRAY_TYPE_KINDS = {'POINTER', 'CONSTANTARRAY', 'INCOMPLETEARRAY', 'VARIABLEARRAY'}
+
+# value the generated timing harness (collector/device_runner.py) passes to every integer parameter
+HARNESS_INT_ARG = 1024
+
 
 class ASTParser:
     def __init__(self):
-        self.index = cindex.Index.create()
+        self._index = None
+        self.std_args = ['-std=c11']
         self.function_patterns = {
             'matmul': ['matmul', 'matrix_multiply', 'sgemm'],
             'fft': ['fft', 'dft', 'fftw', 'cufft'],
@@ -24,6 +102,12 @@ class ASTParser:
         }
         self.type_sizes = {'float': 4, 'double': 8, 'int': 4, 'char': 1, 'pointer': 8}
 
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = load_clang().Index.create()
+        return self._index
+
     def parse_file(self, path: str, include_paths: Optional[List[str]] = None) -> Dict:
         if not os.path.exists(path):
             raise FileNotFoundError(path)
@@ -34,11 +118,15 @@ class ASTParser:
         else:
             return self._parse_c_cpp(path, include_paths)
 
-    def _parse_c_cpp(self, path: str, include_paths: Optional[List[str]]) -> Dict:
-        args = ['-std=c11']
+    def clang_args(self, include_paths: Optional[List[str]] = None) -> List[str]:
+        args = list(self.std_args)
         if include_paths:
             for p in include_paths:
                 args.extend(['-I', p])
+        return args
+
+    def _parse_c_cpp(self, path: str, include_paths: Optional[List[str]]) -> Dict:
+        args = self.clang_args(include_paths)
         tu = self.index.parse(path, args=args)
         if not tu:
             raise RuntimeError("clang failed to parse")
@@ -58,16 +146,21 @@ class ASTParser:
             'exported_functions': []
         }
         self._traverse(root, analysis, loop_depth=0)
+        analysis['parallel_loops'] = self._parallel_loops(root)
+        analysis['loop_nests'] = self._loop_nest_costs(root, analysis)
+        analysis['param_extents'] = self._param_extents(root)
         op_type = self._classify(analysis)
         total_bytes = self._estimate_total_bytes(analysis)
         log_total = math.log10(max(total_bytes, 1))
+        costs = loop_nest_totals(analysis['loop_nests'])
 
         primary_fn = analysis['exported_functions'][0][0] if analysis['exported_functions'] else None
         primary_params = analysis['exported_functions'][0][1] if analysis['exported_functions'] else []
 
         log.info(
             f"[C/C++] Detected op={op_type} log_size={round(log_total,4)} "
-            f"(total_bytes={total_bytes}) has_main={analysis['has_main']} fn={primary_fn}"
+            f"(total_bytes={total_bytes}) has_main={analysis['has_main']} fn={primary_fn} "
+            f"flops={costs['flops']} bytes_moved={costs['bytes_moved']} intensity={costs['arithmetic_intensity']}"
         )
 
         return {
@@ -77,6 +170,7 @@ class ASTParser:
             'primary_function_name': primary_fn,
             'primary_function_params': primary_params,
             'total_memory_bytes': total_bytes,
+            **costs,
             'raw_analysis': analysis
         }
 
@@ -123,6 +217,644 @@ class ASTParser:
         for ch in cursor.get_children():
             self._traverse(ch, analysis, loop_depth + 1 if cursor.kind == CursorKind.FOR_STMT else loop_depth)
 
+    def _parallel_loops(self, root) -> List[Dict]:
+        """Outermost loops of each function in the main file whose iterations are independent."""
+        found = []
+
+        def search(cursor, fn_name):
+            for ch in cursor.get_children():
+                if ch.kind == CursorKind.FOR_STMT:
+                    info = self._parallel_loop_info(ch)
+                    if info is not None:
+                        info['function'] = fn_name
+                        found.append(info)
+                        continue
+                search(ch, fn_name)
+
+        for cursor in root.get_children():
+            if cursor.kind != CursorKind.FUNCTION_DECL or not cursor.is_definition():
+                continue
+            if cursor.location.file is None or cursor.location.file.name != root.spelling:
+                continue
+            if cursor.spelling != 'main':
+                search(cursor, cursor.spelling)
+        return found
+
+    @staticmethod
+    def _strip(cursor):
+        while cursor.kind in (CursorKind.UNEXPOSED_EXPR, CursorKind.PAREN_EXPR):
+            children = list(cursor.get_children())
+            if len(children) != 1:
+                break
+            cursor = children[0]
+        return cursor
+
+    def _subscript(self, cursor):
+        """a[i][j] -> ('a', ('i', 'j')) with each index as its token string; (None, None) otherwise."""
+        idx = []
+        cur = cursor
+        while cur.kind == CursorKind.ARRAY_SUBSCRIPT_EXPR:
+            children = list(cur.get_children())
+            if len(children) != 2:
+                return None, None
+            idx.insert(0, " ".join(t.spelling for t in children[1].get_tokens()))
+            cur = self._strip(children[0])
+        if cur.kind != CursorKind.DECL_REF_EXPR:
+            return None, None
+        return cur.spelling, tuple(idx)
+
+    def _parallel_loop_info(self, for_node) -> Optional[Dict]:
+        """
+        Conservative independence check for `for (int i = a; i < b; i++) body`:
+        - no return/goto, no break out of this loop, only math-library calls
+        - scalars declared outside the body are only updated with `+=` and
+          never read otherwise (turned into reduction(+:...))
+        - every array written is written at a single index expression that
+          has `i` as a whole index, or `i * s + r` with 0 <= r < s provable
+          (see _owned_index), and is only read at that same index
+        Distinct pointer parameters are assumed not to alias, as in the harness.
+        """
+        children = list(for_node.get_children())
+        if len(children) != 4 or children[0].kind != CursorKind.DECL_STMT:
+            return None
+        decls = list(children[0].get_children())
+        if len(decls) != 1 or decls[0].kind != CursorKind.VAR_DECL:
+            return None
+        var = decls[0].spelling
+        cond, inc, body = children[1:]
+        ctoks = [t.spelling for t in cond.get_tokens()]
+        if len(ctoks) < 3 or ctoks[0] != var or ctoks[1] not in ('<', '<=') or var in ctoks[2:]:
+            return None
+        if [t.spelling for t in inc.get_tokens()] not in ([var, '++'], ['++', var], [var, '+=', '1']):
+            return None
+
+        local_vars, writes, reads, refs, updates, targets = set(), {}, {}, {}, {}, {}
+        ok = [True]
+
+        def fail():
+            ok[0] = False
+
+        def assign_target(lhs, op):
+            lhs = self._strip(lhs)
+            if lhs.kind == CursorKind.DECL_REF_EXPR:
+                name = lhs.spelling
+                if name in local_vars:
+                    return
+                if op == '+=' and name != var:
+                    updates[name] = updates.get(name, 0) + 1
+                    return
+                fail()
+            elif lhs.kind == CursorKind.ARRAY_SUBSCRIPT_EXPR:
+                base, idx = self._subscript(lhs)
+                if base is None:
+                    fail()
+                elif base not in local_vars:
+                    writes.setdefault(base, set()).add(idx)
+                    targets[base] = lhs
+            else:
+                fail()
+
+        def visit(node, nested):
+            if not ok[0]:
+                return
+            kind = node.kind
+            if kind in (CursorKind.RETURN_STMT, CursorKind.GOTO_STMT):
+                return fail()
+            if kind == CursorKind.BREAK_STMT and not nested:
+                return fail()
+            if kind == CursorKind.VAR_DECL:
+                local_vars.add(node.spelling)
+            elif kind == CursorKind.CALL_EXPR and node.spelling not in PURE_CALLS:
+                return fail()
+            elif kind in (CursorKind.BINARY_OPERATOR, CursorKind.COMPOUND_ASSIGNMENT_OPERATOR):
+                ch = list(node.get_children())
+                toks = [t.spelling for t in node.get_tokens()]
+                op = toks[len(list(ch[0].get_tokens()))] if len(ch) == 2 and toks else None
+                if op in ASSIGN_OPS:
+                    assign_target(ch[0], op)
+                    lhs = self._strip(ch[0])
+                    if lhs.kind == CursorKind.DECL_REF_EXPR:
+                        # the reduction variable itself is not a read
+                        return visit(ch[1], nested)
+            elif kind == CursorKind.UNARY_OPERATOR:
+                toks = [t.spelling for t in node.get_tokens()]
+                if toks and (toks[0] in ('++', '--') or toks[-1] in ('++', '--')):
+                    assign_target(list(node.get_children())[0], toks[0] if toks[0] in ('++', '--') else toks[-1])
+            elif kind == CursorKind.ARRAY_SUBSCRIPT_EXPR:
+                base, idx = self._subscript(node)
+                if base is not None:
+                    reads.setdefault(base, set()).add(idx)
+                    # visit the index expressions only, not the rest of the chain
+                    cur = node
+                    while cur.kind == CursorKind.ARRAY_SUBSCRIPT_EXPR:
+                        ch = list(cur.get_children())
+                        visit(ch[1], nested)
+                        cur = self._strip(ch[0])
+                    return
+            elif kind == CursorKind.DECL_REF_EXPR:
+                refs[node.spelling] = refs.get(node.spelling, 0) + 1
+
+            inner = nested or kind in (CursorKind.FOR_STMT, CursorKind.WHILE_STMT,
+                                       CursorKind.DO_STMT, CursorKind.SWITCH_STMT)
+            for ch in node.get_children():
+                visit(ch, inner)
+
+        visit(body, False)
+        if not ok[0]:
+            return None
+
+        reductions = sorted(updates)
+        if any(refs.get(name, 0) for name in reductions):
+            return None
+        for base, idxs in writes.items():
+            if len(idxs) != 1:
+                return None
+            (idx,) = idxs
+            if not reads.get(base, set()) <= idxs:
+                return None
+        if writes:
+            loops, assigned = self._inner_loops(body), self._assigned_names(body)
+            for base in writes:
+                levels, cur = [], targets[base]
+                while cur.kind == CursorKind.ARRAY_SUBSCRIPT_EXPR:
+                    ch = list(cur.get_children())
+                    levels.append(ch[1])
+                    cur = self._strip(ch[0])
+                if not any(self._owned_index(index, var, loops, assigned) for index in levels):
+                    return None
+
+        return {
+            'line': for_node.location.line,
+            'column': for_node.location.column,
+            'var': var,
+            'reductions': reductions,
+        }
+
+    def _inner_loops(self, body) -> Dict:
+        """{counter: [for statements]} of the loops nested anywhere in body."""
+        loops = {}
+
+        def walk(node):
+            if node.kind == CursorKind.FOR_STMT:
+                var, _ = self._loop_range(node, {})
+                if var is not None:
+                    loops.setdefault(var, []).append(node)
+            for ch in node.get_children():
+                walk(ch)
+
+        walk(body)
+        return loops
+
+    def _owned_index(self, index, var, loops, assigned) -> bool:
+        """
+        True if index is `var` or `var * s + r` (either order) where every value of r
+        lies in [0, s): a constant s with r's evaluated range inside it, or a symbolic s
+        with r an inner loop counter running from >= 0 while `r < s`. Distinct values
+        of var then never write the same element.
+        """
+        evaluate, binop_kind = clang_fns()
+        index = self._strip(index)
+        if index.kind == CursorKind.DECL_REF_EXPR:
+            return index.spelling == var
+        children = list(index.get_children())
+        if index.kind != CursorKind.BINARY_OPERATOR or binop_kind(index) != BO_ADD or len(children) != 2:
+            return False
+        for scaled, rest in (children, children[::-1]):
+            scaled = self._strip(scaled)
+            factors = list(scaled.get_children())
+            if scaled.kind != CursorKind.BINARY_OPERATOR or binop_kind(scaled) != BO_MUL or len(factors) != 2:
+                continue
+            for counter, stride in (factors, factors[::-1]):
+                counter = self._strip(counter)
+                if counter.kind == CursorKind.DECL_REF_EXPR and counter.spelling == var \
+                        and self._below(rest, stride, loops, assigned):
+                    return True
+        return False
+
+    def _below(self, rest, stride, loops, assigned) -> bool:
+        """0 <= rest < stride for every iteration of the inner loops, see _owned_index."""
+        evaluate, binop_kind = clang_fns()
+        bound = evaluate(self._strip(stride))
+        if bound is not None:
+            ranges = {}
+            for name, nodes in loops.items():
+                spans = [self._loop_range(node, {})[1] for node in nodes]
+                if name not in assigned and None not in spans:
+                    ranges[name] = (min(s[0] for s in spans), max(s[1] for s in spans))
+            span = self._interval(rest, ranges)
+            return span is not None and span[0] >= 0 and span[1] < bound
+
+        rest = self._strip(rest)
+        name = rest.spelling if rest.kind == CursorKind.DECL_REF_EXPR else None
+        stride_toks = [t.spelling for t in stride.get_tokens()]
+        if name not in loops or name in assigned or not stride_toks:
+            return False
+        if any(t in assigned for t in stride_toks):
+            return False
+        for node in loops[name]:
+            init, cond, inc, _ = list(node.get_children())
+            cond = self._strip(cond)
+            if cond.kind != CursorKind.BINARY_OPERATOR or binop_kind(cond) != BO_LT:
+                return False
+            lhs, rhs = list(cond.get_children())
+            if self._strip(lhs).spelling != name or [t.spelling for t in rhs.get_tokens()] != stride_toks:
+                return False
+            # the start and step only need a numeric range: the bound is checked symbolically above
+            values = [c for c in init.get_children() if c.kind != CursorKind.TYPE_REF]
+            if init.kind == CursorKind.DECL_STMT and values:
+                values = [c for c in values[0].get_children() if c.kind != CursorKind.TYPE_REF]
+            elif init.kind == CursorKind.BINARY_OPERATOR and len(values) == 2:
+                values = values[1:]
+            start = self._interval(values[-1], {}) if values else None
+            inc_toks = [t.spelling for t in inc.get_tokens()]
+            if start is None or start[0] < 0 or inc_toks not in ([name, '++'], ['++', name], [name, '+=', '1']):
+                return False
+        return True
+
+    def _loop_nest_costs(self, root, analysis) -> List[Dict]:
+        """
+        Floating-point operations and distinct bytes touched by each outermost
+        loop nest of the kernels in the main file (main() only when it is the
+        only function), see _nest_cost. Trip counts bounded by integer
+        parameters use HARNESS_INT_ARG for them, the value the timing harness
+        and the in-process backend run the kernel with (see _param_extents).
+        """
+        # loops whose trip count is neither constant nor parameter-bounded assume the largest known extent
+        fallback = max([max(d) for d in analysis['array_dimensions'] if d] + analysis['loop_bounds'] + [1])
+        functions = [c for c in root.get_children()
+                     if c.kind == CursorKind.FUNCTION_DECL and c.is_definition()
+                     and c.location.file is not None and c.location.file.name == root.spelling]
+        kernels = [f for f in functions if f.spelling != 'main'] or functions
+        nests = []
+
+        def search(cursor, fn_name, ranges):
+            for ch in cursor.get_children():
+                if ch.kind == CursorKind.FOR_STMT:
+                    nest = self._nest_cost(ch, fallback, ranges)
+                    nest['function'] = fn_name
+                    nests.append(nest)
+                else:
+                    search(ch, fn_name, ranges)
+
+        for fn in kernels:
+            assigned = self._assigned_names(fn)
+            ranges = {p.spelling: (HARNESS_INT_ARG, HARNESS_INT_ARG) for p in fn.get_arguments()
+                      if p.type.get_canonical().kind.name in INT_TYPE_KINDS and p.spelling not in assigned}
+            search(fn, fn.spelling, ranges)
+        return nests
+
+    def _nest_cost(self, for_node, fallback, ranges=None) -> Dict:
+        """
+        - flops: floating-point + - * / (compound assignments included) and
+          math-library calls, each weighted by the product of the enclosing trip counts
+        - bytes: per array, the distinct elements its subscript patterns reach
+          (a subscript position spans the product of its loop variables' trip
+          counts when they are multiplied, e.g. i * n + k, else their sum, e.g.
+          i + ki), capped by the declared dimensions; read-and-written arrays count twice
+        """
+        evaluate, binop_kind = clang_fns()
+        trips, arrays = {}, {}
+        totals = {'flops': 0, 'exact': True}
+
+        def access(node, written, read):
+            levels, cur = [], node
+            while cur.kind == CursorKind.ARRAY_SUBSCRIPT_EXPR:
+                base, index = list(cur.get_children())
+                levels.insert(0, index)
+                cur = self._strip(base)
+            if cur.kind != CursorKind.DECL_REF_EXPR:
+                return levels
+            entry = arrays.setdefault(cur.spelling, {
+                'patterns': set(), 'written': False, 'read': False,
+                'elem': max(node.type.get_size(), 1), 'dims': self._declared_dims(cur.type),
+            })
+            pattern = []
+            for index in levels:
+                names = tuple(sorted({c.spelling for c in index.walk_preorder() if c.kind == CursorKind.DECL_REF_EXPR}))
+                multiplied = any(c.kind == CursorKind.BINARY_OPERATOR and binop_kind(c) == BO_MUL
+                                 for c in index.walk_preorder())
+                pattern.append((names, multiplied))
+            entry['patterns'].add(tuple(pattern))
+            entry['written'] |= written
+            entry['read'] |= read
+            return levels
+
+        def walk(node, mult):
+            kind = node.kind
+            if kind == CursorKind.FOR_STMT:
+                var, trip, known = self._trip_count(node, fallback, ranges)
+                totals['exact'] &= known
+                if var is not None:
+                    trips[var] = max(trips.get(var, 0), trip)
+                children = list(node.get_children())
+                return walk(children[-1], mult * trip)
+            if kind in (CursorKind.BINARY_OPERATOR, CursorKind.COMPOUND_ASSIGNMENT_OPERATOR):
+                op = binop_kind(node)
+                if op in FLOP_BINOPS and node.type.get_canonical().kind.name in FLOAT_TYPE_KINDS:
+                    totals['flops'] += mult
+                if BO_ASSIGN <= op <= BO_OR_ASSIGN:
+                    lhs, rhs = list(node.get_children())
+                    lhs = self._strip(lhs)
+                    if lhs.kind == CursorKind.ARRAY_SUBSCRIPT_EXPR:
+                        for index in access(lhs, written=True, read=op != BO_ASSIGN):
+                            walk(index, mult)
+                    return walk(rhs, mult)
+            elif kind == CursorKind.ARRAY_SUBSCRIPT_EXPR:
+                for index in access(node, written=False, read=True):
+                    walk(index, mult)
+                return
+            elif kind == CursorKind.CALL_EXPR and node.spelling in PURE_CALLS:
+                totals['flops'] += mult * (2 if node.spelling in ('fma', 'fmaf') else 1)
+            for ch in node.get_children():
+                walk(ch, mult)
+
+        walk(for_node, 1)
+
+        def extent(names, multiplied):
+            spans = [trips[n] for n in names if n in trips]
+            if not spans:
+                return 1
+            return math.prod(spans) if multiplied else sum(spans) - len(spans) + 1
+
+        total_bytes = 0
+        for entry in arrays.values():
+            dims = entry['dims']
+            elements = 0
+            for pattern in entry['patterns']:
+                spans = [extent(*p) for p in pattern]
+                # positions line up with the declared dimensions from the innermost one
+                caps = ([None] * len(spans) + dims)[-len(spans):] if spans else []
+                elements += math.prod(min(s, c) if c else s for s, c in zip(spans, caps))
+            if dims and all(dims):
+                elements = min(elements, math.prod(dims))
+            total_bytes += elements * entry['elem'] * (2 if entry['written'] and entry['read'] else 1)
+
+        return {
+            'line': for_node.location.line,
+            'trip_counts': trips,
+            'exact': totals['exact'],
+            'flops': totals['flops'],
+            'bytes': total_bytes,
+        }
+
+    def _trip_count(self, for_node, fallback, ranges=None):
+        """
+        (loop variable, iterations, known) for `for (v = a; v < b; v += s)` and its variants.
+        Bounds may use the variables fixed in ranges ({name: (value, value)}); known is
+        True only for compile-time constant bounds.
+        """
+        evaluate, binop_kind = clang_fns()
+        ranges = ranges or {}
+        known = [True]
+
+        def value(node):
+            constant = evaluate(node)
+            if constant is not None:
+                return constant
+            span = self._interval(node, ranges)
+            if span is None or span[0] != span[1]:
+                return None
+            known[0] = False
+            return span[0]
+
+        children = list(for_node.get_children())
+        if len(children) != 4:
+            return None, fallback, False
+        init, cond, inc, _ = children
+
+        var = start = None
+        if init.kind == CursorKind.DECL_STMT:
+            decls = [d for d in init.get_children() if d.kind == CursorKind.VAR_DECL]
+            values = [c for c in decls[0].get_children() if c.kind not in (CursorKind.TYPE_REF,)] if decls else []
+            if decls and values:
+                var, start = decls[0].spelling, value(values[-1])
+        elif init.kind == CursorKind.BINARY_OPERATOR and binop_kind(init) == BO_ASSIGN:
+            lhs, rhs = list(init.get_children())
+            var, start = self._strip(lhs).spelling, value(rhs)
+
+        cond = self._strip(cond)
+        op = binop_kind(cond) if cond.kind == CursorKind.BINARY_OPERATOR else None
+        end = None
+        if op in (BO_LT, BO_LE, BO_GT, BO_GE, BO_NE):
+            lhs, rhs = list(cond.get_children())
+            if self._strip(lhs).spelling == var:
+                end = value(rhs)
+
+        step = None
+        if inc.kind == CursorKind.UNARY_OPERATOR:
+            toks = [t.spelling for t in inc.get_tokens()]
+            step = 1 if '++' in toks else -1 if '--' in toks else None
+        elif inc.kind == CursorKind.COMPOUND_ASSIGNMENT_OPERATOR and binop_kind(inc) in (BO_ADD_ASSIGN, BO_SUB_ASSIGN):
+            amount = evaluate(list(inc.get_children())[1])
+            if amount:
+                step = amount if binop_kind(inc) == BO_ADD_ASSIGN else -amount
+
+        if None in (start, end, step) or step == 0:
+            return var, fallback, False
+        if step > 0 and op in (BO_LT, BO_LE, BO_NE):
+            span = end - start + (1 if op == BO_LE else 0)
+        elif step < 0 and op in (BO_GT, BO_GE, BO_NE):
+            span = start - end + (1 if op == BO_GE else 0)
+        else:
+            return var, fallback, False
+        return var, max(0, -(-span // abs(step))), known[0]
+
+    def _declared_dims(self, t) -> List:
+        """Array extents of a declared type, None where unknown: float A[N][M] -> [N, M]; float (*)[M] -> [None, M]."""
+        dims = []
+        while True:
+            t = t.get_canonical()
+            if t.kind == TypeKind.CONSTANTARRAY:
+                dims.append(t.get_array_size())
+                t = t.get_array_element_type()
+            elif t.kind in (TypeKind.INCOMPLETEARRAY, TypeKind.VARIABLEARRAY):
+                dims.append(None)
+                t = t.get_array_element_type()
+            elif t.kind == TypeKind.POINTER:
+                dims.append(None)
+                t = t.get_pointee()
+            else:
+                return dims
+
+    def _interval(self, node, ranges):
+        """(lo, hi) an integer expression can take given (lo, hi) per variable in ranges; None if unknown."""
+        evaluate, binop_kind = clang_fns()
+        node = self._strip(node)
+        value = evaluate(node)
+        if value is not None:
+            return value, value
+        children = list(node.get_children())
+        if node.kind == CursorKind.DECL_REF_EXPR:
+            return ranges.get(node.spelling)
+        if node.kind == CursorKind.CSTYLE_CAST_EXPR and children:
+            return self._interval(children[-1], ranges)
+        if node.kind == CursorKind.UNARY_OPERATOR and len(children) == 1:
+            sign = next(iter(node.get_tokens()), None)
+            inner = self._interval(children[0], ranges)
+            if inner is not None and sign is not None and sign.spelling in ('-', '+'):
+                return (-inner[1], -inner[0]) if sign.spelling == '-' else inner
+            return None
+        if node.kind != CursorKind.BINARY_OPERATOR or len(children) != 2:
+            return None
+        a, b = (self._interval(c, ranges) for c in children)
+        if a is None or b is None:
+            return None
+        op = binop_kind(node)
+        if op == BO_ADD:
+            return a[0] + b[0], a[1] + b[1]
+        if op == BO_SUB:
+            return a[0] - b[1], a[1] - b[0]
+        if op == BO_MUL:
+            products = [x * y for x in a for y in b]
+            return min(products), max(products)
+        if op == BO_DIV and a[0] >= 0 and b[0] > 0:
+            return a[0] // b[1], a[1] // b[0]
+        if op == BO_REM and a[0] >= 0 and b[0] > 0:
+            return 0, min(a[1], b[1] - 1)
+        return None
+
+    def _loop_range(self, for_node, ranges):
+        """(variable, (lo, hi)) a loop counter takes inside the body, hi inclusive; (variable, None) if unknown."""
+        evaluate, binop_kind = clang_fns()
+        children = list(for_node.get_children())
+        if len(children) != 4:
+            return None, None
+        init, cond, inc, _ = children
+
+        var = start = None
+        if init.kind == CursorKind.DECL_STMT:
+            decls = [d for d in init.get_children() if d.kind == CursorKind.VAR_DECL]
+            values = [c for c in decls[0].get_children() if c.kind != CursorKind.TYPE_REF] if len(decls) == 1 else []
+            if values:
+                var, start = decls[0].spelling, self._interval(values[-1], ranges)
+        elif init.kind == CursorKind.BINARY_OPERATOR and binop_kind(init) == BO_ASSIGN:
+            lhs, rhs = list(init.get_children())
+            var, start = self._strip(lhs).spelling, self._interval(rhs, ranges)
+
+        cond = self._strip(cond)
+        op = binop_kind(cond) if cond.kind == CursorKind.BINARY_OPERATOR else None
+        end = None
+        if op in (BO_LT, BO_GT, BO_LE, BO_GE, BO_NE):
+            lhs, rhs = list(cond.get_children())
+            if self._strip(lhs).spelling == var:
+                end = self._interval(rhs, ranges)
+
+        step = None
+        if inc.kind == CursorKind.UNARY_OPERATOR:
+            toks = [t.spelling for t in inc.get_tokens()]
+            step = 1 if '++' in toks else -1 if '--' in toks else None
+        elif inc.kind == CursorKind.COMPOUND_ASSIGNMENT_OPERATOR and binop_kind(inc) in (BO_ADD_ASSIGN, BO_SUB_ASSIGN):
+            amount = evaluate(list(inc.get_children())[1])
+            if amount and amount > 0:
+                step = amount if binop_kind(inc) == BO_ADD_ASSIGN else -amount
+
+        if None in (start, end, step):
+            return var, None
+        if step > 0 and (op in (BO_LT, BO_LE) or (op == BO_NE and step == 1)):
+            lo, hi = start[0], end[1] - (0 if op == BO_LE else 1)
+        elif step < 0 and (op in (BO_GT, BO_GE) or (op == BO_NE and step == -1)):
+            lo, hi = end[0] + (0 if op == BO_GE else 1), start[1]
+        else:
+            return var, None
+        return var, ((lo, hi) if lo <= hi else None)
+
+    def _assigned_names(self, cursor) -> set:
+        """Variables assigned anywhere under cursor, except in the init / increment of for statements."""
+        evaluate, binop_kind = clang_fns()
+        names = set()
+
+        def target(node):
+            node = self._strip(node)
+            if node.kind == CursorKind.DECL_REF_EXPR:
+                names.add(node.spelling)
+
+        def walk(node):
+            children = list(node.get_children())
+            if node.kind == CursorKind.FOR_STMT and len(children) == 4:
+                children = [children[1], children[3]]
+            elif node.kind == CursorKind.COMPOUND_ASSIGNMENT_OPERATOR or (
+                    node.kind == CursorKind.BINARY_OPERATOR and binop_kind(node) == BO_ASSIGN):
+                target(children[0])
+            elif node.kind == CursorKind.UNARY_OPERATOR and children:
+                toks = [t.spelling for t in node.get_tokens()]
+                if toks and (toks[0] in ('++', '--', '&') or toks[-1] in ('++', '--')):
+                    target(children[0])
+            for ch in children:
+                walk(ch)
+
+        walk(cursor)
+        return names
+
+    def _param_extents(self, root) -> Dict:
+        """
+        {function: {array/pointer parameter: elements per subscript position, or None}} for the
+        functions of the main file: one more than the largest index any subscript of the
+        parameter can take, from clang-evaluated loop ranges, with integer parameters
+        equal to HARNESS_INT_ARG as in the timing harness. [] for an unused parameter;
+        None when it is used other than through subscripts (pointer arithmetic, passed
+        on, ...) or an index is not provably within [0, extent).
+        """
+        out = {}
+        for fn in root.get_children():
+            if fn.kind != CursorKind.FUNCTION_DECL or not fn.is_definition():
+                continue
+            if fn.location.file is None or fn.location.file.name != root.spelling:
+                continue
+            params = list(fn.get_arguments())
+            assigned = self._assigned_names(fn)
+            extents = {p.spelling: [] for p in params if p.type.get_canonical().kind.name in ARRAY_TYPE_KINDS}
+            ranges = {p.spelling: (HARNESS_INT_ARG, HARNESS_INT_ARG) for p in params
+                      if p.type.get_canonical().kind.name in INT_TYPE_KINDS and p.spelling not in assigned}
+
+            def record(name, levels):
+                spans = [self._interval(index, ranges) for index in levels]
+                need = [None if s is None or s[0] < 0 else s[1] + 1 for s in spans]
+                seen = extents[name]
+                if seen is None:
+                    return
+                if not seen:
+                    extents[name] = need
+                elif len(seen) != len(need):
+                    extents[name] = None
+                else:
+                    extents[name] = [None if a is None or b is None else max(a, b) for a, b in zip(seen, need)]
+
+            def walk(node):
+                if node.kind == CursorKind.FOR_STMT:
+                    var, span = self._loop_range(node, ranges)
+                    saved = ranges.pop(var, None)
+                    if span is not None and var not in assigned:
+                        ranges[var] = span
+                    for ch in node.get_children():
+                        walk(ch)
+                    ranges.pop(var, None)
+                    if saved is not None:
+                        ranges[var] = saved
+                    return
+                if node.kind == CursorKind.ARRAY_SUBSCRIPT_EXPR:
+                    levels, cur = [], node
+                    while cur.kind == CursorKind.ARRAY_SUBSCRIPT_EXPR:
+                        base, index = list(cur.get_children())
+                        levels.insert(0, index)
+                        cur = self._strip(base)
+                    for index in levels:
+                        walk(index)
+                    if cur.kind == CursorKind.DECL_REF_EXPR and cur.spelling in extents:
+                        record(cur.spelling, levels)
+                    else:
+                        walk(cur)
+                    return
+                if node.kind == CursorKind.DECL_REF_EXPR and node.spelling in extents:
+                    extents[node.spelling] = None
+                for ch in node.get_children():
+                    walk(ch)
+
+            for ch in fn.get_children():
+                if ch.kind != CursorKind.PARM_DECL:
+                    walk(ch)
+            out[fn.spelling] = {name: (None if e is None or None in e else e) for name, e in extents.items()}
+        return out
+
     def _extract_loop_constant_bound(self, for_node):
         for child in for_node.get_children():
             if child.kind == CursorKind.BINARY_OPERATOR:
@@ -262,8 +994,11 @@ class ASTParser:
             op_type = "matmul"
 
         log_size = round(math.log10(total_iters + 1), 4)
+        loop_nests = self._python_loop_costs(tree)
+        costs = loop_nest_totals(loop_nests)
 
-        log.info(f"[Python] Detected op={op_type}, loop_bounds={loop_bounds}, total_iters={total_iters}, log_size={log_size}")
+        log.info(f"[Python] Detected op={op_type}, loop_bounds={loop_bounds}, total_iters={total_iters}, log_size={log_size}, "
+                 f"flops={costs['flops']} bytes_moved={costs['bytes_moved']} intensity={costs['arithmetic_intensity']}")
 
         return {
             "operation_type": op_type,
@@ -272,13 +1007,180 @@ class ASTParser:
             "primary_function_name": funcs[0] if funcs else None,
             "primary_function_params": [],
             "total_memory_bytes": total_iters * 4,
+            **costs,
             "raw_analysis": {
                 "functions": funcs,
                 "function_calls": calls,
                 "loop_bounds": loop_bounds,
-                "nested_loop_depth": len(loop_bounds)
+                "nested_loop_depth": len(loop_bounds),
+                "loop_nests": loop_nests,
             }
         }
 
-def parse_and_detect(path):
-    return ASTParser().parse_file(path)
+    def _python_loop_costs(self, tree) -> List[Dict]:
+        """
+        Python counterpart of _loop_nest_costs: `for v in range(...)` nests,
+        arithmetic outside subscripts as flops, list/array subscripts as memory
+        (4-byte elements, as total_memory_bytes assumes). range() arguments
+        resolve through module- or function-level `NAME = <int>` assignments;
+        other trip counts assume the largest such constant.
+        """
+        import ast
+        consts = {}
+        for node in ast.walk(tree):
+            if (isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant)
+                    and type(node.value.value) is int):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        consts[target.id] = node.value.value
+        fallback = max(list(consts.values()) + [1])
+
+        def value(node):
+            if isinstance(node, ast.Constant) and type(node.value) is int:
+                return node.value
+            if isinstance(node, ast.Name):
+                return consts.get(node.id)
+            if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub, ast.Mult, ast.FloorDiv)):
+                a, b = value(node.left), value(node.right)
+                if a is None or b is None:
+                    return None
+                return {ast.Add: a + b, ast.Sub: a - b, ast.Mult: a * b}.get(type(node.op), a // b if b else None)
+            return None
+
+        def trip_count(loop):
+            it = loop.iter
+            if not (isinstance(it, ast.Call) and isinstance(it.func, ast.Name) and it.func.id == "range"
+                    and 1 <= len(it.args) <= 3 and isinstance(loop.target, ast.Name)):
+                return None, fallback, False
+            args = [value(a) for a in it.args]
+            if None in args:
+                return loop.target.id, fallback, False
+            start, stop, step = (0, args[0], 1) if len(args) == 1 else (args[0], args[1], args[2] if len(args) == 3 else 1)
+            return loop.target.id, len(range(start, stop, step)), True
+
+        def nest_cost(loop):
+            trips, arrays = {}, {}
+            totals = {'flops': 0, 'exact': True}
+
+            def access(node, written, read):
+                levels, cur = [], node
+                while isinstance(cur, ast.Subscript):
+                    levels.insert(0, cur.slice)
+                    cur = cur.value
+                if isinstance(cur, ast.Name):
+                    entry = arrays.setdefault(cur.id, {'patterns': set(), 'written': False, 'read': False})
+                    entry['patterns'].add(tuple(
+                        (tuple(sorted({n.id for n in ast.walk(index) if isinstance(n, ast.Name)})),
+                         any(isinstance(n, ast.Mult) for n in ast.walk(index)))
+                        for index in levels))
+                    entry['written'] |= written
+                    entry['read'] |= read
+
+            def walk(node, mult):
+                if isinstance(node, ast.For):
+                    var, trip, known = trip_count(node)
+                    totals['exact'] &= known
+                    if var is not None:
+                        trips[var] = max(trips.get(var, 0), trip)
+                    for stmt in node.body:
+                        walk(stmt, mult * trip)
+                    return
+                if isinstance(node, (ast.Assign, ast.AugAssign)):
+                    targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                    if isinstance(node, ast.AugAssign) and isinstance(node.op, (ast.Add, ast.Sub, ast.Mult, ast.Div)):
+                        totals['flops'] += mult
+                    for target in targets:
+                        if isinstance(target, ast.Subscript):
+                            access(target, written=True, read=isinstance(node, ast.AugAssign))
+                    return walk(node.value, mult)
+                if isinstance(node, ast.Subscript):
+                    # index arithmetic is addressing, not floating-point work
+                    return access(node, written=False, read=True)
+                if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow)):
+                    totals['flops'] += mult
+                for ch in ast.iter_child_nodes(node):
+                    walk(ch, mult)
+
+            walk(loop, 1)
+
+            def extent(names, multiplied):
+                spans = [trips[n] for n in names if n in trips]
+                if not spans:
+                    return 1
+                return math.prod(spans) if multiplied else sum(spans) - len(spans) + 1
+
+            total_bytes = sum(
+                sum(math.prod(extent(*p) for p in pattern) for pattern in e['patterns'])
+                * 4 * (2 if e['written'] and e['read'] else 1)
+                for e in arrays.values()
+            )
+            return {'line': loop.lineno, 'trip_counts': trips, 'exact': totals['exact'],
+                    'flops': totals['flops'], 'bytes': total_bytes}
+
+        functions = [n for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)]
+        kernels = [f for f in functions if f.name != "main"] or functions or [tree]
+        nests = []
+
+        def search(node, fn_name):
+            for ch in ast.iter_child_nodes(node):
+                if isinstance(ch, ast.For):
+                    nests.append({**nest_cost(ch), 'function': fn_name})
+                elif not isinstance(ch, ast.FunctionDef):
+                    search(ch, fn_name)
+
+        for fn in kernels:
+            search(fn, getattr(fn, "name", None))
+        return nests
+
+
+def loop_nest_totals(loop_nests: List[Dict]) -> Dict:
+    """flops, bytes_moved and arithmetic_intensity (flops per byte) summed over loop nests."""
+    flops = sum(n['flops'] for n in loop_nests)
+    bytes_moved = sum(n['bytes'] for n in loop_nests)
+    return {
+        'flops': flops,
+        'bytes_moved': bytes_moved,
+        'arithmetic_intensity': round(flops / bytes_moved, 4) if bytes_moved else 0.0,
+    }
+
+
+_shared_parser = None
+_parser_lock = threading.Lock()
+# libclang Index objects are not safe for concurrent parses from several threads
+_parse_lock = threading.Lock()
+
+
+def get_parser() -> ASTParser:
+    """One ASTParser (and libclang Index) per process instead of one per call."""
+    global _shared_parser
+    with _parser_lock:
+        if _shared_parser is None:
+            _shared_parser = ASTParser()
+        return _shared_parser
+
+
+def parse_and_detect(path, include_paths: Optional[List[str]] = None, use_cache: bool = True):
+    """
+    Analyze a source file, serving unchanged sources from the analysis cache
+    (in-memory first, then the on-disk store shared across processes).
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+
+    parser = get_parser()
+    if not use_cache:
+        with _parse_lock:
+            return parser.parse_file(path, include_paths)
+
+    cache = get_analysis_cache()
+    args = [] if path.lower().endswith(".py") else parser.clang_args(include_paths)
+    key = cache.key(path, args)
+    result = cache.get(key)
+    if result is not None:
+        log.info(f"Analysis cache hit for {path}")
+        return result
+
+    with _parse_lock:
+        result = parser.parse_file(path, include_paths)
+    cache.put(key, result)
+    return result
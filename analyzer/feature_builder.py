@@ -1,15 +1,50 @@
-import numpy as np
+# Column order of the feature dict; batch inference builds frames in this order.
+FEATURE_COLUMNS = [
+    "operation_type",
+    "log_size",
+    "cpu_load_pct",
+    "gpu_load_pct",
+    "gpu_temp_C",
+    "gpu_mem_pressure",
+    "is_battery_powered",
+]
+# Work per kernel from the analyzer's loop nests (ASTParser), optional model inputs:
+# models trained with them (python -m model.train --cost-features) list them in their schema.
+COST_COLUMNS = [
+    "flops",
+    "bytes_moved",
+    "arithmetic_intensity",
+]
+# log10(cpu_ms / gpu_total_ms) of the roofline estimate (model/roofline.py) for the
+# target device, added by main.decide(); an optional input (model.train --roofline-feature).
+ROOFLINE_COLUMNS = [
+    "roofline_log_speedup",
+]
 
-def build_feature_dict(operation_type: str, log_size: float, sys_state: dict) -> dict:
+
+# analyzer operation names -> the benchmark datasets' (and so the model's) operation_type categories
+OPERATION_ALIASES = {
+    "reduce": "reduce_sum",
+}
+
+
+def model_operation_type(operation_type: str) -> str:
+    return OPERATION_ALIASES.get(operation_type, operation_type)
+
+
+def build_feature_dict(operation_type: str, log_size: float, sys_state: dict, analysis: dict = None) -> dict:
     """
     Build a clean feature dictionary for the model.
-    - operation_type: str (e.g., 'matmul', 'conv2d', 'fft', 'elementwise', 'reduce', 'sort', etc.)
+    - operation_type: str (e.g., 'matmul', 'conv2d', 'fft', 'elementwise', 'reduce', 'sort', etc.),
+      stored under the model's name for it (model_operation_type)
     - log_size: float (log10 of total elements or bytes)
     - sys_state: dict returned from collector.sys_state.get_system_state()
+    - analysis: parse_and_detect() result, for flops / bytes_moved / arithmetic_intensity
     """
+    analysis = analysis or {}
 
     return {
-        "operation_type": operation_type,
+        "operation_type": model_operation_type(operation_type),
         "log_size": log_size,
 
         "cpu_load_pct": sys_state.get("cpu_load_pct", 0.0),
@@ -19,6 +54,8 @@ def build_feature_dict(operation_type: str, log_size: float, sys_state: dict) ->
         "gpu_mem_pressure": sys_state.get("gpu_mem_pressure", 0.0),
 
         "is_battery_powered": sys_state.get("is_battery_powered", 0),
+
+        **{c: analysis.get(c) for c in COST_COLUMNS},
     }
 
 
@@ -0,0 +1,109 @@
+"""
+Cold-start benchmark for the HybridFlow CLI.
+
+Runs each scenario in a fresh interpreter several times and reports the
+median wall time and peak RSS, so import-time regressions (e.g. a module
+pulling torch or unpickling the model at import) show up as numbers.
+
+    python benchmarks/bench_startup.py                       # print results
+    python benchmarks/bench_startup.py --save baseline.json  # record a baseline
+    python benchmarks/bench_startup.py --baseline baseline.json --tolerance 20
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    # importing the CLI must not load torch, the model, or libclang
+    "import_main": "import main",
+    # full analysis + prediction of a Python kernel: no libclang involved
+    "decide_python": "import main; main.decide('examples/matmul_example.py')",
+    # same for a C kernel: libclang loaded on demand
+    "decide_c": "import main; main.decide('examples/matmul_example.c')",
+}
+
+
+def run_once(code):
+    """Wall time (ms) and peak RSS (MB) of one fresh interpreter running `code`."""
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    _, status, rusage = os.wait4(proc.pid, 0)
+    wall_ms = (time.perf_counter() - t0) * 1000
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is KiB on Linux
+    return wall_ms, rusage.ru_maxrss / 1024, proc.returncode
+
+
+def bench(scenarios, repeats):
+    results = {}
+    for name in scenarios:
+        code = SCENARIOS[name]
+        run_once(code)  # warm the OS page cache, not the interpreter
+        walls, rss, failed = [], [], 0
+        for _ in range(repeats):
+            w, r, rc = run_once(code)
+            if rc != 0:
+                failed += 1
+                continue
+            walls.append(w)
+            rss.append(r)
+        results[name] = {
+            "wall_ms_median": round(statistics.median(walls), 1) if walls else None,
+            "wall_ms_min": round(min(walls), 1) if walls else None,
+            "rss_mb_max": round(max(rss), 1) if rss else None,
+            "runs": len(walls),
+            "failed": failed,
+        }
+    return results
+
+
+def compare(results, baseline, tolerance_pct):
+    """Names of scenarios whose median wall time or RSS grew beyond the tolerance."""
+    regressions = []
+    for name, cur in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric in ("wall_ms_median", "rss_mb_max"):
+            if cur[metric] is None or base.get(metric) is None:
+                continue
+            limit = base[metric] * (1 + tolerance_pct / 100.0)
+            if cur[metric] > limit:
+                regressions.append(f"{name}.{metric}: {cur[metric]} > {base[metric]} (+{tolerance_pct}%)")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HybridFlow cold-start benchmark")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="run only these scenarios (default: all)")
+    parser.add_argument("--save", help="write results as a baseline JSON file")
+    parser.add_argument("--baseline", help="compare against a baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=20.0, help="allowed regression in percent")
+    args = parser.parse_args()
+
+    results = bench(args.scenario or list(SCENARIOS), args.repeats)
+    print(json.dumps(results, indent=2))
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for r in regressions:
+            print("REGRESSION", r)
+        sys.exit(1 if regressions else 0)
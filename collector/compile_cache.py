@@ -0,0 +1,212 @@
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import tempfile
+import threading
+from utils.hashing import file_digest, include_dirs, local_headers
+from utils.paths import CACHE_DIR
+
+log = logging.getLogger("compile_cache")
+log.setLevel(logging.INFO)
+
+DEFAULT_MAX_BYTES = int(os.environ.get("HYBRIDFLOW_COMPILE_CACHE_MB", "512")) * 1024 * 1024
+CACHE_DISABLED = os.environ.get("HYBRIDFLOW_NO_COMPILE_CACHE", "0") == "1"
+
+SOURCE_EXTS = (".c", ".cc", ".cpp", ".cxx", ".cu")
+
+_compiler_versions = {}
+_versions_lock = threading.Lock()
+
+
+def compiler_version(compiler: str) -> str:
+    """
+    Output of `<compiler> --version`, memoized per process.
+    System headers (<...>) are covered by this, since they ship with the toolchain.
+    """
+    with _versions_lock:
+        if compiler in _compiler_versions:
+            return _compiler_versions[compiler]
+    try:
+        out = subprocess.run([compiler, "--version"], capture_output=True, text=True, check=True).stdout
+        version = out.strip() or "unknown"
+    except (OSError, subprocess.CalledProcessError):
+        version = "unknown"
+    with _versions_lock:
+        _compiler_versions[compiler] = version
+    return version
+
+
+def split_command(cmd):
+    """
+    Split a gcc/nvcc command line into (compiler, sources, flags, output).
+    The output path is removed from flags so the same build with a different
+    `-o` target maps to the same cache entry.
+    """
+    compiler = cmd[0]
+    sources, flags, output = [], [], "a.out"
+    args = list(cmd[1:])
+    i = 0
+    while i < len(args):
+        a = args[i]
+        if a == "-o" and i + 1 < len(args):
+            output = args[i + 1]
+            i += 2
+            continue
+        if a.lower().endswith(SOURCE_EXTS) and os.path.isfile(a):
+            sources.append(a)
+        else:
+            flags.append(a)
+        i += 1
+    return compiler, sources, flags, output
+
+
+class CompileCache:
+    """
+    Content-addressed on-disk cache of compiled binaries.
+
+    Entries are keyed by the hash of every source, every locally included
+    header, the compiler version, the flags and the target device. A hit
+    returns the cached binary without invoking the compiler. The cache is
+    bounded by total size and evicts least-recently-used entries (hits
+    refresh the entry's mtime).
+    """
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = None):
+        self.cache_dir = os.path.join(cache_dir or CACHE_DIR, "bin")
+        self.max_bytes = DEFAULT_MAX_BYTES if max_bytes is None else max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def key(self, cmd, device: str = "cpu") -> str:
+        compiler, sources, flags, output = split_command(cmd)
+        headers = set()
+        for src in sources:
+            local_headers(src, include_dirs(flags), headers)
+
+        payload = {
+            "compiler": compiler,
+            "compiler_version": compiler_version(compiler),
+            "device": device,
+            "flags": flags,
+            "sources": [file_digest(s) for s in sources],
+            "headers": sorted(file_digest(h) for h in headers),
+            "output_ext": os.path.splitext(output)[1],
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def _entry_path(self, key: str, output: str) -> str:
+        return os.path.join(self.cache_dir, key + os.path.splitext(output)[1])
+
+    def lookup(self, cmd, device: str = "cpu"):
+        """Return the cached binary for this build, or None."""
+        _, _, _, output = split_command(cmd)
+        path = self._entry_path(self.key(cmd, device), output)
+        if os.path.exists(path):
+            try:
+                os.utime(path, None)
+            except OSError:
+                pass
+            return path
+        return None
+
+    def compile(self, cmd, device: str = "cpu") -> str:
+        """
+        Build `cmd` through the cache and return the path of the binary.
+        Raises subprocess.CalledProcessError if the compiler fails.
+        """
+        compiler, _, _, output = split_command(cmd)
+        key = self.key(cmd, device)
+        path = self._entry_path(key, output)
+
+        if os.path.exists(path):
+            self.hits += 1
+            try:
+                os.utime(path, None)
+            except OSError:
+                pass
+            log.info(f"Compile cache hit ({device}): {key[:12]}")
+            return path
+
+        self.misses += 1
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".build-", suffix=os.path.splitext(output)[1])
+        os.close(fd)
+        build = [tmp if i > 0 and cmd[i - 1] == "-o" else a for i, a in enumerate(cmd)]
+        if "-o" not in cmd:
+            build += ["-o", tmp]
+        try:
+            subprocess.run(build, check=True)
+            os.chmod(tmp, 0o755)
+            # atomic publish, safe when several processes build the same key
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+        log.info(f"Compile cache miss ({device}): {key[:12]} built with {os.path.basename(compiler)}")
+        self.evict(keep=path)
+        return path
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(".build-"):
+                continue
+            p = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(p)
+            except OSError:
+                continue
+            entries.append((p, st.st_size, st.st_mtime))
+        return entries
+
+    def evict(self, keep: str = None):
+        """Drop least-recently-used binaries until the cache fits in max_bytes."""
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        for p, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if p == keep:
+                continue
+            try:
+                os.unlink(p)
+                total -= size
+                log.info(f"Compile cache evicted {os.path.basename(p)[:12]} ({size} bytes)")
+            except OSError:
+                pass
+
+    def clear(self):
+        for p, _, _ in self._entries():
+            try:
+                os.unlink(p)
+            except OSError:
+                pass
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_compile_cache() -> CompileCache:
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = CompileCache()
+        return _default_cache
+
+
+def compile_cached(cmd, device: str = "cpu") -> str:
+    """
+    Compile through the shared cache and return the binary path.
+    With HYBRIDFLOW_NO_COMPILE_CACHE=1 the command runs as-is and its `-o` target is returned.
+    """
+    if CACHE_DISABLED:
+        subprocess.run(cmd, check=True)
+        return os.path.abspath(split_command(cmd)[3])
+    return get_compile_cache().compile(cmd, device=device)
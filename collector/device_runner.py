@@ -1,123 +1,491 @@
 import subprocess
 import tempfile
 import os
+import re
+import json
+import math
+import hashlib
+import statistics
 import logging
-from analyzer.ast_parser import parse_and_detect
+from analyzer.ast_parser import HARNESS_INT_ARG, parse_and_detect
+from collector.compile_cache import compile_cached
+from utils.paths import cache_subdir
+from utils.dataset_modules import load_dataset_module
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 log = logging.getLogger("device_runner")
 log.setLevel(logging.INFO)
 
+CPU_COMPILER = "/usr/bin/gcc"
+GPU_COMPILER = "nvcc"
+CPU_FLAGS = ["-O3", "-march=native", "-funroll-loops", "-ffast-math"]
+GPU_FLAGS = ["-O3", "-use_fast_math"]
+OPENMP_FLAGS = ["-fopenmp"]
 
-def compile_and_run(cmd_compile, exe_path="./a.out"):
-    try:
-        subprocess.run(cmd_compile, check=True)
+# Same defaults as Dataset/collector/timing.time_cpu
+HARNESS_WARMUP = 3
+HARNESS_REPS = 9
+HARNESS_MARKER = "HYBRIDFLOW_TIMING "
+# "exe": spawn a compiled harness; "inproc": call the kernel through ctypes (see inproc_runner)
+DEFAULT_BACKEND = os.environ.get("HYBRIDFLOW_BACKEND", "exe")
+
+
+def cuda_source_for(source_file: str):
+    """The .cu variant of a kernel, or None if there is none."""
+    if source_file.endswith(".cu"):
+        return source_file
+    cu_file = os.path.splitext(source_file)[0] + ".cu"
+    return cu_file if os.path.exists(cu_file) else None
+
+
+def threads_module():
+    """Dataset/collector/threads.py: thread-count choice and cpu-parallel(N) target names."""
+    return load_dataset_module("collector/threads.py")
+
+
+def openmp_source(source_file: str, metadata: dict):
+    """
+    Copy of a C source with `#pragma omp parallel for` in front of every loop
+    the parser proved parallel (see ASTParser._parallel_loop_info), stored
+    content-addressed in the cache. #line directives keep diagnostics on the
+    original lines. None if the source has no parallel loop.
+    """
+    loops = {l["line"]: l for l in metadata.get("raw_analysis", {}).get("parallel_loops", [])}
+    if not loops:
+        return None
+    with open(source_file, encoding="utf-8") as f:
+        lines = f.read().splitlines(keepends=True)
+
+    origin = json.dumps(os.path.abspath(source_file))
+    out = []
+    for n, text in enumerate(lines, 1):
+        loop = loops.get(n)
+        if loop is None:
+            out.append(text)
+            continue
+        clause = f" reduction(+:{','.join(loop['reductions'])})" if loop["reductions"] else ""
+        col = loop["column"] - 1
+        head, tail = text[:col], text[col:]
+        if head.strip():
+            out.append(head + "\n")
+        out.append(f"#pragma omp parallel for{clause}\n#line {n} {origin}\n{' ' * col}{tail}")
+    content = "".join(out)
+
+    digest = hashlib.sha256(content.encode()).hexdigest()[:16]
+    path = os.path.join(cache_subdir("openmp"), f"{digest}_{os.path.basename(source_file)}")
+    if not os.path.exists(path):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp, path)
+    return path
+
+
+def build_command(source_file: str, device: str, cpu_flags=None, metadata: dict = None):
+    """
+    Compiler command for one device variant of a C/C++/CUDA source, as
+    (cmd, device). A GPU request without a .cu file falls back to the CPU build.
+    "cpu-parallel" builds the OpenMP-annotated copy with -fopenmp (plain CPU
+    build if no loop is parallel).
+    When metadata says the source has no main, the CPU build compiles a
+    generated timing harness instead; cmd is None if no harness can be generated.
+    """
+    if device == "gpu":
+        cu_file = cuda_source_for(source_file)
+        if cu_file:
+            return [GPU_COMPILER, cu_file] + GPU_FLAGS + ["-o", "a.out"], "gpu"
+    flags = CPU_FLAGS if cpu_flags is None else list(cpu_flags)
+    if device == "cpu-parallel":
+        parallel_src = openmp_source(source_file, metadata or parse_and_detect(source_file))
+        if parallel_src is None:
+            log.info(f"No parallel loop in {source_file}; building single-threaded")
+        else:
+            # quoted includes still resolve against the original directory
+            flags = flags + OPENMP_FLAGS + ["-I", os.path.dirname(os.path.abspath(source_file))]
+            source_file = parallel_src
+    if metadata is not None and not metadata.get("has_main", False):
+        harness = write_harness(source_file, metadata)
+        if harness is None:
+            return None, "cpu"
+        return [CPU_COMPILER, harness] + flags + ["-o", "a.out", "-lm"], "cpu"
+    return [CPU_COMPILER, source_file] + flags + ["-o", "a.out"], "cpu"
+
+
+def precompile(source_file: str, devices=("cpu", "gpu"), cpu_flag_sets: dict = None, max_workers: int = None,
+               metadata: dict = None):
+    """
+    Compile every requested variant concurrently into the compile cache.
+
+    - devices: device variants to build with the default flags
+    - cpu_flag_sets: optional {name: flags} of extra CPU builds to produce
+    Returns {variant: binary path or None}. Nothing is executed here, so the
+    timed runs that follow (serially) just hit the cache.
+    """
+    if source_file.endswith(".py"):
+        return {}
+
+    builds = {}
+    for device in devices:
+        builds[device] = build_command(source_file, threads_module().parse_target(device)[0], metadata=metadata)
+    for name, flags in (cpu_flag_sets or {}).items():
+        builds[name] = build_command(source_file, "cpu", cpu_flags=flags, metadata=metadata)
+    builds = {name: b for name, b in builds.items() if b[0] is not None}
+
+    # a GPU request without a .cu file resolves to the CPU build; compile it once
+    unique = {}
+    for cmd, device in builds.values():
+        unique.setdefault((tuple(cmd), device), None)
+
+    def _build(job):
+        cmd, device = job
+        try:
+            return job, compile_cached(list(cmd), device=device)
+        except (subprocess.CalledProcessError, OSError) as e:
+            log.error(f"Compilation failed ({device}): {e}")
+            return job, None
+
+    workers = max_workers or min(len(unique), os.cpu_count() or 1) or 1
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        built = dict(pool.map(_build, unique))
+    log.info(f"Compiled {len(unique)} variant(s) of {source_file} in {(time.perf_counter() - t0) * 1000:.1f} ms")
+    return {name: built[(tuple(cmd), device)] for name, (cmd, device) in builds.items()}
+
+
+def summarize_times(samples_ms, warmup=0, timer="wall"):
+    """
+    Median, percentiles and a 95% confidence interval of the median
+    (distribution-free, from order statistics) for a list of timings in ms.
+    """
+    t = sorted(samples_ms)
+    n = len(t)
+
+    def pct(q):
+        return t[min(n - 1, max(0, int(math.ceil(q / 100.0 * n)) - 1))]
+
+    half = 1.96 * math.sqrt(n) / 2.0
+    lo = max(0, int(math.floor(n / 2.0 - half)) - 1)
+    hi = min(n - 1, int(math.ceil(n / 2.0 + half)) - 1)
+    return {
+        "timer": timer,
+        "warmup": warmup,
+        "reps": n,
+        "median_ms": statistics.median(t),
+        "mean_ms": statistics.fmean(t),
+        "min_ms": t[0],
+        "max_ms": t[-1],
+        "p05_ms": pct(5),
+        "p95_ms": pct(95),
+        "ci95_low_ms": t[lo],
+        "ci95_high_ms": t[hi],
+        "samples_ms": t,
+    }
+
+
+def parse_harness_output(stdout: str):
+    """Timing JSON emitted by a generated harness, or None."""
+    for line in reversed(stdout.splitlines()):
+        if line.startswith(HARNESS_MARKER):
+            return json.loads(line[len(HARNESS_MARKER):])
+    return None
+
+
+def run_binary(exe_path, harness=False, warmup=HARNESS_WARMUP, reps=HARNESS_REPS, env=None):
+    """
+    Execute a compiled kernel and return timing stats.
+
+    A generated harness times only the kernel call in-process with
+    clock_gettime and reports its own stats. Binaries with their own main
+    can only be timed from outside (fork/exec included), once per rep.
+    """
+    if harness:
+        proc = subprocess.run([exe_path, str(warmup), str(reps)], check=True, capture_output=True, text=True, env=env)
+        stats = parse_harness_output(proc.stdout)
+        for line in proc.stdout.splitlines():
+            if not line.startswith(HARNESS_MARKER):
+                print(line)
+        if stats is None:
+            raise RuntimeError("harness produced no timing output")
+        return stats
+
+    samples = []
+    for i in range(warmup + reps):
         t0 = time.perf_counter()
-        subprocess.run([exe_path], check=True)
+        subprocess.run([exe_path], check=True, env=env)
         t1 = time.perf_counter()
-        exec_time_ms = (t1 - t0) * 1000
-        # print(f"Execution time: {exec_time_ms:.2f} ms")
-        return exec_time_ms
-    except subprocess.CalledProcessError as e:
+        if i >= warmup:
+            samples.append((t1 - t0) * 1000)
+    return summarize_times(samples, warmup=warmup, timer="wall")
+
+
+def compile_and_run(cmd_compile, device="cpu", harness=False, warmup=0, reps=1, env=None):
+    """
+    Build through the content-addressed compile cache (a hit skips the
+    compiler entirely) and time the resulting binary (env: e.g. OMP_NUM_THREADS).
+    Returns the stats dict from run_binary, or False on failure.
+    """
+    try:
+        exe_path = compile_cached(cmd_compile, device=device)
+        stats = run_binary(exe_path, harness=harness, warmup=warmup, reps=reps, env=env)
+        log.info(
+            f"{device.upper()} {stats['timer']} timing: median={stats['median_ms']:.4f} ms "
+            f"p95={stats['p95_ms']:.4f} ms CI95=[{stats['ci95_low_ms']:.4f}, {stats['ci95_high_ms']:.4f}] "
+            f"(n={stats['reps']})"
+        )
+        return stats
+    except (subprocess.CalledProcessError, RuntimeError, ValueError) as e:
         log.error(f"Execution failed: {e}")
         return False
 
 
-def run_on_device(source_file: str, device: str, extra_info: dict = None):
+def run_on_device(source_file: str, device: str, extra_info: dict = None, cpu_flags=None,
+                  warmup: int = HARNESS_WARMUP, reps: int = HARNESS_REPS, return_stats: bool = False,
+                  backend: str = None, inputs: dict = None):
     """
-    device: "cpu" or "gpu"
+    device: "cpu", "gpu", "cpu-parallel(N)" (OpenMP build on N threads) or
+            "cpu-vectorized" (Python kernels with NumPy-rewritten loops)
     extra_info: parsed metadata from AST (operation_type, primary_function_name, params, has_main)
+    cpu_flags: optional CPU flag set overriding CPU_FLAGS
+    warmup/reps: kernel calls inside the generated harness (sources without main),
+                 whole-process runs for binaries with their own main and CUDA builds
+    backend: "exe" or "inproc" for CPU sources without main (default: HYBRIDFLOW_BACKEND)
+    inputs: {param name: numpy array} for the inproc backend
+    Returns the median execution time in ms (the full stats dict with
+    return_stats=True), or False on failure.
     """
     metadata = extra_info or parse_and_detect(source_file)
     has_main = metadata.get("has_main", False)
 
+    def _result(stats):
+        if not stats:
+            return False
+        return stats if return_stats else stats["median_ms"]
+
     if source_file.endswith(".py"):
-        log.info(f"Python file detected. Predicted device={device}. Running with python3.")
         cmd = ["python3", source_file]
+        if device == "cpu-vectorized":
+            from collector.vectorizer import vectorize_file, python_command
+            vectorized, _ = vectorize_file(source_file)
+            if vectorized:
+                cmd = python_command(source_file, vectorized)
+            else:
+                log.info("No vectorizable loop nest found; running the original source.")
+        log.info(f"Python file detected. Predicted device={device}. Running with python3.")
         t0 = time.perf_counter()
         try:
             subprocess.run(cmd, check=True)
             t1 = time.perf_counter()
             exec_time_ms = (t1 - t0) * 1000
             print(f"Execution time: {exec_time_ms:.2f} ms")
-            return exec_time_ms
+            return _result(summarize_times([exec_time_ms]))
             
         except subprocess.CalledProcessError as e:
             log.error(f"Python execution failed: {e}")
             return False
 
-    if device == "gpu":
-        cu_file = source_file.replace(".c", ".cu")
-        if os.path.exists(cu_file):
-            
-            # cmd = ["nvcc", cu_file, "-o", "a.out"]
-            cmd = ["nvcc", cu_file, "-O3","-use_fast_math","-o","a.out"]
+    device, threads = threads_module().parse_target(device)
+    env = dict(os.environ, OMP_NUM_THREADS=str(threads)) if device == "cpu-parallel" else None
 
+    if device == "gpu":
+        if cuda_source_for(source_file):
+            cmd, _ = build_command(source_file, "gpu")
             log.info(f"Compiling (GPU) with: {' '.join(cmd)}")
-            return compile_and_run(cmd)
+            return _result(compile_and_run(cmd, device="gpu", warmup=warmup, reps=reps))
         else:
             log.warning(f"GPU predicted but no CUDA file found for {source_file}. Falling back to CPU.")
             device = "cpu"
 
     if has_main:
-       # cmd = ["/usr/bin/gcc", source_file, "-O3", "-o", "a.out"]
-        cmd = ["/usr/bin/gcc", source_file, "-O3","-march=native","-funroll-loops","-ffast-math","-o","a.out"]
+        cmd, _ = build_command(source_file, device, cpu_flags=cpu_flags, metadata=metadata)
 
         log.info(f"Compiling (CPU) with: {' '.join(cmd)}")
-        ok = compile_and_run(cmd)
+        ok = compile_and_run(cmd, device="cpu", warmup=warmup, reps=reps, env=env)
         if not ok:
             log.error("Failed to compile/run with main present.")
-        return ok
-    else:
-        fn = metadata.get("primary_function_name")
-        params = metadata.get("primary_function_params", [])
-        log.info(f"No main found. Generating generic wrapper for fn={fn} params={params}")
+        return _result(ok)
 
-        wrapper_code = generate_generic_wrapper(fn, params)
-        if wrapper_code is None:
-            log.error("Could not generate wrapper. Please provide a main in source.")
-            return False
+    if (backend or DEFAULT_BACKEND) == "inproc" and device == "cpu":
+        from collector.inproc_runner import run_in_process
+        try:
+            stats = run_in_process(source_file, metadata, inputs=inputs, cpu_flags=cpu_flags, warmup=warmup, reps=reps)
+            log.info(f"CPU in-process timing: median={stats['median_ms']:.4f} ms (n={stats['reps']})")
+            return _result(stats)
+        except (OSError, TypeError, ValueError, AttributeError, subprocess.CalledProcessError) as e:
+            log.warning(f"In-process backend unavailable ({e}); using the executable harness")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".c", delete=False) as wf:
-            wf.write(wrapper_code)
-            wrapper_path = wf.name
+    fn = metadata.get("primary_function_name")
+    log.info(f"No main found. Generating timing harness for fn={fn} params={metadata.get('primary_function_params', [])}")
+    cmd, _ = build_command(source_file, device, cpu_flags=cpu_flags, metadata=metadata)
+    if cmd is None:
+        log.error("Could not generate wrapper. Please provide a main in source.")
+        return False
 
-       # cmd = ["/usr/bin/gcc", source_file, wrapper_path, "-O3", "-o", "a.out"]
-        cmd = ["/usr/bin/gcc", source_file, "-O3","-march=native","-funroll-loops","-ffast-math","-o","a.out"]
-        log.info(f"Compiling wrapper (CPU) with: {' '.join(cmd)}")
-        ok = compile_and_run(cmd)
+    log.info(f"Compiling harness (CPU) with: {' '.join(cmd)}")
+    return _result(compile_and_run(cmd, device="cpu", harness=True, warmup=warmup, reps=reps, env=env))
 
-        try:
-            os.unlink(wrapper_path)
-        except Exception:
-            pass
-        
-    return compile_and_run(cmd)
-    
-def run_on_other_device(source_file, decision, analysis, pred_time):
-    other_device = "gpu" if decision == "cpu" else "cpu"
+def execution_target(source_file: str, decision: str, analysis: dict = None, sys_state: dict = None) -> str:
+    """
+    Refine the model's device decision into an execution target:
+    - CPU Python kernels with recognized loop nests run "cpu-vectorized"
+    - CPU C kernels with parallel loops run "cpu-parallel(N)", N chosen from
+      the current CPU load and the cores available to this process
+    """
+    if decision != "cpu":
+        return decision
+    if source_file.endswith(".py"):
+        from collector.vectorizer import is_vectorizable
+        return "cpu-vectorized" if is_vectorizable(source_file) else decision
+    if analysis and analysis.get("raw_analysis", {}).get("parallel_loops"):
+        threads = threads_module()
+        n = threads.choose_thread_count((sys_state or {}).get("cpu_load_pct", 0.0))
+        return threads.target_name(n)
+    return decision
+
+
+def _repeated(stats) -> bool:
+    """An in-binary timing, or whole-process wall times with warmup runs and several reps: not one cold start."""
+    if not stats:
+        return False
+    return stats["timer"] != "wall" or (stats.get("warmup", 0) > 0 and stats.get("reps", 1) > 1)
+
+
+def run_on_other_device(source_file, decision, analysis, pred_time, features=None):
+    """
+    Run on the device not chosen and print how the decision compares. With
+    the decision's feature dict, a genuine CPU-vs-GPU pair is also recorded
+    as a feedback observation for online training (model.feedback), provided
+    both sides were timed the same way and neither is one cold process run
+    (see _repeated). pred_time is the decided device's median ms or, to name
+    its timer, its run_on_device(return_stats=True) dict.
+    """
+    pred_stats = pred_time if isinstance(pred_time, dict) else None
+    pred_timer = pred_stats["timer"] if pred_stats else None
+    pred_time = pred_stats["median_ms"] if pred_stats else pred_time
+    other_device = "gpu" if decision.startswith("cpu") else "cpu"
     print(f"\n--- Running {source_file} on {other_device.upper()} for comparison ---")
-    start = time.perf_counter()
-    success = run_on_device(source_file, other_device, extra_info=analysis)
-    end = time.perf_counter()
-    other_time = (end - start) * 1000 if success else None
+    # compare like with like: the execution time reported by run_on_device, not wall time around build + run
+    stats = run_on_device(source_file, other_device, extra_info=analysis, return_stats=True)
+    other_time = stats["median_ms"] if stats else None
     if other_time:
         print(f"{other_device.upper()} execution time: {other_time:.2f} ms")
+        # .py kernels and sources without a .cu variant never reach the GPU, so they are no evidence
+        if features and pred_time and cuda_source_for(source_file) and not source_file.endswith(".py"):
+            cpu_timer, gpu_timer = (stats["timer"], pred_timer) if decision == "gpu" else (pred_timer, stats["timer"])
+            if cpu_timer is not None and cpu_timer == gpu_timer and _repeated(pred_stats) and _repeated(stats):
+                from model.feedback import record_observation
+                cpu_ms, gpu_ms = (other_time, pred_time) if decision == "gpu" else (pred_time, other_time)
+                record_observation(features, cpu_ms, gpu_ms, source_file=source_file,
+                                   cpu_target="cpu" if decision == "gpu" else decision,
+                                   cpu_timer=cpu_timer, gpu_timer=gpu_timer)
+            else:
+                log.info(f"No feedback recorded: CPU timed by {cpu_timer}, GPU by {gpu_timer} "
+                         f"(both must match and be warmed-up repeated measurements)")
         if pred_time and other_time:
             diff = other_time - pred_time
             percent = (diff / other_time) * 100
             faster = "faster" if percent > 0 else "slower"
             print(f"\nDifference: {abs(diff):.2f} ms")
             print(f"\nPredicted device was {abs(percent):.2f}% {faster} than the {other_device}.")
+            if pred_timer != stats["timer"]:
+                # e.g. an in-binary kernel median against whole-process wall time (start-up included)
+                print(f"Note: timed differently ({decision}: {pred_timer or 'unknown'} timer, "
+                      f"{other_device}: {stats['timer']} timer); not a like-for-like comparison.")
     else:
         print(f"{other_device.upper()} execution failed.")
         
-def generate_generic_wrapper(fn_name, params):
+_ARRAY_TYPE_RE = re.compile(r"^(?P<base>[^\[(]+?)\s*(?P<dims>(\[\d*\])+)$")
+_PTR_TO_ARRAY_RE = re.compile(r"^(?P<base>[^(]+?)\s*\(\*\)\s*(?P<dims>(\[\d+\])+)$")
+_INT_TYPES = ("int", "long", "short", "unsigned", "size_t", "char", "int32_t", "int64_t", "uint32_t", "uint64_t")
+
+
+def _clean_type(spelling: str) -> str:
+    t = re.sub(r"\b(const|volatile|restrict|__restrict|__restrict__)\b", " ", spelling)
+    return " ".join(t.split())
+
+
+def normalize_params(params, extents=None):
     """
-    Generate a generic wrapper main() for any function with known params.
+    Convert AST parameters [(name, type spelling), ...] into harness
+    parameters [(element type, name, dims)]; dims == [] marks a scalar.
+
+    Array and pointer parameters are sized from `extents` ({name: elements per
+    subscript position}, see ASTParser._param_extents): the declared extents,
+    with the outermost one grown until every index the kernel can reach is in
+    the buffer. Integer scalars are set to HARNESS_INT_ARG, the value the
+    extents assume. Entries already in (type, name, dims) form pass through.
+    Returns None if a parameter type cannot be materialized or the buffer size
+    of one the kernel indexes cannot be proven.
+    """
+    extents = extents or {}
+    out = []
+    for p in params:
+        if len(p) == 3:
+            out.append(tuple(p))
+            continue
+        name, spelling = p
+        t = _clean_type(spelling)
+        m = _ARRAY_TYPE_RE.match(t) or _PTR_TO_ARRAY_RE.match(t)
+        if m:
+            base = m.group("base").strip()
+            declared = [int(d) if d else None for d in re.findall(r"\[(\d*)\]", m.group("dims"))]
+            if _PTR_TO_ARRAY_RE.match(t):
+                declared = [None] + declared
+        elif t.endswith("*"):
+            base = t[:-1].strip()
+            if base.endswith("*"):
+                return None
+            base, declared = ("char" if base == "void" else base), [None]
+        else:
+            out.append((t, name, []))
+            continue
+        inner = declared[1:]
+        if None in inner:
+            return None
+        need = extents.get(name)
+        if need is None or (need and len(need) != len(declared)):
+            log.warning(f"Cannot prove how far {name} is indexed; refusing to size its buffer")
+            return None
+        # largest flat index reached, row-major over the declared inner extents
+        row = math.prod(inner)
+        strides = [math.prod(inner[k:]) for k in range(len(declared))]
+        elements = sum((n - 1) * stride for n, stride in zip(need, strides)) + 1 if need else 1
+        rows = max(declared[0] or 0, -(-elements // row), 1)
+        out.append((base, name, [rows] + inner))
+    return out
+
+
+def write_harness(source_file: str, metadata: dict):
+    """Generate the timing harness for a source without main; returns its path or None."""
+    fn = metadata.get("primary_function_name")
+    raw = metadata.get("raw_analysis", {})
+    params = normalize_params(metadata.get("primary_function_params", []),
+                              raw.get("param_extents", {}).get(fn))
+    if params is None:
+        return None
+    code = generate_generic_wrapper(fn, params, source_file=source_file)
+    if code is None:
+        return None
+    # content-addressed, so the compile cache sees identical harnesses as identical builds
+    path = os.path.join(cache_subdir("harness"), hashlib.sha256(code.encode()).hexdigest()[:32] + ".c")
+    if not os.path.exists(path):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".c", dir=os.path.dirname(path), delete=False) as wf:
+            wf.write(code)
+        os.replace(wf.name, path)
+    return path
+
+
+def generate_generic_wrapper(fn_name, params, source_file=None, default_n=HARNESS_INT_ARG):
+    """
+    Generate a timing harness main() for any function with known params.
     - fn_name: function name (string)
-    - params: list of (param_type, param_name, dimensions) extracted by AST
+    - params: list of (param_type, param_name, dimensions), see normalize_params
       Example: [("float", "A", [32,32]), ("float", "B", [32,32]), ("float", "C", [32,32])]
+    - source_file: included into the harness so the real prototype is used;
+      without it an extern void prototype is emitted
+    The binary takes [warmup] [reps] arguments, times each kernel call with
+    clock_gettime(CLOCK_MONOTONIC) and prints one HYBRIDFLOW_TIMING JSON line.
+    Buffer initialization happens before the timed region.
     """
     if not fn_name:
         return None
@@ -128,27 +496,83 @@ def generate_generic_wrapper(fn_name, params):
 
     for ptype, pname, dims in params:
         if not dims:  
-            decls.append(f"{ptype} {pname} = 1;")
+            is_int = any(k in ptype.split() for k in _INT_TYPES)
+            decls.append(f"{ptype} {pname} = {default_n if is_int else 1};")
             args.append(pname)
         else:  
             dim_str = "".join([f"[{d}]" for d in dims])
             decls.append(f"static {ptype} {pname}{dim_str};")
             idx = "][".join([f"i{d}" for d in range(len(dims))])
-            loops = "".join([f"for(int i{d}=0;i{d}<{dims[d]};i{d}++){{" for d in range(len(dims))])
+            loops = "".join([f"for(long i{d}=0;i{d}<{dims[d]};i{d}++){{" for d in range(len(dims))])
             close = "}" * len(dims)
             inits.append(f"""{loops} {pname}[{idx}] = 1; {close}""")
             args.append(pname)
 
-    wrapper = f"""
+    if source_file:
+        prototype = f'#include "{os.path.abspath(source_file)}"'
+    else:
+        prototype = f"extern void {fn_name}({', '.join([f'{ptype} {pname}' + ''.join([f'[{d}]' for d in dims]) for ptype, pname, dims in params])});"
+
+    call = f"{fn_name}({', '.join(args)});"
+    wrapper = f"""#define _POSIX_C_SOURCE 199309L
 #include <stdio.h>
 #include <stdlib.h>
-extern void {fn_name}({', '.join([f'{ptype} {pname}' + ''.join([f'[{d}]' for d in dims]) for ptype, pname, dims in params])});
+#include <math.h>
+#include <time.h>
+{prototype}
 
-int main() {{
+static double hf_now_ms(void) {{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec * 1e3 + ts.tv_nsec / 1e6;
+}}
+
+static int hf_cmp(const void *a, const void *b) {{
+    double x = *(const double *)a, y = *(const double *)b;
+    return (x > y) - (x < y);
+}}
+
+static double hf_pct(const double *t, int n, double q) {{
+    int i = (int)ceil(q / 100.0 * n) - 1;
+    return t[i < 0 ? 0 : (i >= n ? n - 1 : i)];
+}}
+
+int main(int argc, char **argv) {{
+    int warmup = argc > 1 ? atoi(argv[1]) : {HARNESS_WARMUP};
+    int reps = argc > 2 ? atoi(argv[2]) : {HARNESS_REPS};
+    if (reps < 1) reps = 1;
+    double *t = malloc(sizeof(double) * reps);
     {"".join(decls)}
     {"".join(inits)}
-    {fn_name}({", ".join(args)});
-    printf("wrapper: {fn_name} called\\n");
+    for (int w = 0; w < warmup; w++) {{
+        {call}
+        __asm__ __volatile__("" ::: "memory");
+    }}
+    for (int r = 0; r < reps; r++) {{
+        double t0 = hf_now_ms();
+        {call}
+        __asm__ __volatile__("" ::: "memory");
+        t[r] = hf_now_ms() - t0;
+    }}
+    qsort(t, reps, sizeof(double), hf_cmp);
+
+    double mean = 0;
+    for (int r = 0; r < reps; r++) mean += t[r];
+    mean /= reps;
+    double median = reps % 2 ? t[reps / 2] : 0.5 * (t[reps / 2 - 1] + t[reps / 2]);
+    double half = 1.96 * sqrt((double)reps) / 2.0;
+    int lo = (int)floor(reps / 2.0 - half) - 1, hi = (int)ceil(reps / 2.0 + half) - 1;
+    if (lo < 0) lo = 0;
+    if (hi > reps - 1) hi = reps - 1;
+
+    printf("{HARNESS_MARKER}{{\\"timer\\": \\"clock_gettime\\", \\"function\\": \\"{fn_name}\\", \\"warmup\\": %d, \\"reps\\": %d, "
+           "\\"median_ms\\": %.6f, \\"mean_ms\\": %.6f, \\"min_ms\\": %.6f, \\"max_ms\\": %.6f, "
+           "\\"p05_ms\\": %.6f, \\"p95_ms\\": %.6f, \\"ci95_low_ms\\": %.6f, \\"ci95_high_ms\\": %.6f, \\"samples_ms\\": [",
+           warmup, reps, median, mean, t[0], t[reps - 1],
+           hf_pct(t, reps, 5), hf_pct(t, reps, 95), t[lo], t[hi]);
+    for (int r = 0; r < reps; r++) printf("%s%.6f", r ? ", " : "", t[r]);
+    printf("]}}\\n");
+    free(t);
     return 0;
 }}
 """
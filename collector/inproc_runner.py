@@ -0,0 +1,153 @@
+"""
+In-process execution backend: the kernel is built as a shared library,
+loaded with ctypes and called directly, with NumPy buffers passed by pointer.
+
+A repeated invocation costs one foreign function call instead of a process
+spawn, and callers can hand in real input arrays. The kernel runs inside
+the calling process, so a crashing kernel takes that process down with it;
+the executable backend in device_runner stays the default for that reason.
+Buffers are sized from the analyzer's proven index ranges (normalize_params);
+when those cannot be proven, or caller inputs are smaller or change the
+integer arguments they assume, ValueError is raised before any call into the
+library and device_runner uses the executable backend instead.
+"""
+import ctypes
+import logging
+import threading
+import time
+from analyzer.ast_parser import HARNESS_INT_ARG
+from collector.compile_cache import compile_cached
+from collector.device_runner import CPU_COMPILER, CPU_FLAGS, HARNESS_WARMUP, HARNESS_REPS, normalize_params, summarize_times
+
+log = logging.getLogger("inproc_runner")
+log.setLevel(logging.INFO)
+
+# C element type -> (ctypes scalar type, numpy dtype name)
+C_TYPES = {
+    "float": (ctypes.c_float, "float32"),
+    "double": (ctypes.c_double, "float64"),
+    "char": (ctypes.c_byte, "int8"),
+    "signed char": (ctypes.c_byte, "int8"),
+    "unsigned char": (ctypes.c_ubyte, "uint8"),
+    "short": (ctypes.c_short, "int16"),
+    "unsigned short": (ctypes.c_ushort, "uint16"),
+    "int": (ctypes.c_int, "int32"),
+    "unsigned": (ctypes.c_uint, "uint32"),
+    "unsigned int": (ctypes.c_uint, "uint32"),
+    "long": (ctypes.c_long, "int64"),
+    "unsigned long": (ctypes.c_ulong, "uint64"),
+    "long long": (ctypes.c_longlong, "int64"),
+    "size_t": (ctypes.c_size_t, "uint64"),
+    "int32_t": (ctypes.c_int32, "int32"),
+    "int64_t": (ctypes.c_int64, "int64"),
+    "uint32_t": (ctypes.c_uint32, "uint32"),
+    "uint64_t": (ctypes.c_uint64, "uint64"),
+}
+
+_loaded = {}
+_loaded_lock = threading.Lock()
+
+
+def build_shared(source_file: str, cpu_flags=None) -> str:
+    """Compile the kernel with -shared -fPIC through the compile cache; returns the .so path."""
+    flags = CPU_FLAGS if cpu_flags is None else list(cpu_flags)
+    cmd = [CPU_COMPILER, source_file] + flags + ["-shared", "-fPIC", "-o", "kernel.so"]
+    return compile_cached(cmd, device="cpu")
+
+
+class SharedKernel:
+    """
+    A function from a shared library plus the argument layout derived from
+    its AST parameters.
+
+    - params: [(element type, name, dims)] as produced by device_runner.normalize_params
+    Array parameters are passed as raw pointers to C-contiguous NumPy buffers;
+    scalars are converted to their ctypes type.
+    """
+
+    def __init__(self, so_path: str, fn_name: str, params, default_n: int = HARNESS_INT_ARG):
+        with _loaded_lock:
+            if so_path not in _loaded:
+                _loaded[so_path] = ctypes.CDLL(so_path)
+            lib = _loaded[so_path]
+        self.fn = getattr(lib, fn_name)
+        self.fn.restype = None
+        self.fn_name = fn_name
+        self.params = params
+        self.default_n = default_n
+
+        argtypes = []
+        for ptype, pname, dims in params:
+            if ptype not in C_TYPES:
+                raise TypeError(f"unsupported parameter type '{ptype}' for {pname}")
+            argtypes.append(ctypes.c_void_p if dims else C_TYPES[ptype][0])
+        self.fn.argtypes = argtypes
+
+    def make_args(self, inputs: dict = None):
+        """
+        Arguments for one call. Arrays in `inputs` (by parameter name) are used
+        as-is when their dtype and layout already match; anything missing is
+        allocated once, filled with ones (arrays) or default_n / 1 (scalars).
+        Raises ValueError for an array smaller than its buffer size or an
+        integer scalar other than default_n: the sizes only hold for that value.
+        """
+        import numpy as np
+        inputs = inputs or {}
+        args = []
+        for ptype, pname, dims in self.params:
+            ctype, dtype = C_TYPES[ptype]
+            value = inputs.get(pname)
+            if dims:
+                if value is None:
+                    value = np.ones(dims, dtype=dtype)
+                elif value.dtype != np.dtype(dtype) or not value.flags["C_CONTIGUOUS"]:
+                    log.warning(f"{pname}: converting {value.dtype} input to contiguous {dtype} (copy)")
+                    value = np.ascontiguousarray(value, dtype=dtype)
+                if value.size < int(np.prod(dims)):
+                    raise ValueError(f"{pname}: expected at least {int(np.prod(dims))} elements, got {value.size}")
+            elif value is None:
+                value = self.default_n if "int" in dtype else 1
+            elif "int" in dtype and value != self.default_n:
+                raise ValueError(f"{pname}: buffer sizes are proven for {pname} == {self.default_n}, got {value}")
+            args.append(value)
+        return args
+
+    def _raw(self, args):
+        return [a.ctypes.data if hasattr(a, "ctypes") else a for a in args]
+
+    def __call__(self, *args):
+        self.fn(*self._raw(args))
+
+    def time(self, args, warmup: int = HARNESS_WARMUP, reps: int = HARNESS_REPS):
+        """Time `reps` direct calls after `warmup` untimed ones; same stats as the harness."""
+        raw = self._raw(args)
+        fn = self.fn
+        for _ in range(warmup):
+            fn(*raw)
+        samples = []
+        for _ in range(reps):
+            t0 = time.perf_counter_ns()
+            fn(*raw)
+            samples.append((time.perf_counter_ns() - t0) / 1e6)
+        return summarize_times(samples, warmup=warmup, timer="inproc_perf_counter")
+
+
+def load_kernel(source_file: str, metadata: dict, cpu_flags=None) -> SharedKernel:
+    fn = metadata.get("primary_function_name")
+    if not fn:
+        raise ValueError(f"no function to call in {source_file}")
+    raw = metadata.get("raw_analysis", {})
+    # a kernel indexing past an undersized buffer would crash this process: refuse instead
+    params = normalize_params(metadata.get("primary_function_params", []), raw.get("param_extents", {}).get(fn))
+    if params is None:
+        raise ValueError(f"cannot size the buffers of {fn} safely")
+    return SharedKernel(build_shared(source_file, cpu_flags), fn, params)
+
+
+def run_in_process(source_file: str, metadata: dict, inputs: dict = None, cpu_flags=None,
+                   warmup: int = HARNESS_WARMUP, reps: int = HARNESS_REPS):
+    """Build, load and time `primary_function_name` in this process; returns the stats dict."""
+    kernel = load_kernel(source_file, metadata, cpu_flags)
+    stats = kernel.time(kernel.make_args(inputs), warmup=warmup, reps=reps)
+    stats["function"] = kernel.fn_name
+    return stats
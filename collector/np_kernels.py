@@ -0,0 +1,297 @@
+"""
+Runtime half of the cpu-vectorized target (see collector.vectorizer).
+
+Rewritten Python kernels call these helpers in place of recognized loop
+nests. Every helper validates its inputs first (numeric dtype, exact rank,
+extents within bounds, no harmful aliasing) and signals FALLBACK / False
+before mutating anything, in which case the original loop runs instead.
+Lists and tuples are only vectorized when every element is a float: Python
+ints do not overflow, their int64 conversion would. Arrays keep their dtype,
+whose fixed-width arithmetic the loop shares. Results match the loops up to
+floating-point rounding from reordered sums.
+"""
+import numbers
+
+try:
+    import numpy as np
+except ImportError:  # the rewritten kernel then always takes its original loops
+    np = None
+
+FALLBACK = object()
+
+
+def _extents(extents):
+    if any(not isinstance(e, int) or isinstance(e, bool) for e in extents.values()):
+        return None
+    return {v: max(0, e) for v, e in extents.items()}
+
+
+def _all_floats(obj, ndim):
+    if ndim == 1:
+        return all(isinstance(x, float) for x in obj)
+    return all(isinstance(r, (list, tuple)) and _all_floats(r, ndim - 1) for r in obj)
+
+
+def _load(obj, ndim):
+    """
+    obj as a numeric ndarray of exactly `ndim` dimensions, else None.
+    Lists / tuples are converted only when they hold floats throughout.
+    """
+    if isinstance(obj, np.ndarray):
+        a = obj
+    elif isinstance(obj, (list, tuple)):
+        try:
+            a = np.asarray(obj)
+        except (ValueError, TypeError):
+            return None
+        if a.ndim != ndim or a.dtype.kind != "f" or not _all_floats(obj, ndim):
+            return None
+    else:
+        return None
+    if a.ndim != ndim or a.dtype.kind not in "iuf":
+        return None
+    return a
+
+
+def _window(a, vars_, extents):
+    shape = tuple(extents[v] for v in vars_)
+    if any(s > d for s, d in zip(shape, a.shape)):
+        return None
+    return a[tuple(slice(0, s) for s in shape)]
+
+
+def _align(a, vars_, order):
+    """Transpose/reshape an operand indexed by vars_ so it broadcasts over `order`."""
+    perm = sorted(range(len(vars_)), key=lambda d: order.index(vars_[d]))
+    a = a.transpose(perm)
+    sizes = iter(a.shape)
+    return a.reshape([next(sizes) if v in vars_ else 1 for v in order])
+
+
+def _rows(obj):
+    if isinstance(obj, list) and obj and all(isinstance(r, (list, np.ndarray)) for r in obj):
+        return {id(r) for r in obj}
+    return set()
+
+
+def _aliases(target, other):
+    if other is target:
+        return True
+    if isinstance(target, np.ndarray) and isinstance(other, np.ndarray):
+        return np.shares_memory(target, other)
+    return bool(_rows(target) & _rows(other))
+
+
+def _rows_distinct(obj):
+    if isinstance(obj, list) and obj and isinstance(obj[0], list):
+        return len({id(r) for r in obj}) == len(obj)
+    return True
+
+
+def _store(target, values):
+    """Write values into the leading window of target (ndarray or nested lists)."""
+    if isinstance(target, np.ndarray):
+        target[tuple(slice(0, s) for s in values.shape)] = values
+        return
+    if values.ndim == 1:
+        target[:values.shape[0]] = values.tolist()
+        return
+    for r in range(values.shape[0]):
+        _store(target[r], values[r])
+
+
+def _operands(operands, extents, order):
+    """Operands windowed and aligned to `order` (scalars pass through), or None."""
+    arrays = []
+    for obj, vars_ in operands:
+        if not vars_:
+            if not isinstance(obj, numbers.Real) or isinstance(obj, bool):
+                return None
+            arrays.append(obj)
+            continue
+        a = _load(obj, len(vars_))
+        if a is None:
+            return None
+        a = _window(a, vars_, extents)
+        if a is None:
+            return None
+        arrays.append(_align(a, vars_, order))
+    return arrays
+
+
+def _target(target, t_vars, extents):
+    if not _rows_distinct(target):
+        return None
+    t = _load(target, len(t_vars))
+    if t is None:
+        return None
+    return _window(t, t_vars, extents)
+
+
+_AUG = {
+    "+": lambda a, b: a + b,
+    "-": lambda a, b: a - b,
+    "*": lambda a, b: a * b,
+    "/": lambda a, b: a / b,
+}
+
+
+def assign(target, t_vars, extents, fn, operands, op=None):
+    """
+    for <all loop vars>: target[t_vars] (op)= fn(operands...)
+    t_vars covers every loop variable; operands may index any subset of them.
+    Returns False (nothing written) when the loop must run instead.
+    """
+    if np is None or (extents := _extents(extents)) is None:
+        return False
+    t_vars = tuple(t_vars)
+    for obj, vars_ in operands:
+        # reading a permuted view of the target while writing it is order dependent
+        if vars_ and tuple(vars_) != t_vars and _aliases(target, obj):
+            return False
+    cur = _target(target, t_vars, extents)
+    if cur is None:
+        return False
+    if cur.size == 0:
+        return True
+    args = _operands(operands, extents, t_vars)
+    if args is None:
+        return False
+    try:
+        with np.errstate(all="raise"):
+            values = fn(*args)
+            if op is not None:
+                values = _AUG[op](cur, values)
+            values = np.broadcast_to(np.asarray(values), cur.shape)
+    except (FloatingPointError, ZeroDivisionError, OverflowError, TypeError, ValueError):
+        return False
+    _store(target, values)
+    return True
+
+
+def _reduce(loop_vars, t_vars, extents, fn, operands, product):
+    if product:
+        letters = {v: chr(ord("a") + i) for i, v in enumerate(loop_vars)}
+        arrays, scale, specs = [], 1, []
+        for obj, vars_ in operands:
+            if not vars_:
+                if not isinstance(obj, numbers.Real) or isinstance(obj, bool):
+                    return None
+                scale = scale * obj
+                continue
+            a = _load(obj, len(vars_))
+            if a is None:
+                return None
+            a = _window(a, vars_, extents)
+            if a is None:
+                return None
+            arrays.append(a)
+            specs.append("".join(letters[v] for v in vars_))
+        spec = ",".join(specs) + "->" + "".join(letters[v] for v in t_vars)
+        with np.errstate(all="raise"):
+            return np.einsum(spec, *arrays, optimize=True) * scale
+
+    args = _operands(operands, extents, loop_vars)
+    if args is None:
+        return None
+    with np.errstate(all="raise"):
+        full = np.broadcast_to(np.asarray(fn(*args)), tuple(extents[v] for v in loop_vars))
+        summed = full.sum(axis=tuple(i for i, v in enumerate(loop_vars) if v not in t_vars))
+    kept = [v for v in loop_vars if v in t_vars]
+    return summed.transpose([kept.index(v) for v in t_vars])
+
+
+def accumulate(target, loop_vars, t_vars, extents, fn, operands, product=False):
+    """
+    for <loop_vars>: target[t_vars] += fn(operands...), with t_vars a strict
+    subset of loop_vars, i.e. a contraction (matmul, matvec, row sums, ...).
+    Pure products are evaluated with einsum.
+    """
+    if np is None or (extents := _extents(extents)) is None:
+        return False
+    loop_vars, t_vars = tuple(loop_vars), tuple(t_vars)
+    if any(vars_ and _aliases(target, obj) for obj, vars_ in operands):
+        return False
+    cur = _target(target, t_vars, extents)
+    if cur is None:
+        return False
+    if any(extents[v] == 0 for v in loop_vars):
+        return True
+    try:
+        values = _reduce(loop_vars, t_vars, extents, fn, operands, product)
+        if values is None:
+            return False
+        with np.errstate(all="raise"):
+            values = cur + values
+    except (FloatingPointError, ZeroDivisionError, OverflowError, TypeError, ValueError):
+        return False
+    _store(target, values)
+    return True
+
+
+def reduce(loop_vars, extents, fn, operands, product=False):
+    """for <loop_vars>: acc += fn(operands...); returns the total to add, or FALLBACK."""
+    if np is None or (extents := _extents(extents)) is None:
+        return FALLBACK
+    if any(extents[v] == 0 for v in loop_vars):
+        return 0
+    try:
+        values = _reduce(tuple(loop_vars), (), extents, fn, operands, product)
+    except (FloatingPointError, ZeroDivisionError, OverflowError, TypeError, ValueError):
+        return FALLBACK
+    return FALLBACK if values is None else values.item()
+
+
+def _running(seed, values, op):
+    """Running sum/product starting from seed, accumulated left to right like the loop."""
+    seq = np.concatenate([np.asarray([seed], dtype=np.result_type(seed, values)), values])
+    return (np.cumsum(seq) if op == "+" else np.cumprod(seq))[1:]
+
+
+def scan(target, source, start, stop, op="+"):
+    """for i in range(start, stop): target[i] = target[i-1] op source[i]   (start >= 1)"""
+    if np is None or not all(isinstance(x, int) and not isinstance(x, bool) for x in (start, stop)):
+        return False
+    if start < 1:
+        return False
+    if stop <= start:
+        return True
+    if source is not target and _aliases(target, source):
+        return False
+    t = _load(target, 1)
+    s = t if source is target else _load(source, 1)
+    if t is None or s is None or stop > t.shape[0] or stop > s.shape[0]:
+        return False
+    try:
+        with np.errstate(all="raise"):
+            values = _running(t[start - 1], s[start:stop], op)
+    except (FloatingPointError, OverflowError, TypeError, ValueError):
+        return False
+    target[start:stop] = values if isinstance(target, np.ndarray) else values.tolist()
+    return True
+
+
+def scan_acc(acc, target, source, stop, op="+"):
+    """
+    for i in range(stop): acc op= source[i]; target[i] = acc
+    Returns the final accumulator, or FALLBACK.
+    """
+    if np is None or not isinstance(stop, int) or isinstance(stop, bool):
+        return FALLBACK
+    if not isinstance(acc, numbers.Real) or isinstance(acc, bool):
+        return FALLBACK
+    if stop <= 0:
+        return acc
+    if source is not target and _aliases(target, source):
+        return FALLBACK
+    t = _load(target, 1)
+    s = _load(source, 1)
+    if t is None or s is None or stop > t.shape[0] or stop > s.shape[0]:
+        return FALLBACK
+    try:
+        with np.errstate(all="raise"):
+            values = _running(acc, s[:stop], op)
+    except (FloatingPointError, OverflowError, TypeError, ValueError):
+        return FALLBACK
+    _store(target, values)
+    return values[-1].item()
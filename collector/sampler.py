@@ -0,0 +1,148 @@
+import logging
+import threading
+import time
+from collections import deque
+import psutil
+from collector.sys_state import read_battery, read_power_mode, read_gpu_state
+
+log = logging.getLogger("sampler")
+log.setLevel(logging.INFO)
+
+# Continuous signals worth smoothing; everything else is reported as last seen.
+SMOOTHED_FIELDS = (
+    "cpu_load_pct",
+    "gpu_load_pct",
+    "gpu_mem_used_mb",
+    "gpu_mem_pressure",
+    "gpu_temp_C",
+    "thermal_headroom",
+    "concurrent_gpu_tasks",
+)
+
+
+def _trend_per_s(times, values):
+    """Least-squares slope of values over time, in units per second."""
+    n = len(times)
+    if n < 2:
+        return 0.0
+    mt = sum(times) / n
+    mv = sum(values) / n
+    var = sum((t - mt) ** 2 for t in times)
+    if var == 0:
+        return 0.0
+    return sum((t - mt) * (v - mv) for t, v in zip(times, values)) / var
+
+
+class SystemStateSampler(threading.Thread):
+    """
+    Polls CPU, battery, power mode and GPU state in the background.
+
+    Samples land in a fixed-size ring buffer; after each poll the thread
+    publishes a fresh, never-mutated snapshot dict by rebinding one
+    attribute, so readers take no lock and never wait on hardware probes.
+
+    snapshot() returns:
+        {"timestamp", "samples", "instant", "ewma", "min", "max", "trend_per_s"}
+    system_state(mode) returns a get_system_state()-compatible dict built
+    from the instantaneous ("instant") or smoothed ("ewma") values.
+    """
+
+    def __init__(self, interval_s: float = 0.25, window: int = 40, alpha: float = 0.3,
+                 power_mode_interval_s: float = 30.0):
+        super().__init__(name="hybridflow-sampler", daemon=True)
+        self.interval_s = interval_s
+        self.alpha = alpha
+        self.power_mode_interval_s = power_mode_interval_s
+        self._buffer = deque(maxlen=window)
+        self._ewma = {}
+        self._stop_event = threading.Event()
+        self._ready = threading.Event()
+        self._snapshot = None
+
+    def _poll(self):
+        state = {"cpu_load_pct": psutil.cpu_percent(interval=None)}
+        state["is_battery_powered"] = read_battery()
+        state["power_mode"] = read_power_mode(self.power_mode_interval_s)
+        try:
+            state.update(read_gpu_state())
+        except Exception as e:
+            log.warning(f"GPU probe failed: {e}")
+        return state
+
+    def _publish(self, now, state):
+        self._buffer.append((now, state))
+        for f in SMOOTHED_FIELDS:
+            if f in state:
+                prev = self._ewma.get(f)
+                self._ewma[f] = state[f] if prev is None else self.alpha * state[f] + (1 - self.alpha) * prev
+
+        times = [t for t, _ in self._buffer]
+        lo, hi, trend = {}, {}, {}
+        for f in SMOOTHED_FIELDS:
+            vals = [s[f] for _, s in self._buffer if f in s]
+            if vals:
+                lo[f], hi[f] = min(vals), max(vals)
+                trend[f] = _trend_per_s(times[-len(vals):], vals)
+
+        self._snapshot = {
+            "timestamp": now,
+            "samples": len(self._buffer),
+            "instant": dict(state),
+            "ewma": dict(self._ewma),
+            "min": lo,
+            "max": hi,
+            "trend_per_s": trend,
+        }
+        self._ready.set()
+
+    def run(self):
+        # psutil.cpu_percent(interval=None) measures since the previous call; the
+        # first reading has no reference point, so discard it
+        psutil.cpu_percent(interval=None)
+        self._stop_event.wait(self.interval_s)
+        while not self._stop_event.is_set():
+            t0 = time.monotonic()
+            try:
+                self._publish(t0, self._poll())
+            except Exception as e:
+                log.warning(f"System state poll failed: {e}")
+            self._stop_event.wait(max(0.0, self.interval_s - (time.monotonic() - t0)))
+
+    def stop(self):
+        self._stop_event.set()
+
+    def wait_ready(self, timeout: float = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def snapshot(self):
+        """Latest published snapshot, or None before the first poll."""
+        return self._snapshot
+
+    def system_state(self, mode: str = "ewma") -> dict:
+        snap = self._snapshot
+        if snap is None:
+            from collector.sys_state import get_system_state
+            return get_system_state()
+        state = dict(snap["instant"])
+        if mode == "ewma":
+            for f, v in snap["ewma"].items():
+                state[f] = round(v, 4)
+        return state
+
+
+_sampler = None
+_sampler_lock = threading.Lock()
+
+
+def start_sampler(**kwargs) -> SystemStateSampler:
+    """Start (once) and return the process-wide sampler."""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None or not _sampler.is_alive():
+            _sampler = SystemStateSampler(**kwargs)
+            _sampler.start()
+        return _sampler
+
+
+def get_sampler():
+    return _sampler
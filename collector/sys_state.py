@@ -1,50 +1,102 @@
 import psutil
-import torch
 import os
-try:
-    import pynvml
-    pynvml.nvmlInit()
-    NVML_AVAILABLE = True
-except:
-    NVML_AVAILABLE = False
+import time
 
-def get_system_state():
+_nvml = None
+_nvml_checked = False
+_cuda_available = None
+
+
+def get_nvml():
+    """pynvml, initialized on first use, or None when NVML is unavailable."""
+    global _nvml, _nvml_checked
+    if not _nvml_checked:
+        _nvml_checked = True
+        try:
+            import pynvml
+            pynvml.nvmlInit()
+            _nvml = pynvml
+        except Exception:
+            _nvml = None
+    return _nvml
+
+
+def cuda_available():
     """
-    Collect real-time system stats:
-    - CPU load %
-    - Battery / power mode
-    - GPU load %, temperature, memory usage & pressure
-    - Number of concurrent GPU tasks
+    CUDA device presence without importing torch: ask NVML for a device count,
+    otherwise look for the NVIDIA driver in /proc and /dev, or a Tegra SoC.
     """
-    state = {}
+    global _cuda_available
+    if _cuda_available is None:
+        nvml = get_nvml()
+        found = False
+        if nvml is not None:
+            try:
+                found = nvml.nvmlDeviceGetCount() > 0
+            except Exception:
+                found = False
+        if not found:
+            found = any(os.path.exists(p) for p in (
+                "/proc/driver/nvidia/version",
+                "/dev/nvidia0",
+                "/etc/nv_tegra_release",
+            ))
+        _cuda_available = found
+    return _cuda_available
+
+
+_gpu_handle = None
+_power_mode = None
+_power_mode_at = 0.0
+# nvpmodel needs sudo and a process spawn; the mode changes rarely
+POWER_MODE_TTL_S = 60.0
+
+
+def get_gpu_handle():
+    """NVML handle of GPU 0, fetched once."""
+    global _gpu_handle
+    if _gpu_handle is None:
+        _gpu_handle = get_nvml().nvmlDeviceGetHandleByIndex(0)
+    return _gpu_handle
 
-    state["cpu_load_pct"] = psutil.cpu_percent(interval=None)
 
+def read_battery():
+    """1 when running on battery (a battery present and not plugged in), else 0."""
     if hasattr(psutil, "sensors_battery"):
         battery = psutil.sensors_battery()
-        state["is_battery_powered"] = int(battery and battery.power_plugged)
-    else:
-        state["is_battery_powered"] = 0
+        return int(bool(battery) and not battery.power_plugged)
+    return 0
 
+
+def read_power_mode(max_age_s: float = POWER_MODE_TTL_S):
+    global _power_mode, _power_mode_at
+    now = time.monotonic()
+    if _power_mode is not None and now - _power_mode_at < max_age_s:
+        return _power_mode
     try:
         if os.path.exists("/etc/nvpmodel.conf"):
             cmd = "sudo nvpmodel -q --verbose | grep 'Power Mode' | awk '{print $3}'"
             mode = os.popen(cmd).read().strip()
-            state["power_mode"] = int(mode) if mode.isdigit() else 0
+            _power_mode = int(mode) if mode.isdigit() else 0
         else:
-            state["power_mode"] = 0
+            _power_mode = 0
     except:
-        state["power_mode"] = 0
+        _power_mode = 0
+    _power_mode_at = now
+    return _power_mode
+
 
-    if torch.cuda.is_available():
-        if NVML_AVAILABLE:
-            h = pynvml.nvmlDeviceGetHandleByIndex(0)
+def read_gpu_state():
+    if cuda_available():
+        pynvml = get_nvml()
+        if pynvml is not None:
+            h = get_gpu_handle()
             util = pynvml.nvmlDeviceGetUtilizationRates(h)
             mem = pynvml.nvmlDeviceGetMemoryInfo(h)
             temp = pynvml.nvmlDeviceGetTemperature(h, pynvml.NVML_TEMPERATURE_GPU)
             procs = pynvml.nvmlDeviceGetComputeRunningProcesses(h)
 
-            state.update({
+            return {
                 "gpu_load_pct": util.gpu,
                 "gpu_mem_used_mb": mem.used // (1024 ** 2),
                 "gpu_mem_total_mb": mem.total // (1024 ** 2),
@@ -52,27 +104,41 @@ def get_system_state():
                 "gpu_temp_C": temp,
                 "thermal_headroom": max(0, 85 - temp),  
                 "concurrent_gpu_tasks": len(procs)
-            })
-        else:
-            state.update({
-                "gpu_load_pct": -1,
-                "gpu_mem_used_mb": -1,
-                "gpu_mem_total_mb": -1,
-                "gpu_mem_pressure": -1,
-                "gpu_temp_C": -1,
-                "thermal_headroom": -1,
-                "concurrent_gpu_tasks": -1
-            })
-    else:
-        state.update({
-            "gpu_load_pct": 0,
-            "gpu_mem_used_mb": 0,
-            "gpu_mem_total_mb": 0,
-            "gpu_mem_pressure": 0,
-            "gpu_temp_C": 0,
-            "thermal_headroom": 0,
-            "concurrent_gpu_tasks": 0
-        })
+            }
+        return {
+            "gpu_load_pct": -1,
+            "gpu_mem_used_mb": -1,
+            "gpu_mem_total_mb": -1,
+            "gpu_mem_pressure": -1,
+            "gpu_temp_C": -1,
+            "thermal_headroom": -1,
+            "concurrent_gpu_tasks": -1
+        }
+    return {
+        "gpu_load_pct": 0,
+        "gpu_mem_used_mb": 0,
+        "gpu_mem_total_mb": 0,
+        "gpu_mem_pressure": 0,
+        "gpu_temp_C": 0,
+        "thermal_headroom": 0,
+        "concurrent_gpu_tasks": 0
+    }
+
+
+def get_system_state():
+    """
+    Collect real-time system stats:
+    - CPU load %
+    - Battery / power mode
+    - GPU load %, temperature, memory usage & pressure
+    - Number of concurrent GPU tasks
+    """
+    state = {}
+
+    state["cpu_load_pct"] = psutil.cpu_percent(interval=None)
+    state["is_battery_powered"] = read_battery()
+    state["power_mode"] = read_power_mode()
+    state.update(read_gpu_state())
 
     return state
 
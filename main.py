@@ -1,47 +1,125 @@
 import sys
 from analyzer.ast_parser import parse_and_detect
-from analyzer.feature_builder import build_feature_dict
+from analyzer.feature_builder import build_feature_dict, model_operation_type
 from collector.sys_state import get_system_state
-from model.inference import predict  
-from collector.device_runner import run_on_device
+from model.crossover_table import table_predict
+from model.inference import model_operation_types
+from model.roofline import estimate as roofline_estimate, sanity_check
+from collector.device_runner import run_on_device, precompile, execution_target
 from utils.logger import get_logger
 from collector.device_runner import run_on_other_device
 import time
 
 logger = get_logger("main")
 
-def run_pipeline(source_file):
-    # Static analysis 
+
+def decide(source_file, sys_state=None, detailed=False):
+    """
+    Analysis + system state + prediction for one source file, without executing it.
+    Returns the analysis, the feature dict, the decision and per-stage timings in ms;
+    detailed=True adds "estimate": expected per-device runtimes, speedup and margin,
+    and the roofline estimate (model/roofline.py) under "roofline".
+    """
+    t0 = time.perf_counter()
+    # Static analysis
     analysis = parse_and_detect(source_file)
-    op_type = analysis['operation_type']
-    log_size = analysis['log_total_sizes']   
+    op_type = model_operation_type(analysis['operation_type'])
+    log_size = analysis['log_total_sizes']
+    t1 = time.perf_counter()
 
     # Dynamic system state
-    sys_state = get_system_state()
+    if sys_state is None:
+        sys_state = get_system_state()
+    t2 = time.perf_counter()
 
-    # Feature vector
-    features = build_feature_dict(op_type, log_size, sys_state)
+    # Feature vector, with the roofline estimate for this machine's device profile
+    features = build_feature_dict(op_type, log_size, sys_state, analysis)
+    roofline = roofline_estimate(features)
+    features["roofline_log_speedup"] = roofline["log_speedup"] if roofline else None
     logger.info("Final feature dict sent to model: %s", features)
 
-    # Model prediction
-    decision = predict(features)  
+    if roofline is not None and op_type not in model_operation_types():
+        # the model cannot tell this op from the others: decide from the roofline alone
+        device = roofline["faster_device"]
+        estimate = {"decision": device, "source": "roofline"} if detailed else None
+        logger.info("Roofline decision for %s: %s", op_type, device)
+    else:
+        # Crossover table when it covers the case, else the model (memoized under similar machine conditions)
+        if detailed:
+            from model.inference import predict_detailed
+            estimate = predict_detailed(features)
+            model_device = estimate["decision"]
+        else:
+            estimate, model_device = None, table_predict(features)
+        device = sanity_check(model_device, roofline)
+        if estimate is not None and device != model_device:
+            estimate.update(decision=device, model_decision=model_device)
+    if estimate is not None and roofline is not None:
+        estimate["roofline"] = roofline
+    decision = execution_target(source_file, device, analysis, sys_state)
     logger.info("Prediction: %s", decision)
+    t3 = time.perf_counter()
+
+    result = {
+        "source_file": source_file,
+        "analysis": analysis,
+        "features": features,
+        "decision": decision,
+        "timings_ms": {
+            "analysis": (t1 - t0) * 1000,
+            "system_state": (t2 - t1) * 1000,
+            "predict": (t3 - t2) * 1000,
+        },
+    }
+    if estimate is not None:
+        result["estimate"] = estimate
+    return result
+
+
+def run_pipeline(source_file, compare=True):
+    result = decide(source_file)
+    decision = result["decision"]
+    analysis = result["analysis"]
+
+    # Build every variant we are about to time in parallel; the runs below stay serialized
+    other = "gpu" if decision.startswith("cpu") else "cpu"
+    precompile(source_file, devices=(decision, other) if compare else (decision,), metadata=analysis)
 
     # Execute on predicted device
-    # run_on_device(source_file, decision, extra_info=analysis)
-    pred_time = run_on_device(source_file, decision, extra_info=analysis)
+    pred_stats = run_on_device(source_file, decision, extra_info=analysis, return_stats=True)
+    pred_time = pred_stats["median_ms"] if pred_stats else False
     if pred_time:
         print(f"{decision.upper()} execution time: {pred_time:.2f} ms")
     else:
         print(f"{decision.upper()} execution failed.")
+    result["timings_ms"]["execute"] = pred_time or None
+
+    if compare:
+        run_on_other_device(source_file, decision, analysis, pred_stats, features=result["features"])
+    return result
 
-    run_on_other_device(source_file, decision, analysis, pred_time)
 
+def run_batch(source_files, gpu_stand_in=False):
+    """Schedule several files over the CPU and GPU queues at once, minimizing total makespan."""
+    from scheduler.backends import local_backends
+    from scheduler.batch_scheduler import run_batch as schedule
+    summary = schedule(source_files, backends=local_backends(gpu_stand_in=gpu_stand_in))
+    for r in sorted(summary["results"], key=lambda r: r["job_id"]):
+        moved = f" (planned {r['planned_device']})" if r["stolen"] else ""
+        took = f"{r['actual_ms']:.2f} ms" if r["actual_ms"] else r["error"]
+        print(f"{r['source_file']}: {r['device'].upper()}{moved} est {r['estimate_ms']:.2f} ms, {took}")
+    for path in summary["unschedulable"]:
+        print(f"{path}: no device can run it")
+    print(f"Makespan: {summary['makespan_ms']:.2f} ms (planned {summary['planned_makespan_ms']:.2f} ms)")
+    return summary
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
+    if len(sys.argv) < 2:
         sys.exit(1)
-    run_pipeline(sys.argv[1])
-      
-    
+    if len(sys.argv) == 2:
+        run_pipeline(sys.argv[1])
+    else:
+        run_batch(sys.argv[1:])
+
+
@@ -0,0 +1,5049 @@
+"""Generated by model/export.py from the fitted pipeline; do not edit."""
+import math
+from array import array
+
+SOURCE_SHA256 = '4c8e2f4e5417f9e4e1ee7a87ae6ca94d5eca5f8d227455fea805efc2f53bcd78'
+FEATURE_COLUMNS = ['operation_type', 'log_size', 'cpu_load_pct', 'is_battery_powered', 'gpu_load_pct', 'gpu_mem_pressure', 'gpu_temp_C']
+INPUTS = [('impute', 'gpu_mem_pressure'), ('onehot', ('operation_type', 'conv2d')), ('onehot', ('operation_type', 'elementwise')), ('onehot', ('operation_type', 'fft')), ('onehot', ('operation_type', 'matmul')), ('onehot', ('operation_type', 'reduce_sum')), ('onehot', ('operation_type', 'scan')), ('onehot', ('operation_type', 'sort')), ('onehot', ('operation_type', 'transpose')), ('value', 'log_size'), ('value', 'cpu_load_pct'), ('value', 'is_battery_powered'), ('value', 'gpu_load_pct'), ('value', 'gpu_temp_C')]
+IMPUTE_VALUE = 0.09585376016260162
+MEAN = [0.09585376016260098, 0.0867430441898527, 0.14811783960720132, 0.11865793780687398, 0.11783960720130933, 0.14238952536824878, 0.1448445171849427, 0.15384615384615385, 0.08756137479541735, 4.731045335515548, 15.617594108019652, 0.4067103109656301, 3.076104746317512, 54.375613747954176]
+SCALE = [0.03479889225064271, 0.2814581469322386, 0.3552167580468252, 0.3233855772948085, 0.32241810460324605, 0.34944920722997025, 0.35194400552701527, 0.3608012122941107, 0.2826559400390385, 2.0716157407815037, 24.196920779851517, 0.49121994454609547, 4.26782602743888, 1.444724385929842]
+BASE_MARGIN = 0.7827223539352417
+_NAN = float('nan')
+
+
+def _trees(x, margin):
+    """Add the 100 trees' leaf values to margin[0] (float32, like XGBoost)."""
+    # tree 0
+    if x[9] < 1.2778213024139404:
+        if x[7] < 0.9256167411804199:
+            if x[9] < -0.1508297175168991:
+                if x[13] < -1.1952389478683472:
+                    if x[0] < -0.7880632877349854:
+                        margin[0] += -0.895088791847229
+                    else:
+                        if x[0] < 0.0016458351165056229:
+                            margin[0] += -0.2695884704589844
+                        else:
+                            margin[0] += 0.2898988723754883
+                else:
+                    margin[0] += -0.9214989542961121
+            else:
+                if x[8] < 0.5077582597732544:
+                    if x[3] < 2.7253599166870117:
+                        if x[0] < 0.0016458351165056229:
+                            margin[0] += 0.03350367024540901
+                        else:
+                            margin[0] += 0.31921303272247314
+                    else:
+                        if x[9] < 0.4415658116340637:
+                            margin[0] += -0.6287387609481812
+                        else:
+                            margin[0] += 0.1927730143070221
+                else:
+                    margin[0] += -0.9077638983726501
+        else:
+            if x[9] < -0.8583856821060181:
+                margin[0] += -0.8441987037658691
+            else:
+                if x[9] < -0.783709704875946:
+                    if x[12] < 0.22136290371418:
+                        if x[0] < 0.0016458351165056229:
+                            margin[0] += 0.009692427702248096
+                        else:
+                            margin[0] += 0.26030823588371277
+                    else:
+                        margin[0] += -0.19571946561336517
+                else:
+                    margin[0] += 0.4157569706439972
+    else:
+        if x[8] < 0.5077582597732544:
+            if x[10] < 2.660768508911133:
+                margin[0] += 0.4258033335208893
+            else:
+                margin[0] += 0.1020330861210823
+        else:
+            margin[0] += -0.6723403930664062
+    # tree 1
+    if x[9] < 1.3182121515274048:
+        if x[7] < 0.9256167411804199:
+            if x[9] < -0.11850369721651077:
+                if x[13] < -1.1952389478683472:
+                    if x[0] < -0.7880632877349854:
+                        margin[0] += -0.5364589095115662
+                    else:
+                        if x[9] < -0.6699550151824951:
+                            margin[0] += -0.2867119610309601
+                        else:
+                            margin[0] += 0.09493610262870789
+                else:
+                    if x[8] < 0.5077582597732544:
+                        if x[0] < 0.5393857359886169:
+                            margin[0] += -0.5419471859931946
+                        else:
+                            margin[0] += -0.25917577743530273
+                    else:
+                        if x[0] < 0.0016458351165056229:
+                            margin[0] += -0.3360278606414795
+                        else:
+                            margin[0] += 0.04231671243906021
+            else:
+                if x[8] < 0.5077582597732544:
+                    if x[3] < 2.7253599166870117:
+                        if x[9] < -0.07938022911548615:
+                            margin[0] += -0.1502389758825302
+                        else:
+                            margin[0] += 0.23212769627571106
+                    else:
+                        if x[10] < -0.5462326407432556:
+                            margin[0] += -0.5467344522476196
+                        else:
+                            margin[0] += 0.008431189693510532
+                else:
+                    margin[0] += -0.5438321828842163
+        else:
+            if x[9] < -0.8583856821060181:
+                margin[0] += -0.5223580598831177
+            else:
+                if x[9] < -0.783709704875946:
+                    if x[10] < -0.5462326407432556:
+                        if x[12] < 0.22136290371418:
+                            margin[0] += 0.07962224632501602
+                        else:
+                            margin[0] += -0.4487517774105072
+                    else:
+                        margin[0] += 0.30275386571884155
+                else:
+                    margin[0] += 0.3650485575199127
+    else:
+        if x[8] < 0.5077582597732544:
+            if x[10] < 2.660768508911133:
+                margin[0] += 0.37770333886146545
+            else:
+                margin[0] += 0.0875464528799057
+        else:
+            margin[0] += -0.40365058183670044
+    # tree 2
+    if x[9] < 1.3182121515274048:
+        if x[7] < 0.9256167411804199:
+            if x[9] < -0.1508297175168991:
+                if x[13] < -1.1952389478683472:
+                    if x[0] < -0.7880632877349854:
+                        margin[0] += -0.4288237392902374
+                    else:
+                        if x[9] < -1.1204516887664795:
+                            margin[0] += 0.3389660716056824
+                        else:
+                            margin[0] += -0.16407698392868042
+                else:
+                    if x[8] < 0.5077582597732544:
+                        if x[0] < 0.5393857359886169:
+                            margin[0] += -0.43459999561309814
+                        else:
+                            margin[0] += -0.1817084550857544
+                    else:
+                        if x[0] < 0.0016458351165056229:
+                            margin[0] += -0.2854052782058716
+                        else:
+                            margin[0] += 0.035710886120796204
+            else:
+                if x[8] < 0.5077582597732544:
+                    if x[0] < 0.5768716335296631:
+                        if x[5] < 2.4541778564453125:
+                            margin[0] += -0.096189484000206
+                        else:
+                            margin[0] += 0.27624067664146423
+                    else:
+                        if x[9] < 0.15402892231941223:
+                            margin[0] += -0.031989846378564835
+                        else:
+                            margin[0] += 0.33750998973846436
+                else:
+                    margin[0] += -0.4343430697917938
+        else:
+            if x[9] < -0.8583856821060181:
+                margin[0] += -0.41565847396850586
+            else:
+                if x[9] < -0.783709704875946:
+                    if x[10] < -0.5462326407432556:
+                        if x[12] < 0.22136290371418:
+                            margin[0] += 0.06211103871464729
+                        else:
+                            margin[0] += -0.35728397965431213
+                    else:
+                        margin[0] += 0.26518866419792175
+                else:
+                    if x[9] < -0.6422001719474792:
+                        if x[0] < 0.3071398437023163:
+                            margin[0] += 0.2943650186061859
+                        else:
+                            margin[0] += -0.009350001811981201
+                    else:
+                        margin[0] += 0.3466312885284424
+    else:
+        if x[8] < 0.5077582597732544:
+            if x[10] < 2.660768508911133:
+                if x[0] < -1.1640334129333496:
+                    if x[9] < 1.8399429321289062:
+                        margin[0] += -0.06600246578454971
+                    else:
+                        margin[0] += 0.2758539915084839
+                else:
+                    margin[0] += 0.3510976731777191
+            else:
+                margin[0] += 0.07524490356445312
+        else:
+            margin[0] += -0.33068910241127014
+    # tree 3
+    if x[9] < 1.3182121515274048:
+        if x[7] < 0.9256167411804199:
+            if x[9] < -0.07938022911548615:
+                if x[9] < -0.2826014459133148:
+                    if x[9] < -1.1204516887664795:
+                        if x[13] < -1.6414515972137451:
+                            margin[0] += 0.13184404373168945
+                        else:
+                            margin[0] += -0.3394497334957123
+                    else:
+                        margin[0] += -0.37218400835990906
+                else:
+                    if x[11] < 1.0729485750198364:
+                        if x[5] < 2.4541778564453125:
+                            margin[0] += -0.18481925129890442
+                        else:
+                            margin[0] += 0.1607801467180252
+                    else:
+                        margin[0] += -0.46984127163887024
+            else:
+                if x[8] < 0.5077582597732544:
+                    if x[3] < 2.7253599166870117:
+                        if x[12] < -0.6908470392227173:
+                            margin[0] += -0.003457398619502783
+                        else:
+                            margin[0] += 0.26368722319602966
+                    else:
+                        if x[9] < 0.3682602345943451:
+                            margin[0] += -0.26004254817962646
+                        else:
+                            margin[0] += 0.1555469036102295
+                else:
+                    margin[0] += -0.3786918818950653
+        else:
+            if x[9] < -0.8583856821060181:
+                margin[0] += -0.35835614800453186
+            else:
+                if x[9] < -0.783709704875946:
+                    if x[10] < -0.5462326407432556:
+                        if x[12] < 0.22136290371418:
+                            margin[0] += 0.04824899882078171
+                        else:
+                            margin[0] += -0.298949271440506
+                    else:
+                        margin[0] += 0.23629987239837646
+                else:
+                    if x[9] < -0.6422001719474792:
+                        if x[0] < 0.3071398437023163:
+                            margin[0] += 0.2649204134941101
+                        else:
+                            margin[0] += -0.007333993446081877
+                    else:
+                        margin[0] += 0.3241584300994873
+    else:
+        if x[8] < 0.5077582597732544:
+            if x[10] < 2.660768508911133:
+                if x[0] < -1.1640334129333496:
+                    if x[9] < 1.8399429321289062:
+                        margin[0] += -0.05346056818962097
+                    else:
+                        margin[0] += 0.2519165575504303
+                else:
+                    margin[0] += 0.3302353620529175
+            else:
+                margin[0] += 0.06474930793046951
+        else:
+            margin[0] += -0.2828615605831146
+    # tree 4
+    if x[9] < 1.2778213024139404:
+        if x[7] < 0.9256167411804199:
+            if x[9] < -0.2826014459133148:
+                if x[13] < -1.1952389478683472:
+                    if x[0] < 0.0016458351165056229:
+                        if x[9] < -1.1204516887664795:
+                            margin[0] += 0.10465140640735626
+                        else:
+                            margin[0] += -0.33091139793395996
+                    else:
+                        margin[0] += 0.27965936064720154
+                else:
+                    margin[0] += -0.342406302690506
+            else:
+                if x[8] < 0.5077582597732544:
+                    if x[9] < 0.30384722352027893:
+                        if x[0] < -0.7716843485832214:
+                            margin[0] += -0.36178869009017944
+                        else:
+                            margin[0] += -0.011929966509342194
+                    else:
+                        if x[12] < -0.45534420013427734:
+                            margin[0] += -0.0699058547616005
+                        else:
+                            margin[0] += 0.2454063445329666
+                else:
+                    if x[9] < -0.23618608713150024:
+                        margin[0] += 0.02586558647453785
+                    else:
+                        margin[0] += -0.3420967161655426
+        else:
+            if x[9] < -0.783709704875946:
+                if x[9] < -0.8583856821060181:
+                    margin[0] += -0.32083436846733093
+                else:
+                    if x[10] < -0.5462326407432556:
+                        if x[9] < -0.8304365277290344:
+                            margin[0] += 0.13691841065883636
+                        else:
+                            margin[0] += -0.18290448188781738
+                    else:
+                        margin[0] += 0.21279828250408173
+            else:
+                if x[9] < -0.6422001719474792:
+                    if x[0] < 0.3071398437023163:
+                        if x[9] < -0.685235857963562:
+                            margin[0] += 0.3005933165550232
+                        else:
+                            margin[0] += 0.03619769215583801
+                    else:
+                        if x[9] < -0.685235857963562:
+                            margin[0] += -0.05850538611412048
+                        else:
+                            margin[0] += 0.05325824022293091
+                else:
+                    margin[0] += 0.3064463138580322
+    else:
+        if x[8] < 0.5077582597732544:
+            if x[9] < 1.7539325952529907:
+                if x[10] < 2.189634323120117:
+                    if x[10] < 1.4115698337554932:
+                        margin[0] += 0.2952195703983307
+                    else:
+                        if x[0] < 0.13297276198863983:
+                            margin[0] += 0.2115461379289627
+                        else:
+                            margin[0] += -0.016879212111234665
+                else:
+                    margin[0] += -0.1002296656370163
+            else:
+                margin[0] += 0.32690951228141785
+        else:
+            margin[0] += -0.27877357602119446
+    # tree 5
+    if x[9] < 1.3182121515274048:
+        if x[7] < 0.9256167411804199:
+            if x[9] < -0.1508297175168991:
+                if x[13] < -1.1952389478683472:
+                    if x[0] < -0.7880632877349854:
+                        margin[0] += -0.3203325867652893
+                    else:
+                        if x[9] < -0.6699550151824951:
+                            margin[0] += -0.08641182631254196
+                        else:
+                            margin[0] += 0.18872608244419098
+                else:
+                    if x[10] < -0.5462326407432556:
+                        margin[0] += -0.3355312645435333
+                    else:
+                        if x[10] < 0.9663380980491638:
+                            margin[0] += -0.02909448929131031
+                        else:
+                            margin[0] += -0.30903565883636475
+            else:
+                if x[8] < 0.5077582597732544:
+                    if x[0] < 0.5768716335296631:
+                        if x[5] < 2.4541778564453125:
+                            margin[0] += -0.06445912271738052
+                        else:
+                            margin[0] += 0.22509387135505676
+                    else:
+                        if x[9] < 0.15402892231941223:
+                            margin[0] += -0.037246476858854294
+                        else:
+                            margin[0] += 0.28490492701530457
+                else:
+                    margin[0] += -0.32019466161727905
+        else:
+            if x[9] < -0.783709704875946:
+                if x[9] < -0.8583856821060181:
+                    margin[0] += -0.2928539514541626
+                else:
+                    if x[10] < -0.5462326407432556:
+                        if x[0] < 0.0016458351165056229:
+                            margin[0] += -0.20656466484069824
+                        else:
+                            margin[0] += 0.09467165917158127
+                    else:
+                        margin[0] += 0.19297146797180176
+            else:
+                if x[9] < -0.6422001719474792:
+                    if x[0] < 0.3071398437023163:
+                        if x[9] < -0.685235857963562:
+                            margin[0] += 0.28398868441581726
+                        else:
+                            margin[0] += 0.0287006888538599
+                    else:
+                        if x[9] < -0.685235857963562:
+                            margin[0] += -0.047439899295568466
+                        else:
+                            margin[0] += 0.04573901370167732
+                else:
+                    margin[0] += 0.29094594717025757
+    else:
+        if x[8] < 0.5077582597732544:
+            if x[9] < 1.7539325952529907:
+                if x[10] < 1.5503575801849365:
+                    margin[0] += 0.2793119251728058
+                else:
+                    if x[12] < 0.22136290371418:
+                        if x[10] < 1.668906807899475:
+                            margin[0] += 0.07896959781646729
+                        else:
+                            margin[0] += -0.13395577669143677
+                    else:
+                        margin[0] += 0.19826555252075195
+            else:
+                margin[0] += 0.31627389788627625
+        else:
+            margin[0] += -0.21797144412994385
+    # tree 6
+    if x[9] < 1.2232118844985962:
+        if x[7] < 0.9256167411804199:
+            if x[9] < -0.07938022911548615:
+                if x[12] < 0.44598954916000366:
+                    if x[9] < -0.2826014459133148:
+                        if x[13] < -1.1952389478683472:
+                            margin[0] += -0.06476682424545288
+                        else:
+                            margin[0] += -0.2761496901512146
+                    else:
+                        if x[10] < 0.4249468743801117:
+                            margin[0] += 0.0006992338458076119
+                        else:
+                            margin[0] += -0.3320883810520172
+                else:
+                    margin[0] += -0.3551015257835388
+            else:
+                if x[8] < 0.5077582597732544:
+                    if x[12] < 0.6863166689872742:
+                        if x[1] < 3.244734525680542:
+                            margin[0] += 0.029934540390968323
+                        else:
+                            margin[0] += -0.3061850666999817
+                    else:
+                        if x[0] < -0.7716843485832214:
+                            margin[0] += -0.10211584717035294
+                        else:
+                            margin[0] += 0.31302952766418457
+                else:
+                    margin[0] += -0.29743021726608276
+        else:
+            if x[9] < -0.7416870594024658:
+                if x[0] < 0.3071398437023163:
+                    if x[9] < -0.8583856821060181:
+                        margin[0] += -0.25641462206840515
+                    else:
+                        if x[0] < 0.0016458351165056229:
+                            margin[0] += 0.05198288336396217
+                        else:
+                            margin[0] += 0.20567254722118378
+                else:
+                    margin[0] += -0.3918037414550781
+            else:
+                if x[9] < -0.6422001719474792:
+                    if x[9] < -0.685235857963562:
+                        margin[0] += 0.26963797211647034
+                    else:
+                        if x[0] < 0.0016458351165056229:
+                            margin[0] += -0.08730965852737427
+                        else:
+                            margin[0] += 0.13766422867774963
+                else:
+                    margin[0] += 0.27606144547462463
+    else:
+        if x[8] < 0.5077582597732544:
+            if x[9] < 1.7539325952529907:
+                if x[10] < 2.189634323120117:
+                    if x[10] < 1.4115698337554932:
+                        margin[0] += 0.26604869961738586
+                    else:
+                        if x[0] < 0.13297276198863983:
+                            margin[0] += 0.17467936873435974
+                        else:
+                            margin[0] += -0.02094257064163685
+                else:
+                    margin[0] += -0.07593317329883575
+            else:
+                margin[0] += 0.307783305644989
+        else:
+            margin[0] += -0.23496997356414795
+    # tree 7
+    if x[9] < 0.9131301045417786:
+        if x[7] < 0.9256167411804199:
+            if x[9] < -0.2826014459133148:
+                if x[13] < -1.1952389478683472:
+                    if x[0] < 0.0016458351165056229:
+                        if x[9] < -1.1204516887664795:
+                            margin[0] += 0.15608425438404083
+                        else:
+                            margin[0] += -0.2500656545162201
+                    else:
+                        margin[0] += 0.2318163961172104
+                else:
+                    if x[10] < 0.9215359091758728:
+                        if x[9] < -0.37638044357299805:
+                            margin[0] += -0.3144105076789856
+                        else:
+                            margin[0] += -0.09431087970733643
+                    else:
+                        if x[10] < 1.5140857696533203:
+                            margin[0] += 0.1458907127380371
+                        else:
+                            margin[0] += -0.23153090476989746
+            else:
+                if x[0] < -1.1100385189056396:
+                    if x[6] < 2.4298055171966553:
+                        if x[12] < 0.250946581363678:
+                            margin[0] += -0.13486462831497192
+                        else:
+                            margin[0] += -0.43214452266693115
+                    else:
+                        margin[0] += 0.03248132765293121
+                else:
+                    if x[12] < -0.2308482974767685:
+                        if x[10] < -0.5462326407432556:
+                            margin[0] += -0.14128081500530243
+                        else:
+                            margin[0] += 0.06450775265693665
+                    else:
+                        if x[9] < -0.1508297175168991:
+                            margin[0] += -0.2547941207885742
+                        else:
+                            margin[0] += 0.12591634690761566
+        else:
+            if x[9] < -0.7416870594024658:
+                if x[0] < 0.3071398437023163:
+                    if x[9] < -0.8583856821060181:
+                        margin[0] += -0.2362382560968399
+                    else:
+                        if x[9] < -0.783709704875946:
+                            margin[0] += 0.044725317507982254
+                        else:
+                            margin[0] += 0.2068520039319992
+                else:
+                    margin[0] += -0.3478776514530182
+            else:
+                if x[12] < -0.6908470392227173:
+                    if x[0] < 0.0016458351165056229:
+                        margin[0] += -0.04332365468144417
+                    else:
+                        margin[0] += 0.22082892060279846
+                else:
+                    margin[0] += 0.2649387717247009
+    else:
+        if x[8] < 0.5077582597732544:
+            if x[0] < -1.1640334129333496:
+                if x[9] < 1.8399429321289062:
+                    margin[0] += -0.10667053610086441
+                else:
+                    margin[0] += 0.17391835153102875
+            else:
+                if x[13] < 0.2660311162471771:
+                    margin[0] += 0.3055751919746399
+                else:
+                    if x[10] < -0.37023210525512695:
+                        margin[0] += -0.2519785463809967
+                    else:
+                        if x[9] < 1.0895239114761353:
+                            margin[0] += 0.01565205119550228
+                        else:
+                            margin[0] += 0.2661101222038269
+        else:
+            margin[0] += -0.2720935642719269
+    # tree 8
+    if x[9] < 0.9131301045417786:
+        if x[7] < 0.9256167411804199:
+            if x[9] < -0.2826014459133148:
+                if x[13] < -1.1952389478683472:
+                    if x[0] < -0.7880632877349854:
+                        margin[0] += -0.2651250660419464
+                    else:
+                        if x[9] < -1.1204516887664795:
+                            margin[0] += 0.2577400207519531
+                        else:
+                            margin[0] += -0.06592892110347748
+                else:
+                    if x[3] < 2.7253599166870117:
+                        if x[9] < -0.37638044357299805:
+                            margin[0] += -0.30394238233566284
+                        else:
+                            margin[0] += -0.07328922301530838
+                    else:
+                        if x[10] < 0.9663380980491638:
+                            margin[0] += 0.1630174219608307
+                        else:
+                            margin[0] += -0.2226973921060562
+            else:
+                if x[0] < -0.7716843485832214:
+                    if x[9] < 0.04125024750828743:
+                        margin[0] += -0.36145511269569397
+                    else:
+                        if x[13] < -0.8935047388076782:
+                            margin[0] += -0.2665320634841919
+                        else:
+                            margin[0] += 0.04457775130867958
+                else:
+                    if x[12] < -0.2308482974767685:
+                        if x[5] < 2.4541778564453125:
+                            margin[0] += -0.09589971601963043
+                        else:
+                            margin[0] += 0.1602143794298172
+                    else:
+                        if x[10] < -0.03432467579841614:
+                            margin[0] += 0.20635570585727692
+                        else:
+                            margin[0] += -0.2106839120388031
+        else:
+            if x[9] < -0.7416870594024658:
+                if x[0] < 0.3071398437023163:
+                    if x[9] < -0.8583856821060181:
+                        margin[0] += -0.217850461602211
+                    else:
+                        if x[0] < -1.3061840534210205:
+                            margin[0] += 0.14801251888275146
+                        else:
+                            margin[0] += -0.0003224590909667313
+                else:
+                    margin[0] += -0.30957603454589844
+            else:
+                if x[9] < -0.493163526058197:
+                    if x[9] < -0.5399386286735535:
+                        if x[12] < -0.6908470392227173:
+                            margin[0] += 0.036547061055898666
+                        else:
+                            margin[0] += 0.20880436897277832
+                    else:
+                        margin[0] += -0.10865621268749237
+                else:
+                    margin[0] += 0.26818037033081055
+    else:
+        if x[8] < 0.5077582597732544:
+            if x[9] < 1.7539325952529907:
+                if x[10] < 1.6027827262878418:
+                    if x[9] < 1.1902085542678833:
+                        margin[0] += 0.3241060674190521
+                    else:
+                        if x[13] < 1.1243572235107422:
+                            margin[0] += 0.21382898092269897
+                        else:
+                            margin[0] += -0.08592432737350464
+                else:
+                    if x[12] < 0.22136290371418:
+                        if x[1] < 3.244734525680542:
+                            margin[0] += 0.05293774977326393
+                        else:
+                            margin[0] += -0.40813523530960083
+                    else:
+                        margin[0] += 0.21366098523139954
+            else:
+                margin[0] += 0.2944662868976593
+        else:
+            margin[0] += -0.2537970542907715
+    # tree 9
+    if x[9] < 1.8096766471862793:
+        if x[13] < 1.404827356338501:
+            if x[9] < -0.37638044357299805:
+                if x[0] < 0.0016458351165056229:
+                    if x[10] < 0.4249468743801117:
+                        if x[2] < 2.3982038497924805:
+                            margin[0] += -0.3804585039615631
+                        else:
+                            margin[0] += -0.09842997789382935
+                    else:
+                        if x[12] < -0.45534420013427734:
+                            margin[0] += 0.2666797339916229
+                        else:
+                            margin[0] += -0.1904647946357727
+                else:
+                    if x[0] < 0.3278498351573944:
+                        if x[5] < 2.4541778564453125:
+                            margin[0] += 0.10533658415079117
+                        else:
+                            margin[0] += -0.21801015734672546
+                    else:
+                        margin[0] += -0.26882946491241455
+            else:
+                if x[13] < 0.4321836531162262:
+                    if x[0] < -1.1640334129333496:
+                        margin[0] += -0.29638123512268066
+                    else:
+                        if x[9] < 0.9131301045417786:
+                            margin[0] += 0.04099348932504654
+                        else:
+                            margin[0] += 0.23584388196468353
+                else:
+                    if x[9] < -0.007779836654663086:
+                        if x[9] < -0.2629084885120392:
+                            margin[0] += -0.012541437521576881
+                        else:
+                            margin[0] += -0.3373947739601135
+                    else:
+                        if x[12] < 0.22136290371418:
+                            margin[0] += -0.12072800099849701
+                        else:
+                            margin[0] += 0.1132393628358841
+        else:
+            if x[9] < -0.783709704875946:
+                if x[10] < 0.3169807493686676:
+                    margin[0] += -0.07631344348192215
+                else:
+                    margin[0] += 0.11326636373996735
+            else:
+                margin[0] += 0.25550705194473267
+    else:
+        margin[0] += 0.28700241446495056
+    # tree 10
+    if x[9] < 1.8096766471862793:
+        if x[13] < 1.404827356338501:
+            if x[9] < -0.5749940872192383:
+                if x[0] < 0.2890116274356842:
+                    if x[9] < -0.8906793594360352:
+                        if x[2] < 2.3982038497924805:
+                            margin[0] += -0.22151772677898407
+                        else:
+                            margin[0] += 0.057624537497758865
+                    else:
+                        margin[0] += -0.3763331174850464
+                else:
+                    if x[0] < 0.3071398437023163:
+                        margin[0] += 0.1689009815454483
+                    else:
+                        if x[9] < -0.7236073613166809:
+                            margin[0] += -0.2980731129646301
+                        else:
+                            margin[0] += -0.03727297484874725
+            else:
+                if x[8] < 3.2280893325805664:
+                    if x[0] < 0.5768716335296631:
+                        if x[0] < 0.3691565692424774:
+                            margin[0] += 0.025996850803494453
+                        else:
+                            margin[0] += -0.14663498103618622
+                    else:
+                        if x[9] < 0.04125024750828743:
+                            margin[0] += -0.2834835648536682
+                        else:
+                            margin[0] += 0.26486992835998535
+                else:
+                    if x[9] < -0.23618608713150024:
+                        margin[0] += 0.09130097925662994
+                    else:
+                        margin[0] += -0.2806706130504608
+        else:
+            if x[9] < -0.8304365277290344:
+                margin[0] += -0.07172954827547073
+            else:
+                if x[9] < -0.783709704875946:
+                    margin[0] += 0.06535948067903519
+                else:
+                    margin[0] += 0.2400791347026825
+    else:
+        margin[0] += 0.27937865257263184
+    # tree 11
+    if x[9] < 1.8096766471862793:
+        if x[13] < 1.404827356338501:
+            if x[0] < -0.7716843485832214:
+                if x[9] < 0.331844687461853:
+                    if x[0] < -1.2774475812911987:
+                        if x[10] < -0.09991329908370972:
+                            margin[0] += -0.21758690476417542
+                        else:
+                            margin[0] += 0.22013165056705475
+                    else:
+                        if x[9] < 0.18654745817184448:
+                            margin[0] += -0.31569787859916687
+                        else:
+                            margin[0] += -0.08242716640233994
+                else:
+                    if x[0] < -1.1640334129333496:
+                        margin[0] += -0.23174475133419037
+                    else:
+                        if x[12] < 0.6494148373603821:
+                            margin[0] += 0.22202712297439575
+                        else:
+                            margin[0] += 0.04714928939938545
+            else:
+                if x[9] < -0.37638044357299805:
+                    if x[13] < -1.1952389478683472:
+                        if x[9] < -1.1204516887664795:
+                            margin[0] += 0.23302976787090302
+                        else:
+                            margin[0] += -0.02089589275419712
+                    else:
+                        if x[0] < 0.2890116274356842:
+                            margin[0] += -0.3148091733455658
+                        else:
+                            margin[0] += -0.06374528259038925
+                else:
+                    if x[12] < -0.2308482974767685:
+                        if x[10] < -0.5462326407432556:
+                            margin[0] += -0.07150182873010635
+                        else:
+                            margin[0] += 0.07851078361272812
+                    else:
+                        if x[8] < 0.5077582597732544:
+                            margin[0] += 0.22095641493797302
+                        else:
+                            margin[0] += -0.21376341581344604
+        else:
+            if x[9] < -0.783709704875946:
+                if x[0] < -1.3346741199493408:
+                    margin[0] += -0.07852628827095032
+                else:
+                    margin[0] += 0.059574637562036514
+            else:
+                margin[0] += 0.22342772781848907
+    else:
+        margin[0] += 0.27090317010879517
+    # tree 12
+    if x[9] < 1.8096766471862793:
+        if x[7] < 0.9256167411804199:
+            if x[9] < -0.5399386286735535:
+                if x[9] < -1.1204516887664795:
+                    margin[0] += 0.027251893654465675
+                else:
+                    if x[9] < -0.8906793594360352:
+                        if x[9] < -0.9755406379699707:
+                            margin[0] += -0.20848141610622406
+                        else:
+                            margin[0] += 0.017347633838653564
+                    else:
+                        margin[0] += -0.2714771330356598
+            else:
+                if x[10] < 1.4209413528442383:
+                    if x[10] < 0.9215359091758728:
+                        if x[8] < 0.5077582597732544:
+                            margin[0] += 0.006830561440438032
+                        else:
+                            margin[0] += -0.19438274204730988
+                    else:
+                        if x[3] < 2.7253599166870117:
+                            margin[0] += 0.18063341081142426
+                        else:
+                            margin[0] += 0.5411192178726196
+                else:
+                    if x[9] < 0.5141816139221191:
+                        if x[2] < 2.3982038497924805:
+                            margin[0] += -0.3122643232345581
+                        else:
+                            margin[0] += 0.09660719335079193
+                    else:
+                        if x[9] < 0.7160375714302063:
+                            margin[0] += 0.24309496581554413
+                        else:
+                            margin[0] += -0.0778297483921051
+        else:
+            if x[9] < -0.6422001719474792:
+                if x[10] < 0.7639397382736206:
+                    if x[0] < 0.0016458351165056229:
+                        if x[12] < -0.6908470392227173:
+                            margin[0] += -0.3713568449020386
+                        else:
+                            margin[0] += -0.021510807797312737
+                    else:
+                        if x[0] < 0.3071398437023163:
+                            margin[0] += 0.1399957835674286
+                        else:
+                            margin[0] += -0.11405589431524277
+                else:
+                    margin[0] += 0.15449504554271698
+            else:
+                if x[9] < -0.493163526058197:
+                    if x[9] < -0.5399386286735535:
+                        margin[0] += 0.20736700296401978
+                    else:
+                        margin[0] += -0.10122054070234299
+                else:
+                    margin[0] += 0.23678527772426605
+    else:
+        margin[0] += 0.26133713126182556
+    # tree 13
+    if x[9] < 1.3182121515274048:
+        if x[7] < 0.9256167411804199:
+            if x[9] < -0.5399386286735535:
+                if x[13] < -1.6414515972137451:
+                    if x[9] < -0.8906793594360352:
+                        if x[9] < -1.1204516887664795:
+                            margin[0] += 0.11584347486495972
+                        else:
+                            margin[0] += -0.021792951971292496
+                    else:
+                        margin[0] += -0.19173720479011536
+                else:
+                    margin[0] += -0.25634559988975525
+            else:
+                if x[10] < 1.4209413528442383:
+                    if x[10] < 0.9215359091758728:
+                        if x[13] < 0.4321836531162262:
+                            margin[0] += 0.01881091669201851
+                        else:
+                            margin[0] += -0.10203226655721664
+                    else:
+                        if x[13] < 0.9181175231933594:
+                            margin[0] += 0.3848877549171448
+                        else:
+                            margin[0] += 0.07816164940595627
+                else:
+                    if x[9] < 0.4678254723548889:
+                        if x[2] < 2.3982038497924805:
+                            margin[0] += -0.2589242458343506
+                        else:
+                            margin[0] += 0.08016398549079895
+                    else:
+                        if x[3] < 2.7253599166870117:
+                            margin[0] += -0.21147406101226807
+                        else:
+                            margin[0] += 0.1452029049396515
+        else:
+            if x[9] < -0.6422001719474792:
+                if x[9] < -0.8583856821060181:
+                    margin[0] += -0.19302929937839508
+                else:
+                    if x[12] < 0.22136290371418:
+                        if x[0] < 0.0016458351165056229:
+                            margin[0] += -0.02056097984313965
+                        else:
+                            margin[0] += 0.17048722505569458
+                    else:
+                        if x[9] < -0.7416870594024658:
+                            margin[0] += -0.15398293733596802
+                        else:
+                            margin[0] += 0.009044280275702477
+            else:
+                if x[9] < -0.37638044357299805:
+                    if x[9] < -0.5152719020843506:
+                        margin[0] += 0.23036302626132965
+                    else:
+                        if x[0] < 0.0016458351165056229:
+                            margin[0] += 0.03148813545703888
+                        else:
+                            margin[0] += -0.14108332991600037
+                else:
+                    margin[0] += 0.24449610710144043
+    else:
+        if x[0] < -1.1640334129333496:
+            margin[0] += -0.05703621730208397
+        else:
+            if x[0] < 0.5570752620697021:
+                if x[0] < 0.3777775466442108:
+                    if x[13] < 1.1243572235107422:
+                        margin[0] += 0.2401314526796341
+                    else:
+                        margin[0] += 0.003294402966275811
+                else:
+                    margin[0] += -0.13080139458179474
+            else:
+                margin[0] += 0.25043997168540955
+    # tree 14
+    if x[9] < 1.8096766471862793:
+        if x[8] < 3.2280893325805664:
+            if x[9] < -0.07938022911548615:
+                if x[4] < 2.7360758781433105:
+                    if x[12] < 0.6851018071174622:
+                        if x[0] < -1.2774475812911987:
+                            margin[0] += 0.19985896348953247
+                        else:
+                            margin[0] += -0.015581023879349232
+                    else:
+                        if x[7] < 0.9256167411804199:
+                            margin[0] += -0.27865952253341675
+                        else:
+                            margin[0] += 0.0039019244723021984
+                else:
+                    margin[0] += -0.34962815046310425
+            else:
+                if x[0] < 0.5768716335296631:
+                    if x[9] < 0.014467079192399979:
+                        if x[13] < 0.3004273772239685:
+                            margin[0] += 0.3093416690826416
+                        else:
+                            margin[0] += -0.018573740497231483
+                    else:
+                        if x[12] < 0.22136290371418:
+                            margin[0] += -0.07430077344179153
+                        else:
+                            margin[0] += 0.11617957800626755
+                else:
+                    if x[10] < 0.5541642308235168:
+                        margin[0] += 0.27481788396835327
+                    else:
+                        margin[0] += -0.07670239359140396
+        else:
+            if x[9] < -0.23618608713150024:
+                margin[0] += 0.09648142009973526
+            else:
+                margin[0] += -0.2521055340766907
+    else:
+        margin[0] += 0.24260185658931732
+    # tree 15
+    if x[9] < 0.9131301045417786:
+        if x[9] < 0.767784595489502:
+            if x[1] < 3.244734525680542:
+                if x[9] < -0.9288138151168823:
+                    if x[9] < -1.1204516887664795:
+                        margin[0] += -0.0035980769898742437
+                    else:
+                        margin[0] += -0.2555324137210846
+                else:
+                    if x[10] < -0.5462326407432556:
+                        if x[3] < 2.7253599166870117:
+                            margin[0] += 0.00960124284029007
+                        else:
+                            margin[0] += -0.16473515331745148
+                    else:
+                        if x[10] < 1.4209413528442383:
+                            margin[0] += 0.16661864519119263
+                        else:
+                            margin[0] += -0.014052163809537888
+            else:
+                margin[0] += -0.26763394474983215
+        else:
+            if x[12] < 0.6863166689872742:
+                margin[0] += -0.40549108386039734
+            else:
+                margin[0] += 0.13593794405460358
+    else:
+        if x[8] < 0.5077582597732544:
+            if x[10] < 1.6069154739379883:
+                if x[13] < 0.2660311162471771:
+                    margin[0] += 0.27355310320854187
+                else:
+                    if x[10] < -0.37023210525512695:
+                        margin[0] += -0.21405836939811707
+                    else:
+                        if x[10] < 1.4115698337554932:
+                            margin[0] += 0.2567954659461975
+                        else:
+                            margin[0] += 0.014245816506445408
+            else:
+                if x[12] < -0.6908470392227173:
+                    if x[10] < 1.7580723762512207:
+                        margin[0] += 0.06495343148708344
+                    else:
+                        margin[0] += -0.2892179787158966
+                else:
+                    if x[0] < -1.1100385189056396:
+                        margin[0] += -0.009012511931359768
+                    else:
+                        margin[0] += 0.19885891675949097
+        else:
+            margin[0] += -0.1821519285440445
+    # tree 16
+    if x[9] < 1.8096766471862793:
+        if x[8] < 3.2280893325805664:
+            if x[9] < -0.07938022911548615:
+                if x[4] < 2.7360758781433105:
+                    if x[12] < 0.6851018071174622:
+                        if x[0] < 0.4007667899131775:
+                            margin[0] += 0.034942205995321274
+                        else:
+                            margin[0] += -0.174105703830719
+                    else:
+                        if x[7] < 0.9256167411804199:
+                            margin[0] += -0.26496461033821106
+                        else:
+                            margin[0] += 0.00021038083650637418
+                else:
+                    margin[0] += -0.31099557876586914
+            else:
+                if x[0] < -1.1100385189056396:
+                    if x[9] < 0.9131301045417786:
+                        if x[10] < 1.3579368591308594:
+                            margin[0] += -0.06795886904001236
+                        else:
+                            margin[0] += -0.2917872965335846
+                    else:
+                        if x[9] < 1.2972747087478638:
+                            margin[0] += 0.17439399659633636
+                        else:
+                            margin[0] += -0.05164584144949913
+                else:
+                    if x[12] < -0.2308482974767685:
+                        if x[9] < 0.014467079192399979:
+                            margin[0] += 0.242714986205101
+                        else:
+                            margin[0] += -0.012861696071922779
+                    else:
+                        if x[10] < 1.4115698337554932:
+                            margin[0] += 0.26204055547714233
+                        else:
+                            margin[0] += 0.0060942512936890125
+        else:
+            if x[9] < -0.23618608713150024:
+                margin[0] += 0.061905838549137115
+            else:
+                margin[0] += -0.2342914491891861
+    else:
+        margin[0] += 0.219967320561409
+    # tree 17
+    if x[9] < 0.9131301045417786:
+        if x[9] < 0.767784595489502:
+            if x[1] < 3.244734525680542:
+                if x[9] < 0.331844687461853:
+                    if x[4] < 2.7360758781433105:
+                        if x[10] < -0.2941528856754303:
+                            margin[0] += -0.029426375404000282
+                        else:
+                            margin[0] += 0.09383798390626907
+                    else:
+                        if x[0] < 0.5393857359886169:
+                            margin[0] += -0.4058765470981598
+                        else:
+                            margin[0] += -0.003410541685298085
+                else:
+                    if x[4] < 2.7360758781433105:
+                        if x[10] < 1.4351072311401367:
+                            margin[0] += -0.22185803949832916
+                        else:
+                            margin[0] += 0.1539699286222458
+                    else:
+                        if x[9] < 0.5141816139221191:
+                            margin[0] += 0.32916906476020813
+                        else:
+                            margin[0] += 0.0032348637469112873
+            else:
+                margin[0] += -0.22943530976772308
+        else:
+            if x[12] < -0.6908470392227173:
+                margin[0] += -0.37740829586982727
+            else:
+                if x[0] < -0.1805393397808075:
+                    margin[0] += -0.1525624692440033
+                else:
+                    margin[0] += 0.17559713125228882
+    else:
+        if x[13] < 0.2660311162471771:
+            if x[0] < -1.1640334129333496:
+                margin[0] += -0.04170142114162445
+            else:
+                if x[0] < 0.5501968264579773:
+                    margin[0] += 0.24654515087604523
+                else:
+                    margin[0] += 0.05249635875225067
+        else:
+            if x[12] < -0.2308482974767685:
+                if x[9] < 1.3182121515274048:
+                    if x[13] < 0.434999942779541:
+                        margin[0] += -0.3067999482154846
+                    else:
+                        margin[0] += -0.048193808645009995
+                else:
+                    if x[9] < 1.4936907291412354:
+                        margin[0] += 0.18536682426929474
+                    else:
+                        if x[9] < 1.681196928024292:
+                            margin[0] += -0.128127783536911
+                        else:
+                            margin[0] += 0.07180417329072952
+            else:
+                margin[0] += 0.17575101554393768
+    # tree 18
+    if x[9] < 1.8096766471862793:
+        if x[9] < -0.9288138151168823:
+            if x[9] < -1.1204516887664795:
+                margin[0] += 0.0019162498647347093
+            else:
+                margin[0] += -0.23585259914398193
+        else:
+            if x[13] < 1.404827356338501:
+                if x[0] < -0.7716843485832214:
+                    if x[9] < 0.18654745817184448:
+                        if x[0] < -1.2774475812911987:
+                            margin[0] += 0.04830821231007576
+                        else:
+                            margin[0] += -0.274152934551239
+                    else:
+                        if x[10] < -0.5462326407432556:
+                            margin[0] += 0.1876954585313797
+                        else:
+                            margin[0] += -0.04955976456403732
+                else:
+                    if x[9] < -0.8304365277290344:
+                        margin[0] += 0.23314858973026276
+                    else:
+                        if x[9] < -0.7416870594024658:
+                            margin[0] += -0.1939418762922287
+                        else:
+                            margin[0] += 0.017110586166381836
+            else:
+                if x[10] < -0.5462326407432556:
+                    if x[0] < -1.3346741199493408:
+                        margin[0] += -0.06379000842571259
+                    else:
+                        margin[0] += 0.11778146028518677
+                else:
+                    margin[0] += 0.20322974026203156
+    else:
+        margin[0] += 0.19909726083278656
+    # tree 19
+    if x[9] < 1.8096766471862793:
+        if x[8] < 3.2280893325805664:
+            if x[10] < 1.6093180179595947:
+                if x[10] < -0.22389601171016693:
+                    if x[0] < 0.4007667899131775:
+                        if x[0] < 0.0016458351165056229:
+                            margin[0] += -0.034015852957963943
+                        else:
+                            margin[0] += 0.0609719380736351
+                    else:
+                        if x[9] < 0.014467079192399979:
+                            margin[0] += -0.30268773436546326
+                        else:
+                            margin[0] += 0.01962040737271309
+                else:
+                    if x[0] < 0.5393857359886169:
+                        if x[0] < 0.3278498351573944:
+                            margin[0] += 0.06411419808864594
+                        else:
+                            margin[0] += -0.23827679455280304
+                    else:
+                        if x[12] < -0.6908470392227173:
+                            margin[0] += 0.025872619822621346
+                        else:
+                            margin[0] += 0.3097136616706848
+            else:
+                if x[10] < 1.7722257375717163:
+                    if x[9] < 1.0895239114761353:
+                        margin[0] += -0.3276452124118805
+                    else:
+                        margin[0] += -0.06515775620937347
+                else:
+                    if x[10] < 2.797149658203125:
+                        if x[9] < -0.03671487793326378:
+                            margin[0] += -0.07198084890842438
+                        else:
+                            margin[0] += 0.19768621027469635
+                    else:
+                        margin[0] += -0.157011017203331
+        else:
+            if x[9] < -0.23618608713150024:
+                margin[0] += 0.045563969761133194
+            else:
+                margin[0] += -0.21445569396018982
+    else:
+        margin[0] += 0.1852262318134308
+    # tree 20
+    if x[9] < -0.6422001719474792:
+        if x[9] < -0.685235857963562:
+            if x[9] < -0.7416870594024658:
+                if x[13] < -1.6414515972137451:
+                    if x[9] < -1.1204516887664795:
+                        margin[0] += 0.13075342774391174
+                    else:
+                        margin[0] += 0.006953126285225153
+                else:
+                    if x[13] < 1.404827356338501:
+                        if x[12] < -0.6908470392227173:
+                            margin[0] += -0.09838186949491501
+                        else:
+                            margin[0] += -0.23857466876506805
+                    else:
+                        if x[9] < -0.8304365277290344:
+                            margin[0] += -0.05365933105349541
+                        else:
+                            margin[0] += 0.05773322656750679
+            else:
+                margin[0] += 0.1339026242494583
+        else:
+            if x[0] < 0.2890116274356842:
+                margin[0] += -0.26871034502983093
+            else:
+                margin[0] += 0.014538352377712727
+    else:
+        if x[7] < 0.9256167411804199:
+            if x[9] < 0.9131301045417786:
+                if x[10] < 1.4209413528442383:
+                    if x[9] < 0.5455568432807922:
+                        if x[10] < -0.5462326407432556:
+                            margin[0] += -0.005979366600513458
+                        else:
+                            margin[0] += 0.12858380377292633
+                    else:
+                        margin[0] += -0.25136590003967285
+                else:
+                    if x[9] < 0.5455568432807922:
+                        if x[10] < 1.5779861211776733:
+                            margin[0] += -0.04968367889523506
+                        else:
+                            margin[0] += -0.23415178060531616
+                    else:
+                        if x[10] < 1.4351072311401367:
+                            margin[0] += -0.19365040957927704
+                        else:
+                            margin[0] += 0.18912696838378906
+            else:
+                if x[12] < 0.22136290371418:
+                    if x[10] < 1.6069154739379883:
+                        if x[13] < 1.1243572235107422:
+                            margin[0] += 0.15124812722206116
+                        else:
+                            margin[0] += -0.10248386859893799
+                    else:
+                        if x[9] < 1.616025447845459:
+                            margin[0] += -0.253692626953125
+                        else:
+                            margin[0] += 0.038932375609874725
+                else:
+                    margin[0] += 0.19127462804317474
+        else:
+            if x[9] < -0.493163526058197:
+                if x[0] < 0.0016458351165056229:
+                    margin[0] += 0.15792085230350494
+                else:
+                    margin[0] += -0.10713910311460495
+            else:
+                margin[0] += 0.19285427033901215
+    # tree 21
+    if x[9] < -0.9288138151168823:
+        if x[9] < -1.1204516887664795:
+            margin[0] += -0.0025884509086608887
+        else:
+            margin[0] += -0.2117687314748764
+    else:
+        if x[13] < 1.404827356338501:
+            if x[9] < -0.8304365277290344:
+                margin[0] += 0.18417921662330627
+            else:
+                if x[9] < -0.37638044357299805:
+                    if x[9] < -0.394689679145813:
+                        if x[9] < -0.6422001719474792:
+                            margin[0] += -0.11894169449806213
+                        else:
+                            margin[0] += 0.03637563809752464
+                    else:
+                        margin[0] += -0.3200792670249939
+                else:
+                    if x[0] < -1.1100385189056396:
+                        if x[9] < 0.9131301045417786:
+                            margin[0] += -0.15908324718475342
+                        else:
+                            margin[0] += 0.044353071600198746
+                    else:
+                        if x[9] < -0.32793018221855164:
+                            margin[0] += 0.2300758957862854
+                        else:
+                            margin[0] += 0.016598055139183998
+        else:
+            if x[9] < -0.783709704875946:
+                margin[0] += 0.0042656841687858105
+            else:
+                if x[12] < 0.6851018071174622:
+                    margin[0] += 0.19602392613887787
+                else:
+                    margin[0] += 0.04952019825577736
+    # tree 22
+    if x[8] < 3.2280893325805664:
+        if x[0] < 0.5768716335296631:
+            if x[0] < 0.3691565692424774:
+                if x[6] < 2.4298055171966553:
+                    if x[13] < -1.6414515972137451:
+                        if x[9] < -0.20256909728050232:
+                            margin[0] += 0.09754004329442978
+                        else:
+                            margin[0] += -0.16128680109977722
+                    else:
+                        if x[9] < -0.1946646124124527:
+                            margin[0] += -0.015499969944357872
+                        else:
+                            margin[0] += 0.10196584463119507
+                else:
+                    if x[12] < -0.6908470392227173:
+                        margin[0] += -0.3265092074871063
+                    else:
+                        if x[9] < -0.1946646124124527:
+                            margin[0] += -0.1403803676366806
+                        else:
+                            margin[0] += 0.24845238029956818
+            else:
+                if x[9] < 0.12625636160373688:
+                    if x[9] < -0.007779836654663086:
+                        if x[0] < 0.5393857359886169:
+                            margin[0] += -0.17844951152801514
+                        else:
+                            margin[0] += 0.07103922963142395
+                    else:
+                        margin[0] += 0.2844237983226776
+                else:
+                    if x[4] < 2.7360758781433105:
+                        margin[0] += -0.3397464454174042
+                    else:
+                        if x[9] < 0.8520295023918152:
+                            margin[0] += -0.2016848474740982
+                        else:
+                            margin[0] += 0.052817776799201965
+        else:
+            if x[9] < 0.15402892231941223:
+                margin[0] += -0.10252303630113602
+            else:
+                if x[10] < 0.7307708859443665:
+                    margin[0] += 0.23135694861412048
+                else:
+                    margin[0] += 0.017584051936864853
+    else:
+        if x[9] < -0.23618608713150024:
+            margin[0] += 0.02986438199877739
+        else:
+            margin[0] += -0.20080620050430298
+    # tree 23
+    if x[9] < -0.9288138151168823:
+        if x[9] < -1.1204516887664795:
+            margin[0] += -0.008719094097614288
+        else:
+            margin[0] += -0.19853045046329498
+    else:
+        if x[13] < 1.404827356338501:
+            if x[0] < -0.7716843485832214:
+                if x[9] < 0.18654745817184448:
+                    if x[0] < -1.2774475812911987:
+                        if x[10] < 0.4249468743801117:
+                            margin[0] += -0.08739235252141953
+                        else:
+                            margin[0] += 0.13956734538078308
+                    else:
+                        if x[12] < 0.6863166689872742:
+                            margin[0] += -0.26874759793281555
+                        else:
+                            margin[0] += -0.035791728645563126
+                else:
+                    if x[0] < -1.1100385189056396:
+                        if x[9] < 0.9131301045417786:
+                            margin[0] += -0.13540592789649963
+                        else:
+                            margin[0] += 0.04770604521036148
+                    else:
+                        if x[9] < 0.3682602345943451:
+                            margin[0] += 0.18589358031749725
+                        else:
+                            margin[0] += 0.04814917966723442
+            else:
+                if x[13] < -1.0129834413528442:
+                    if x[9] < -0.007779836654663086:
+                        if x[0] < 0.0016458351165056229:
+                            margin[0] += 0.10213585197925568
+                        else:
+                            margin[0] += 0.2903193235397339
+                    else:
+                        if x[10] < 1.4351072311401367:
+                            margin[0] += -0.33951336145401
+                        else:
+                            margin[0] += 0.18193331360816956
+                else:
+                    if x[9] < -0.1508297175168991:
+                        if x[0] < 0.2890116274356842:
+                            margin[0] += -0.25700557231903076
+                        else:
+                            margin[0] += 0.011927583254873753
+                    else:
+                        if x[5] < 2.4541778564453125:
+                            margin[0] += -0.0036822394467890263
+                        else:
+                            margin[0] += 0.23828797042369843
+        else:
+            if x[10] < -0.5462326407432556:
+                if x[0] < -1.3346741199493408:
+                    margin[0] += -0.051824018359184265
+                else:
+                    margin[0] += 0.09215491265058517
+            else:
+                margin[0] += 0.1826632171869278
+    # tree 24
+    if x[9] < 1.7539325952529907:
+        if x[9] < 1.4936907291412354:
+            if x[9] < 1.3182121515274048:
+                if x[7] < 0.9256167411804199:
+                    if x[13] < -1.0129834413528442:
+                        if x[0] < 0.0016458351165056229:
+                            margin[0] += -0.01693110354244709
+                        else:
+                            margin[0] += 0.26725733280181885
+                    else:
+                        if x[9] < -0.1508297175168991:
+                            margin[0] += -0.15149074792861938
+                        else:
+                            margin[0] += 0.005317719653248787
+                else:
+                    if x[9] < -0.493163526058197:
+                        if x[10] < 0.7639397382736206:
+                            margin[0] += -0.02847973443567753
+                        else:
+                            margin[0] += 0.13758476078510284
+                    else:
+                        margin[0] += 0.17557425796985626
+            else:
+                margin[0] += 0.20610357820987701
+        else:
+            if x[9] < 1.616025447845459:
+                margin[0] += -0.25002843141555786
+            else:
+                if x[0] < 0.0016458351165056229:
+                    margin[0] += -0.0738152340054512
+                else:
+                    margin[0] += 0.06659723818302155
+    else:
+        margin[0] += 0.15078787505626678
+    # tree 25
+    if x[10] < 2.797149658203125:
+        if x[10] < 2.2175912857055664:
+            if x[10] < 1.668906807899475:
+                if x[9] < 1.3182121515274048:
+                    if x[9] < 0.4168508052825928:
+                        if x[9] < 0.331844687461853:
+                            margin[0] += -0.0011165065225213766
+                        else:
+                            margin[0] += 0.14166449010372162
+                    else:
+                        if x[12] < -0.002149007748812437:
+                            margin[0] += -0.1459832340478897
+                        else:
+                            margin[0] += 0.07417836040258408
+                else:
+                    if x[9] < 1.4936907291412354:
+                        margin[0] += 0.18625333905220032
+                    else:
+                        if x[1] < 3.244734525680542:
+                            margin[0] += -0.053454674780368805
+                        else:
+                            margin[0] += 0.06486698985099792
+            else:
+                if x[9] < 1.616025447845459:
+                    if x[10] < 1.7722257375717163:
+                        margin[0] += -0.328574538230896
+                    else:
+                        margin[0] += 0.046511825174093246
+                else:
+                    margin[0] += 0.079585500061512
+        else:
+            margin[0] += 0.18173034489154816
+    else:
+        margin[0] += -0.13555091619491577
+    # tree 26
+    if x[0] < -0.7716843485832214:
+        if x[0] < -1.010197639465332:
+            if x[12] < 0.6851018071174622:
+                if x[10] < 1.6093180179595947:
+                    if x[10] < 0.7639397382736206:
+                        if x[9] < -0.783709704875946:
+                            margin[0] += -0.023511769250035286
+                        else:
+                            margin[0] += 0.023333081975579262
+                    else:
+                        margin[0] += 0.16735872626304626
+                else:
+                    margin[0] += -0.054756954312324524
+            else:
+                if x[10] < -0.04618745297193527:
+                    if x[9] < 0.18654745817184448:
+                        if x[9] < -0.6699550151824951:
+                            margin[0] += -0.005554606206715107
+                        else:
+                            margin[0] += -0.15643078088760376
+                    else:
+                        margin[0] += 0.19281388819217682
+                else:
+                    if x[9] < 0.08471126109361649:
+                        margin[0] += 0.01757587119936943
+                    else:
+                        if x[9] < 0.5455568432807922:
+                            margin[0] += -0.2491234391927719
+                        else:
+                            margin[0] += -0.008093020878732204
+        else:
+            if x[9] < -0.07938022911548615:
+                margin[0] += -0.22457605600357056
+            else:
+                margin[0] += -0.011900622397661209
+    else:
+        if x[0] < 1.834478546174946e-14:
+            margin[0] += 0.19097018241882324
+        else:
+            if x[13] < -1.0129834413528442:
+                if x[9] < -0.20256909728050232:
+                    if x[9] < -0.37638044357299805:
+                        if x[9] < -0.4732274115085602:
+                            margin[0] += 0.1375018060207367
+                        else:
+                            margin[0] += -0.10000763088464737
+                    else:
+                        if x[10] < -0.5462326407432556:
+                            margin[0] += 0.3308265805244446
+                        else:
+                            margin[0] += 0.04164491221308708
+                else:
+                    if x[10] < 1.4351072311401367:
+                        if x[9] < -0.007779836654663086:
+                            margin[0] += -0.02666262723505497
+                        else:
+                            margin[0] += -0.2888452112674713
+                    else:
+                        if x[9] < 0.3682602345943451:
+                            margin[0] += 0.012705488130450249
+                        else:
+                            margin[0] += 0.22203493118286133
+            else:
+                if x[10] < 1.5779861211776733:
+                    if x[10] < 0.37049925327301025:
+                        if x[3] < 2.7253599166870117:
+                            margin[0] += -0.0014276402071118355
+                        else:
+                            margin[0] += -0.25154054164886475
+                    else:
+                        if x[13] < -0.21414311230182648:
+                            margin[0] += -0.07671239972114563
+                        else:
+                            margin[0] += 0.23281647264957428
+                else:
+                    if x[9] < 0.5141816139221191:
+                        margin[0] += -0.2454555183649063
+                    else:
+                        if x[12] < -0.6908470392227173:
+                            margin[0] += -0.14886699616909027
+                        else:
+                            margin[0] += 0.18839459121227264
+    # tree 27
+    if x[9] < -0.9288138151168823:
+        if x[9] < -1.1204516887664795:
+            margin[0] += -0.0020424872636795044
+        else:
+            margin[0] += -0.1868094950914383
+    else:
+        if x[7] < 0.9256167411804199:
+            if x[10] < 1.4209413528442383:
+                if x[10] < -0.5462326407432556:
+                    if x[9] < 0.5455568432807922:
+                        if x[9] < 0.331844687461853:
+                            margin[0] += -0.032167304307222366
+                        else:
+                            margin[0] += 0.17106619477272034
+                    else:
+                        if x[0] < 0.5387021899223328:
+                            margin[0] += -0.23720921576023102
+                        else:
+                            margin[0] += -0.027344409376382828
+                else:
+                    if x[3] < 2.7253599166870117:
+                        if x[9] < 1.0298290252685547:
+                            margin[0] += -0.058035317808389664
+                        else:
+                            margin[0] += 0.1461520940065384
+                    else:
+                        margin[0] += 0.2937939167022705
+            else:
+                if x[9] < 0.5455568432807922:
+                    if x[10] < 2.2175912857055664:
+                        if x[9] < 0.08471126109361649:
+                            margin[0] += -0.29330751299858093
+                        else:
+                            margin[0] += -0.07357408851385117
+                    else:
+                        margin[0] += 0.03495388478040695
+                else:
+                    if x[10] < 1.5884385108947754:
+                        margin[0] += -0.1498173177242279
+                    else:
+                        if x[0] < -1.1100385189056396:
+                            margin[0] += -0.10272814333438873
+                        else:
+                            margin[0] += 0.15633037686347961
+        else:
+            if x[10] < -0.2941528856754303:
+                if x[9] < -0.37638044357299805:
+                    if x[9] < -0.5152719020843506:
+                        if x[9] < -0.6422001719474792:
+                            margin[0] += -0.003518130863085389
+                        else:
+                            margin[0] += 0.19785259664058685
+                    else:
+                        margin[0] += -0.267839252948761
+                else:
+                    margin[0] += 0.1768413484096527
+            else:
+                margin[0] += 0.1942545622587204
+    # tree 28
+    if x[8] < 3.2280893325805664:
+        if x[0] < 0.5768716335296631:
+            if x[0] < 0.3691565692424774:
+                if x[0] < 0.0016458351165056229:
+                    if x[9] < 0.331844687461853:
+                        if x[4] < 2.7360758781433105:
+                            margin[0] += -0.020254511386156082
+                        else:
+                            margin[0] += -0.2265494167804718
+                    else:
+                        if x[13] < -1.6414515972137451:
+                            margin[0] += -0.06281937658786774
+                        else:
+                            margin[0] += 0.07681138813495636
+                else:
+                    if x[0] < 0.2858205735683441:
+                        margin[0] += 0.2553894817829132
+                    else:
+                        if x[0] < 0.2890116274356842:
+                            margin[0] += -0.11390253156423569
+                        else:
+                            margin[0] += 0.051079485565423965
+            else:
+                if x[9] < 0.12625636160373688:
+                    if x[9] < 0.014467079192399979:
+                        if x[10] < 0.37049925327301025:
+                            margin[0] += -0.15392298996448517
+                        else:
+                            margin[0] += 0.06515952199697495
+                    else:
+                        margin[0] += 0.2475406974554062
+                else:
+                    if x[4] < 2.7360758781433105:
+                        margin[0] += -0.2845973074436188
+                    else:
+                        if x[9] < 0.8520295023918152:
+                            margin[0] += -0.1722361147403717
+                        else:
+                            margin[0] += 0.04572931304574013
+        else:
+            if x[10] < 0.5541642308235168:
+                if x[9] < 0.15402892231941223:
+                    margin[0] += 0.028255699202418327
+                else:
+                    margin[0] += 0.213715597987175
+            else:
+                margin[0] += -0.09416821599006653
+    else:
+        if x[9] < -0.23618608713150024:
+            margin[0] += 0.06764030456542969
+        else:
+            margin[0] += -0.18880495429039001
+    # tree 29
+    if x[9] < 1.7539325952529907:
+        if x[9] < 1.5090900659561157:
+            if x[9] < 1.3182121515274048:
+                if x[1] < 3.244734525680542:
+                    if x[12] < 1.1123276948928833:
+                        if x[9] < -0.9288138151168823:
+                            margin[0] += -0.08770231902599335
+                        else:
+                            margin[0] += 0.01430618017911911
+                    else:
+                        margin[0] += -0.13421043753623962
+                else:
+                    if x[12] < -0.6908470392227173:
+                        margin[0] += -0.19741538166999817
+                    else:
+                        margin[0] += 0.014591760002076626
+            else:
+                margin[0] += 0.1628056913614273
+        else:
+            if x[9] < 1.616025447845459:
+                margin[0] += -0.19874325394630432
+            else:
+                margin[0] += -0.019836565479636192
+    else:
+        margin[0] += 0.12552939355373383
+    # tree 30
+    if x[10] < 2.797149658203125:
+        if x[10] < 2.2175912857055664:
+            if x[10] < 1.4209413528442383:
+                if x[10] < 0.9215359091758728:
+                    if x[9] < -0.37638044357299805:
+                        if x[9] < -0.5152719020843506:
+                            margin[0] += 0.0004149542364757508
+                        else:
+                            margin[0] += -0.18167725205421448
+                    else:
+                        if x[12] < -0.2308482974767685:
+                            margin[0] += -0.013146229088306427
+                        else:
+                            margin[0] += 0.08095869421958923
+                else:
+                    margin[0] += 0.18174932897090912
+            else:
+                if x[9] < 0.5455568432807922:
+                    if x[10] < 1.5779861211776733:
+                        if x[9] < 0.4415658116340637:
+                            margin[0] += -0.14592844247817993
+                        else:
+                            margin[0] += 0.1787528693675995
+                    else:
+                        if x[0] < -1.1040468215942383:
+                            margin[0] += -0.010353977791965008
+                        else:
+                            margin[0] += -0.24703826010227203
+                else:
+                    if x[10] < 1.5884385108947754:
+                        if x[1] < 3.244734525680542:
+                            margin[0] += -0.22330665588378906
+                        else:
+                            margin[0] += 0.05303925648331642
+                    else:
+                        if x[3] < 2.7253599166870117:
+                            margin[0] += -0.0026643439196050167
+                        else:
+                            margin[0] += 0.2073008418083191
+        else:
+            margin[0] += 0.15891271829605103
+    else:
+        margin[0] += -0.12442003935575485
+    # tree 31
+    if x[0] < -0.7716843485832214:
+        if x[0] < -1.2774475812911987:
+            if x[9] < -0.783709704875946:
+                margin[0] += -0.0503678135573864
+            else:
+                if x[12] < 0.6851018071174622:
+                    margin[0] += 0.16152966022491455
+                else:
+                    if x[7] < 0.9256167411804199:
+                        margin[0] += -0.042533989995718
+                    else:
+                        margin[0] += 0.06040719896554947
+        else:
+            if x[9] < 0.18654745817184448:
+                if x[9] < 0.04125024750828743:
+                    margin[0] += -0.22802682220935822
+                else:
+                    margin[0] += -0.08616238832473755
+            else:
+                if x[0] < -1.1100385189056396:
+                    if x[9] < 0.9131301045417786:
+                        margin[0] += -0.13421541452407837
+                    else:
+                        margin[0] += 0.03660820424556732
+                else:
+                    if x[9] < 0.3682602345943451:
+                        margin[0] += 0.12524409592151642
+                    else:
+                        margin[0] += 0.018908128142356873
+    else:
+        if x[13] < -1.0129834413528442:
+            if x[9] < -0.20256909728050232:
+                if x[9] < -0.37638044357299805:
+                    if x[9] < -0.8906793594360352:
+                        margin[0] += 0.1764286458492279
+                    else:
+                        if x[9] < -0.4732274115085602:
+                            margin[0] += 0.020240111276507378
+                        else:
+                            margin[0] += -0.06579936295747757
+                else:
+                    margin[0] += 0.24018217623233795
+            else:
+                if x[10] < -0.5462326407432556:
+                    margin[0] += -0.180387482047081
+                else:
+                    if x[10] < 1.4351072311401367:
+                        margin[0] += -0.008775497786700726
+                    else:
+                        if x[9] < 0.5455568432807922:
+                            margin[0] += 0.04108734056353569
+                        else:
+                            margin[0] += 0.16492916643619537
+        else:
+            if x[9] < -0.1508297175168991:
+                if x[0] < 0.2890116274356842:
+                    if x[7] < 0.9256167411804199:
+                        margin[0] += -0.24788694083690643
+                    else:
+                        margin[0] += -0.10239602625370026
+                else:
+                    if x[10] < -0.2941528856754303:
+                        if x[9] < -0.34791457653045654:
+                            margin[0] += 0.055481214076280594
+                        else:
+                            margin[0] += -0.2120637744665146
+                    else:
+                        margin[0] += 0.19974833726882935
+            else:
+                if x[12] < -0.2308482974767685:
+                    if x[5] < 2.4541778564453125:
+                        if x[9] < 0.04125024750828743:
+                            margin[0] += -0.32473647594451904
+                        else:
+                            margin[0] += -0.007980423048138618
+                    else:
+                        margin[0] += 0.20793133974075317
+                else:
+                    if x[0] < 1.481260895729065:
+                        margin[0] += 0.2427905648946762
+                    else:
+                        margin[0] += -0.013468447141349316
+    # tree 32
+    if x[9] < 0.4168508052825928:
+        if x[9] < 0.331844687461853:
+            if x[4] < 2.7360758781433105:
+                if x[10] < -0.2941528856754303:
+                    if x[0] < 0.5185866355895996:
+                        if x[9] < -0.24939244985580444:
+                            margin[0] += -0.026980219408869743
+                        else:
+                            margin[0] += 0.04877832531929016
+                    else:
+                        margin[0] += -0.1729615032672882
+                else:
+                    if x[10] < 1.2597638368606567:
+                        if x[9] < -0.40640613436698914:
+                            margin[0] += -0.017807811498641968
+                        else:
+                            margin[0] += 0.2230900377035141
+                    else:
+                        if x[0] < 0.5570752620697021:
+                            margin[0] += -0.09996550530195236
+                        else:
+                            margin[0] += 0.12748534977436066
+            else:
+                if x[0] < 0.5393857359886169:
+                    margin[0] += -0.2726994454860687
+                else:
+                    margin[0] += 0.00462345452979207
+        else:
+            if x[4] < 2.7360758781433105:
+                margin[0] += -0.08978960663080215
+            else:
+                margin[0] += 0.25559481978416443
+    else:
+        if x[9] < 0.4678254723548889:
+            margin[0] += -0.17152199149131775
+        else:
+            if x[0] < 0.5768716335296631:
+                if x[0] < 0.3777775466442108:
+                    if x[4] < 2.7360758781433105:
+                        if x[10] < 1.5945172309875488:
+                            margin[0] += 0.12977074086666107
+                        else:
+                            margin[0] += -0.010516957379877567
+                    else:
+                        if x[12] < -0.6908470392227173:
+                            margin[0] += -0.32348600029945374
+                        else:
+                            margin[0] += 0.06981536746025085
+                else:
+                    if x[0] < 0.5393857359886169:
+                        margin[0] += -0.21779650449752808
+                    else:
+                        margin[0] += -0.030280904844403267
+            else:
+                margin[0] += 0.11688680946826935
+    # tree 33
+    if x[8] < 3.2280893325805664:
+        if x[0] < 0.5768716335296631:
+            if x[9] < 0.12625636160373688:
+                if x[0] < 0.0016458351165056229:
+                    if x[0] < -1.2774475812911987:
+                        if x[10] < -0.09991329908370972:
+                            margin[0] += -0.004657625686377287
+                        else:
+                            margin[0] += 0.1255483627319336
+                    else:
+                        if x[9] < -0.8906793594360352:
+                            margin[0] += 0.08619029819965363
+                        else:
+                            margin[0] += -0.07677736133337021
+                else:
+                    if x[9] < -0.1508297175168991:
+                        if x[9] < -0.2629084885120392:
+                            margin[0] += 0.03335307165980339
+                        else:
+                            margin[0] += -0.18152642250061035
+                    else:
+                        if x[3] < 2.7253599166870117:
+                            margin[0] += 0.20242609083652496
+                        else:
+                            margin[0] += 0.03645709529519081
+            else:
+                if x[0] < 0.2655479609966278:
+                    if x[0] < -1.1100385189056396:
+                        if x[9] < 0.9131301045417786:
+                            margin[0] += -0.1481800228357315
+                        else:
+                            margin[0] += 0.03347678482532501
+                    else:
+                        if x[12] < -0.6908470392227173:
+                            margin[0] += -0.02949514240026474
+                        else:
+                            margin[0] += 0.1369955986738205
+                else:
+                    if x[4] < 2.7360758781433105:
+                        margin[0] += -0.23119206726551056
+                    else:
+                        if x[9] < 0.8520295023918152:
+                            margin[0] += -0.128923237323761
+                        else:
+                            margin[0] += 0.056934844702482224
+        else:
+            if x[9] < 0.15402892231941223:
+                margin[0] += -0.06525798887014389
+            else:
+                if x[10] < 0.24723830819129944:
+                    margin[0] += 0.18828557431697845
+                else:
+                    margin[0] += 0.047296199947595596
+    else:
+        if x[9] < 0.08471126109361649:
+            margin[0] += 0.02248215861618519
+        else:
+            margin[0] += -0.177642822265625
+    # tree 34
+    if x[9] < -0.9288138151168823:
+        if x[9] < -1.1204516887664795:
+            margin[0] += 0.0012332206824794412
+        else:
+            margin[0] += -0.1768452525138855
+    else:
+        if x[9] < -0.8304365277290344:
+            if x[12] < -0.6908470392227173:
+                margin[0] += 0.20350199937820435
+            else:
+                margin[0] += -0.036351777613162994
+        else:
+            if x[7] < 0.9256167411804199:
+                if x[9] < -0.5399386286735535:
+                    margin[0] += -0.20607861876487732
+                else:
+                    if x[9] < -0.4549807608127594:
+                        if x[13] < -1.1952389478683472:
+                            margin[0] += 0.1948787271976471
+                        else:
+                            margin[0] += -0.02361437864601612
+                    else:
+                        if x[9] < -0.37638044357299805:
+                            margin[0] += -0.20347708463668823
+                        else:
+                            margin[0] += -0.0022369043435901403
+            else:
+                if x[9] < -0.493163526058197:
+                    if x[9] < -0.6605208516120911:
+                        if x[9] < -0.7416870594024658:
+                            margin[0] += -0.03355758637189865
+                        else:
+                            margin[0] += 0.13005287945270538
+                    else:
+                        if x[12] < 0.548690915107727:
+                            margin[0] += 0.06414822489023209
+                        else:
+                            margin[0] += -0.2814134359359741
+                else:
+                    margin[0] += 0.16552415490150452
+    # tree 35
+    if x[8] < 3.2280893325805664:
+        if x[0] < 0.5393857359886169:
+            if x[0] < 0.4007667899131775:
+                if x[10] < 1.4115698337554932:
+                    if x[10] < 0.9215359091758728:
+                        if x[9] < -0.37638044357299805:
+                            margin[0] += -0.029289808124303818
+                        else:
+                            margin[0] += 0.0339629240334034
+                    else:
+                        margin[0] += 0.15045277774333954
+                else:
+                    if x[10] < 1.4351072311401367:
+                        if x[9] < 0.4415658116340637:
+                            margin[0] += -0.22575505077838898
+                        else:
+                            margin[0] += -0.0523628406226635
+                    else:
+                        if x[0] < -1.1100385189056396:
+                            margin[0] += -0.06611037254333496
+                        else:
+                            margin[0] += 0.05807038024067879
+            else:
+                if x[9] < -0.07938022911548615:
+                    margin[0] += -0.2100001722574234
+                else:
+                    if x[2] < 2.3982038497924805:
+                        margin[0] += -0.11041618883609772
+                    else:
+                        margin[0] += 0.18732744455337524
+        else:
+            if x[9] < 0.08471126109361649:
+                if x[9] < -0.07938022911548615:
+                    margin[0] += 0.007942157797515392
+                else:
+                    margin[0] += -0.15452811121940613
+            else:
+                if x[10] < 1.5779861211776733:
+                    if x[10] < -0.5462326407432556:
+                        if x[0] < 0.5768716335296631:
+                            margin[0] += -0.0691332221031189
+                        else:
+                            margin[0] += 0.18302267789840698
+                    else:
+                        margin[0] += 0.2559618651866913
+                else:
+                    margin[0] += -0.03480935096740723
+    else:
+        if x[13] < -0.21414311230182648:
+            margin[0] += 0.02290002629160881
+        else:
+            margin[0] += -0.1669384241104126
+    # tree 36
+    if x[13] < 1.404827356338501:
+        if x[0] < -0.7716843485832214:
+            if x[9] < 0.04125024750828743:
+                if x[12] < 0.22136290371418:
+                    margin[0] += -0.03475828841328621
+                else:
+                    margin[0] += -0.21608050167560577
+            else:
+                if x[10] < 1.3579368591308594:
+                    if x[9] < 0.08471126109361649:
+                        margin[0] += 0.12290772795677185
+                    else:
+                        if x[0] < -1.1100385189056396:
+                            margin[0] += -0.035753361880779266
+                        else:
+                            margin[0] += 0.05474090948700905
+                else:
+                    if x[12] < 0.6494148373603821:
+                        if x[12] < 0.22136290371418:
+                            margin[0] += -0.0502033568918705
+                        else:
+                            margin[0] += 0.051526155322790146
+                    else:
+                        margin[0] += -0.1525462418794632
+        else:
+            if x[13] < -1.0129834413528442:
+                if x[9] < -0.20256909728050232:
+                    if x[9] < -0.37638044357299805:
+                        if x[9] < -0.4732274115085602:
+                            margin[0] += 0.11083395779132843
+                        else:
+                            margin[0] += -0.03821937367320061
+                    else:
+                        margin[0] += 0.20540538430213928
+                else:
+                    if x[10] < 1.4351072311401367:
+                        if x[9] < -0.007779836654663086:
+                            margin[0] += -0.018875252455472946
+                        else:
+                            margin[0] += -0.22842463850975037
+                    else:
+                        margin[0] += 0.12544380128383636
+            else:
+                if x[12] < -0.6908470392227173:
+                    if x[6] < 2.4298055171966553:
+                        if x[13] < 0.2660311162471771:
+                            margin[0] += 0.014723408967256546
+                        else:
+                            margin[0] += -0.10668109357357025
+                    else:
+                        margin[0] += -0.24164839088916779
+                else:
+                    if x[9] < -0.7236073613166809:
+                        margin[0] += -0.19410231709480286
+                    else:
+                        if x[0] < 0.564565122127533:
+                            margin[0] += 0.10712283849716187
+                        else:
+                            margin[0] += -0.03884618729352951
+    else:
+        if x[9] < -0.783709704875946:
+            margin[0] += -0.008331910707056522
+        else:
+            margin[0] += 0.12720882892608643
+    # tree 37
+    if x[9] < -0.9288138151168823:
+        if x[9] < -1.1204516887664795:
+            margin[0] += 0.00471509387716651
+        else:
+            margin[0] += -0.16604378819465637
+    else:
+        if x[9] < -0.8304365277290344:
+            if x[12] < -0.6908470392227173:
+                margin[0] += 0.17088617384433746
+            else:
+                margin[0] += -0.01680571772158146
+        else:
+            if x[13] < -1.6414515972137451:
+                if x[9] < -0.20256909728050232:
+                    if x[9] < -0.24939244985580444:
+                        margin[0] += -0.09836041927337646
+                    else:
+                        margin[0] += 0.1598198264837265
+                else:
+                    if x[10] < -0.2280287742614746:
+                        margin[0] += -0.3280165493488312
+                    else:
+                        if x[9] < 0.08471126109361649:
+                            margin[0] += 0.2262488305568695
+                        else:
+                            margin[0] += -0.06315533816814423
+            else:
+                if x[13] < -0.9521634578704834:
+                    margin[0] += 0.23076140880584717
+                else:
+                    if x[9] < 1.681196928024292:
+                        if x[12] < -0.6908470392227173:
+                            margin[0] += -0.03941858932375908
+                        else:
+                            margin[0] += 0.016031863167881966
+                    else:
+                        margin[0] += 0.11948282271623611
+    # tree 38
+    if x[6] < 2.4298055171966553:
+        if x[8] < 3.2280893325805664:
+            if x[10] < 1.4209413528442383:
+                if x[10] < -0.22389601171016693:
+                    if x[10] < -0.393339067697525:
+                        if x[9] < 0.5455568432807922:
+                            margin[0] += 0.03370664641261101
+                        else:
+                            margin[0] += -0.10221097618341446
+                    else:
+                        margin[0] += -0.2771359980106354
+                else:
+                    if x[3] < 2.7253599166870117:
+                        if x[9] < 0.4678254723548889:
+                            margin[0] += -0.087704598903656
+                        else:
+                            margin[0] += 0.18058952689170837
+                    else:
+                        margin[0] += 0.20720750093460083
+            else:
+                if x[9] < 0.5455568432807922:
+                    if x[9] < -0.37638044357299805:
+                        margin[0] += 0.07112215459346771
+                    else:
+                        if x[10] < 1.7722257375717163:
+                            margin[0] += -0.13882143795490265
+                        else:
+                            margin[0] += 0.006573705468326807
+                else:
+                    if x[9] < 0.7160375714302063:
+                        margin[0] += 0.18888531625270844
+                    else:
+                        if x[10] < 1.5884385108947754:
+                            margin[0] += -0.10811091214418411
+                        else:
+                            margin[0] += 0.023407086730003357
+        else:
+            if x[9] < 0.08471126109361649:
+                margin[0] += 0.02942408062517643
+            else:
+                margin[0] += -0.1567194014787674
+    else:
+        if x[9] < -0.3579357862472534:
+            margin[0] += 0.10605577379465103
+        else:
+            if x[9] < -0.1946646124124527:
+                margin[0] += -0.23249956965446472
+            else:
+                margin[0] += 0.01649508811533451
+    # tree 39
+    if x[9] < -0.6422001719474792:
+        if x[9] < -0.685235857963562:
+            if x[9] < -0.7416870594024658:
+                if x[0] < 0.3071398437023163:
+                    if x[9] < -0.9288138151168823:
+                        margin[0] += -0.07484163343906403
+                    else:
+                        if x[9] < -0.8304365277290344:
+                            margin[0] += 0.130097433924675
+                        else:
+                            margin[0] += -0.005512265022844076
+                else:
+                    margin[0] += -0.19147922098636627
+            else:
+                margin[0] += 0.12372209876775742
+        else:
+            if x[0] < 0.2890116274356842:
+                margin[0] += -0.21306195855140686
+            else:
+                margin[0] += 0.002564986003562808
+    else:
+        if x[9] < -0.5152719020843506:
+            if x[7] < 0.9256167411804199:
+                margin[0] += 0.04277332127094269
+            else:
+                margin[0] += 0.19758020341396332
+        else:
+            if x[9] < -0.37638044357299805:
+                if x[0] < 0.2858205735683441:
+                    if x[9] < -0.40820568799972534:
+                        margin[0] += 0.12272047251462936
+                    else:
+                        margin[0] += -0.2057269811630249
+                else:
+                    margin[0] += -0.22907081246376038
+            else:
+                if x[9] < -0.30968356132507324:
+                    margin[0] += 0.18238145112991333
+                else:
+                    if x[6] < 2.4298055171966553:
+                        if x[13] < 0.4321836531162262:
+                            margin[0] += 0.04038453474640846
+                        else:
+                            margin[0] += -0.025797521695494652
+                    else:
+                        if x[9] < -0.1946646124124527:
+                            margin[0] += -0.20046086609363556
+                        else:
+                            margin[0] += 0.013037222437560558
+    # tree 40
+    if x[8] < 3.2280893325805664:
+        if x[9] < 0.9131301045417786:
+            if x[1] < 3.244734525680542:
+                if x[9] < 0.767784595489502:
+                    if x[9] < 0.331844687461853:
+                        if x[4] < 2.7360758781433105:
+                            margin[0] += 0.0008414681651629508
+                        else:
+                            margin[0] += -0.13713553547859192
+                    else:
+                        if x[3] < 2.7253599166870117:
+                            margin[0] += 0.16574887931346893
+                        else:
+                            margin[0] += -0.00241368031129241
+                else:
+                    margin[0] += -0.11550440639257431
+            else:
+                margin[0] += -0.1256408840417862
+        else:
+            if x[10] < 1.5779861211776733:
+                if x[13] < 0.2660311162471771:
+                    margin[0] += 0.19104716181755066
+                else:
+                    if x[10] < -0.2321615219116211:
+                        margin[0] += -0.10798951983451843
+                    else:
+                        margin[0] += 0.12768593430519104
+            else:
+                if x[13] < -0.8935047388076782:
+                    margin[0] += 0.058146607130765915
+                else:
+                    if x[10] < 1.7140603065490723:
+                        margin[0] += -0.025549141690135002
+                    else:
+                        margin[0] += -0.10423333197832108
+    else:
+        margin[0] += -0.079099141061306
+    # tree 41
+    if x[9] < -0.6422001719474792:
+        if x[12] < 0.22136290371418:
+            if x[0] < 0.2890116274356842:
+                if x[9] < -0.8304365277290344:
+                    if x[9] < -0.9288138151168823:
+                        margin[0] += -0.02237570285797119
+                    else:
+                        margin[0] += 0.17913472652435303
+                else:
+                    if x[0] < -1.3061840534210205:
+                        margin[0] += 0.0523441918194294
+                    else:
+                        margin[0] += -0.2348785102367401
+            else:
+                if x[9] < -0.783709704875946:
+                    margin[0] += -0.001313078566454351
+                else:
+                    margin[0] += 0.10744974762201309
+        else:
+            if x[9] < -0.7416870594024658:
+                margin[0] += -0.14515410363674164
+            else:
+                margin[0] += -0.03386826068162918
+    else:
+        if x[9] < -0.5152719020843506:
+            if x[7] < 0.9256167411804199:
+                margin[0] += 0.034621499478816986
+            else:
+                margin[0] += 0.18280057609081268
+        else:
+            if x[9] < -0.37638044357299805:
+                if x[0] < 0.2858205735683441:
+                    if x[9] < -0.40820568799972534:
+                        margin[0] += 0.10763109475374222
+                    else:
+                        margin[0] += -0.17514461278915405
+                else:
+                    margin[0] += -0.1832330822944641
+            else:
+                if x[9] < -0.32793018221855164:
+                    margin[0] += 0.20476840436458588
+                else:
+                    if x[7] < 0.9256167411804199:
+                        if x[6] < 2.4298055171966553:
+                            margin[0] += 0.0009527127840556204
+                        else:
+                            margin[0] += -0.08925873041152954
+                    else:
+                        margin[0] += 0.15586306154727936
+    # tree 42
+    if x[9] < -0.493163526058197:
+        if x[0] < 0.3071398437023163:
+            if x[12] < 0.548690915107727:
+                if x[10] < -0.5462326407432556:
+                    if x[9] < -0.6699550151824951:
+                        if x[9] < -0.8057697415351868:
+                            margin[0] += 0.0744326114654541
+                        else:
+                            margin[0] += -0.058393340557813644
+                    else:
+                        margin[0] += 0.1433255821466446
+                else:
+                    margin[0] += -0.09038730710744858
+            else:
+                margin[0] += -0.07572655379772186
+        else:
+            if x[9] < -0.6605208516120911:
+                margin[0] += -0.018583837896585464
+            else:
+                margin[0] += -0.2654116451740265
+    else:
+        if x[7] < 0.9256167411804199:
+            if x[0] < -1.1100385189056396:
+                if x[9] < 0.9131301045417786:
+                    if x[0] < -1.3061840534210205:
+                        margin[0] += -0.02970028668642044
+                    else:
+                        if x[9] < 0.331844687461853:
+                            margin[0] += -0.1788986474275589
+                        else:
+                            margin[0] += -0.03770303726196289
+                else:
+                    margin[0] += 0.03004762902855873
+            else:
+                if x[12] < -0.6908470392227173:
+                    if x[9] < -0.24939244985580444:
+                        margin[0] += -0.1218329668045044
+                    else:
+                        if x[10] < 0.26938220858573914:
+                            margin[0] += 0.021276406943798065
+                        else:
+                            margin[0] += -0.07261159271001816
+                else:
+                    if x[9] < 0.5868630409240723:
+                        if x[10] < 1.5779861211776733:
+                            margin[0] += 0.04361593723297119
+                        else:
+                            margin[0] += -0.11606951802968979
+                    else:
+                        margin[0] += 0.15551169216632843
+        else:
+            if x[0] < 0.0016458351165056229:
+                margin[0] += 0.05428822711110115
+            else:
+                margin[0] += 0.18042638897895813
+    # tree 43
+    if x[13] < 1.404827356338501:
+        if x[0] < -0.7716843485832214:
+            if x[9] < 0.04125024750828743:
+                if x[9] < -0.493163526058197:
+                    margin[0] += -0.04893123358488083
+                else:
+                    margin[0] += -0.18791881203651428
+            else:
+                if x[12] < 0.22136290371418:
+                    margin[0] += -0.11581441760063171
+                else:
+                    if x[10] < -0.04618745297193527:
+                        if x[9] < 0.08471126109361649:
+                            margin[0] += 0.18924014270305634
+                        else:
+                            margin[0] += 0.0037147856783121824
+                    else:
+                        if x[10] < 1.6027827262878418:
+                            margin[0] += -0.11199377477169037
+                        else:
+                            margin[0] += 0.11676029115915298
+        else:
+            if x[10] < -0.2651577293872833:
+                if x[4] < 2.7360758781433105:
+                    if x[0] < 0.5185866355895996:
+                        if x[13] < -1.0129834413528442:
+                            margin[0] += 0.046321772038936615
+                        else:
+                            margin[0] += -0.031189769506454468
+                    else:
+                        margin[0] += -0.23096300661563873
+                else:
+                    if x[9] < 0.6224873661994934:
+                        if x[9] < 0.30384722352027893:
+                            margin[0] += -0.024291254580020905
+                        else:
+                            margin[0] += 0.22235612571239471
+                    else:
+                        if x[9] < 0.9884441494941711:
+                            margin[0] += -0.07468777149915695
+                        else:
+                            margin[0] += 0.03760926052927971
+            else:
+                if x[4] < 2.7360758781433105:
+                    if x[10] < 1.6069154739379883:
+                        if x[9] < 0.12625636160373688:
+                            margin[0] += 0.21343764662742615
+                        else:
+                            margin[0] += 0.02654254250228405
+                    else:
+                        if x[9] < 0.4678254723548889:
+                            margin[0] += -0.12669900059700012
+                        else:
+                            margin[0] += 0.09199470281600952
+                else:
+                    margin[0] += -0.13836339116096497
+    else:
+        if x[9] < -0.783709704875946:
+            margin[0] += -0.018107527866959572
+        else:
+            margin[0] += 0.10923715680837631
+    # tree 44
+    if x[9] < -0.9288138151168823:
+        margin[0] += -0.0778888687491417
+    else:
+        if x[8] < 3.2280893325805664:
+            if x[0] < 0.5768716335296631:
+                if x[10] < -0.2280287742614746:
+                    if x[10] < -0.352011501789093:
+                        if x[0] < 0.5185866355895996:
+                            margin[0] += 0.00947912223637104
+                        else:
+                            margin[0] += -0.11400069296360016
+                    else:
+                        margin[0] += -0.2035778909921646
+                else:
+                    if x[10] < 1.4209413528442383:
+                        if x[12] < 0.6420788764953613:
+                            margin[0] += 0.17347325384616852
+                        else:
+                            margin[0] += 0.03965374827384949
+                    else:
+                        if x[4] < 2.7360758781433105:
+                            margin[0] += 0.01188068650662899
+                        else:
+                            margin[0] += -0.11184913665056229
+            else:
+                if x[9] < 0.15402892231941223:
+                    margin[0] += -0.02836652100086212
+                else:
+                    margin[0] += 0.1384011059999466
+        else:
+            margin[0] += -0.08178003877401352
+    # tree 45
+    if x[9] < 1.681196928024292:
+        if x[10] < 1.7722257375717163:
+            if x[10] < 1.668906807899475:
+                if x[9] < 1.3182121515274048:
+                    if x[9] < 0.4168508052825928:
+                        if x[9] < 0.331844687461853:
+                            margin[0] += -0.006523448973894119
+                        else:
+                            margin[0] += 0.09337811172008514
+                    else:
+                        if x[12] < 0.22136290371418:
+                            margin[0] += -0.10576662421226501
+                        else:
+                            margin[0] += 0.037856873124837875
+                else:
+                    if x[9] < 1.5090900659561157:
+                        margin[0] += 0.13998264074325562
+                    else:
+                        margin[0] += -0.015557545237243176
+            else:
+                margin[0] += -0.21186627447605133
+        else:
+            if x[10] < 2.4541306495666504:
+                margin[0] += 0.1245095506310463
+            else:
+                margin[0] += 0.004358170088380575
+    else:
+        margin[0] += 0.07269472628831863
+    # tree 46
+    if x[9] < 0.9131301045417786:
+        if x[9] < 0.4168508052825928:
+            if x[9] < 0.331844687461853:
+                if x[4] < 2.7360758781433105:
+                    if x[10] < -0.2941528856754303:
+                        if x[13] < -1.0129834413528442:
+                            margin[0] += 0.026057658717036247
+                        else:
+                            margin[0] += -0.027596672996878624
+                    else:
+                        if x[11] < 1.0729485750198364:
+                            margin[0] += 0.11561980098485947
+                        else:
+                            margin[0] += -0.02007317543029785
+                else:
+                    if x[0] < 0.5393857359886169:
+                        margin[0] += -0.1925545483827591
+                    else:
+                        margin[0] += 0.018742503598332405
+            else:
+                if x[4] < 2.7360758781433105:
+                    margin[0] += -0.062021974474191666
+                else:
+                    margin[0] += 0.2029600441455841
+        else:
+            if x[3] < 2.7253599166870117:
+                if x[12] < -0.002149007748812437:
+                    margin[0] += -0.17217254638671875
+                else:
+                    if x[0] < -0.8594333529472351:
+                        margin[0] += -0.13758882880210876
+                    else:
+                        margin[0] += 0.0812944769859314
+            else:
+                if x[9] < 0.5455568432807922:
+                    margin[0] += -0.06294525414705276
+                else:
+                    margin[0] += 0.10167378932237625
+    else:
+        if x[13] < 0.2660311162471771:
+            if x[10] < 1.668906807899475:
+                margin[0] += 0.17225298285484314
+            else:
+                margin[0] += -0.016948848962783813
+        else:
+            if x[1] < 3.244734525680542:
+                margin[0] += -0.14715157449245453
+            else:
+                if x[0] < 0.2655479609966278:
+                    margin[0] += 0.1260683536529541
+                else:
+                    margin[0] += -0.0805819109082222
+    # tree 47
+    if x[9] < -0.9288138151168823:
+        margin[0] += -0.06567750871181488
+    else:
+        if x[13] < 1.404827356338501:
+            if x[0] < 0.0016458351165056229:
+                if x[9] < 0.18654745817184448:
+                    if x[5] < 2.4541778564453125:
+                        if x[10] < -0.2280287742614746:
+                            margin[0] += -0.1257619708776474
+                        else:
+                            margin[0] += 0.05625675618648529
+                    else:
+                        if x[0] < 1.834478546174946e-14:
+                            margin[0] += -0.02522399090230465
+                        else:
+                            margin[0] += 0.13863536715507507
+                else:
+                    if x[12] < 0.22136290371418:
+                        if x[10] < 1.6069154739379883:
+                            margin[0] += 0.011558149941265583
+                        else:
+                            margin[0] += -0.10579811781644821
+                    else:
+                        if x[0] < -1.1100385189056396:
+                            margin[0] += -0.028691884130239487
+                        else:
+                            margin[0] += 0.11319445818662643
+            else:
+                if x[0] < 0.2858205735683441:
+                    margin[0] += 0.19464516639709473
+                else:
+                    if x[0] < 0.2890116274356842:
+                        if x[9] < -0.1946646124124527:
+                            margin[0] += -0.18686991930007935
+                        else:
+                            margin[0] += 0.01980576291680336
+                    else:
+                        if x[13] < 0.292116641998291:
+                            margin[0] += 0.05133383348584175
+                        else:
+                            margin[0] += -0.06456959992647171
+        else:
+            if x[9] < -0.783709704875946:
+                margin[0] += 0.007287992630153894
+            else:
+                margin[0] += 0.09788652509450912
+    # tree 48
+    if x[9] < 1.681196928024292:
+        if x[9] < 1.4936907291412354:
+            if x[9] < 1.2778213024139404:
+                if x[1] < 3.244734525680542:
+                    if x[13] < -1.0129834413528442:
+                        if x[9] < -0.20256909728050232:
+                            margin[0] += 0.09193427860736847
+                        else:
+                            margin[0] += -0.04504259675741196
+                    else:
+                        if x[9] < -0.8583856821060181:
+                            margin[0] += -0.17306898534297943
+                        else:
+                            margin[0] += 0.0013126134872436523
+                else:
+                    margin[0] += -0.08494339138269424
+            else:
+                margin[0] += 0.11060624569654465
+        else:
+            margin[0] += -0.0882139652967453
+    else:
+        margin[0] += 0.07034003734588623
+    # tree 49
+    if x[8] < 3.2280893325805664:
+        if x[9] < 0.9131301045417786:
+            if x[9] < 0.767784595489502:
+                if x[1] < 3.244734525680542:
+                    if x[9] < -0.07938022911548615:
+                        if x[0] < 0.4007667899131775:
+                            margin[0] += 0.0023398338817059994
+                        else:
+                            margin[0] += -0.1537851095199585
+                    else:
+                        if x[3] < 2.7253599166870117:
+                            margin[0] += 0.08119265735149384
+                        else:
+                            margin[0] += -0.02301427535712719
+                else:
+                    margin[0] += -0.09742464870214462
+            else:
+                margin[0] += -0.08574442565441132
+        else:
+            if x[10] < 1.7639602422714233:
+                if x[13] < 1.1243572235107422:
+                    if x[1] < 3.244734525680542:
+                        margin[0] += 0.18099486827850342
+                    else:
+                        if x[10] < 1.5022470951080322:
+                            margin[0] += -0.018580637872219086
+                        else:
+                            margin[0] += 0.08181776851415634
+                else:
+                    margin[0] += -0.035093337297439575
+            else:
+                margin[0] += -0.03129693865776062
+    else:
+        margin[0] += -0.07148496061563492
+    # tree 50
+    if x[9] < -0.9288138151168823:
+        margin[0] += -0.05817776545882225
+    else:
+        if x[13] < 1.404827356338501:
+            if x[0] < -0.7716843485832214:
+                if x[9] < 0.04125024750828743:
+                    margin[0] += -0.13862434029579163
+                else:
+                    if x[10] < 1.3579368591308594:
+                        if x[10] < -0.2280287742614746:
+                            margin[0] += -0.006589545402675867
+                        else:
+                            margin[0] += 0.10856132954359055
+                    else:
+                        if x[10] < 1.6027827262878418:
+                            margin[0] += -0.11269393563270569
+                        else:
+                            margin[0] += 0.042527295649051666
+            else:
+                if x[9] < -0.37638044357299805:
+                    if x[9] < -0.5152719020843506:
+                        if x[0] < 0.3071398437023163:
+                            margin[0] += 0.06654515862464905
+                        else:
+                            margin[0] += -0.04863179475069046
+                    else:
+                        margin[0] += -0.1643931120634079
+                else:
+                    if x[12] < -0.2308482974767685:
+                        if x[9] < -0.20256909728050232:
+                            margin[0] += 0.05889518931508064
+                        else:
+                            margin[0] += -0.022248025983572006
+                    else:
+                        if x[9] < -0.1508297175168991:
+                            margin[0] += 0.016125444322824478
+                        else:
+                            margin[0] += 0.14648275077342987
+        else:
+            if x[12] < 0.6851018071174622:
+                margin[0] += 0.08978115022182465
+            else:
+                margin[0] += 4.101808735867962e-05
+    # tree 51
+    if x[9] < -0.493163526058197:
+        if x[10] < 0.9215359091758728:
+            if x[9] < -0.6605208516120911:
+                if x[9] < -0.7416870594024658:
+                    if x[12] < 0.22136290371418:
+                        if x[2] < 2.3982038497924805:
+                            margin[0] += -0.030209343880414963
+                        else:
+                            margin[0] += 0.07173504680395126
+                    else:
+                        margin[0] += -0.15030793845653534
+                else:
+                    if x[12] < -0.002149007748812437:
+                        margin[0] += -0.0888662040233612
+                    else:
+                        margin[0] += 0.1838449090719223
+            else:
+                if x[12] < -0.6908470392227173:
+                    margin[0] += -0.0009580746991559863
+                else:
+                    margin[0] += -0.2415618747472763
+        else:
+            margin[0] += 0.11320000886917114
+    else:
+        if x[7] < 0.9256167411804199:
+            if x[9] < -0.3579357862472534:
+                margin[0] += 0.1111006885766983
+            else:
+                if x[9] < -0.2826014459133148:
+                    margin[0] += -0.17047402262687683
+                else:
+                    if x[6] < 2.4298055171966553:
+                        if x[0] < -1.1100385189056396:
+                            margin[0] += -0.07269878685474396
+                        else:
+                            margin[0] += 0.015649285167455673
+                    else:
+                        if x[9] < -0.1946646124124527:
+                            margin[0] += -0.16983084380626678
+                        else:
+                            margin[0] += 0.020139139145612717
+        else:
+            if x[0] < 0.0016458351165056229:
+                margin[0] += 0.046760305762290955
+            else:
+                margin[0] += 0.17151401937007904
+    # tree 52
+    if x[8] < 3.2280893325805664:
+        if x[9] < 0.9131301045417786:
+            if x[13] < -0.8935047388076782:
+                if x[13] < -1.0129834413528442:
+                    if x[0] < 0.0016458351165056229:
+                        if x[9] < -0.20256909728050232:
+                            margin[0] += 0.04583215340971947
+                        else:
+                            margin[0] += -0.11796390265226364
+                    else:
+                        margin[0] += 0.1840846985578537
+                else:
+                    if x[9] < -0.1946646124124527:
+                        margin[0] += -0.20351308584213257
+                    else:
+                        if x[0] < -1.1100385189056396:
+                            margin[0] += -0.07778193801641464
+                        else:
+                            margin[0] += 0.055555958300828934
+            else:
+                if x[5] < 2.4541778564453125:
+                    if x[12] < -0.6908470392227173:
+                        if x[10] < -0.3653879463672638:
+                            margin[0] += -0.018190858885645866
+                        else:
+                            margin[0] += -0.22276534140110016
+                    else:
+                        if x[9] < -0.6422001719474792:
+                            margin[0] += -0.044586293399333954
+                        else:
+                            margin[0] += 0.05369004234671593
+                else:
+                    margin[0] += 0.09556175768375397
+        else:
+            if x[9] < 1.5090900659561157:
+                if x[13] < 0.24422882497310638:
+                    margin[0] += 0.17953236401081085
+                else:
+                    margin[0] += -0.008690300397574902
+            else:
+                if x[9] < 1.681196928024292:
+                    margin[0] += -0.0789404883980751
+                else:
+                    margin[0] += 0.07620462775230408
+    else:
+        margin[0] += -0.07130938023328781
+    # tree 53
+    if x[7] < 0.9256167411804199:
+        if x[9] < -1.1204516887664795:
+            margin[0] += 0.07921434938907623
+        else:
+            if x[9] < -0.5399386286735535:
+                if x[9] < -0.8906793594360352:
+                    margin[0] += -0.026261145249009132
+                else:
+                    margin[0] += -0.17220091819763184
+            else:
+                if x[9] < -0.3579357862472534:
+                    if x[0] < 0.0016458351165056229:
+                        margin[0] += -0.02319132536649704
+                    else:
+                        margin[0] += 0.17007574439048767
+                else:
+                    if x[9] < -0.24939244985580444:
+                        if x[12] < -0.45534420013427734:
+                            margin[0] += -0.007831658236682415
+                        else:
+                            margin[0] += -0.1709194779396057
+                    else:
+                        if x[5] < 2.4541778564453125:
+                            margin[0] += -0.010187988169491291
+                        else:
+                            margin[0] += 0.04701455682516098
+    else:
+        if x[9] < -0.493163526058197:
+            if x[9] < -0.6605208516120911:
+                if x[9] < -0.783709704875946:
+                    if x[9] < -0.8057697415351868:
+                        if x[9] < -0.8304365277290344:
+                            margin[0] += -0.03339400514960289
+                        else:
+                            margin[0] += 0.0816245749592781
+                    else:
+                        margin[0] += -0.08379697054624557
+                else:
+                    if x[12] < -0.6908470392227173:
+                        margin[0] += 0.018607784062623978
+                    else:
+                        margin[0] += 0.13286156952381134
+            else:
+                if x[12] < 0.548690915107727:
+                    margin[0] += 0.015378449112176895
+                else:
+                    margin[0] += -0.18187791109085083
+        else:
+            if x[9] < -0.394689679145813:
+                margin[0] += 0.15987682342529297
+            else:
+                margin[0] += 0.04151865094900131
+    # tree 54
+    if x[13] < 1.404827356338501:
+        if x[9] < -0.37638044357299805:
+            if x[9] < -0.5152719020843506:
+                if x[9] < -0.6422001719474792:
+                    if x[12] < -0.6908470392227173:
+                        if x[0] < 0.2890116274356842:
+                            margin[0] += -0.06338445842266083
+                        else:
+                            margin[0] += 0.08445441722869873
+                    else:
+                        margin[0] += -0.10991711914539337
+                else:
+                    if x[7] < 0.9256167411804199:
+                        margin[0] += 0.0277313981205225
+                    else:
+                        margin[0] += 0.17432843148708344
+            else:
+                margin[0] += -0.1784009337425232
+        else:
+            if x[9] < -0.32793018221855164:
+                margin[0] += 0.14499855041503906
+            else:
+                if x[6] < 2.4298055171966553:
+                    if x[13] < 0.4321836531162262:
+                        if x[13] < -0.8935047388076782:
+                            margin[0] += -0.004148578271269798
+                        else:
+                            margin[0] += 0.08906451612710953
+                    else:
+                        if x[9] < 0.08471126109361649:
+                            margin[0] += -0.1104016825556755
+                        else:
+                            margin[0] += 0.0042047700844705105
+                else:
+                    if x[9] < -0.1946646124124527:
+                        margin[0] += -0.17172394692897797
+                    else:
+                        margin[0] += 0.012781999073922634
+    else:
+        if x[9] < -0.783709704875946:
+            margin[0] += 0.005683703348040581
+        else:
+            margin[0] += 0.08246417343616486
+    # tree 55
+    if x[8] < 3.2280893325805664:
+        if x[12] < -0.6908470392227173:
+            if x[13] < -1.0129834413528442:
+                if x[9] < -0.20256909728050232:
+                    if x[9] < -0.9288138151168823:
+                        margin[0] += 0.01266519445925951
+                    else:
+                        margin[0] += 0.10348202288150787
+                else:
+                    if x[10] < 1.4351072311401367:
+                        margin[0] += -0.1225847452878952
+                    else:
+                        margin[0] += 0.11591633409261703
+            else:
+                if x[0] < 0.5570752620697021:
+                    if x[0] < 0.36340925097465515:
+                        if x[1] < 3.244734525680542:
+                            margin[0] += -0.04761610925197601
+                        else:
+                            margin[0] += 0.07874763756990433
+                    else:
+                        if x[2] < 2.3982038497924805:
+                            margin[0] += -0.14395616948604584
+                        else:
+                            margin[0] += -0.01261239591985941
+                else:
+                    margin[0] += 0.06514197587966919
+        else:
+            if x[9] < 0.6224873661994934:
+                if x[10] < 1.5779861211776733:
+                    if x[9] < -0.6422001719474792:
+                        if x[13] < 1.404827356338501:
+                            margin[0] += -0.0856381207704544
+                        else:
+                            margin[0] += -0.0017538348911330104
+                    else:
+                        if x[9] < -0.3579357862472534:
+                            margin[0] += 0.11491574347019196
+                        else:
+                            margin[0] += 0.011456907726824284
+                else:
+                    margin[0] += -0.09209276735782623
+            else:
+                if x[0] < -1.1100385189056396:
+                    margin[0] += -0.01805475912988186
+                else:
+                    margin[0] += 0.18570908904075623
+    else:
+        margin[0] += -0.06426911801099777
+    # tree 56
+    if x[7] < 0.9256167411804199:
+        if x[9] < -0.37638044357299805:
+            if x[13] < -1.1952389478683472:
+                if x[9] < -0.8906793594360352:
+                    margin[0] += 0.06358408182859421
+                else:
+                    margin[0] += -0.03857431933283806
+            else:
+                margin[0] += -0.13829916715621948
+        else:
+            if x[9] < -0.32793018221855164:
+                margin[0] += 0.09990375488996506
+            else:
+                if x[6] < 2.4298055171966553:
+                    if x[0] < -1.1640334129333496:
+                        margin[0] += -0.1008567288517952
+                    else:
+                        if x[9] < 1.681196928024292:
+                            margin[0] += 0.0017502635018900037
+                        else:
+                            margin[0] += 0.09603630751371384
+                else:
+                    if x[9] < -0.11850369721651077:
+                        margin[0] += -0.110669806599617
+                    else:
+                        margin[0] += -0.012025386095046997
+    else:
+        if x[9] < -0.493163526058197:
+            if x[9] < -0.6605208516120911:
+                if x[9] < -0.783709704875946:
+                    if x[9] < -0.8057697415351868:
+                        if x[9] < -0.8304365277290344:
+                            margin[0] += -0.027000660076737404
+                        else:
+                            margin[0] += 0.07423282414674759
+                    else:
+                        margin[0] += -0.06926216930150986
+                else:
+                    if x[0] < 0.0016458351165056229:
+                        margin[0] += 0.012200516648590565
+                    else:
+                        margin[0] += 0.13395659625530243
+            else:
+                margin[0] += -0.11833841353654861
+        else:
+            if x[0] < 0.0016458351165056229:
+                margin[0] += 0.037613723427057266
+            else:
+                margin[0] += 0.15685662627220154
+    # tree 57
+    if x[13] < 1.404827356338501:
+        if x[13] < 1.1243572235107422:
+            if x[9] < 1.0895239114761353:
+                if x[0] < 0.0016458351165056229:
+                    if x[5] < 2.4541778564453125:
+                        if x[3] < 2.7253599166870117:
+                            margin[0] += -0.07676252722740173
+                        else:
+                            margin[0] += 0.0048075211234390736
+                    else:
+                        margin[0] += 0.08852799236774445
+                else:
+                    if x[0] < 0.2858205735683441:
+                        margin[0] += 0.1594502478837967
+                    else:
+                        if x[0] < 0.2890116274356842:
+                            margin[0] += -0.10275903344154358
+                        else:
+                            margin[0] += 0.022646769881248474
+            else:
+                if x[0] < 0.3777775466442108:
+                    if x[12] < 0.17126071453094482:
+                        margin[0] += 0.17237591743469238
+                    else:
+                        margin[0] += 0.02419978938996792
+                else:
+                    margin[0] += -0.03227311372756958
+        else:
+            if x[10] < 1.2638965845108032:
+                if x[9] < 0.767784595489502:
+                    margin[0] += 0.0642390102148056
+                else:
+                    margin[0] += -0.03264695778489113
+            else:
+                margin[0] += -0.17953726649284363
+    else:
+        if x[0] < -1.3346741199493408:
+            margin[0] += 0.004020067863166332
+        else:
+            margin[0] += 0.07838819921016693
+    # tree 58
+    if x[9] < -0.5152719020843506:
+        if x[9] < -0.6422001719474792:
+            if x[9] < -0.6699550151824951:
+                if x[9] < -0.9288138151168823:
+                    margin[0] += -0.0500086285173893
+                else:
+                    if x[13] < 1.404827356338501:
+                        if x[0] < 0.2890116274356842:
+                            margin[0] += -0.079527348279953
+                        else:
+                            margin[0] += 0.05602777376770973
+                    else:
+                        margin[0] += 0.06626152992248535
+            else:
+                margin[0] += -0.1270330548286438
+        else:
+            if x[7] < 0.9256167411804199:
+                margin[0] += 0.02969781681895256
+            else:
+                margin[0] += 0.18009699881076813
+    else:
+        if x[9] < -0.37638044357299805:
+            if x[9] < -0.4549807608127594:
+                margin[0] += -0.16355156898498535
+            else:
+                margin[0] += -0.05466655269265175
+        else:
+            if x[10] < 1.4209413528442383:
+                if x[10] < -0.5462326407432556:
+                    if x[9] < 0.5455568432807922:
+                        if x[9] < 0.18654745817184448:
+                            margin[0] += -0.010869480669498444
+                        else:
+                            margin[0] += 0.1168624758720398
+                    else:
+                        if x[9] < 0.9377968311309814:
+                            margin[0] += -0.17480845749378204
+                        else:
+                            margin[0] += 0.0035980597604066133
+                else:
+                    if x[11] < 1.2077882289886475:
+                        if x[9] < 0.24790054559707642:
+                            margin[0] += 0.20380346477031708
+                        else:
+                            margin[0] += 0.01572667807340622
+                    else:
+                        if x[12] < 0.45142483711242676:
+                            margin[0] += -0.09572703391313553
+                        else:
+                            margin[0] += 0.039193637669086456
+            else:
+                if x[9] < 0.08471126109361649:
+                    margin[0] += -0.13339650630950928
+                else:
+                    if x[0] < 0.5570752620697021:
+                        if x[9] < 0.4415658116340637:
+                            margin[0] += -0.12928715348243713
+                        else:
+                            margin[0] += 0.00760375102981925
+                    else:
+                        margin[0] += 0.13686807453632355
+    # tree 59
+    if x[8] < 3.2280893325805664:
+        if x[10] < 1.5779861211776733:
+            if x[9] < 0.9131301045417786:
+                if x[9] < 0.5455568432807922:
+                    if x[9] < 0.4678254723548889:
+                        if x[13] < -1.0129834413528442:
+                            margin[0] += 0.038218773901462555
+                        else:
+                            margin[0] += -0.01074786763638258
+                    else:
+                        margin[0] += 0.18481037020683289
+                else:
+                    margin[0] += -0.13158515095710754
+            else:
+                if x[10] < -0.5462326407432556:
+                    margin[0] += 0.006412833463400602
+                else:
+                    margin[0] += 0.13212081789970398
+        else:
+            if x[9] < 0.5455568432807922:
+                if x[3] < 2.7253599166870117:
+                    margin[0] += 0.0584341399371624
+                else:
+                    margin[0] += -0.17020408809185028
+            else:
+                if x[3] < 2.7253599166870117:
+                    if x[9] < 1.681196928024292:
+                        if x[1] < 3.244734525680542:
+                            margin[0] += -0.1238856390118599
+                        else:
+                            margin[0] += 0.00114657380618155
+                    else:
+                        margin[0] += 0.031743451952934265
+                else:
+                    margin[0] += 0.1642252653837204
+    else:
+        margin[0] += -0.06750178337097168
+    # tree 60
+    if x[8] < 3.2280893325805664:
+        if x[9] < -0.9288138151168823:
+            margin[0] += -0.04607238620519638
+        else:
+            if x[9] < -0.5152719020843506:
+                if x[9] < -0.6422001719474792:
+                    if x[9] < -0.6699550151824951:
+                        if x[9] < -0.8057697415351868:
+                            margin[0] += 0.05880897864699364
+                        else:
+                            margin[0] += -0.005894290748983622
+                    else:
+                        margin[0] += -0.10048065334558487
+                else:
+                    if x[7] < 0.9256167411804199:
+                        margin[0] += 0.023447196930646896
+                    else:
+                        margin[0] += 0.166969895362854
+            else:
+                if x[9] < -0.37638044357299805:
+                    if x[9] < -0.4549807608127594:
+                        margin[0] += -0.1313447803258896
+                    else:
+                        margin[0] += -0.04335447773337364
+                else:
+                    if x[10] < 1.4209413528442383:
+                        if x[12] < -0.2308482974767685:
+                            margin[0] += -0.0037146173417568207
+                        else:
+                            margin[0] += 0.06780993938446045
+                    else:
+                        if x[9] < 0.014467079192399979:
+                            margin[0] += -0.12235882878303528
+                        else:
+                            margin[0] += 0.0009007512126117945
+    else:
+        margin[0] += -0.05687214434146881
+    # tree 61
+    if x[9] < -1.1204516887664795:
+        margin[0] += 0.05982845276594162
+    else:
+        if x[10] < -0.2651577293872833:
+            if x[4] < 2.7360758781433105:
+                if x[0] < 0.5185866355895996:
+                    if x[0] < 0.0016458351165056229:
+                        if x[5] < 2.4541778564453125:
+                            margin[0] += -0.06684602797031403
+                        else:
+                            margin[0] += 0.0936826691031456
+                    else:
+                        if x[9] < -0.1508297175168991:
+                            margin[0] += -0.021060761064291
+                        else:
+                            margin[0] += 0.11620881408452988
+                else:
+                    margin[0] += -0.17982815206050873
+            else:
+                if x[9] < 0.5455568432807922:
+                    if x[9] < 0.30384722352027893:
+                        margin[0] += -0.045851580798625946
+                    else:
+                        margin[0] += 0.20018288493156433
+                else:
+                    margin[0] += -0.0507650263607502
+        else:
+            if x[9] < 0.12625636160373688:
+                if x[11] < 1.0729485750198364:
+                    if x[10] < 1.4351072311401367:
+                        margin[0] += 0.18720553815364838
+                    else:
+                        margin[0] += -0.02742338925600052
+                else:
+                    if x[0] < -1.2774475812911987:
+                        margin[0] += 0.09430330246686935
+                    else:
+                        margin[0] += -0.1328313797712326
+            else:
+                if x[9] < 0.5455568432807922:
+                    if x[10] < 1.6027827262878418:
+                        if x[9] < 0.4415658116340637:
+                            margin[0] += -0.16947223246097565
+                        else:
+                            margin[0] += -0.04881471395492554
+                    else:
+                        margin[0] += 0.0253967996686697
+                else:
+                    if x[3] < 2.7253599166870117:
+                        if x[10] < 1.5779861211776733:
+                            margin[0] += 0.0449569970369339
+                        else:
+                            margin[0] += -0.036125920712947845
+                    else:
+                        margin[0] += 0.12117787450551987
+    # tree 62
+    if x[7] < 0.9256167411804199:
+        if x[13] < -0.9521634578704834:
+            if x[9] < -0.20256909728050232:
+                if x[9] < -0.9288138151168823:
+                    margin[0] += 0.0055877817794680595
+                else:
+                    if x[9] < -0.2629084885120392:
+                        margin[0] += 0.04847285524010658
+                    else:
+                        margin[0] += 0.12170637398958206
+            else:
+                if x[10] < -0.2280287742614746:
+                    margin[0] += -0.14208805561065674
+                else:
+                    if x[9] < 0.08471126109361649:
+                        margin[0] += 0.18256396055221558
+                    else:
+                        margin[0] += -0.03953741490840912
+        else:
+            if x[9] < -0.1508297175168991:
+                if x[10] < -0.5462326407432556:
+                    if x[9] < -0.3579357862472534:
+                        margin[0] += 0.006366997957229614
+                    else:
+                        margin[0] += -0.22842608392238617
+                else:
+                    margin[0] += 0.04816442355513573
+            else:
+                if x[5] < 2.4541778564453125:
+                    if x[9] < 0.04125024750828743:
+                        if x[12] < -0.2308482974767685:
+                            margin[0] += -0.2541266083717346
+                        else:
+                            margin[0] += 0.03154047578573227
+                    else:
+                        if x[9] < 0.4168508052825928:
+                            margin[0] += 0.07334622740745544
+                        else:
+                            margin[0] += -0.017326820641756058
+                else:
+                    if x[9] < -0.07938022911548615:
+                        margin[0] += 0.1657865047454834
+                    else:
+                        margin[0] += -0.057422492653131485
+    else:
+        if x[9] < -0.493163526058197:
+            if x[9] < -0.6605208516120911:
+                if x[9] < -0.7416870594024658:
+                    if x[12] < 0.22136290371418:
+                        if x[9] < -0.8057697415351868:
+                            margin[0] += 0.03673115372657776
+                        else:
+                            margin[0] += -0.017196331173181534
+                    else:
+                        margin[0] += -0.08205989748239517
+                else:
+                    margin[0] += 0.11799325793981552
+            else:
+                if x[12] < 0.548690915107727:
+                    margin[0] += 0.022518686950206757
+                else:
+                    margin[0] += -0.14676088094711304
+        else:
+            if x[9] < -0.394689679145813:
+                margin[0] += 0.1619969755411148
+            else:
+                margin[0] += 0.04518522322177887
+    # tree 63
+    if x[13] < 1.404827356338501:
+        if x[13] < 1.1243572235107422:
+            if x[9] < 1.0895239114761353:
+                if x[13] < -1.0129834413528442:
+                    if x[0] < -0.7880632877349854:
+                        margin[0] += -0.05956164374947548
+                    else:
+                        if x[9] < -0.20256909728050232:
+                            margin[0] += 0.08473920077085495
+                        else:
+                            margin[0] += -0.011384237557649612
+                else:
+                    if x[9] < 0.5141816139221191:
+                        if x[9] < -0.493163526058197:
+                            margin[0] += -0.05691259726881981
+                        else:
+                            margin[0] += 0.01159580610692501
+                    else:
+                        if x[10] < 1.5617388486862183:
+                            margin[0] += -0.02929767780005932
+                        else:
+                            margin[0] += -0.13809427618980408
+            else:
+                if x[0] < 0.3777775466442108:
+                    if x[12] < 0.17126071453094482:
+                        margin[0] += 0.15782853960990906
+                    else:
+                        margin[0] += 0.02920437604188919
+                else:
+                    margin[0] += -0.019883614033460617
+        else:
+            if x[10] < 1.2638965845108032:
+                if x[11] < -0.3392893970012665:
+                    margin[0] += 0.03487350419163704
+                else:
+                    margin[0] += -0.028563566505908966
+            else:
+                margin[0] += -0.14576351642608643
+    else:
+        if x[9] < -0.783709704875946:
+            margin[0] += -0.001760900137014687
+        else:
+            margin[0] += 0.08632241189479828
+    # tree 64
+    if x[7] < 0.9256167411804199:
+        if x[2] < 2.3982038497924805:
+            if x[9] < -0.37638044357299805:
+                margin[0] += -0.11898177117109299
+            else:
+                if x[9] < -0.32793018221855164:
+                    margin[0] += 0.10457680374383926
+                else:
+                    if x[9] < 0.331844687461853:
+                        if x[10] < 0.4249468743801117:
+                            margin[0] += -0.010957637801766396
+                        else:
+                            margin[0] += -0.11563502252101898
+                    else:
+                        if x[12] < 0.22136290371418:
+                            margin[0] += -0.026120685040950775
+                        else:
+                            margin[0] += 0.06004210188984871
+        else:
+            if x[9] < -0.07938022911548615:
+                if x[9] < -0.4549807608127594:
+                    if x[9] < -0.9288138151168823:
+                        margin[0] += -0.009699161164462566
+                    else:
+                        margin[0] += 0.07504197210073471
+                else:
+                    if x[0] < 0.0016458351165056229:
+                        margin[0] += -0.12519468367099762
+                    else:
+                        margin[0] += -0.024444526061415672
+            else:
+                margin[0] += 0.11277001351118088
+    else:
+        if x[9] < -0.493163526058197:
+            if x[9] < -0.5535029172897339:
+                if x[0] < 0.0016458351165056229:
+                    if x[9] < -0.685235857963562:
+                        if x[9] < -0.8057697415351868:
+                            margin[0] += -0.029355641454458237
+                        else:
+                            margin[0] += 0.03493979200720787
+                    else:
+                        margin[0] += -0.07082591950893402
+                else:
+                    if x[9] < -0.7416870594024658:
+                        if x[9] < -0.8057697415351868:
+                            margin[0] += 0.051168039441108704
+                        else:
+                            margin[0] += -0.0735340490937233
+                    else:
+                        margin[0] += 0.12370771169662476
+            else:
+                margin[0] += -0.09858153015375137
+        else:
+            margin[0] += 0.11657440662384033
+    # tree 65
+    if x[13] < 1.404827356338501:
+        if x[0] < 0.0016458351165056229:
+            if x[9] < 0.18654745817184448:
+                if x[9] < -0.8906793594360352:
+                    margin[0] += 0.04518096148967743
+                else:
+                    if x[9] < -0.5399386286735535:
+                        margin[0] += -0.18281815946102142
+                    else:
+                        if x[9] < -0.4381822943687439:
+                            margin[0] += 0.08682776987552643
+                        else:
+                            margin[0] += -0.06013714149594307
+            else:
+                if x[12] < 0.22136290371418:
+                    if x[10] < 1.6069154739379883:
+                        if x[1] < 3.244734525680542:
+                            margin[0] += -0.07519008219242096
+                        else:
+                            margin[0] += 0.09713328629732132
+                    else:
+                        margin[0] += -0.07773661613464355
+                else:
+                    if x[10] < 1.6027827262878418:
+                        if x[10] < -0.30241841077804565:
+                            margin[0] += 0.10046322643756866
+                        else:
+                            margin[0] += -0.0764484852552414
+                    else:
+                        margin[0] += 0.14347577095031738
+        else:
+            if x[13] < 0.292116641998291:
+                if x[9] < -0.493163526058197:
+                    if x[9] < -0.6605208516120911:
+                        if x[9] < -0.7416870594024658:
+                            margin[0] += -0.026731044054031372
+                        else:
+                            margin[0] += 0.13904768228530884
+                    else:
+                        margin[0] += -0.12983743846416473
+                else:
+                    if x[9] < -0.34791457653045654:
+                        margin[0] += 0.1758657693862915
+                    else:
+                        if x[9] < -0.1946646124124527:
+                            margin[0] += -0.09912584722042084
+                        else:
+                            margin[0] += 0.07044034451246262
+            else:
+                if x[10] < 0.30509692430496216:
+                    margin[0] += -0.142607182264328
+                else:
+                    if x[9] < 0.12625636160373688:
+                        margin[0] += 0.08968332409858704
+                    else:
+                        margin[0] += -0.02986314333975315
+    else:
+        if x[9] < -0.783709704875946:
+            margin[0] += -0.002017950639128685
+        else:
+            margin[0] += 0.07769148051738739
+    # tree 66
+    if x[9] < -0.9288138151168823:
+        margin[0] += -0.05639799311757088
+    else:
+        if x[9] < -0.5152719020843506:
+            if x[9] < -0.6422001719474792:
+                if x[9] < -0.6605208516120911:
+                    if x[0] < 0.2890116274356842:
+                        if x[9] < -0.8304365277290344:
+                            margin[0] += 0.08919596672058105
+                        else:
+                            margin[0] += -0.04792630299925804
+                    else:
+                        if x[0] < 0.3071398437023163:
+                            margin[0] += 0.08399319648742676
+                        else:
+                            margin[0] += -0.0036079655401408672
+                else:
+                    margin[0] += -0.10065662860870361
+            else:
+                if x[7] < 0.9256167411804199:
+                    margin[0] += 0.0022131113801151514
+                else:
+                    margin[0] += 0.16993391513824463
+        else:
+            if x[9] < -0.37638044357299805:
+                margin[0] += -0.12494064122438431
+            else:
+                if x[9] < -0.34791457653045654:
+                    margin[0] += 0.10240226238965988
+                else:
+                    if x[6] < 2.4298055171966553:
+                        if x[9] < -0.20256909728050232:
+                            margin[0] += 0.07495224475860596
+                        else:
+                            margin[0] += -0.0034604049287736416
+                    else:
+                        if x[9] < -0.11850369721651077:
+                            margin[0] += -0.1102355495095253
+                        else:
+                            margin[0] += -0.004122199956327677
+    # tree 67
+    if x[10] < -0.2651577293872833:
+        if x[13] < -1.0129834413528442:
+            if x[9] < -0.20256909728050232:
+                if x[9] < -0.2629084885120392:
+                    if x[9] < -0.8906793594360352:
+                        margin[0] += 0.06360715627670288
+                    else:
+                        margin[0] += -0.0358414500951767
+                else:
+                    margin[0] += 0.1769237518310547
+            else:
+                margin[0] += -0.08622957020998001
+        else:
+            if x[3] < 2.7253599166870117:
+                if x[9] < -0.1946646124124527:
+                    if x[7] < 0.9256167411804199:
+                        if x[9] < -0.3579357862472534:
+                            margin[0] += -0.016464022919535637
+                        else:
+                            margin[0] += -0.20180648565292358
+                    else:
+                        if x[9] < -0.5152719020843506:
+                            margin[0] += 0.024248212575912476
+                        else:
+                            margin[0] += -0.05739107355475426
+                else:
+                    if x[9] < 0.5455568432807922:
+                        if x[12] < -0.6908470392227173:
+                            margin[0] += 0.02494877018034458
+                        else:
+                            margin[0] += 0.13763394951820374
+                    else:
+                        if x[0] < 0.0016458351165056229:
+                            margin[0] += -0.09106126427650452
+                        else:
+                            margin[0] += -0.0009562786435708404
+            else:
+                if x[12] < 0.45142483711242676:
+                    margin[0] += -0.18111173808574677
+                else:
+                    margin[0] += 0.021206244826316833
+    else:
+        if x[4] < 2.7360758781433105:
+            if x[12] < -0.45534420013427734:
+                if x[10] < 1.6069154739379883:
+                    if x[9] < 0.12625636160373688:
+                        margin[0] += 0.15206484496593475
+                    else:
+                        if x[10] < 1.4351072311401367:
+                            margin[0] += -0.05959028750658035
+                        else:
+                            margin[0] += 0.1189897358417511
+                else:
+                    if x[3] < 2.7253599166870117:
+                        margin[0] += 0.04441947489976883
+                    else:
+                        margin[0] += -0.06571096181869507
+            else:
+                if x[12] < 0.22136290371418:
+                    margin[0] += -0.08527925610542297
+                else:
+                    if x[12] < 0.6851018071174622:
+                        margin[0] += 0.06649075448513031
+                    else:
+                        if x[9] < 0.08471126109361649:
+                            margin[0] += 0.04155268147587776
+                        else:
+                            margin[0] += -0.07969138026237488
+        else:
+            if x[12] < -0.6908470392227173:
+                margin[0] += -0.11689811944961548
+            else:
+                margin[0] += 0.04949628561735153
+    # tree 68
+    if x[9] < -0.9288138151168823:
+        margin[0] += -0.057245876640081406
+    else:
+        if x[7] < 0.9256167411804199:
+            if x[13] < -0.9521634578704834:
+                if x[10] < 1.6069154739379883:
+                    if x[9] < -0.20256909728050232:
+                        if x[9] < -0.2629084885120392:
+                            margin[0] += 0.024651555344462395
+                        else:
+                            margin[0] += 0.15705867111682892
+                    else:
+                        if x[10] < -0.2280287742614746:
+                            margin[0] += -0.09494762867689133
+                        else:
+                            margin[0] += 0.11192988604307175
+                else:
+                    margin[0] += -0.04809574782848358
+            else:
+                if x[9] < 1.681196928024292:
+                    if x[12] < -0.6908470392227173:
+                        if x[10] < 0.26938220858573914:
+                            margin[0] += -0.028799675405025482
+                        else:
+                            margin[0] += -0.13206827640533447
+                    else:
+                        if x[9] < 0.6224873661994934:
+                            margin[0] += -0.015324095264077187
+                        else:
+                            margin[0] += 0.10886187106370926
+                else:
+                    margin[0] += 0.08958616107702255
+        else:
+            if x[9] < -0.493163526058197:
+                if x[9] < -0.6605208516120911:
+                    if x[9] < -0.783709704875946:
+                        if x[9] < -0.8057697415351868:
+                            margin[0] += 0.03348010033369064
+                        else:
+                            margin[0] += -0.059635091572999954
+                    else:
+                        margin[0] += 0.08208384364843369
+                else:
+                    if x[12] < 0.548690915107727:
+                        margin[0] += 0.03373173996806145
+                    else:
+                        margin[0] += -0.1033196896314621
+            else:
+                margin[0] += 0.1082228273153305
+    # tree 69
+    if x[9] < 0.9131301045417786:
+        if x[1] < 3.244734525680542:
+            if x[10] < 1.6027827262878418:
+                if x[9] < 0.5868630409240723:
+                    if x[12] < 0.44598954916000366:
+                        if x[0] < 0.4093877375125885:
+                            margin[0] += 0.02675946243107319
+                        else:
+                            margin[0] += -0.0310025867074728
+                    else:
+                        if x[9] < 0.4415658116340637:
+                            margin[0] += -0.04808378964662552
+                        else:
+                            margin[0] += 0.07182035595178604
+                else:
+                    margin[0] += -0.11872497200965881
+            else:
+                if x[9] < 0.30384722352027893:
+                    margin[0] += -0.018238991498947144
+                else:
+                    margin[0] += 0.11249016970396042
+        else:
+            margin[0] += -0.08746127784252167
+    else:
+        if x[13] < 0.2660311162471771:
+            if x[10] < 1.668906807899475:
+                margin[0] += 0.1283336728811264
+            else:
+                margin[0] += -0.0018068993231281638
+        else:
+            if x[1] < 3.244734525680542:
+                margin[0] += -0.09199270606040955
+            else:
+                if x[9] < 1.3815468549728394:
+                    margin[0] += 0.014697542414069176
+                else:
+                    margin[0] += 0.05357421562075615
+    # tree 70
+    if x[13] < 1.404827356338501:
+        if x[9] < -0.37638044357299805:
+            if x[9] < -0.5152719020843506:
+                if x[9] < -0.6422001719474792:
+                    if x[12] < -0.6908470392227173:
+                        if x[0] < 0.2890116274356842:
+                            margin[0] += -0.049331311136484146
+                        else:
+                            margin[0] += 0.0552329383790493
+                    else:
+                        margin[0] += -0.09146992117166519
+                else:
+                    margin[0] += 0.0830249935388565
+            else:
+                margin[0] += -0.12446383386850357
+        else:
+            if x[0] < -1.1100385189056396:
+                if x[9] < 0.9131301045417786:
+                    if x[10] < -0.1247098371386528:
+                        margin[0] += -0.11465958505868912
+                    else:
+                        margin[0] += -0.026169894263148308
+                else:
+                    margin[0] += 0.0346643328666687
+            else:
+                if x[9] < -0.34791457653045654:
+                    margin[0] += 0.09208422899246216
+                else:
+                    if x[6] < 2.4298055171966553:
+                        if x[13] < 0.4321836531162262:
+                            margin[0] += 0.04441706836223602
+                        else:
+                            margin[0] += -0.007423067465424538
+                    else:
+                        margin[0] += -0.07681366056203842
+    else:
+        if x[9] < -0.783709704875946:
+            margin[0] += -0.0022754932288080454
+        else:
+            margin[0] += 0.07850119471549988
+    # tree 71
+    if x[8] < 3.2280893325805664:
+        if x[9] < 0.6224873661994934:
+            if x[10] < 1.5779861211776733:
+                if x[9] < 0.4415658116340637:
+                    if x[10] < 1.4209413528442383:
+                        if x[9] < 0.331844687461853:
+                            margin[0] += -0.004425654653459787
+                        else:
+                            margin[0] += 0.09318128228187561
+                    else:
+                        margin[0] += -0.08111091703176498
+                else:
+                    margin[0] += 0.07552215456962585
+            else:
+                if x[3] < 2.7253599166870117:
+                    margin[0] += 0.04946865886449814
+                else:
+                    margin[0] += -0.13403542339801788
+        else:
+            if x[12] < 0.22136290371418:
+                if x[0] < 0.5393857359886169:
+                    if x[4] < 2.7360758781433105:
+                        if x[10] < 1.6069154739379883:
+                            margin[0] += 0.0739889144897461
+                        else:
+                            margin[0] += -0.05002092197537422
+                    else:
+                        margin[0] += -0.08927538990974426
+                else:
+                    margin[0] += 0.07588811218738556
+            else:
+                margin[0] += 0.11046936362981796
+    else:
+        margin[0] += -0.05495130270719528
+    # tree 72
+    if x[13] < 1.404827356338501:
+        if x[0] < -1.1100385189056396:
+            if x[10] < 0.4249468743801117:
+                margin[0] += -0.09622204303741455
+            else:
+                margin[0] += 0.012327485717833042
+        else:
+            if x[9] < -0.493163526058197:
+                if x[9] < -1.1204516887664795:
+                    margin[0] += 0.0677059218287468
+                else:
+                    if x[7] < 0.9256167411804199:
+                        margin[0] += -0.08391223847866058
+                    else:
+                        if x[9] < -0.5535029172897339:
+                            margin[0] += 0.005382603034377098
+                        else:
+                            margin[0] += -0.08029647171497345
+            else:
+                if x[9] < -0.394689679145813:
+                    margin[0] += 0.11595559865236282
+                else:
+                    if x[12] < -0.6908470392227173:
+                        if x[9] < -0.24939244985580444:
+                            margin[0] += -0.16898605227470398
+                        else:
+                            margin[0] += -0.0005462056142278016
+                    else:
+                        if x[0] < 0.3691565692424774:
+                            margin[0] += 0.0630529448390007
+                        else:
+                            margin[0] += -0.009679855778813362
+    else:
+        if x[9] < -0.783709704875946:
+            margin[0] += -0.000509302073623985
+        else:
+            margin[0] += 0.06784674525260925
+    # tree 73
+    if x[9] < -0.9288138151168823:
+        margin[0] += -0.04464321210980415
+    else:
+        if x[7] < 0.9256167411804199:
+            if x[2] < 2.3982038497924805:
+                if x[10] < 1.7140603065490723:
+                    if x[0] < 0.5418601632118225:
+                        if x[0] < 0.26284822821617126:
+                            margin[0] += 0.006494065281003714
+                        else:
+                            margin[0] += -0.06405007094144821
+                    else:
+                        if x[9] < 0.08471126109361649:
+                            margin[0] += -0.07525862753391266
+                        else:
+                            margin[0] += 0.12751956284046173
+                else:
+                    if x[9] < 1.0895239114761353:
+                        margin[0] += -0.11727238446474075
+                    else:
+                        margin[0] += -0.0040362197905778885
+            else:
+                if x[9] < -0.07938022911548615:
+                    if x[9] < -0.4549807608127594:
+                        margin[0] += 0.06270435452461243
+                    else:
+                        if x[0] < 0.0016458351165056229:
+                            margin[0] += -0.10633540153503418
+                        else:
+                            margin[0] += -0.012930015102028847
+                else:
+                    margin[0] += 0.09562715888023376
+        else:
+            if x[9] < -0.493163526058197:
+                if x[9] < -0.5399386286735535:
+                    if x[0] < 0.0016458351165056229:
+                        if x[9] < -0.685235857963562:
+                            margin[0] += 0.013869530521333218
+                        else:
+                            margin[0] += -0.06456394493579865
+                    else:
+                        if x[9] < -0.7416870594024658:
+                            margin[0] += -0.022985121235251427
+                        else:
+                            margin[0] += 0.11461462080478668
+                else:
+                    margin[0] += -0.07533444464206696
+            else:
+                margin[0] += 0.10028848797082901
+    # tree 74
+    if x[9] < -1.1204516887664795:
+        margin[0] += 0.05172916129231453
+    else:
+        if x[13] < -1.6414515972137451:
+            if x[10] < -0.2280287742614746:
+                if x[9] < -0.20256909728050232:
+                    if x[9] < -0.5399386286735535:
+                        margin[0] += -0.05230644717812538
+                    else:
+                        margin[0] += 0.0717337355017662
+                else:
+                    margin[0] += -0.20549622178077698
+            else:
+                if x[10] < 1.6069154739379883:
+                    margin[0] += 0.07205875962972641
+                else:
+                    margin[0] += -0.04315725341439247
+        else:
+            if x[2] < 2.3982038497924805:
+                if x[12] < -0.6908470392227173:
+                    if x[9] < 0.014467079192399979:
+                        if x[0] < 0.0016458351165056229:
+                            margin[0] += -0.06368644535541534
+                        else:
+                            margin[0] += 0.06487684696912766
+                    else:
+                        if x[9] < 0.30384722352027893:
+                            margin[0] += -0.1945776790380478
+                        else:
+                            margin[0] += -0.002961330348625779
+                else:
+                    if x[12] < 0.4507904648780823:
+                        if x[10] < 0.26938220858573914:
+                            margin[0] += 0.011020050384104252
+                        else:
+                            margin[0] += 0.10839586704969406
+                    else:
+                        if x[9] < 0.014467079192399979:
+                            margin[0] += -0.049470555037260056
+                        else:
+                            margin[0] += 0.024720674380660057
+            else:
+                margin[0] += 0.07398879528045654
+    # tree 75
+    if x[13] < 1.404827356338501:
+        if x[0] < -0.7716843485832214:
+            if x[9] < 0.04125024750828743:
+                margin[0] += -0.1229684129357338
+            else:
+                if x[9] < 0.5141816139221191:
+                    if x[12] < 0.45142483711242676:
+                        margin[0] += -0.0568886324763298
+                    else:
+                        if x[10] < -0.04618745297193527:
+                            margin[0] += 0.10822206735610962
+                        else:
+                            margin[0] += -0.008581126108765602
+                else:
+                    if x[9] < 0.9131301045417786:
+                        margin[0] += -0.11769033968448639
+                    else:
+                        margin[0] += 0.04158444330096245
+        else:
+            if x[13] < -1.0129834413528442:
+                if x[9] < -0.007779836654663086:
+                    if x[9] < -0.37638044357299805:
+                        if x[9] < -0.8906793594360352:
+                            margin[0] += 0.08415710926055908
+                        else:
+                            margin[0] += -0.02933196909725666
+                    else:
+                        margin[0] += 0.08480219542980194
+                else:
+                    margin[0] += -0.02922881580889225
+            else:
+                if x[12] < -0.2308482974767685:
+                    if x[10] < -0.2569580674171448:
+                        if x[13] < -0.21414311230182648:
+                            margin[0] += -0.022740397602319717
+                        else:
+                            margin[0] += -0.12872247397899628
+                    else:
+                        if x[4] < 2.7360758781433105:
+                            margin[0] += 0.055834848433732986
+                        else:
+                            margin[0] += -0.08911512792110443
+                else:
+                    if x[9] < -0.6422001719474792:
+                        margin[0] += -0.058434706181287766
+                    else:
+                        if x[0] < 0.3691565692424774:
+                            margin[0] += 0.09447877109050751
+                        else:
+                            margin[0] += -0.01717175357043743
+    else:
+        if x[9] < -0.783709704875946:
+            margin[0] += -0.002715351525694132
+        else:
+            margin[0] += 0.0670342743396759
+    # tree 76
+    if x[8] < 3.2280893325805664:
+        if x[0] < 0.5768716335296631:
+            if x[0] < 0.4007667899131775:
+                if x[10] < 1.6027827262878418:
+                    if x[9] < 0.014467079192399979:
+                        if x[9] < -0.24939244985580444:
+                            margin[0] += -0.010468732565641403
+                        else:
+                            margin[0] += 0.07646266371011734
+                    else:
+                        if x[13] < 0.434999942779541:
+                            margin[0] += -0.08205077052116394
+                        else:
+                            margin[0] += 0.06655953079462051
+                else:
+                    if x[1] < 3.244734525680542:
+                        if x[9] < 0.30384722352027893:
+                            margin[0] += 0.00451913895085454
+                        else:
+                            margin[0] += 0.11743829399347305
+                    else:
+                        margin[0] += -0.047697510570287704
+            else:
+                if x[9] < -0.007779836654663086:
+                    margin[0] += -0.13359452784061432
+                else:
+                    if x[9] < 0.12625636160373688:
+                        margin[0] += 0.14820446074008942
+                    else:
+                        if x[9] < 0.8520295023918152:
+                            margin[0] += -0.11684954911470413
+                        else:
+                            margin[0] += -0.0008684255299158394
+        else:
+            if x[9] < 0.15402892231941223:
+                margin[0] += 0.002686576684936881
+            else:
+                margin[0] += 0.0928187370300293
+    else:
+        margin[0] += -0.05655479058623314
+    # tree 77
+    if x[9] < -0.9288138151168823:
+        margin[0] += -0.04804758355021477
+    else:
+        if x[9] < -0.5152719020843506:
+            if x[9] < -0.6422001719474792:
+                if x[9] < -0.6605208516120911:
+                    if x[12] < -0.002149007748812437:
+                        if x[9] < -0.8057697415351868:
+                            margin[0] += 0.05079967901110649
+                        else:
+                            margin[0] += -0.07438107579946518
+                    else:
+                        if x[9] < -0.7454786896705627:
+                            margin[0] += -0.0021847900934517384
+                        else:
+                            margin[0] += 0.11177825182676315
+                else:
+                    margin[0] += -0.0870489850640297
+            else:
+                if x[7] < 0.9256167411804199:
+                    margin[0] += -0.01108494121581316
+                else:
+                    margin[0] += 0.1564941555261612
+        else:
+            if x[9] < -0.37638044357299805:
+                margin[0] += -0.08721523731946945
+            else:
+                if x[10] < 1.4209413528442383:
+                    if x[13] < -0.8935047388076782:
+                        if x[0] < 0.2890116274356842:
+                            margin[0] += -0.050836093723773956
+                        else:
+                            margin[0] += 0.05158068239688873
+                    else:
+                        if x[8] < 3.2280893325805664:
+                            margin[0] += 0.04559779539704323
+                        else:
+                            margin[0] += -0.04560326784849167
+                else:
+                    if x[9] < 0.5455568432807922:
+                        if x[10] < 1.5779861211776733:
+                            margin[0] += -0.010858342051506042
+                        else:
+                            margin[0] += -0.10118935257196426
+                    else:
+                        if x[3] < 2.7253599166870117:
+                            margin[0] += -0.022721536457538605
+                        else:
+                            margin[0] += 0.10652512311935425
+    # tree 78
+    if x[6] < 2.4298055171966553:
+        if x[0] < 0.4093877375125885:
+            if x[9] < 0.014467079192399979:
+                if x[9] < -0.24939244985580444:
+                    if x[9] < -0.394689679145813:
+                        if x[9] < -0.493163526058197:
+                            margin[0] += -0.001693249330855906
+                        else:
+                            margin[0] += 0.1383521556854248
+                    else:
+                        margin[0] += -0.11483519524335861
+                else:
+                    if x[13] < -1.6414515972137451:
+                        margin[0] += 0.0023961090482771397
+                    else:
+                        if x[9] < -0.11850369721651077:
+                            margin[0] += 0.021769139915704727
+                        else:
+                            margin[0] += 0.16892671585083008
+            else:
+                if x[9] < 0.18654745817184448:
+                    if x[13] < -1.6414515972137451:
+                        margin[0] += 0.002293533878400922
+                    else:
+                        margin[0] += -0.19385965168476105
+                else:
+                    if x[12] < 0.22136290371418:
+                        if x[9] < 1.3182121515274048:
+                            margin[0] += -0.06969811022281647
+                        else:
+                            margin[0] += 0.038882821798324585
+                    else:
+                        if x[0] < -1.1100385189056396:
+                            margin[0] += -0.022342436015605927
+                        else:
+                            margin[0] += 0.08868733048439026
+        else:
+            if x[9] < -0.007779836654663086:
+                margin[0] += -0.15079735219478607
+            else:
+                if x[9] < 0.18654745817184448:
+                    if x[4] < 2.7360758781433105:
+                        margin[0] += 0.11861453205347061
+                    else:
+                        margin[0] += 0.02635592594742775
+                else:
+                    if x[4] < 2.7360758781433105:
+                        margin[0] += -0.11982506513595581
+                    else:
+                        margin[0] += 0.0645890086889267
+    else:
+        if x[9] < -0.3579357862472534:
+            margin[0] += 0.028697269037365913
+        else:
+            margin[0] += -0.07051806151866913
+    # tree 79
+    if x[0] < -1.2774475812911987:
+        if x[10] < -0.09991329908370972:
+            if x[0] < -1.3346741199493408:
+                margin[0] += -0.04407275840640068
+            else:
+                margin[0] += 0.0283080842345953
+        else:
+            margin[0] += 0.09649430960416794
+    else:
+        if x[13] < -0.9521634578704834:
+            if x[12] < 0.12518718838691711:
+                if x[9] < -0.007779836654663086:
+                    if x[9] < -0.8906793594360352:
+                        margin[0] += 0.07590025663375854
+                    else:
+                        if x[9] < -0.5323734283447266:
+                            margin[0] += -0.02881564572453499
+                        else:
+                            margin[0] += 0.0558134950697422
+                else:
+                    margin[0] += -0.01665985770523548
+            else:
+                margin[0] += -0.04892018809914589
+        else:
+            if x[9] < -0.493163526058197:
+                if x[9] < -0.5399386286735535:
+                    if x[9] < -0.7416870594024658:
+                        margin[0] += -0.06940421462059021
+                    else:
+                        margin[0] += 0.033907074481248856
+                else:
+                    margin[0] += -0.10332988947629929
+            else:
+                if x[7] < 0.9256167411804199:
+                    if x[9] < 0.331844687461853:
+                        if x[10] < 0.4249468743801117:
+                            margin[0] += -0.011351565830409527
+                        else:
+                            margin[0] += -0.10332528501749039
+                    else:
+                        if x[9] < 0.4168508052825928:
+                            margin[0] += 0.10724300891160965
+                        else:
+                            margin[0] += -0.011490118689835072
+                else:
+                    margin[0] += 0.08063732087612152
+    # tree 80
+    if x[9] < -0.9288138151168823:
+        margin[0] += -0.04759131371974945
+    else:
+        if x[9] < -0.5152719020843506:
+            if x[9] < -0.6422001719474792:
+                if x[9] < -0.6605208516120911:
+                    if x[12] < -0.002149007748812437:
+                        if x[9] < -0.8057697415351868:
+                            margin[0] += 0.04781167954206467
+                        else:
+                            margin[0] += -0.0545419417321682
+                    else:
+                        if x[9] < -0.783709704875946:
+                            margin[0] += -0.007080588024109602
+                        else:
+                            margin[0] += 0.08867499232292175
+                else:
+                    margin[0] += -0.07069030404090881
+            else:
+                margin[0] += 0.08093176782131195
+        else:
+            if x[9] < -0.37638044357299805:
+                margin[0] += -0.07963381707668304
+            else:
+                if x[9] < -0.34791457653045654:
+                    margin[0] += 0.0688212513923645
+                else:
+                    if x[6] < 2.4298055171966553:
+                        if x[9] < -0.2246774435043335:
+                            margin[0] += 0.06035023555159569
+                        else:
+                            margin[0] += -0.003095322987064719
+                    else:
+                        margin[0] += -0.056464049965143204
+    # tree 81
+    if x[7] < 0.9256167411804199:
+        if x[9] < -0.07938022911548615:
+            if x[12] < 0.44598954916000366:
+                if x[0] < 0.4093877375125885:
+                    if x[0] < 0.0016458351165056229:
+                        if x[9] < -0.8906793594360352:
+                            margin[0] += 0.057010989636182785
+                        else:
+                            margin[0] += -0.05176921188831329
+                    else:
+                        if x[9] < -0.1508297175168991:
+                            margin[0] += -0.023425046354532242
+                        else:
+                            margin[0] += 0.17351052165031433
+                else:
+                    margin[0] += -0.09448839724063873
+            else:
+                margin[0] += -0.1633453369140625
+        else:
+            if x[2] < 2.3982038497924805:
+                if x[0] < 0.889288067817688:
+                    if x[0] < 0.2655479609966278:
+                        if x[10] < 1.4115698337554932:
+                            margin[0] += 0.03639790788292885
+                        else:
+                            margin[0] += -0.013792747631669044
+                    else:
+                        if x[0] < 0.5570752620697021:
+                            margin[0] += -0.10546553879976273
+                        else:
+                            margin[0] += 0.01170292403548956
+                else:
+                    margin[0] += 0.07446113228797913
+            else:
+                margin[0] += 0.09179576486349106
+    else:
+        if x[9] < -0.493163526058197:
+            if x[9] < -0.8304365277290344:
+                margin[0] += -0.05093097314238548
+            else:
+                if x[9] < -0.6605208516120911:
+                    if x[0] < 0.0016458351165056229:
+                        margin[0] += -0.00955931656062603
+                    else:
+                        margin[0] += 0.07294906675815582
+                else:
+                    if x[0] < 0.0016458351165056229:
+                        margin[0] += 0.03190462663769722
+                    else:
+                        margin[0] += -0.07073154300451279
+        else:
+            margin[0] += 0.0890282616019249
+    # tree 82
+    if x[10] < -0.2651577293872833:
+        if x[4] < 2.7360758781433105:
+            if x[0] < 0.4007667899131775:
+                if x[9] < 0.014467079192399979:
+                    if x[0] < 0.0016458351165056229:
+                        if x[9] < -0.8304365277290344:
+                            margin[0] += 0.03276435658335686
+                        else:
+                            margin[0] += -0.04802335053682327
+                    else:
+                        if x[9] < -0.1508297175168991:
+                            margin[0] += -0.0031687081791460514
+                        else:
+                            margin[0] += 0.17789790034294128
+                else:
+                    if x[12] < -0.2308482974767685:
+                        margin[0] += -0.18920215964317322
+                    else:
+                        margin[0] += 0.039247117936611176
+            else:
+                margin[0] += -0.10780505836009979
+        else:
+            if x[9] < 0.5455568432807922:
+                if x[9] < 0.30384722352027893:
+                    margin[0] += -0.01956269145011902
+                else:
+                    margin[0] += 0.17054946720600128
+            else:
+                margin[0] += -0.025450555607676506
+    else:
+        if x[4] < 2.7360758781433105:
+            if x[12] < -0.45534420013427734:
+                if x[10] < 1.6069154739379883:
+                    if x[9] < 0.12625636160373688:
+                        margin[0] += 0.13364504277706146
+                    else:
+                        margin[0] += 0.03472186252474785
+                else:
+                    margin[0] += 0.001218208926729858
+            else:
+                if x[0] < -1.263079285621643:
+                    margin[0] += 0.06203306093811989
+                else:
+                    if x[12] < 0.22136290371418:
+                        margin[0] += -0.1014823466539383
+                    else:
+                        if x[12] < 0.6770597100257874:
+                            margin[0] += 0.047663137316703796
+                        else:
+                            margin[0] += -0.04480602964758873
+        else:
+            if x[10] < 1.6027827262878418:
+                margin[0] += -0.09244261682033539
+            else:
+                margin[0] += 0.012680650688707829
+    # tree 83
+    if x[9] < 0.8775057196617126:
+        if x[9] < 0.23332254588603973:
+            if x[10] < -0.2941528856754303:
+                if x[0] < 0.2890116274356842:
+                    if x[9] < -0.394689679145813:
+                        if x[9] < -0.6184763312339783:
+                            margin[0] += -0.02923540584743023
+                        else:
+                            margin[0] += 0.08475024253129959
+                    else:
+                        if x[5] < 2.4541778564453125:
+                            margin[0] += -0.08987084776163101
+                        else:
+                            margin[0] += 0.01848604530096054
+                else:
+                    if x[9] < 0.014467079192399979:
+                        if x[0] < 0.3691565692424774:
+                            margin[0] += 0.02249503880739212
+                        else:
+                            margin[0] += -0.10078157484531403
+                    else:
+                        margin[0] += 0.08756811171770096
+            else:
+                if x[10] < 0.4249468743801117:
+                    margin[0] += 0.0879245400428772
+                else:
+                    if x[9] < -0.36997467279434204:
+                        margin[0] += 0.07394018769264221
+                    else:
+                        if x[9] < 0.04125024750828743:
+                            margin[0] += -0.13035552203655243
+                        else:
+                            margin[0] += 0.07144699990749359
+        else:
+            if x[10] < 1.6027827262878418:
+                if x[4] < 2.7360758781433105:
+                    if x[9] < 0.4415658116340637:
+                        margin[0] += -0.15191662311553955
+                    else:
+                        margin[0] += -0.030324403196573257
+                else:
+                    margin[0] += 0.024561673402786255
+            else:
+                margin[0] += 0.04677315801382065
+    else:
+        if x[13] < 1.1243572235107422:
+            if x[10] < 1.6069154739379883:
+                if x[9] < 1.348942756652832:
+                    margin[0] += 0.02520645409822464
+                else:
+                    margin[0] += 0.11505266278982162
+            else:
+                if x[9] < 1.616025447845459:
+                    margin[0] += -0.047015007585287094
+                else:
+                    margin[0] += 0.041496142745018005
+        else:
+            margin[0] += -0.028909185901284218
+    # tree 84
+    if x[13] < 1.404827356338501:
+        if x[9] < -0.493163526058197:
+            if x[10] < -0.5462326407432556:
+                if x[12] < -0.6908470392227173:
+                    if x[0] < 0.2890116274356842:
+                        if x[9] < -0.8906793594360352:
+                            margin[0] += 0.04931401088833809
+                        else:
+                            margin[0] += -0.06387702375650406
+                    else:
+                        margin[0] += 0.06185740604996681
+                else:
+                    if x[9] < -0.6605208516120911:
+                        margin[0] += -0.01154982578009367
+                    else:
+                        margin[0] += -0.08237455040216446
+            else:
+                margin[0] += -0.11609858274459839
+        else:
+            if x[7] < 0.9256167411804199:
+                if x[9] < 0.8775057196617126:
+                    if x[0] < -1.1100385189056396:
+                        margin[0] += -0.06392411142587662
+                    else:
+                        if x[10] < 0.4249468743801117:
+                            margin[0] += 0.015123569406569004
+                        else:
+                            margin[0] += -0.03344182297587395
+                else:
+                    if x[13] < 0.2660311162471771:
+                        if x[9] < 1.5090900659561157:
+                            margin[0] += 0.09913869947195053
+                        else:
+                            margin[0] += 0.0003900561132468283
+                    else:
+                        if x[10] < 1.5884385108947754:
+                            margin[0] += -0.03828481212258339
+                        else:
+                            margin[0] += 0.04054654762148857
+            else:
+                margin[0] += 0.0658247098326683
+    else:
+        if x[9] < -0.783709704875946:
+            margin[0] += 0.003202007617801428
+        else:
+            margin[0] += 0.06915360689163208
+    # tree 85
+    if x[9] < -0.9288138151168823:
+        margin[0] += -0.05386502668261528
+    else:
+        if x[10] < -0.09578053653240204:
+            if x[10] < -0.30241841077804565:
+                if x[6] < 2.4298055171966553:
+                    if x[9] < -0.394689679145813:
+                        if x[9] < -0.6422001719474792:
+                            margin[0] += -0.006570978555828333
+                        else:
+                            margin[0] += 0.0941598191857338
+                    else:
+                        if x[9] < -0.24939244985580444:
+                            margin[0] += -0.1426433026790619
+                        else:
+                            margin[0] += 0.015473416075110435
+                else:
+                    if x[9] < -0.3579357862472534:
+                        margin[0] += 0.0315156951546669
+                    else:
+                        margin[0] += -0.09899761527776718
+            else:
+                margin[0] += -0.0635799840092659
+        else:
+            if x[10] < 1.4209413528442383:
+                if x[13] < -0.21414311230182648:
+                    margin[0] += -0.0014203423634171486
+                else:
+                    margin[0] += 0.12247738242149353
+            else:
+                if x[9] < 0.5455568432807922:
+                    if x[3] < 2.7253599166870117:
+                        margin[0] += 0.04550023376941681
+                    else:
+                        if x[10] < 1.5779861211776733:
+                            margin[0] += 0.013921884819865227
+                        else:
+                            margin[0] += -0.1353505402803421
+                else:
+                    if x[10] < 1.5884385108947754:
+                        margin[0] += -0.05718689411878586
+                    else:
+                        if x[10] < 1.7639602422714233:
+                            margin[0] += 0.11716730147600174
+                        else:
+                            margin[0] += -0.0035258890129625797
+    # tree 86
+    if x[9] < 1.681196928024292:
+        if x[10] < 1.7722257375717163:
+            if x[10] < 1.668906807899475:
+                if x[10] < 1.6027827262878418:
+                    if x[10] < 1.5779861211776733:
+                        if x[10] < -0.2651577293872833:
+                            margin[0] += -0.008014888502657413
+                        else:
+                            margin[0] += 0.03197368234395981
+                    else:
+                        margin[0] += -0.09712128341197968
+                else:
+                    margin[0] += 0.07603828608989716
+            else:
+                margin[0] += -0.1492556631565094
+        else:
+            margin[0] += 0.07485127449035645
+    else:
+        margin[0] += 0.04897376522421837
+    # tree 87
+    if x[13] < 1.404827356338501:
+        if x[9] < -0.37638044357299805:
+            if x[9] < -0.5152719020843506:
+                if x[9] < -0.6422001719474792:
+                    if x[12] < -0.6908470392227173:
+                        if x[0] < 0.2890116274356842:
+                            margin[0] += -0.03261803463101387
+                        else:
+                            margin[0] += 0.04269711300730705
+                    else:
+                        margin[0] += -0.08219677954912186
+                else:
+                    margin[0] += 0.05404773727059364
+            else:
+                margin[0] += -0.09625557065010071
+        else:
+            if x[0] < -1.1100385189056396:
+                if x[9] < 0.5455568432807922:
+                    margin[0] += 0.00784885324537754
+                else:
+                    margin[0] += -0.06453487277030945
+            else:
+                if x[13] < 1.1243572235107422:
+                    if x[12] < 0.22136290371418:
+                        if x[9] < 0.014467079192399979:
+                            margin[0] += 0.03554031252861023
+                        else:
+                            margin[0] += -0.025253700092434883
+                    else:
+                        if x[9] < 0.18654745817184448:
+                            margin[0] += -0.004451156128197908
+                        else:
+                            margin[0] += 0.08531849831342697
+                else:
+                    if x[10] < -0.30241841077804565:
+                        margin[0] += 0.03023305907845497
+                    else:
+                        margin[0] += -0.08402912318706512
+    else:
+        if x[9] < -0.783709704875946:
+            margin[0] += 0.002236969769001007
+        else:
+            margin[0] += 0.06005795672535896
+    # tree 88
+    if x[9] < 1.0895239114761353:
+        if x[1] < 3.244734525680542:
+            if x[10] < 1.6027827262878418:
+                if x[9] < 0.5868630409240723:
+                    if x[10] < 1.4209413528442383:
+                        if x[9] < 0.331844687461853:
+                            margin[0] += -0.004803091287612915
+                        else:
+                            margin[0] += 0.11860588192939758
+                    else:
+                        if x[9] < 0.4415658116340637:
+                            margin[0] += -0.09585560858249664
+                        else:
+                            margin[0] += 0.023311804980039597
+                else:
+                    margin[0] += -0.07481943815946579
+            else:
+                if x[13] < -0.8935047388076782:
+                    margin[0] += -0.001561095006763935
+                else:
+                    margin[0] += 0.08907332271337509
+        else:
+            margin[0] += -0.06774778664112091
+    else:
+        if x[0] < 0.5387021899223328:
+            if x[10] < 1.5884385108947754:
+                margin[0] += -0.060742031782865524
+            else:
+                margin[0] += 0.0650118738412857
+        else:
+            margin[0] += 0.07765749841928482
+    # tree 89
+    if x[9] < 0.9131301045417786:
+        if x[9] < 0.6838404536247253:
+            if x[13] < -1.0129834413528442:
+                if x[9] < -0.20256909728050232:
+                    if x[9] < -0.9288138151168823:
+                        margin[0] += 0.004021189641207457
+                    else:
+                        margin[0] += 0.06422219425439835
+                else:
+                    if x[10] < -0.2280287742614746:
+                        margin[0] += -0.10046538710594177
+                    else:
+                        margin[0] += 0.09023278951644897
+            else:
+                if x[13] < -0.8935047388076782:
+                    if x[9] < -0.07938022911548615:
+                        margin[0] += -0.12186423689126968
+                    else:
+                        margin[0] += -0.012284688651561737
+                else:
+                    if x[9] < -0.8304365277290344:
+                        margin[0] += -0.06338094919919968
+                    else:
+                        if x[10] < 1.5738533735275269:
+                            margin[0] += 0.015388239175081253
+                        else:
+                            margin[0] += -0.04127507284283638
+        else:
+            margin[0] += -0.06740066409111023
+    else:
+        if x[10] < 1.7639602422714233:
+            if x[13] < 1.1243572235107422:
+                if x[9] < 1.3182121515274048:
+                    margin[0] += -0.0074420832097530365
+                else:
+                    margin[0] += 0.11168401688337326
+            else:
+                margin[0] += -0.014680835418403149
+        else:
+            margin[0] += -0.019055217504501343
+    # tree 90
+    if x[9] < 0.8775057196617126:
+        if x[9] < 0.23332254588603973:
+            if x[10] < -0.2941528856754303:
+                if x[13] < -1.0129834413528442:
+                    if x[9] < -0.20256909728050232:
+                        if x[9] < -0.4816147983074188:
+                            margin[0] += 0.01631375588476658
+                        else:
+                            margin[0] += 0.10924406349658966
+                    else:
+                        margin[0] += -0.06176471710205078
+                else:
+                    if x[9] < -0.1508297175168991:
+                        if x[7] < 0.9256167411804199:
+                            margin[0] += -0.12008011341094971
+                        else:
+                            margin[0] += 0.0003007038321811706
+                    else:
+                        if x[5] < 2.4541778564453125:
+                            margin[0] += -0.022182470187544823
+                        else:
+                            margin[0] += 0.08527439087629318
+            else:
+                if x[11] < 1.0729485750198364:
+                    if x[10] < 1.4209413528442383:
+                        margin[0] += 0.09992364794015884
+                    else:
+                        margin[0] += 0.013632848858833313
+                else:
+                    margin[0] += -0.020896906033158302
+        else:
+            if x[10] < 1.6027827262878418:
+                if x[4] < 2.7360758781433105:
+                    if x[9] < 0.4415658116340637:
+                        margin[0] += -0.1371258944272995
+                    else:
+                        margin[0] += -0.024926552549004555
+                else:
+                    margin[0] += 0.019579585641622543
+            else:
+                margin[0] += 0.041590094566345215
+    else:
+        if x[9] < 1.4936907291412354:
+            if x[13] < 0.24422882497310638:
+                margin[0] += 0.09076379984617233
+            else:
+                margin[0] += 0.000812858750578016
+        else:
+            if x[9] < 1.681196928024292:
+                margin[0] += -0.05422156676650047
+            else:
+                margin[0] += 0.04050404950976372
+    # tree 91
+    if x[13] < 1.404827356338501:
+        if x[9] < -0.493163526058197:
+            if x[13] < -1.6414515972137451:
+                if x[9] < -0.9288138151168823:
+                    margin[0] += 0.0008270688122138381
+                else:
+                    margin[0] += 0.014209684915840626
+            else:
+                if x[9] < -0.7416870594024658:
+                    margin[0] += -0.07525824010372162
+                else:
+                    if x[9] < -0.5399386286735535:
+                        margin[0] += 0.03300093859434128
+                    else:
+                        margin[0] += -0.06234794110059738
+        else:
+            if x[7] < 0.9256167411804199:
+                if x[0] < -1.1100385189056396:
+                    if x[9] < 0.5455568432807922:
+                        margin[0] += 0.0013605908025056124
+                    else:
+                        margin[0] += -0.061560068279504776
+                else:
+                    if x[9] < 0.5455568432807922:
+                        if x[10] < 0.4249468743801117:
+                            margin[0] += 0.018619181588292122
+                        else:
+                            margin[0] += -0.0669398233294487
+                    else:
+                        if x[10] < 0.019936664029955864:
+                            margin[0] += -0.032531045377254486
+                        else:
+                            margin[0] += 0.0672103688120842
+            else:
+                margin[0] += 0.06499037146568298
+    else:
+        if x[0] < -1.3346741199493408:
+            margin[0] += 0.004427594598382711
+        else:
+            margin[0] += 0.04837684705853462
+    # tree 92
+    if x[9] < -0.9288138151168823:
+        margin[0] += -0.037814706563949585
+    else:
+        if x[9] < -0.8057697415351868:
+            margin[0] += 0.042875636368989944
+        else:
+            if x[13] < -1.6414515972137451:
+                if x[10] < -0.2280287742614746:
+                    margin[0] += -0.06446199864149094
+                else:
+                    if x[10] < 1.6093180179595947:
+                        margin[0] += 0.03142816573381424
+                    else:
+                        margin[0] += -0.016618886962532997
+            else:
+                if x[2] < 2.3982038497924805:
+                    if x[12] < -0.6908470392227173:
+                        if x[0] < 0.5570752620697021:
+                            margin[0] += -0.040830034762620926
+                        else:
+                            margin[0] += 0.05615701153874397
+                    else:
+                        if x[10] < 1.6027827262878418:
+                            margin[0] += 0.007523504551500082
+                        else:
+                            margin[0] += 0.0737362951040268
+                else:
+                    margin[0] += 0.07207077741622925
+    # tree 93
+    if x[10] < 1.5779861211776733:
+        if x[10] < 0.9215359091758728:
+            if x[0] < 0.2890116274356842:
+                if x[9] < 0.18654745817184448:
+                    if x[13] < -1.1952389478683472:
+                        if x[9] < -0.20256909728050232:
+                            margin[0] += 0.056003469973802567
+                        else:
+                            margin[0] += -0.08176601678133011
+                    else:
+                        if x[13] < 0.434999942779541:
+                            margin[0] += -0.09832464903593063
+                        else:
+                            margin[0] += 0.010146611370146275
+                else:
+                    if x[9] < 0.5455568432807922:
+                        margin[0] += 0.08310210704803467
+                    else:
+                        margin[0] += -0.058181677013635635
+            else:
+                if x[13] < 0.292116641998291:
+                    if x[9] < -0.493163526058197:
+                        if x[9] < -0.6605208516120911:
+                            margin[0] += 0.026197662577033043
+                        else:
+                            margin[0] += -0.06752979010343552
+                    else:
+                        if x[0] < 0.4093877375125885:
+                            margin[0] += 0.12317387014627457
+                        else:
+                            margin[0] += -0.0016425078501924872
+                else:
+                    margin[0] += -0.06126442179083824
+        else:
+            if x[9] < 0.4415658116340637:
+                if x[12] < -0.2308482974767685:
+                    margin[0] += 0.06163743510842323
+                else:
+                    margin[0] += -0.08683949708938599
+            else:
+                margin[0] += 0.11479994654655457
+    else:
+        if x[9] < 0.5455568432807922:
+            margin[0] += -0.07468804717063904
+        else:
+            if x[9] < 1.5556720495224:
+                margin[0] += 0.06850960105657578
+            else:
+                margin[0] += -0.031551461666822433
+    # tree 94
+    if x[9] < -0.8583856821060181:
+        if x[9] < -1.03568696975708:
+            margin[0] += 0.009926855564117432
+        else:
+            margin[0] += -0.06869706511497498
+    else:
+        if x[7] < 0.9256167411804199:
+            if x[9] < -0.37638044357299805:
+                margin[0] += -0.08508606255054474
+            else:
+                if x[0] < -1.1100385189056396:
+                    if x[10] < 0.18111419677734375:
+                        margin[0] += -0.06063329428434372
+                    else:
+                        margin[0] += 0.0005999691202305257
+                else:
+                    if x[12] < 0.22136290371418:
+                        if x[9] < 1.616025447845459:
+                            margin[0] += -0.012137590907514095
+                        else:
+                            margin[0] += 0.05700613558292389
+                    else:
+                        if x[9] < 0.18654745817184448:
+                            margin[0] += -0.017896054312586784
+                        else:
+                            margin[0] += 0.06347775459289551
+        else:
+            if x[9] < -0.5152719020843506:
+                if x[12] < 0.548690915107727:
+                    if x[9] < -0.783709704875946:
+                        margin[0] += 0.03339482843875885
+                    else:
+                        margin[0] += 0.11183301359415054
+                else:
+                    if x[9] < -0.6605208516120911:
+                        margin[0] += 0.03873765468597412
+                    else:
+                        margin[0] += -0.027207762002944946
+            else:
+                margin[0] += -0.0075687323696911335
+    # tree 95
+    if x[2] < 2.3982038497924805:
+        if x[10] < 1.5779861211776733:
+            if x[9] < -0.783709704875946:
+                if x[13] < 1.404827356338501:
+                    margin[0] += -0.06651616841554642
+                else:
+                    margin[0] += -0.011961298994719982
+            else:
+                if x[13] < -0.8935047388076782:
+                    if x[9] < 0.014467079192399979:
+                        margin[0] += 0.06730316579341888
+                    else:
+                        margin[0] += -0.10084376484155655
+                else:
+                    if x[9] < 0.4415658116340637:
+                        if x[10] < 1.4209413528442383:
+                            margin[0] += 0.022912759333848953
+                        else:
+                            margin[0] += -0.08194325864315033
+                    else:
+                        if x[10] < 1.020063877105713:
+                            margin[0] += -0.010339639149606228
+                        else:
+                            margin[0] += 0.13195809721946716
+        else:
+            if x[9] < 0.5455568432807922:
+                margin[0] += -0.11588285863399506
+            else:
+                if x[9] < 1.5556720495224:
+                    margin[0] += 0.05642492324113846
+                else:
+                    margin[0] += -0.03179340064525604
+    else:
+        if x[9] < -0.07938022911548615:
+            if x[9] < -0.8906793594360352:
+                margin[0] += 0.045141905546188354
+            else:
+                if x[9] < -0.4549807608127594:
+                    margin[0] += -0.011752448044717312
+                else:
+                    margin[0] += -0.06284544616937637
+        else:
+            margin[0] += 0.09958453476428986
+    # tree 96
+    if x[9] < -0.9288138151168823:
+        margin[0] += -0.042059123516082764
+    else:
+        if x[9] < -0.8057697415351868:
+            margin[0] += 0.04089359566569328
+        else:
+            if x[9] < -0.783709704875946:
+                margin[0] += -0.05264120548963547
+            else:
+                if x[7] < 0.9256167411804199:
+                    if x[9] < -0.37638044357299805:
+                        margin[0] += -0.05127428099513054
+                    else:
+                        if x[10] < 1.4209413528442383:
+                            margin[0] += 0.01013479195535183
+                        else:
+                            margin[0] += -0.018281422555446625
+                else:
+                    if x[9] < -0.5152719020843506:
+                        if x[12] < 0.548690915107727:
+                            margin[0] += 0.09512725472450256
+                        else:
+                            margin[0] += 0.017445465549826622
+                    else:
+                        margin[0] += -0.010179742239415646
+    # tree 97
+    if x[2] < 2.3982038497924805:
+        if x[10] < 2.144040822982788:
+            if x[9] < 1.616025447845459:
+                if x[10] < 1.668906807899475:
+                    if x[9] < -0.6422001719474792:
+                        if x[9] < -0.6605208516120911:
+                            margin[0] += -0.010736372321844101
+                        else:
+                            margin[0] += -0.07764045894145966
+                    else:
+                        if x[9] < -0.5152719020843506:
+                            margin[0] += 0.08937454223632812
+                        else:
+                            margin[0] += -0.0004149869200773537
+                else:
+                    margin[0] += -0.08744823187589645
+            else:
+                margin[0] += 0.07996901124715805
+        else:
+            margin[0] += -0.06310799717903137
+    else:
+        if x[9] < -0.07938022911548615:
+            if x[9] < -0.4549807608127594:
+                if x[9] < -0.8906793594360352:
+                    margin[0] += 0.041640184819698334
+                else:
+                    margin[0] += -0.0029624756425619125
+            else:
+                margin[0] += -0.053095895797014236
+        else:
+            margin[0] += 0.08446364849805832
+    # tree 98
+    if x[9] < -0.8583856821060181:
+        if x[9] < -1.03568696975708:
+            margin[0] += 0.006252823397517204
+        else:
+            margin[0] += -0.0660572424530983
+    else:
+        if x[7] < 0.9256167411804199:
+            if x[9] < -0.37638044357299805:
+                margin[0] += -0.06131235882639885
+            else:
+                if x[0] < 0.5418601632118225:
+                    if x[0] < 0.4093877375125885:
+                        if x[9] < 0.014467079192399979:
+                            margin[0] += 0.03038684092462063
+                        else:
+                            margin[0] += -0.012139491736888885
+                    else:
+                        margin[0] += -0.062260907143354416
+                else:
+                    if x[9] < 0.08471126109361649:
+                        margin[0] += -0.065656878054142
+                    else:
+                        if x[9] < 0.3682602345943451:
+                            margin[0] += 0.12928089499473572
+                        else:
+                            margin[0] += -0.0020834875758737326
+        else:
+            if x[9] < -0.8057697415351868:
+                margin[0] += 0.08198243379592896
+            else:
+                if x[9] < -0.493163526058197:
+                    if x[9] < -0.783709704875946:
+                        margin[0] += -0.04003511741757393
+                    else:
+                        if x[9] < -0.6605208516120911:
+                            margin[0] += 0.05140024051070213
+                        else:
+                            margin[0] += -0.03138643503189087
+                else:
+                    margin[0] += 0.07438129931688309
+    # tree 99
+    if x[2] < 2.3982038497924805:
+        if x[9] < -0.8304365277290344:
+            margin[0] += -0.05866340175271034
+        else:
+            if x[13] < 1.404827356338501:
+                if x[9] < 0.9131301045417786:
+                    if x[13] < -0.8935047388076782:
+                        if x[9] < 0.014467079192399979:
+                            margin[0] += 0.02060750126838684
+                        else:
+                            margin[0] += -0.10324452072381973
+                    else:
+                        if x[5] < 2.4541778564453125:
+                            margin[0] += -0.008994468487799168
+                        else:
+                            margin[0] += 0.055445607751607895
+                else:
+                    if x[13] < 0.2660311162471771:
+                        if x[9] < 1.5556720495224:
+                            margin[0] += 0.0898953229188919
+                        else:
+                            margin[0] += 0.0015190417179837823
+                    else:
+                        if x[9] < 1.5205426216125488:
+                            margin[0] += -0.034339357167482376
+                        else:
+                            margin[0] += 0.007224779576063156
+            else:
+                margin[0] += 0.043027445673942566
+    else:
+        if x[9] < -0.07938022911548615:
+            if x[9] < -0.4549807608127594:
+                if x[9] < -0.9288138151168823:
+                    margin[0] += -0.006680284161120653
+                else:
+                    margin[0] += 0.05100829154253006
+            else:
+                margin[0] += -0.04444563388824463
+        else:
+            margin[0] += 0.07473540306091309
+
+
+def _vector(features):
+    """Model input row, as XGBoost sees it (float32)."""
+    get = features.get
+    x = []
+    for kind, arg in INPUTS:
+        if kind == "impute":
+            v = get(arg)
+            x.append(IMPUTE_VALUE if v is None or v != v else float(v))
+        elif kind == "onehot":
+            x.append(1.0 if get(arg[0]) == arg[1] else 0.0)
+        else:
+            v = get(arg)
+            x.append(_NAN if v is None else float(v))
+    if SCALE is not None:
+        x = [(v - m) / s for v, m, s in zip(x, MEAN, SCALE)]
+    return array("f", x)
+
+
+def predict_proba(features):
+    """P(gpu) for one feature dict."""
+    margin = array("f", [BASE_MARGIN])
+    _trees(_vector(features), margin)
+    z = margin[0]
+    return array("f", [1.0 / (1.0 + math.exp(-z)) if z > -700 else 0.0])[0]
+
+
+def predict(features):
+    return "gpu" if predict_proba(features) > 0.5 else "cpu"
+
+
+def predict_many(features_list):
+    """(decisions, probabilities) for a list of feature dicts."""
+    proba = [predict_proba(f) for f in features_list]
+    return ["gpu" if p > 0.5 else "cpu" for p in proba], proba
@@ -0,0 +1,217 @@
+"""
+Crossover-threshold table: O(1) CPU/GPU decisions without pandas or xgboost.
+
+For most ops the benchmark winner is "GPU above some log_size" once the
+machine's load is fixed. The table stores, per
+    (operation_type, dtype, device, CPU load bin, GPU load bin)
+the log_size threshold that best separates the measured winners, with the
+decision on either side, the log_size range it was fitted on and its
+accuracy. Device "*" entries are fitted on every device pooled and serve
+machines the dataset has never seen; they are kept only where rows of at
+least MIN_POOLED_DEVICES devices were pooled, since a "pooled" cell that one
+device filled would hand that device's thresholds to any unknown machine.
+
+lookup() answers only from cells that are reliable (enough rows, accuracy at
+least MIN_ACCURACY), for log_size inside the fitted range and for usual
+system states (mains power, GPU neither hot nor short of memory); otherwise
+it returns None and table_predict() falls back to the full model.
+
+Build (stdlib only): python -m model.crossover_table --data Final_dataset.csv jetson_nano_complete_benchmark.csv
+"""
+import argparse
+import csv
+import json
+import logging
+import os
+import re
+import threading
+from utils.dataset_modules import load_dataset_module
+
+log = logging.getLogger("crossover_table")
+log.setLevel(logging.INFO)
+
+CROSSOVER_TABLE_PATH = os.path.join("model", "crossover_table.json")
+USE_CROSSOVER_TABLE = os.environ.get("HYBRIDFLOW_CROSSOVER_TABLE", "1") != "0"
+ANY_DEVICE = "*"
+MIN_ROWS = 6
+MIN_ACCURACY = 0.9
+MIN_POOLED_DEVICES = 2
+
+_table = None
+_table_lock = threading.Lock()
+
+
+def _dtype(value):
+    """'float32', "<class 'torch.float32'>", "float32'>" -> 'float32'."""
+    match = re.search(r"(float|int|uint|bfloat)\d+", str(value or ""))
+    return match.group(0) if match else "float32"
+
+
+def _float(value, default=0.0):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _bins(features):
+    b = load_dataset_module("collector/feature_bins.py")
+    return b.bin_cpu_load(_float(features.get("cpu_load_pct"))), b.bin_gpu_load(_float(features.get("gpu_load_pct")))
+
+
+def fit_threshold(points):
+    """
+    Best single split of (log_size, winner) points: returns
+    (threshold, below, above, accuracy) with below/above in "cpu"/"gpu";
+    threshold None when one decision fits everything best.
+    """
+    points = sorted(points)
+    n = len(points)
+    total_gpu = sum(w for _, w in points)
+    # no split: everything one way
+    best = (total_gpu if total_gpu * 2 > n else n - total_gpu, None, "gpu" if total_gpu * 2 > n else "cpu")
+    gpu_below = 0
+    for i in range(1, n):
+        gpu_below += points[i - 1][1]
+        if points[i][0] == points[i - 1][0]:
+            continue
+        cpu_below, gpu_above = i - gpu_below, total_gpu - gpu_below
+        threshold = (points[i - 1][0] + points[i][0]) / 2
+        for correct, below in ((cpu_below + gpu_above, "cpu"), (gpu_below + (n - i - gpu_above), "gpu")):
+            if correct > best[0]:
+                best = (correct, threshold, below)
+    correct, threshold, below = best
+    above = below if threshold is None else ("gpu" if below == "cpu" else "cpu")
+    return threshold, below, above, correct / n if n else 0.0
+
+
+def build(paths, min_rows=MIN_ROWS):
+    """Fit every (op, dtype, device, load bins) cell, plus pooled device "*" cells, from benchmark CSVs."""
+    cells, devices = {}, {}
+    for path in paths:
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                winner = row.get("winner")
+                if winner in (None, "") or not row.get("log_size"):
+                    continue
+                cpu_bin, gpu_bin = _bins(row)
+                point = (_float(row["log_size"]), int(_float(winner)))
+                name = row.get("device_name") or "unknown"
+                for device in (name, ANY_DEVICE):
+                    key = (row["operation_type"], _dtype(row.get("dtype")), device, cpu_bin, gpu_bin)
+                    cells.setdefault(key, []).append(point)
+                    devices.setdefault(key, set()).add(name)
+
+    entries = {}
+    for key, points in cells.items():
+        if len(points) < min_rows:
+            continue
+        if key[2] == ANY_DEVICE and len(devices[key]) < MIN_POOLED_DEVICES:
+            continue
+        threshold, below, above, accuracy = fit_threshold(points)
+        entries["|".join(map(str, key))] = {
+            "threshold": None if threshold is None else round(threshold, 4),
+            "below": below,
+            "above": above,
+            "lo": round(min(p[0] for p in points), 4),
+            "hi": round(max(p[0] for p in points), 4),
+            "accuracy": round(accuracy, 4),
+            "rows": len(points),
+            "devices": len(devices[key]),
+        }
+    return {"version": 1, "key": "operation_type|dtype|device|cpu_load_bin|gpu_load_bin", "entries": entries}
+
+
+class CrossoverTable:
+    """Loaded table; lookup() is a dict access and a comparison."""
+
+    def __init__(self, artifact: dict, device: str = None, min_accuracy: float = MIN_ACCURACY):
+        self.device = device if device is not None else self._local_device()
+        # unreliable cells are dropped up front; the rest become (op, dtype, cpu_bin, gpu_bin) ->
+        # (lo, hi, threshold, below, above), this device's cell taking precedence over the pooled one
+        self.entries = {}
+        for key, e in sorted(artifact["entries"].items(), key=lambda kv: kv[0].split("|")[2] == self.device):
+            op, dtype, dev, cpu_bin, gpu_bin = key.split("|")
+            if dev == ANY_DEVICE and e.get("devices", 1) < MIN_POOLED_DEVICES:
+                continue
+            if dev in (self.device, ANY_DEVICE) and e["accuracy"] >= min_accuracy:
+                threshold = float("-inf") if e["threshold"] is None else e["threshold"]
+                self.entries[(op, dtype, int(cpu_bin), int(gpu_bin))] = (e["lo"], e["hi"], threshold, e["below"], e["above"])
+        bins = load_dataset_module("collector/feature_bins.py")
+        self._cpu_bin, self._gpu_bin = bins.bin_cpu_load, bins.bin_gpu_load
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _local_device():
+        from model.registry import local_device_profile
+        name = local_device_profile()["device_name"]
+        return ANY_DEVICE if name == "Unknown" else name
+
+    def lookup(self, features: dict, dtype: str = "float32"):
+        """"cpu"/"gpu" from the table, or None when the model should decide."""
+        get = features.get
+        # usual states only: mains power, GPU below 70 C and 70% memory use
+        if not get("is_battery_powered") and (get("gpu_temp_C") or 0) < 70 and (get("gpu_mem_pressure") or 0) <= 0.7:
+            entry = self.entries.get((get("operation_type"), dtype, self._cpu_bin(get("cpu_load_pct") or 0),
+                                      self._gpu_bin(get("gpu_load_pct") or 0)))
+            if entry is not None:
+                lo, hi, threshold, below, above = entry
+                log_size = get("log_size")
+                if lo <= log_size <= hi:
+                    self.hits += 1
+                    return below if log_size < threshold else above
+        self.misses += 1
+        return None
+
+
+def get_crossover_table():
+    """
+    The shipped table, loaded on first use; None when it is missing, disabled
+    (HYBRIDFLOW_CROSSOVER_TABLE=0) or stale because the live model has been
+    retrained on feedback.
+    """
+    global _table
+    from model.inference import ONLINE_MODEL_PATH, USE_ONLINE_MODEL, model_version
+    if not USE_CROSSOVER_TABLE or model_version() > 0:
+        return None
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                if not os.path.exists(CROSSOVER_TABLE_PATH) or (USE_ONLINE_MODEL and os.path.exists(ONLINE_MODEL_PATH)):
+                    _table = False
+                else:
+                    with open(CROSSOVER_TABLE_PATH, encoding="utf-8") as f:
+                        _table = CrossoverTable(json.load(f))
+                    log.info(f"Loaded {len(_table.entries)} crossover cells for device {_table.device!r}")
+    return _table or None
+
+
+def table_predict(features: dict, dtype: str = "float32") -> str:
+    """Table decision when it has one, else the (cached) model's."""
+    table = get_crossover_table()
+    if table is not None:
+        decision = table.lookup(features, dtype)
+        if decision is not None:
+            return decision
+    from model.decision_cache import get_decision_cache
+    return get_decision_cache().predict(features)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Build the crossover-threshold table from benchmark CSVs")
+    ap.add_argument("--data", nargs="+", default=["Final_dataset.csv"])
+    ap.add_argument("--out", default=CROSSOVER_TABLE_PATH)
+    ap.add_argument("--min-rows", type=int, default=MIN_ROWS)
+    args = ap.parse_args()
+
+    artifact = build(args.data, min_rows=args.min_rows)
+    entries = artifact["entries"].values()
+    reliable = sum(e["accuracy"] >= MIN_ACCURACY for e in entries)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(artifact, f, separators=(",", ":"), sort_keys=True)
+    print(f"{len(entries)} cells ({reliable} with accuracy >= {MIN_ACCURACY}) saved as {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from utils.dataset_modules import load_dataset_module
+
+log = logging.getLogger("decision_cache")
+log.setLevel(logging.INFO)
+
+DEFAULT_TTL_S = float(os.environ.get("HYBRIDFLOW_DECISION_TTL_S", "30"))
+DEFAULT_MAX_ENTRIES = 4096
+# log10 size is quantized to this step: 0.25 ~ a factor of 1.8 in problem size
+DEFAULT_LOG_SIZE_STEP = 0.25
+
+
+class DecisionCache:
+    """
+    Memoizes model decisions under similar conditions.
+
+    The key is (operation_type, quantized log_size, battery flag) plus the
+    CPU load, GPU load, GPU memory and GPU temperature bins from
+    Dataset/collector/feature_bins.py and the log2 arithmetic intensity.
+    Entries expire after `ttl_s` seconds and the least-recently-used entry
+    is dropped past `max_entries`.
+    """
+
+    def __init__(self, ttl_s: float = DEFAULT_TTL_S, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 log_size_step: float = DEFAULT_LOG_SIZE_STEP):
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.log_size_step = log_size_step
+        self.bins = load_dataset_module("collector/feature_bins.py")
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, features: dict) -> tuple:
+        b = self.bins
+        mem_pressure = features.get("gpu_mem_pressure", 0.0)
+        # feature_bins works on free/total; the feature dict carries used/total
+        mem_bin = -1 if mem_pressure is None or mem_pressure < 0 else b.bin_gpu_mem(1.0 - mem_pressure, 1.0)
+        intensity = features.get("arithmetic_intensity")
+        return (
+            features.get("operation_type"),
+            round(float(features.get("log_size", 0.0)) / self.log_size_step),
+            int(features.get("is_battery_powered", 0) or 0),
+            b.bin_cpu_load(features.get("cpu_load_pct", 0.0) or 0.0),
+            b.bin_gpu_load(features.get("gpu_load_pct", 0.0) or 0.0),
+            mem_bin,
+            b.bin_gpu_temp(features.get("gpu_temp_C", 0.0) or 0.0),
+            # compute per byte, in factors of two: same-size kernels can still be memory- or compute-bound
+            round(math.log2(intensity)) if intensity else None,
+        )
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            decision, stored_at = entry
+            if time.monotonic() - stored_at > self.ttl_s:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return decision
+
+    def put(self, key, decision):
+        with self._lock:
+            self._entries[key] = (decision, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def predict(self, features: dict, predict_fn=None) -> str:
+        """Cached decision for `features`; calls the model only on a miss."""
+        if predict_fn is None:
+            from model.inference import predict as predict_fn
+        if self.ttl_s <= 0:
+            return predict_fn(features)
+
+        key = self.key(features)
+        decision = self.get(key)
+        if decision is not None:
+            log.info(f"Decision cache hit: {decision.upper()} for {key}")
+            return decision
+        decision = predict_fn(features)
+        self.put(key, decision)
+        return decision
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_decision_cache() -> DecisionCache:
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = DecisionCache()
+        return _default_cache
+
+
+def cached_predict(features: dict) -> str:
+    return get_decision_cache().predict(features)
@@ -0,0 +1,266 @@
+"""
+Compile the fitted pipeline into a standalone Python module.
+
+The generated module (COMPILED_MODEL_PATH by default) needs nothing beyond
+the standard library:
+- OneHotEncoder categories, the KNNImputer fill value and the StandardScaler
+  mean/scale become constants
+- every XGBoost tree becomes nested if/else code, summed in float32 exactly
+  like XGBoost (inputs and margins rounded through array('f'))
+
+It offers the same contract as model.inference: predict(features) -> "cpu"/"gpu",
+predict_proba(features) -> P(gpu) and predict_many(features_list) ->
+(decisions, probabilities). SOURCE_SHA256 records the pickle it was compiled
+from, so inference only uses it while that is still the model on disk.
+
+python -m model.export [--model model/preprocesing_model.pkl] [--out model/compiled_model.py] [--check Final_dataset.csv]
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+from analyzer.feature_builder import FEATURE_COLUMNS
+
+log = logging.getLogger("export")
+log.setLevel(logging.INFO)
+
+COMPILED_MODEL_PATH = os.path.join("model", "compiled_model.py")
+
+# appended to the generated constants and trees
+_RUNTIME = '''
+
+def _vector(features):
+    """Model input row, as XGBoost sees it (float32)."""
+    get = features.get
+    x = []
+    for kind, arg in INPUTS:
+        if kind == "impute":
+            v = get(arg)
+            x.append(IMPUTE_VALUE if v is None or v != v else float(v))
+        elif kind == "onehot":
+            x.append(1.0 if get(arg[0]) == arg[1] else 0.0)
+        else:
+            v = get(arg)
+            x.append(_NAN if v is None else float(v))
+    if SCALE is not None:
+        x = [(v - m) / s for v, m, s in zip(x, MEAN, SCALE)]
+    return array("f", x)
+
+
+def predict_proba(features):
+    """P(gpu) for one feature dict."""
+    margin = array("f", [BASE_MARGIN])
+    _trees(_vector(features), margin)
+    z = margin[0]
+    return array("f", [1.0 / (1.0 + math.exp(-z)) if z > -700 else 0.0])[0]
+
+
+def predict(features):
+    return "gpu" if predict_proba(features) > 0.5 else "cpu"
+
+
+def predict_many(features_list):
+    """(decisions, probabilities) for a list of feature dicts."""
+    proba = [predict_proba(f) for f in features_list]
+    return ["gpu" if p > 0.5 else "cpu" for p in proba], proba
+'''
+
+
+def _f32(value):
+    """Exact double value of value rounded to float32, as source text."""
+    import numpy as np
+    return repr(float(np.float32(value)))
+
+
+def _unwrap(pipeline):
+    """(ColumnTransformer, StandardScaler or None, XGBClassifier); samplers such as SMOTE only act in fit."""
+    steps = [step for _, step in pipeline.steps if not hasattr(step, "fit_resample")]
+    preprocessor, classifier = steps[0], steps[-1]
+    scalers = steps[1:-1]
+    if len(scalers) > 1 or (scalers and not hasattr(scalers[0], "scale_")):
+        raise ValueError(f"cannot compile pipeline steps {[type(s).__name__ for s in steps]}")
+    return preprocessor, (scalers[0] if scalers else None), classifier
+
+
+def _column_names(preprocessor, columns):
+    if isinstance(columns, str):
+        columns = [columns]
+    names = getattr(preprocessor, "feature_names_in_", None)
+    return [str(names[c]) if not isinstance(c, str) else c for c in columns] if names is not None else \
+        [FEATURE_COLUMNS[c] if not isinstance(c, str) else c for c in columns]
+
+
+def _inputs(preprocessor):
+    """(kind, arg) per transformed column, and the imputer's fill value."""
+    import numpy as np
+    inputs, impute_value = [], None
+    for name, transformer, columns in preprocessor.transformers_:
+        names = _column_names(preprocessor, columns)
+        if transformer == "drop" or not names:
+            continue
+        if transformer == "passthrough":
+            inputs += [("value", n) for n in names]
+        elif type(transformer).__name__ == "OneHotEncoder":
+            if len(names) != 1:
+                raise ValueError(f"{name}: only single-column one-hot encoders can be compiled")
+            inputs += [("onehot", (names[0], str(c))) for c in transformer.categories_[0]]
+        elif type(transformer).__name__ in ("KNNImputer", "SimpleImputer"):
+            if len(names) != 1:
+                # with several columns the fill value depends on the neighbours, not a constant
+                raise ValueError(f"{name}: only single-column imputers can be compiled")
+            # a lone column has no other features to find neighbours by: the imputer fills in a constant
+            impute_value = float(transformer.transform(np.array([[np.nan]]))[0, 0])
+            inputs.append(("impute", names[0]))
+        else:
+            raise ValueError(f"{name}: cannot compile {type(transformer).__name__}")
+    return inputs, impute_value
+
+
+def _tree_source(tree, indent="    "):
+    """Nested if/else adding the leaf value of one XGBoost tree (JSON dump) to margin[0]."""
+    left, right = tree["left_children"], tree["right_children"]
+    feature, cond, default_left = tree["split_indices"], tree["split_conditions"], tree["default_left"]
+    if any(tree.get("split_type") or []):
+        raise ValueError("categorical splits cannot be compiled")
+    lines = []
+
+    def emit(node, depth):
+        pad = indent * depth
+        if left[node] == -1:
+            lines.append(f"{pad}margin[0] += {_f32(cond[node])}")
+            return
+        i, threshold = feature[node], _f32(cond[node])
+        # missing values (NaN) follow the learned default direction
+        missing = f" or x[{i}] != x[{i}]" if default_left[node] else ""
+        lines.append(f"{pad}if x[{i}] < {threshold}{missing}:")
+        emit(left[node], depth + 1)
+        lines.append(f"{pad}else:")
+        emit(right[node], depth + 1)
+
+    emit(0, 1)
+    return lines
+
+
+def _base_margin(learner):
+    import numpy as np
+    # "5E-1" in older models, "[5E-1]" (one per target) since XGBoost 3
+    base = np.float32(np.atleast_1d(json.loads(learner["learner_model_param"]["base_score"]))[0])
+    objective = learner["objective"]["name"]
+    if objective == "binary:logistic":
+        return float(-np.log(np.float32(1.0) / base - np.float32(1.0)))
+    if objective == "binary:logitraw":
+        return float(base)
+    raise ValueError(f"cannot compile objective {objective}")
+
+
+def compile_source(pipeline, source_sha256=None):
+    """Source text of the standalone module for a fitted pipeline."""
+    preprocessor, scaler, classifier = _unwrap(pipeline)
+    inputs, impute_value = _inputs(preprocessor)
+    learner = json.loads(classifier.get_booster().save_raw("json"))["learner"]
+    booster = learner["gradient_booster"]
+    if booster["name"] != "gbtree" or int(learner["learner_model_param"].get("num_class", 0)) > 1:
+        raise ValueError("only binary gbtree models can be compiled")
+    trees = booster["model"]["trees"]
+    if len(inputs) != int(learner["learner_model_param"]["num_feature"]):
+        raise ValueError(f"{len(inputs)} transformed columns, model expects {learner['learner_model_param']['num_feature']}")
+
+    mean = scale = None
+    if scaler is not None:
+        mean = [float(v) for v in scaler.mean_] if scaler.mean_ is not None and scaler.with_mean else [0.0] * len(inputs)
+        scale = [float(v) for v in scaler.scale_] if scaler.scale_ is not None else [1.0] * len(inputs)
+
+    out = [
+        '"""Generated by model/export.py from the fitted pipeline; do not edit."""',
+        "import math",
+        "from array import array",
+        "",
+        f"SOURCE_SHA256 = {source_sha256!r}",
+        f"FEATURE_COLUMNS = {list(getattr(preprocessor, 'feature_names_in_', FEATURE_COLUMNS))!r}",
+        f"INPUTS = {inputs!r}",
+        f"IMPUTE_VALUE = {impute_value!r}",
+        f"MEAN = {mean!r}",
+        f"SCALE = {scale!r}",
+        f"BASE_MARGIN = {_base_margin(learner)!r}",
+        "_NAN = float('nan')",
+        "",
+        "",
+        "def _trees(x, margin):",
+        f'    """Add the {len(trees)} trees\' leaf values to margin[0] (float32, like XGBoost)."""',
+    ]
+    for n, tree in enumerate(trees):
+        out.append(f"    # tree {n}")
+        out += _tree_source(tree)
+    return "\n".join(out) + "\n" + _RUNTIME
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def export(model_path=None, out_path=COMPILED_MODEL_PATH):
+    """Compile the pickled pipeline at model_path (default: the inference model) into out_path."""
+    import joblib
+    from model.inference import MODEL_PATH
+    model_path = model_path or MODEL_PATH
+    source = compile_source(joblib.load(model_path), file_sha256(model_path))
+    tmp = f"{out_path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(source)
+    os.replace(tmp, out_path)
+    log.info(f"Compiled {model_path} into {out_path} ({len(source) // 1024} KiB)")
+    return out_path
+
+
+def load_compiled(path=COMPILED_MODEL_PATH):
+    """The generated module at path, imported by file location."""
+    import importlib.util
+    spec = importlib.util.spec_from_file_location("hybridflow_compiled_model", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def check(pipeline, module, df):
+    """Rows of df where the compiled module disagrees with the pipeline: (decision mismatches, max |dP|)."""
+    import numpy as np
+    from model.inference import model_columns
+    columns = model_columns(pipeline)
+    rows = df[columns].astype(object).where(df[columns].notna(), None).to_dict("records")
+    expected = pipeline.predict_proba(df[columns])[:, 1]
+    decisions, proba = module.predict_many(rows)
+    mismatches = int(np.sum((expected > 0.5) != (np.array(decisions) == "gpu")))
+    return mismatches, float(np.max(np.abs(expected - np.array(proba)))) if rows else 0.0
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Compile the model pipeline into a dependency-free Python module")
+    ap.add_argument("--model", default=None, help="pickled pipeline (default: the inference model)")
+    ap.add_argument("--out", default=COMPILED_MODEL_PATH)
+    ap.add_argument("--check", nargs="*", default=[], help="CSV files to compare both predictors on")
+    args = ap.parse_args()
+
+    export(args.model, args.out)
+    print(f"Compiled model written to {args.out}")
+    if args.check:
+        import joblib
+        import pandas as pd
+        from model.inference import MODEL_PATH
+        from utils.dataset_modules import load_dataset_module
+        from model.roofline import log_speedups
+        # harmonized like training data: typed, costs estimated where the file has none, roofline feature added
+        df = pd.concat([load_dataset_module("collector/store.py").read_any(p) for p in args.check], ignore_index=True)
+        df["roofline_log_speedup"] = log_speedups(df)
+        mismatches, max_diff = check(joblib.load(args.model or MODEL_PATH), load_compiled(args.out), df)
+        print(f"{len(df)} rows: {mismatches} decision mismatches, max |P(gpu) difference| {max_diff:.2e}")
+        if mismatches:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""
+Online feedback: every measured CPU-vs-GPU comparison becomes a training
+observation, and the classifier keeps boosting on them.
+
+- Observations are appended as JSON lines to CACHE_DIR/feedback/observations.jsonl
+  (one os.write per record on an O_APPEND descriptor, so concurrent writers
+  never interleave and a crash loses at most the last partial line).
+- update_model() runs continued boosting: the live XGBoost booster gets
+  `rounds` more trees fitted on the observations added since the last
+  update, transformed by the pipeline's already-fitted preprocessing. Every
+  HOLDOUT_EVERY-th comparable observation is held out and never trained on;
+  the new pipeline is swapped in (model.inference.swap_model) only if it is
+  at least as accurate as the current one on those held-out observations.
+  Observations whose CPU and GPU times come from different timers (e.g. an
+  in-binary clock vs. wall time around a process) are skipped (comparable()).
+- FeedbackUpdater runs update_model() in the background whenever enough
+  new observations have arrived.
+
+CLI: python -m model.feedback stats|update|reset
+"""
+import argparse
+import copy
+import fcntl
+import json
+import logging
+import os
+import threading
+import time
+from analyzer.feature_builder import COST_COLUMNS, FEATURE_COLUMNS, ROOFLINE_COLUMNS
+from utils.paths import cache_subdir
+
+log = logging.getLogger("feedback")
+log.setLevel(logging.INFO)
+
+MIN_BATCH = int(os.environ.get("HYBRIDFLOW_FEEDBACK_MIN_BATCH", "32"))
+BOOST_ROUNDS = int(os.environ.get("HYBRIDFLOW_FEEDBACK_ROUNDS", "10"))
+# measured observations count this much more than a SMOTE-balanced training row
+FEEDBACK_WEIGHT = float(os.environ.get("HYBRIDFLOW_FEEDBACK_WEIGHT", "1.0"))
+# every k-th comparable observation only scores candidates (the drift guard), never trains them
+HOLDOUT_EVERY = int(os.environ.get("HYBRIDFLOW_FEEDBACK_HOLDOUT_EVERY", "5"))
+
+
+class FeedbackStore:
+    """Append-only JSONL store of measured executions plus the index of the last trained line."""
+
+    def __init__(self, directory: str = None):
+        self.directory = directory or cache_subdir("feedback")
+        self.path = os.path.join(self.directory, "observations.jsonl")
+        self.state_path = os.path.join(self.directory, "state.json")
+        self.lock_path = os.path.join(self.directory, "update.lock")
+        self._lock = threading.Lock()
+
+    def append(self, record: dict):
+        line = (json.dumps(record, sort_keys=True, default=float) + "\n").encode()
+        with self._lock:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+
+    def read(self, start: int = 0):
+        """Records from line `start` on; unparsable (torn) lines are skipped."""
+        if not os.path.exists(self.path):
+            return []
+        records = []
+        with open(self.path, encoding="utf-8") as f:
+            for i, line in enumerate(f):
+                if i < start:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    log.warning(f"Skipping malformed feedback line {i + 1}")
+        return records
+
+    def count(self) -> int:
+        if not os.path.exists(self.path):
+            return 0
+        with open(self.path, "rb") as f:
+            return sum(1 for _ in f)
+
+    def trained_lines(self) -> int:
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                return json.load(f).get("trained_lines", 0)
+        except (OSError, ValueError):
+            return 0
+
+    def mark_trained(self, lines: int, **info):
+        tmp = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"trained_lines": lines, "updated_at": time.time(), **info}, f)
+        os.replace(tmp, self.state_path)
+
+    def pending(self) -> int:
+        return self.count() - self.trained_lines()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_feedback_store() -> FeedbackStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = FeedbackStore()
+        return _store
+
+
+def record_observation(features: dict, cpu_ms: float, gpu_ms: float, source_file: str = None,
+                       cpu_target: str = "cpu", cpu_timer: str = None, gpu_timer: str = None):
+    """
+    Persist one measured comparison. gpu_ms includes transfers (whole kernel
+    run on the GPU); cpu_target names the CPU variant that produced cpu_ms;
+    cpu_timer / gpu_timer the timer behind each side (the "timer" of the
+    run_on_device stats).
+    """
+    record = {
+        "ts": time.time(),
+        "source_file": source_file,
+        "features": {c: features.get(c) for c in FEATURE_COLUMNS + COST_COLUMNS + ROOFLINE_COLUMNS},
+        "cpu_ms": cpu_ms,
+        "gpu_ms": gpu_ms,
+        "cpu_target": cpu_target,
+        "cpu_timer": cpu_timer,
+        "gpu_timer": gpu_timer,
+        "winner": int(gpu_ms < cpu_ms),
+    }
+    get_feedback_store().append(record)
+    updater = _updater
+    if updater is not None:
+        updater.notify()
+    return record
+
+
+def comparable(record: dict) -> bool:
+    """Both sides timed with the same, known timer (records without timers predate them)."""
+    return record.get("cpu_timer") is not None and record.get("cpu_timer") == record.get("gpu_timer")
+
+
+def split_holdout(records, start: int = 0, every: int = HOLDOUT_EVERY):
+    """
+    (training batch from line `start` on, held-out observations) among the
+    comparable records; a record's role depends only on its position among
+    them, so it stays the same across updates.
+    """
+    usable = [(i, r) for i, r in enumerate(records) if comparable(r)]
+    held = {i for n, (i, _) in enumerate(usable) if n % every == every - 1}
+    batch = [r for i, r in usable if i >= start and i not in held]
+    return batch, [r for i, r in usable if i in held]
+
+
+def _transform(pipeline, df):
+    """Run the fitted, non-resampling steps in front of the classifier."""
+    X = df
+    for _, step in pipeline.steps[:-1]:
+        if hasattr(step, "fit_resample"):
+            continue  # SMOTE only acts at fit time
+        X = step.transform(X)
+    return X
+
+
+def _accuracy(pipeline, df, y):
+    import numpy as np
+    return float(np.mean(pipeline.predict(df) == y)) if len(y) else 0.0
+
+
+def continue_boosting(pipeline, df, y, rounds: int = BOOST_ROUNDS, weight: float = FEEDBACK_WEIGHT):
+    """A copy of `pipeline` whose XGBoost classifier has `rounds` more trees fitted on (df, y)."""
+    import numpy as np
+    import xgboost as xgb
+    clf = pipeline.steps[-1][1]
+    booster = clf.get_booster()
+    # hyper-parameters come from the booster itself: the pickled sklearn wrapper may
+    # predate the installed xgboost and miss attributes get_xgb_params() expects
+    config = json.loads(booster.save_config())["learner"]
+    tree = config["gradient_booster"].get("tree_train_param", {})
+    params = {"objective": config["objective"]["name"]}
+    params.update({k: tree[k] for k in ("eta", "max_depth", "min_child_weight", "subsample", "lambda", "alpha")
+                   if k in tree})
+    dtrain = xgb.DMatrix(_transform(pipeline, df), label=y, weight=np.full(len(y), weight))
+    booster = xgb.train(params, dtrain, num_boost_round=rounds, xgb_model=booster.copy())
+
+    new_clf = copy.deepcopy(clf)
+    new_clf._Booster = booster
+    if getattr(new_clf, "n_estimators", None):
+        new_clf.n_estimators += rounds
+    new_pipeline = copy.copy(pipeline)
+    new_pipeline.steps = pipeline.steps[:-1] + [(pipeline.steps[-1][0], new_clf)]
+    return new_pipeline
+
+
+def update_model(store: FeedbackStore = None, min_batch: int = MIN_BATCH, rounds: int = BOOST_ROUNDS,
+                 force: bool = False):
+    """
+    One incremental update from the observations added since the last one.
+    Returns a summary dict, or None when there was nothing (or not enough) to
+    train on or another process holds the update lock.
+    """
+    import numpy as np
+    from model.inference import get_model, model_columns, swap_model, _to_frame
+
+    store = store or get_feedback_store()
+    with open(store.lock_path, "w") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return None
+
+        start, total = store.trained_lines(), store.count()
+        if total - start < (1 if force else min_batch):
+            return None
+        batch, holdout = split_holdout(store.read(), start)
+        if not batch:
+            log.info(f"Feedback update: no comparable observations to train on in {total - start} new lines")
+            store.mark_trained(total)
+            return None
+        current = get_model()
+        columns = model_columns(current)
+        df_new = _to_frame([r["features"] for r in batch], columns)
+        y_new = np.array([r["winner"] for r in batch], dtype=int)
+
+        candidate = continue_boosting(current, df_new, y_new, rounds=rounds)
+
+        # guard against drift on observations neither model was trained on; without any, nothing is swapped
+        df_held = _to_frame([r["features"] for r in holdout], columns)
+        y_held = np.array([r["winner"] for r in holdout], dtype=int)
+        before, after = _accuracy(current, df_held, y_held), _accuracy(candidate, df_held, y_held)
+        accepted = bool(holdout) and after >= before
+        if accepted:
+            swap_model(candidate)
+        store.mark_trained(total, accuracy_before=before, accuracy_after=after, accepted=accepted)
+
+    summary = {"observations": len(batch), "held_out": len(holdout), "accuracy_before": before, "accuracy_after": after, "accepted": accepted}
+    log.info(f"Feedback update: {summary}")
+    return summary
+
+
+class FeedbackUpdater(threading.Thread):
+    """Runs update_model() when notified of new observations, at most every `interval_s` seconds."""
+
+    def __init__(self, store: FeedbackStore = None, interval_s: float = 60.0, min_batch: int = MIN_BATCH):
+        super().__init__(name="hybridflow-feedback", daemon=True)
+        self.store = store or get_feedback_store()
+        self.interval_s = interval_s
+        self.min_batch = min_batch
+        self._wake = threading.Event()
+        self._stop_event = threading.Event()
+
+    def notify(self):
+        self._wake.set()
+
+    def stop(self):
+        self._stop_event.set()
+        self._wake.set()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            self._wake.wait(self.interval_s)
+            self._wake.clear()
+            if self._stop_event.is_set():
+                break
+            try:
+                if self.store.pending() >= self.min_batch:
+                    update_model(self.store, min_batch=self.min_batch)
+            except Exception as e:
+                log.warning(f"Feedback update failed: {e}")
+            self._stop_event.wait(self.interval_s)
+
+
+_updater = None
+_updater_lock = threading.Lock()
+
+
+def start_updater(**kwargs) -> FeedbackUpdater:
+    """Start (once) and return the process-wide background updater."""
+    global _updater
+    with _updater_lock:
+        if _updater is None or not _updater.is_alive():
+            _updater = FeedbackUpdater(**kwargs)
+            _updater.start()
+        return _updater
+
+
+def main():
+    ap = argparse.ArgumentParser(description="HybridFlow online feedback")
+    ap.add_argument("command", choices=["stats", "update", "reset"])
+    ap.add_argument("--rounds", type=int, default=BOOST_ROUNDS)
+    ap.add_argument("--force", action="store_true", help="update even below the minimum batch size")
+    args = ap.parse_args()
+
+    store = get_feedback_store()
+    if args.command == "stats":
+        usable = sum(comparable(r) for r in store.read())
+        print(json.dumps({"observations": store.count(), "comparable": usable, "pending": store.pending(),
+                          "path": store.path}, indent=2))
+    elif args.command == "update":
+        print(json.dumps(update_model(store, rounds=args.rounds, force=args.force), indent=2))
+    else:
+        # back to the shipped model; observations are kept
+        from model.inference import ONLINE_MODEL_PATH
+        if os.path.exists(ONLINE_MODEL_PATH):
+            os.remove(ONLINE_MODEL_PATH)
+        store.mark_trained(0)
+        print("Online model removed; all observations will be retrained on the next update")
+
+
+if __name__ == "__main__":
+    main()
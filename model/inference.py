@@ -1,30 +1,224 @@
-import joblib
-import pandas as pd
 import os
 import logging
+import threading
+from analyzer.feature_builder import COST_COLUMNS, FEATURE_COLUMNS, ROOFLINE_COLUMNS
+from utils.paths import CACHE_DIR
 
 log = logging.getLogger("inference")
 log.setLevel(logging.INFO)
 
 MODEL_PATH = os.path.join("model", "preprocesing_model.pkl")
+# written next to MODEL_PATH by model.train --publish: version, feature schema, metrics
+MANIFEST_PATH = os.path.join("model", "model_manifest.json")
+# written by model.feedback after continued training on measured runs; preferred when present
+ONLINE_MODEL_PATH = os.path.join(CACHE_DIR, "models", "online_model.pkl")
+USE_ONLINE_MODEL = os.environ.get("HYBRIDFLOW_ONLINE_MODEL", "1") != "0"
+# generated by model.export: the same pipeline as plain Python, without sklearn/xgboost/pandas
+COMPILED_MODEL_PATH = os.path.join("model", "compiled_model.py")
+USE_COMPILED_MODEL = os.environ.get("HYBRIDFLOW_COMPILED_MODEL", "1") != "0"
+
+_model = None
+_model_version = 0
+_model_lock = threading.Lock()
+_compiled = None
+
+
+def model_entry():
+    """(name, entry) of the registered model for this machine (model.registry); the shipped model without a registry."""
+    from model.registry import get_registry
+    name, entry = get_registry().select()
+    return (name, entry) if entry else (None, {"model": MODEL_PATH, "compiled": COMPILED_MODEL_PATH})
+
+
+def get_model(profile: dict = None):
+    """
+    Unpickle the pipeline on first use; importing this module stays cheap.
+    profile: another device's get_device_profile(); its registered (or nearest)
+    model is returned instead of this machine's.
+    """
+    global _model
+    if profile is not None:
+        from model.registry import get_registry
+        return get_registry().model_for(profile)
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                if USE_ONLINE_MODEL and os.path.exists(ONLINE_MODEL_PATH):
+                    _model = _load(ONLINE_MODEL_PATH)
+                    log.info(f"Loaded model from {ONLINE_MODEL_PATH}")
+                else:
+                    from model.registry import get_registry
+                    name, entry = model_entry()
+                    _model = get_registry().load(name) if name else _load(entry["model"])
+                    log.info(f"Using model {name or entry['model']}{_check_manifest(entry['model'])}")
+    return _model
+
+
+def _load(path):
+    import joblib
+    return joblib.load(path)
+
+
+def _check_manifest(model_path) -> str:
+    """' (version ...)' for a published artifact; refuses one trained on other feature columns."""
+    manifest_path = MANIFEST_PATH if model_path == MODEL_PATH else os.path.join(os.path.dirname(model_path), "manifest.json")
+    if not os.path.exists(manifest_path):
+        return ""
+    import json
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    columns = manifest["feature_schema"]["columns"]
+    optional = COST_COLUMNS + ROOFLINE_COLUMNS
+    if columns[:len(FEATURE_COLUMNS)] != list(FEATURE_COLUMNS) or not set(columns) <= set(FEATURE_COLUMNS + optional):
+        raise RuntimeError(f"{model_path} was trained on features {columns}, inference builds "
+                           f"{FEATURE_COLUMNS} + {optional}")
+    return f" (version {manifest['version']})"
+
+
+def get_compiled_model():
+    """
+    The compiled module of this machine's registered model when it matches
+    that pickle, else None: it is missing, disabled (HYBRIDFLOW_COMPILED_MODEL=0),
+    compiled from another pickle, or superseded by the online model.
+    """
+    global _compiled
+    if not USE_COMPILED_MODEL or _model_version > 0:
+        return None
+    if _compiled is None:
+        with _model_lock:
+            if _compiled is None:
+                _compiled = False
+                _, entry = model_entry()
+                path = entry.get("compiled")
+                if path and os.path.exists(path) and not (USE_ONLINE_MODEL and os.path.exists(ONLINE_MODEL_PATH)):
+                    from model.export import file_sha256, load_compiled
+                    module = load_compiled(path)
+                    if module.SOURCE_SHA256 == file_sha256(entry["model"]):
+                        _compiled = module
+                        log.info(f"Using compiled model {path}")
+                    else:
+                        log.warning(f"{path} is stale, rerun python -m model.export --model {entry['model']} --out {path}")
+    return _compiled or None
+
+
+def model_version() -> int:
+    """Bumped on every swap_model(); 0 is the model loaded at start-up."""
+    return _model_version
+
+
+def swap_model(pipeline, persist: bool = True):
+    """
+    Replace the live model. Readers holding the old pipeline finish with it;
+    new predictions see the new one. With persist=True the pipeline is also
+    written (atomically) to ONLINE_MODEL_PATH for other and later processes.
+    Cached decisions are dropped since they came from the old model.
+    """
+    global _model, _model_version
+    if persist:
+        import joblib
+        os.makedirs(os.path.dirname(ONLINE_MODEL_PATH), exist_ok=True)
+        tmp = f"{ONLINE_MODEL_PATH}.{os.getpid()}.tmp"
+        joblib.dump(pipeline, tmp)
+        os.replace(tmp, ONLINE_MODEL_PATH)
+    with _model_lock:
+        _model = pipeline
+        _model_version += 1
+    from model.decision_cache import get_decision_cache
+    get_decision_cache().clear()
+    log.info(f"Model swapped (version {_model_version})")
+
+
+def model_columns(model) -> list:
+    """Input columns of a fitted pipeline: FEATURE_COLUMNS, plus COST_COLUMNS / ROOFLINE_COLUMNS when it was trained with them."""
+    return list(getattr(model.steps[0][1], "feature_names_in_", FEATURE_COLUMNS))
+
+
+def model_operation_types(profile: dict = None) -> set:
+    """operation_type values the model one-hot encodes; it cannot tell any other value apart."""
+    compiled = get_compiled_model() if profile is None else None
+    if compiled is not None:
+        return {arg[1] for kind, arg in compiled.INPUTS if kind == "onehot" and arg[0] == "operation_type"}
+    for _, transformer, _ in get_model(profile).steps[0][1].transformers_:
+        if "operation_type" in list(getattr(transformer, "feature_names_in_", [])) and hasattr(transformer, "categories_"):
+            return {str(c) for c in transformer.categories_[0]}
+    return set()
+
+
+def _to_frame(features_list, columns=FEATURE_COLUMNS):
+    import pandas as pd
+    if isinstance(features_list, pd.DataFrame):
+        return features_list.reindex(columns=columns)
+    rows = list(features_list)
+    # column-wise construction is much cheaper than one record at a time
+    return pd.DataFrame({c: [f.get(c) for f in rows] for c in columns}, columns=columns)
+
+
+def predict_many(features_list, profile: dict = None):
+    """
+    Vectorized prediction for many kernels at once.
+    - features_list: list/array of dicts from analyzer.feature_builder.build_feature_dict,
+      or a DataFrame with those columns.
+    Returns (decisions, gpu_probabilities): a list of "cpu"/"gpu" strings and a
+    numpy array with P(gpu) per row. Preprocessing and the classifier run once for the whole batch.
+    - profile: decide for another device (see get_model) instead of this machine.
+    """
+    import numpy as np
+    compiled = get_compiled_model() if profile is None else None
+    if compiled is not None:
+        # a DataFrame is converted without importing pandas for the usual list of dicts
+        rows = features_list.to_dict("records") if hasattr(features_list, "to_dict") else list(features_list)
+        decisions, proba = compiled.predict_many(rows)
+        return decisions, np.asarray(proba, dtype=np.float32)
+
+    model = get_model(profile)
+    df = _to_frame(features_list, model_columns(model))
+    if len(df) == 0:
+        return [], np.empty(0)
+
+    proba = model.predict_proba(df)[:, 1]
+    # same threshold XGBClassifier.predict applies for binary problems
+    decisions = np.where(proba > 0.5, "gpu", "cpu").tolist()
+    log.debug(f"Batch prediction: {len(decisions)} kernels, {decisions.count('gpu')} to GPU")
+    return decisions, proba
 
-model = joblib.load(MODEL_PATH)
 
 def predict(features: dict) -> str:
     """
     Predict CPU or GPU given a feature dictionary.
-    Logs every feature before passing it to the model.
+    The full feature snapshot is logged at DEBUG level.
     """
-    log.info("===== FEATURE SNAPSHOT BEFORE PREDICTION =====")
-    for k, v in features.items():
-        log.info(f"  {k:<25} : {v}")
-    log.info("===============================================")
-
-    df = pd.DataFrame([features])
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("===== FEATURE SNAPSHOT BEFORE PREDICTION =====")
+        for k, v in features.items():
+            log.debug(f"  {k:<25} : {v}")
+        log.debug("===============================================")
 
-    prediction = model.predict(df)[0]
-    decision = "gpu" if prediction == 1 else "cpu"
+    compiled = get_compiled_model()
+    decision = compiled.predict(features) if compiled is not None else predict_many([features])[0][0]
 
     log.info(f"MODEL PREDICTION : {decision.upper()}")
 
     return decision
+
+
+def predict_detailed(features: dict) -> dict:
+    """
+    Decision plus the runtime model's view of it:
+        {"decision", "p_gpu"} and, when model/runtime_model.pkl exists,
+        "runtimes" (per-device ms with 95% intervals, see runtime_model.predict_runtimes)
+        and "speedup", "margin_ms", "p_chosen_faster", "faster_device".
+    """
+    from model.runtime_model import predict_runtimes, compare_devices
+    decisions, proba = predict_many([features])
+    result = {"decision": decisions[0], "p_gpu": float(proba[0])}
+    estimates = predict_runtimes([features])
+    if estimates:
+        result["runtimes"] = estimates[0]
+        result.update(compare_devices(estimates[0], result["decision"]))
+        log.info(
+            f"MODEL PREDICTION : {result['decision'].upper()} "
+            f"(expected speedup x{result['speedup']:.2f}, margin {result['margin_ms']:.3f} ms)"
+        )
+    else:
+        log.info(f"MODEL PREDICTION : {result['decision'].upper()}")
+    return result
@@ -14,6 +14,10 @@ from xgboost import XGBClassifier
 
 df=pd.read_csv("D:\Dataset_featuring\Final_dataset.csv")
 df.drop(["dtype","cpu_runtime_ms","gpu_runtime_ms","transfer_time_ms","power_mode","thermal_headroom","device_name","is_edge","gpu_mem_used_mb","gpu_mem_total_mb","gpu_mem_free_mb","source_file","concurrent_gpu_tasks","data_transfer_cost_ms"],axis=1,inplace=True)
+# cpu-parallel(N) measurements, transfer split and timing diagnostics are outcomes, not inputs; older datasets lack them
+df.drop(["cpu_threads","cpu_parallel_runtime_ms","best_target","h2d_time_ms","d2h_time_ms",
+         "cpu_reps","cpu_ci_pct","gpu_reps","gpu_ci_pct",
+         "flops","bytes_moved","arithmetic_intensity"],axis=1,inplace=True,errors="ignore")
 knn_imputer = KNNImputer(n_neighbors=8)
 preprocessor = ColumnTransformer(
     transformers=[
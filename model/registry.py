@@ -0,0 +1,149 @@
+"""
+Per-device model registry.
+
+model/registry.json maps a name to the device a model was trained on and its
+files:
+
+    "nvidia_geforce_rtx_2050": {"device_name": "NVIDIA GeForce RTX 2050", "bus_type": "PCIe",
+                                "is_edge": 0, "model": "model/preprocesing_model.pkl",
+                                "compiled": "model/compiled_model.py", "runtime": "model/runtime_model.pkl"}
+
+("runtime", optional: the model.runtime_model regressor trained on the same device.)
+
+select() picks the entry for a device profile (Dataset/collector/device_profile.py):
+the same device_name if registered, else the nearest device class, i.e. the
+same bus_type ("PCIe" discrete GPU, "SoC" unified memory, "CPU-only") and
+is_edge, then the same bus_type, then the same is_edge, then the default.
+Models are unpickled on first use and at most MAX_LOADED_MODELS are kept
+(least recently used dropped).
+
+HYBRIDFLOW_DEVICE_MODEL=<name> forces an entry for this machine.
+Register a model: python -m model.train --data jetson.csv --register
+           and its runtime model: python -m model.runtime_model --data jetson.csv --register
+"""
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from utils.dataset_modules import load_dataset_module
+
+log = logging.getLogger("registry")
+log.setLevel(logging.INFO)
+
+REGISTRY_PATH = os.path.join("model", "registry.json")
+DEVICE_MODELS_DIR = os.path.join("model", "devices")
+MAX_LOADED_MODELS = 2
+FORCED_MODEL = os.environ.get("HYBRIDFLOW_DEVICE_MODEL")
+
+_registry = None
+_registry_lock = threading.Lock()
+_profile = None
+
+
+def local_device_profile() -> dict:
+    """get_device_profile() of this machine, probed once."""
+    global _profile
+    if _profile is None:
+        try:
+            _profile = load_dataset_module("collector/device_profile.py").get_device_profile()
+        except Exception as e:
+            log.warning(f"Device profile unavailable ({e}), using the default model")
+            _profile = {"device_name": "Unknown", "bus_type": "Unknown", "is_edge": 0}
+    return _profile
+
+
+def bus_type_of(device_name: str) -> str:
+    """bus_type get_device_profile() reports for a device name (for data that lacks it)."""
+    name = device_name or ""
+    if "Jetson" in name or "Tegra" in name:
+        return "SoC"
+    return "PCIe" if "NVIDIA" in name or "GeForce" in name else "CPU-only"
+
+
+def device_slug(device_name: str) -> str:
+    return load_dataset_module("collector/store.py").device_slug(device_name)
+
+
+def nearest(entries: dict, profile: dict, default: str = None):
+    """
+    (key, entry) of the entry ({"device_name", "bus_type", "is_edge"}) closest to
+    a device profile: same device_name, else same bus_type and is_edge, same
+    bus_type, same is_edge, then `default`.
+    """
+    name, bus, edge = profile.get("device_name"), profile.get("bus_type"), int(profile.get("is_edge") or 0)
+
+    def score(item):
+        key, e = item
+        return (e["device_name"] == name,
+                e["bus_type"] == bus and int(e["is_edge"]) == edge,
+                e["bus_type"] == bus,
+                int(e["is_edge"]) == edge,
+                key == default)
+
+    return max(entries.items(), key=score)
+
+
+class ModelRegistry:
+    """Entries of registry.json and an LRU cache of the loaded models."""
+
+    def __init__(self, path: str = REGISTRY_PATH, max_loaded: int = MAX_LOADED_MODELS):
+        self.path = path
+        self.max_loaded = max_loaded
+        self.entries, self.default = {}, None
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.entries, self.default = data["models"], data.get("default")
+        self._loaded = OrderedDict()
+        self._lock = threading.Lock()
+
+    def select(self, profile: dict = None):
+        """(name, entry) of the model for a device profile (default: this machine); (None, None) if empty."""
+        if not self.entries:
+            return None, None
+        if profile is None:
+            if FORCED_MODEL in self.entries:
+                return FORCED_MODEL, self.entries[FORCED_MODEL]
+            profile = local_device_profile()
+        return nearest(self.entries, profile, self.default)
+
+    def load(self, name: str):
+        """The pickled pipeline of entry `name`, from the LRU cache when loaded before."""
+        with self._lock:
+            if name in self._loaded:
+                self._loaded.move_to_end(name)
+                return self._loaded[name]
+            import joblib
+            model = joblib.load(self.entries[name]["model"])
+            self._loaded[name] = model
+            while len(self._loaded) > self.max_loaded:
+                dropped, _ = self._loaded.popitem(last=False)
+                log.info(f"Unloaded model {dropped}")
+            log.info(f"Loaded model {name} from {self.entries[name]['model']}")
+            return model
+
+    def model_for(self, profile: dict = None):
+        name, _ = self.select(profile)
+        return None if name is None else self.load(name)
+
+    def register(self, name: str, entry: dict, default: bool = False):
+        """Add or replace an entry and save registry.json (atomically)."""
+        with self._lock:
+            self.entries[name] = entry
+            self._loaded.pop(name, None)
+            if default or self.default is None:
+                self.default = name
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "default": self.default, "models": self.entries}, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.path)
+
+
+def get_registry() -> ModelRegistry:
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry()
+    return _registry
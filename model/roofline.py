@@ -0,0 +1,332 @@
+"""
+Roofline cost model: runtime per device from a kernel's flops and bytes_moved
+(analyzer loop nests, Dataset/collector/op_costs.py for benchmark rows).
+
+    time(side)   = overhead_ms + max(flops / peak_gflops, bytes_moved / bandwidth_gbs)
+    transfer_ms  = latency_ms + bytes_moved / link bandwidth_gbs
+    gpu_total_ms = time(gpu) + transfer_ms          (what the benchmark winner compares)
+
+The numbers come from device profiles, model/device_profiles/<slug>.json:
+
+    {"device_name": "NVIDIA GeForce RTX 2050", "bus_type": "PCIe", "is_edge": 0, "source": "...",
+     "cpu": {"peak_gflops", "bandwidth_gbs", "overhead_ms"},
+     "gpu": {...} or null, "transfer": {"bandwidth_gbs", "latency_ms"} or null}
+
+written by either
+- python -m model.roofline fit --data Final_dataset.csv ...: per device in the
+  benchmark data, overhead = 5th percentile runtime and peak / bandwidth = 90th
+  percentile of the rates achieved by rows whose runtime is mostly work
+- python -m model.roofline probe: microbenchmarks (torch) on this machine; the
+  GPU part only with CUDA, otherwise gpu/transfer of an existing file are kept
+
+Estimating needs no GPU and nothing beyond the standard library, so any
+device can be estimated from its file; profile_for() picks the file like the
+model registry picks a model (HYBRIDFLOW_DEVICE_MODEL forces one here too).
+
+main.decide() uses the estimate
+- for operation types the model has no category for (analyzer "unknown"...)
+- as a sanity check: a model decision is replaced when the roofline expects
+  the other device to be at least SANITY_RATIO times faster
+  (HYBRIDFLOW_ROOFLINE_SANITY_RATIO, 0 only logs disagreements)
+- as the roofline_log_speedup feature (model.train --roofline-feature)
+HYBRIDFLOW_ROOFLINE=0 disables it.
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import statistics
+import threading
+import time
+from model.registry import FORCED_MODEL, bus_type_of, device_slug, local_device_profile, nearest
+
+log = logging.getLogger("roofline")
+log.setLevel(logging.INFO)
+
+PROFILES_DIR = os.path.join("model", "device_profiles")
+USE_ROOFLINE = os.environ.get("HYBRIDFLOW_ROOFLINE", "1") != "0"
+# on the RTX 2050 data no model decision is that far off; at 5x the overrides are all wrong
+SANITY_RATIO = float(os.environ.get("HYBRIDFLOW_ROOFLINE_SANITY_RATIO", "10"))
+OVERHEAD_QUANTILE = 0.05
+ROOF_QUANTILE = 0.9
+MIN_FIT_ROWS = 20
+PROBE_REPS = 9
+
+_profiles = None
+_profiles_lock = threading.Lock()
+
+
+def load_profiles(directory: str = PROFILES_DIR) -> dict:
+    """{slug: profile} of every profile file in directory."""
+    profiles = {}
+    if os.path.isdir(directory):
+        for fname in sorted(os.listdir(directory)):
+            if fname.endswith(".json"):
+                with open(os.path.join(directory, fname), encoding="utf-8") as f:
+                    profiles[fname[:-5]] = json.load(f)
+    return profiles
+
+
+def get_profiles() -> dict:
+    global _profiles
+    if _profiles is None:
+        with _profiles_lock:
+            if _profiles is None:
+                _profiles = load_profiles()
+    return _profiles
+
+
+def profile_for(device: dict = None):
+    """(slug, profile) for a get_device_profile() dict (default: this machine); (None, None) without profiles."""
+    profiles = get_profiles()
+    if not profiles:
+        return None, None
+    if device is None:
+        if FORCED_MODEL in profiles:
+            return FORCED_MODEL, profiles[FORCED_MODEL]
+        device = local_device_profile()
+    return nearest(profiles, device)
+
+
+def device_time(roof: dict, flops: float, bytes_moved: float):
+    """(ms, "compute"/"memory") of one kernel on one side of a profile."""
+    peak, bandwidth = roof.get("peak_gflops"), roof.get("bandwidth_gbs")
+    compute_ms = flops / (peak * 1e6) if peak else 0.0
+    memory_ms = bytes_moved / (bandwidth * 1e6) if bandwidth else 0.0
+    bound = "compute" if compute_ms >= memory_ms else "memory"
+    return roof.get("overhead_ms", 0.0) + max(compute_ms, memory_ms), bound
+
+
+def transfer_time(link: dict, bytes_moved: float) -> float:
+    if not link:
+        return 0.0
+    bandwidth = link.get("bandwidth_gbs")
+    return link.get("latency_ms", 0.0) + (bytes_moved / (bandwidth * 1e6) if bandwidth else 0.0)
+
+
+def estimate(features: dict, device: dict = None, profile: dict = None):
+    """
+    Roofline runtimes of one kernel, None without flops/bytes_moved or a profile:
+        {"cpu_ms", "gpu_ms", "transfer_ms", "gpu_total_ms", "bound": {"cpu", "gpu"},
+         "faster_device", "speedup" (slower / faster), "log_speedup" (log10 cpu / gpu total), "profile"}
+    GPU fields are None for a device without a GPU.
+    - device: get_device_profile() dict of another machine; profile: a profile itself
+    """
+    flops, moved = features.get("flops"), features.get("bytes_moved")
+    if not USE_ROOFLINE or flops is None or moved is None or flops != flops or moved != moved:
+        return None
+    name = None
+    if profile is None:
+        name, profile = profile_for(device)
+        if profile is None:
+            return None
+    cpu_ms, cpu_bound = device_time(profile["cpu"], flops, moved)
+    result = {"cpu_ms": cpu_ms, "gpu_ms": None, "transfer_ms": None, "gpu_total_ms": None,
+              "bound": {"cpu": cpu_bound, "gpu": None}, "faster_device": "cpu", "speedup": None,
+              "log_speedup": None, "profile": name or profile.get("device_name")}
+    if profile.get("gpu"):
+        gpu_ms, gpu_bound = device_time(profile["gpu"], flops, moved)
+        transfer_ms = transfer_time(profile.get("transfer"), moved)
+        total = gpu_ms + transfer_ms
+        result.update(gpu_ms=gpu_ms, transfer_ms=transfer_ms, gpu_total_ms=total,
+                      faster_device="gpu" if total < cpu_ms else "cpu",
+                      speedup=max(cpu_ms, total) / max(min(cpu_ms, total), 1e-12),
+                      log_speedup=math.log10(max(cpu_ms, 1e-12) / max(total, 1e-12)))
+        result["bound"]["gpu"] = gpu_bound
+    return result
+
+
+def sanity_check(decision: str, roofline: dict, ratio: float = SANITY_RATIO) -> str:
+    """decision ("cpu"/"gpu"), or the roofline's when it expects the other device to be at least ratio times faster."""
+    if roofline is None or roofline["speedup"] is None or decision == roofline["faster_device"]:
+        return decision
+    if ratio and roofline["speedup"] >= ratio:
+        log.warning(f"Model chose {decision.upper()}, roofline expects {roofline['faster_device'].upper()} "
+                    f"x{roofline['speedup']:.1f} faster: using {roofline['faster_device'].upper()}")
+        return roofline["faster_device"]
+    log.info(f"Model chose {decision.upper()}, roofline prefers {roofline['faster_device'].upper()} "
+             f"(x{roofline['speedup']:.2f})")
+    return decision
+
+
+def log_speedups(df):
+    """roofline_log_speedup per row of a frame with flops, bytes_moved, device_name and is_edge (NaN without a profile)."""
+    import numpy as np
+    out = np.full(len(df), np.nan)
+    if not USE_ROOFLINE or not get_profiles():
+        return out
+    for (name, edge), idx in df.groupby(["device_name", "is_edge"], dropna=False).indices.items():
+        _, profile = profile_for({"device_name": name, "bus_type": bus_type_of(name), "is_edge": int(edge or 0)})
+        rows = df.iloc[idx]
+        estimates = [estimate({"flops": f, "bytes_moved": b}, profile=profile)
+                     for f, b in zip(rows["flops"].tolist(), rows["bytes_moved"].tolist())]
+        out[idx] = [np.nan if e is None or e["log_speedup"] is None else e["log_speedup"] for e in estimates]
+    return out
+
+
+def _rounded(value):
+    return None if value is None or not math.isfinite(value) else float(f"{value:.4g}")
+
+
+def _fit_roof(flops, moved, ms, quantile=ROOF_QUANTILE):
+    """{"peak_gflops", "bandwidth_gbs", "overhead_ms"} from measured runtimes of one side."""
+    import numpy as np
+    overhead = float(np.quantile(ms, OVERHEAD_QUANTILE))
+    busy = ms - overhead
+    # rows whose time is mostly work rather than the fixed per-call cost
+    work = busy > overhead
+    if not work.any():
+        work = busy > 0
+    compute = work & (flops > 0)
+    return {
+        "peak_gflops": _rounded(float(np.quantile(flops[compute] / busy[compute], quantile)) / 1e6) if compute.any() else None,
+        "bandwidth_gbs": _rounded(float(np.quantile(moved[work] / busy[work], quantile)) / 1e6) if work.any() else None,
+        "overhead_ms": _rounded(overhead),
+    }
+
+
+def _fit_link(moved, ms, quantile=ROOF_QUANTILE):
+    import numpy as np
+    latency = float(np.quantile(ms, OVERHEAD_QUANTILE))
+    work = ms - latency > latency
+    return {
+        "bandwidth_gbs": _rounded(float(np.quantile(moved[work] / (ms[work] - latency), quantile)) / 1e6) if work.any() else None,
+        "latency_ms": _rounded(latency),
+    }
+
+
+def fit(df, source: str = None, quantile: float = ROOF_QUANTILE, min_rows: int = MIN_FIT_ROWS) -> dict:
+    """{slug: profile} for every device with at least min_rows rows in a harmonized benchmark frame."""
+    import numpy as np
+    profiles = {}
+    df = df.dropna(subset=["flops", "bytes_moved", "cpu_runtime_ms"])
+    for name, rows in df.groupby("device_name"):
+        if len(rows) < min_rows:
+            log.warning(f"{name}: {len(rows)} rows, at least {min_rows} needed for a profile")
+            continue
+        flops, moved = rows["flops"].to_numpy(float), rows["bytes_moved"].to_numpy(float)
+        cpu_ms, gpu_ms = rows["cpu_runtime_ms"].to_numpy(float), rows["gpu_runtime_ms"].to_numpy(float)
+        transfer_ms = rows["transfer_time_ms"].to_numpy(float)
+        on_gpu = np.isfinite(gpu_ms) & (gpu_ms > 0) & np.isfinite(transfer_ms)
+        has_gpu = on_gpu.sum() >= min_rows
+        profiles[device_slug(name)] = {
+            "device_name": name,
+            "bus_type": bus_type_of(name),
+            "is_edge": int(rows["is_edge"].fillna(0).astype(int).max()),
+            "source": f"fit {source or 'data'} ({len(rows)} rows, q={quantile})",
+            "cpu": _fit_roof(flops, moved, cpu_ms, quantile),
+            "gpu": _fit_roof(flops[on_gpu], moved[on_gpu], gpu_ms[on_gpu], quantile) if has_gpu else None,
+            "transfer": _fit_link(moved[on_gpu], transfer_ms[on_gpu], quantile) if has_gpu else None,
+        }
+    return profiles
+
+
+def agreement(df, profile: dict) -> float:
+    """Share of labelled rows whose measured winner the profile's roofline predicts."""
+    hits = total = 0
+    for f, b, w in zip(df["flops"].tolist(), df["bytes_moved"].tolist(), df["winner"].tolist()):
+        e = estimate({"flops": f, "bytes_moved": b}, profile=profile)
+        if e is not None and w == w:
+            hits += (e["faster_device"] == "gpu") == bool(w)
+            total += 1
+    return hits / total if total else float("nan")
+
+
+def _median_ms(fn, sync=None, reps=PROBE_REPS):
+    fn()
+    if sync:
+        sync()
+    times = []
+    for _ in range(reps):
+        t0 = time.perf_counter()
+        fn()
+        if sync:
+            sync()
+        times.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(times)
+
+
+def _probe_roof(torch, device, sync=None, n=1024, elements=1 << 24):
+    a = torch.rand(n, n, device=device)
+    x = torch.rand(elements, device=device)
+    y, tiny = torch.empty_like(x), torch.rand(1, device=device)
+    return {
+        "peak_gflops": _rounded(2 * n ** 3 / _median_ms(lambda: a @ a, sync) / 1e6),
+        # copy: read + write
+        "bandwidth_gbs": _rounded(2 * x.numel() * x.element_size() / _median_ms(lambda: y.copy_(x), sync) / 1e6),
+        "overhead_ms": _rounded(_median_ms(lambda: tiny + tiny, sync)),
+    }
+
+
+def probe(existing: dict = None) -> dict:
+    """Profile of this machine from microbenchmarks; without CUDA the GPU side of `existing` is kept."""
+    import torch
+    device = local_device_profile()
+    existing = existing or {}
+    profile = {
+        "device_name": device["device_name"],
+        "bus_type": device["bus_type"],
+        "is_edge": int(device["is_edge"]),
+        "source": "probe",
+        "cpu": _probe_roof(torch, "cpu"),
+        "gpu": existing.get("gpu"),
+        "transfer": existing.get("transfer"),
+    }
+    if torch.cuda.is_available():
+        sync = torch.cuda.synchronize
+        profile["gpu"] = _probe_roof(torch, "cuda", sync)
+        # pageable copies, like the collector's .to("cuda")
+        x, tiny = torch.rand(1 << 24), torch.rand(1)
+        latency = _median_ms(lambda: tiny.to("cuda"), sync)
+        copy_ms = _median_ms(lambda: x.to("cuda"), sync)
+        profile["transfer"] = {
+            "bandwidth_gbs": _rounded(x.numel() * x.element_size() / max(copy_ms - latency, 1e-6) / 1e6),
+            "latency_ms": _rounded(latency),
+        }
+    else:
+        log.info("No CUDA device: GPU and transfer numbers kept from the existing profile")
+    return profile
+
+
+def save_profile(slug: str, profile: dict, directory: str = PROFILES_DIR) -> str:
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{slug}.json")
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(profile, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+    return path
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Write roofline device profiles")
+    sub = ap.add_subparsers(dest="command", required=True)
+    fit_ap = sub.add_parser("fit", help="from benchmark data, one profile per device")
+    fit_ap.add_argument("--data", nargs="+", default=["Final_dataset.csv"])
+    fit_ap.add_argument("--quantile", type=float, default=ROOF_QUANTILE)
+    fit_ap.add_argument("--min-rows", type=int, default=MIN_FIT_ROWS)
+    probe_ap = sub.add_parser("probe", help="microbenchmarks on this machine")
+    for p in (fit_ap, probe_ap):
+        p.add_argument("--out", default=PROFILES_DIR)
+    args = ap.parse_args()
+
+    if args.command == "fit":
+        import pandas as pd
+        from utils.dataset_modules import load_dataset_module
+        store = load_dataset_module("collector/store.py")
+        df = pd.concat([store.read_any(p) for p in args.data], ignore_index=True)
+        for slug, profile in fit(df, " ".join(args.data), args.quantile, args.min_rows).items():
+            path = save_profile(slug, profile, args.out)
+            rows = df[df["device_name"] == profile["device_name"]]
+            print(f"{profile['device_name']}: saved as {path}, roofline agrees with "
+                  f"{agreement(rows, profile):.1%} of {len(rows)} measured winners")
+    else:
+        slug = device_slug(local_device_profile()["device_name"])
+        existing = load_profiles(args.out).get(slug)
+        path = save_profile(slug, probe(existing), args.out)
+        print(f"Profile of this machine saved as {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Per-device runtime regression: expected CPU, GPU, transfer and GPU+transfer
+milliseconds for a feature dict, with an uncertainty band.
+
+Each target is a bootstrap ensemble of XGBoost regressors on log(ms + 1 us).
+The spread of the ensemble (model uncertainty) plus the out-of-bag residual
+spread (noise the features cannot explain) gives a log-space standard
+deviation, reported as a 95% interval around the predicted median.
+
+Like the classifier, the regressor is per device: a model.registry entry
+names its file under "runtime", and estimates come from the entry selected
+for this machine. An entry without one gets no estimates rather than
+another device class's.
+
+Train:  python -m model.runtime_model --data Final_dataset.csv [--register]
+"""
+import argparse
+import logging
+import math
+import os
+import threading
+from analyzer.feature_builder import FEATURE_COLUMNS
+
+log = logging.getLogger("runtime_model")
+log.setLevel(logging.INFO)
+
+RUNTIME_MODEL_PATH = os.path.join("model", "runtime_model.pkl")
+
+# output name -> dataset column(s) summed into the regression target
+RUNTIME_TARGETS = {
+    "cpu_ms": ("cpu_runtime_ms",),
+    "gpu_ms": ("gpu_runtime_ms",),
+    "transfer_ms": ("transfer_time_ms",),
+    "gpu_total_ms": ("gpu_runtime_ms", "transfer_time_ms"),
+}
+Z95 = 1.96
+# offset before taking logs, so zero timings stay finite (1 microsecond)
+EPS_MS = 1e-3
+
+_runtime_models = {}
+_runtime_model_lock = threading.Lock()
+
+
+def _pipeline(seed):
+    from sklearn.compose import ColumnTransformer
+    from sklearn.preprocessing import OneHotEncoder
+    from sklearn.pipeline import Pipeline
+    from xgboost import XGBRegressor
+
+    # XGBoost handles the missing gpu_mem_pressure values natively
+    preprocessor = ColumnTransformer(
+        transformers=[('op_type_encode', OneHotEncoder(handle_unknown='ignore'), ['operation_type'])],
+        remainder='passthrough',
+    )
+    return Pipeline(steps=[
+        ('preprocessing', preprocessor),
+        ('regressor', XGBRegressor(n_estimators=120, max_depth=4, learning_rate=0.1, subsample=0.9,
+                                   random_state=seed, verbosity=0)),
+    ])
+
+
+def _target_values(df, columns):
+    import numpy as np
+    y = df[list(columns)].sum(axis=1).to_numpy(dtype=float)
+    return np.log(np.clip(y, 0, None) + EPS_MS)
+
+
+def _to_ms(log_value):
+    return max(0.0, math.exp(log_value) - EPS_MS)
+
+
+def fit_ensemble(X, y, n_models=5, seed=42):
+    """Bootstrap ensemble on (X, log target); returns (models, out-of-bag residual sd)."""
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    n = len(X)
+    oob_sum, oob_count = np.zeros(n), np.zeros(n)
+    models = []
+    for b in range(n_models):
+        idx = rng.integers(0, n, n)
+        model = _pipeline(seed + b).fit(X.iloc[idx], y[idx])
+        models.append(model)
+        oob = np.setdiff1d(np.arange(n), idx)
+        if len(oob):
+            oob_sum[oob] += model.predict(X.iloc[oob])
+            oob_count[oob] += 1
+    seen = oob_count > 0
+    resid = y[seen] - oob_sum[seen] / oob_count[seen]
+    return models, float(np.sqrt(np.mean(resid ** 2))) if len(resid) else 0.0
+
+
+def train(data_path, n_models=5, test_size=0.2, seed=42):
+    """Fit every target on data_path; reports hold-out error, then refits on all rows."""
+    import numpy as np
+    import pandas as pd
+    from sklearn.model_selection import train_test_split
+
+    df = pd.read_csv(data_path)
+    devices = sorted(df["device_name"].dropna().unique().tolist()) if "device_name" in df else []
+    artifact = {"feature_columns": list(FEATURE_COLUMNS), "targets": {}, "trained_rows": len(df),
+                "device_names": devices}
+    for name, columns in RUNTIME_TARGETS.items():
+        rows = df[np.isfinite(df[list(columns)]).all(axis=1)]
+        X, y = rows[FEATURE_COLUMNS], _target_values(rows, columns)
+
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=seed)
+        models, _ = fit_ensemble(X_train, y_train, n_models=n_models, seed=seed)
+        pred = np.mean([m.predict(X_test) for m in models], axis=0)
+        # error as a ratio: exp(|log error|) of 1.3 means typically within 30%
+        ratio = float(np.exp(np.median(np.abs(pred - y_test))))
+        ss_res, ss_tot = np.sum((pred - y_test) ** 2), np.sum((y_test - y_test.mean()) ** 2)
+        print(f"{name:<13} rows={len(rows):<5} hold-out R2(log)={1 - ss_res / ss_tot:.3f} median error x{ratio:.2f}")
+
+        models, resid_sd = fit_ensemble(X, y, n_models=n_models, seed=seed)
+        artifact["targets"][name] = {"models": models, "residual_sd": resid_sd}
+    return artifact
+
+
+def runtime_model_path():
+    """
+    File of the runtime model for this machine: the "runtime" of the registry entry
+    whose classifier decides here (model.inference.model_entry), RUNTIME_MODEL_PATH
+    without a registry; None when that entry has no runtime model.
+    """
+    from model.inference import model_entry
+    name, entry = model_entry()
+    return RUNTIME_MODEL_PATH if name is None else entry.get("runtime")
+
+
+def get_runtime_model():
+    """The trained artifact for this machine, loaded on first use; None if there is none."""
+    path = runtime_model_path()
+    if path is None or not os.path.exists(path):
+        return None
+    with _runtime_model_lock:
+        if path not in _runtime_models:
+            import joblib
+            _runtime_models[path] = joblib.load(path)
+            log.info(f"Loaded runtime model {path}")
+        return _runtime_models[path]
+
+
+def predict_runtimes(features_list):
+    """
+    Expected runtimes for each feature dict (or a DataFrame), as a list of
+        {target: {"ms", "low_ms", "high_ms", "log_mean", "log_sd"}}
+    for target in cpu_ms, gpu_ms, transfer_ms, gpu_total_ms. "ms" is the
+    median estimate, low/high the 95% interval. Returns None if this
+    machine's registry entry has no runtime model.
+    """
+    import numpy as np
+    from model.inference import _to_frame
+    artifact = get_runtime_model()
+    if artifact is None:
+        return None
+    df = _to_frame(features_list)
+    out = [{} for _ in range(len(df))]
+    if len(df) == 0:
+        return out
+    for name, entry in artifact["targets"].items():
+        preds = np.array([m.predict(df) for m in entry["models"]])
+        mu = preds.mean(axis=0)
+        sd = np.sqrt(preds.var(axis=0) + entry["residual_sd"] ** 2)
+        for row, m, s in zip(out, mu, sd):
+            row[name] = {
+                "ms": _to_ms(m),
+                "low_ms": _to_ms(m - Z95 * s),
+                "high_ms": _to_ms(m + Z95 * s),
+                "log_mean": float(m),
+                "log_sd": float(s),
+            }
+    return out
+
+
+def compare_devices(estimate: dict, decision: str) -> dict:
+    """
+    Speedup and margin of `decision` over the other device from one
+    predict_runtimes() row. GPU time includes transfers.
+    - speedup: other device time / chosen device time (> 1: the decision wins)
+    - margin_ms: other device time - chosen device time
+    - p_chosen_faster: probability the chosen device is faster under the log-normal estimates
+    """
+    cpu, gpu = estimate["cpu_ms"], estimate["gpu_total_ms"]
+    chosen, other = (gpu, cpu) if decision == "gpu" else (cpu, gpu)
+    sd = math.hypot(chosen["log_sd"], other["log_sd"]) or 1e-9
+    z = (other["log_mean"] - chosen["log_mean"]) / sd
+    return {
+        "speedup": other["ms"] / chosen["ms"] if chosen["ms"] > 0 else float("inf"),
+        "margin_ms": other["ms"] - chosen["ms"],
+        "p_chosen_faster": 0.5 * (1 + math.erf(z / math.sqrt(2))),
+        "faster_device": "gpu" if gpu["ms"] < cpu["ms"] else "cpu",
+    }
+
+
+def register(path, device_name):
+    """Attach the runtime model at path to the registry entry of device_name (which must exist)."""
+    from model.registry import device_slug, get_registry
+    registry = get_registry()
+    name = device_slug(device_name)
+    if name not in registry.entries:
+        raise ValueError(f"no registered model for {device_name!r}: register its classifier first")
+    registry.register(name, {**registry.entries[name], "runtime": path})
+    return name
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Train the per-device runtime regression model")
+    ap.add_argument("--data", default="Final_dataset.csv")
+    ap.add_argument("--out", default=None,
+                    help=f"default: {RUNTIME_MODEL_PATH}, or the device's model directory with --register")
+    ap.add_argument("--models", type=int, default=5, help="bootstrap ensemble size per target")
+    ap.add_argument("--register", action="store_true", help="attach to the registry entry of the data's device")
+    args = ap.parse_args()
+
+    import joblib
+    artifact = train(args.data, n_models=args.models)
+    out = args.out or RUNTIME_MODEL_PATH
+    if args.register:
+        from model.registry import DEVICE_MODELS_DIR, device_slug
+        if len(artifact["device_names"]) != 1:
+            raise SystemExit(f"training data covers devices {artifact['device_names']}: cannot register")
+        out = args.out or os.path.join(DEVICE_MODELS_DIR, device_slug(artifact["device_names"][0]), "runtime_model.pkl")
+        os.makedirs(os.path.dirname(out), exist_ok=True)
+    joblib.dump(artifact, out, compress=3)
+    print(f"Runtime model saved as {out}")
+    if args.register:
+        print(f"Registered for {register(out, artifact['device_names'][0])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+"""
+Training entry point for the CPU/GPU classifier.
+
+- data: benchmark CSVs (--data) or the Dataset benchmark store (--store),
+  harmonized onto the store's typed schema, reduced to FEATURE_COLUMNS + winner
+- cross-validation folds and the final fit on all rows run in parallel
+  (--jobs); every metric comes from the same out-of-fold predictions, so
+  each fold is fitted exactly once
+- XGBoost uses the histogram tree method (max_bin quantiles)
+- --cost-features adds flops, bytes_moved and arithmetic_intensity to the
+  model inputs (measured by the collector, estimated for older rows);
+  --roofline-feature adds the roofline speedup estimate for each row's device
+  (model/roofline.py profiles)
+- --external-memory streams the data in batches into an
+  xgboost.ExtMemQuantileDMatrix, for datasets larger than RAM; preprocessing
+  is then fitted on a sample and every 5th row is held out for metrics
+- the artifact is versioned: model/artifacts/<version>/{model.pkl,manifest.json},
+  the manifest carrying the feature schema, parameters, data and metrics;
+  --publish also installs it as the model inference loads and recompiles
+  model/compiled_model.py (model.export)
+
+python -m model.train --data Final_dataset.csv jetson_nano_complete_benchmark.csv --publish
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from analyzer.feature_builder import COST_COLUMNS, FEATURE_COLUMNS, ROOFLINE_COLUMNS
+from utils.dataset_modules import load_dataset_module
+
+log = logging.getLogger("train")
+log.setLevel(logging.INFO)
+
+ARTIFACTS_DIR = os.path.join("model", "artifacts")
+LABEL = "winner"
+CATEGORICAL = ["operation_type"]
+IMPUTED = ["gpu_mem_pressure"]
+# not model inputs: recorded in the manifest to register the model per device (model.registry)
+DEVICE_COLUMNS = ["device_name", "is_edge"]
+STORE_COLUMNS = FEATURE_COLUMNS + COST_COLUMNS + [LABEL, "dtype"] + DEVICE_COLUMNS
+XGB_PARAMS = {
+    "tree_method": "hist",
+    "max_bin": 256,
+    "n_estimators": 100,
+    "eval_metric": "logloss",
+    "random_state": 42,
+    "verbosity": 0,
+}
+
+
+def _store_module():
+    return load_dataset_module("collector/store.py")
+
+
+def _select(df):
+    """Typed training columns of a harmonized frame; rows without a label are dropped."""
+    # rows stored before costs were recorded have them estimated now
+    df = _store_module().fill_costs(df[STORE_COLUMNS].copy())
+    df = df[FEATURE_COLUMNS + COST_COLUMNS + [LABEL] + DEVICE_COLUMNS]
+    df = df[df[LABEL].notna()].astype({LABEL: int})
+    from model.roofline import log_speedups
+    return df.assign(**{ROOFLINE_COLUMNS[0]: log_speedups(df)})
+
+
+def load_frame(data=None, use_store=False, devices=None):
+    """All training rows in memory, from CSV/parquet files and/or the benchmark store."""
+    import pandas as pd
+    store = _store_module()
+    frames = [_select(store.read_any(path)) for path in data or []]
+    if use_store:
+        frames.append(_select(store.BenchmarkStore().load(columns=STORE_COLUMNS, devices=devices)))
+    if not frames:
+        raise ValueError("no training data: pass --data and/or --store")
+    return pd.concat(frames, ignore_index=True)
+
+
+def iter_frames(data=None, use_store=False, devices=None, batch_size=65536):
+    """The same rows as load_frame(), as a stream of DataFrames."""
+    import pandas as pd
+    store = _store_module()
+    for path in data or []:
+        if path.endswith(".csv"):
+            for chunk in pd.read_csv(path, chunksize=batch_size):
+                yield _select(store.harmonize(chunk))
+        else:
+            yield _select(store.read_any(path))
+    if use_store:
+        for chunk in store.BenchmarkStore().batches(columns=STORE_COLUMNS, devices=devices,
+                                                    batch_size=batch_size):
+            yield _select(chunk)
+
+
+def build_preprocessing(categories=None):
+    """Same steps as the shipped pipeline, selected by column name."""
+    from sklearn.compose import ColumnTransformer
+    from sklearn.impute import KNNImputer
+    from sklearn.preprocessing import OneHotEncoder, StandardScaler
+    encoder = OneHotEncoder(handle_unknown="ignore", categories=[categories] if categories else "auto")
+    preprocessor = ColumnTransformer(
+        transformers=[
+            ("gpu_mem_impute", KNNImputer(n_neighbors=3), IMPUTED),
+            ("op_type_encode", encoder, CATEGORICAL),
+        ],
+        remainder="passthrough",
+    )
+    return preprocessor, StandardScaler()
+
+
+def build_pipeline(y, smote=True, n_jobs=1, **params):
+    from imblearn.over_sampling import SMOTE
+    from imblearn.pipeline import Pipeline as ImbPipeline
+    from xgboost import XGBClassifier
+    preprocessor, scaler = build_preprocessing()
+    positives = max(int(y.sum()), 1)
+    clf = XGBClassifier(scale_pos_weight=(len(y) - positives) / positives, n_jobs=n_jobs, **{**XGB_PARAMS, **params})
+    steps = [("preprocessing", preprocessor), ("scaler", scaler)]
+    if smote:
+        steps.append(("smote", SMOTE(random_state=42)))
+    return ImbPipeline(steps=steps + [("classifier", clf)])
+
+
+def _fit(pipeline, X, y, train_idx, test_idx):
+    pipeline.fit(X.iloc[train_idx], y.iloc[train_idx])
+    if test_idx is None:
+        return pipeline, None
+    return pipeline, pipeline.predict_proba(X.iloc[test_idx])[:, 1]
+
+
+def _metrics(y_true, proba, folds=None):
+    import numpy as np
+    from sklearn.metrics import classification_report, roc_auc_score
+    y_pred = (proba > 0.5).astype(int)
+    out = {
+        "accuracy": float(np.mean(y_pred == y_true)),
+        "report": classification_report(y_true, y_pred, output_dict=True, zero_division=0),
+    }
+    if len(set(y_true)) > 1:
+        out["roc_auc"] = float(roc_auc_score(y_true, proba))
+    if folds:
+        accs = [float(np.mean((p > 0.5).astype(int) == t)) for t, p in folds]
+        out.update(fold_accuracies=accs, accuracy_mean=float(np.mean(accs)), accuracy_std=float(np.std(accs)))
+    return out
+
+
+def train_in_memory(df, columns=FEATURE_COLUMNS, folds=5, jobs=-1, smote=True, **params):
+    """(pipeline fitted on all rows, metrics from out-of-fold predictions)."""
+    import numpy as np
+    from joblib import Parallel, delayed, cpu_count
+    from sklearn.base import clone
+    from sklearn.model_selection import StratifiedKFold
+
+    X, y = df[columns], df[LABEL]
+    splits = list(StratifiedKFold(n_splits=folds, shuffle=True, random_state=42).split(X, y)) if folds > 1 else []
+    tasks = splits + [(np.arange(len(X)), None)]
+    n_workers = min(len(tasks), cpu_count() if jobs in (None, -1) else max(jobs, 1))
+    # split the cores between concurrent fits instead of oversubscribing them
+    template = build_pipeline(y, smote=smote, n_jobs=max(1, cpu_count() // n_workers), **params)
+    results = Parallel(n_jobs=n_workers)(
+        delayed(_fit)(clone(template), X, y, train_idx, test_idx) for train_idx, test_idx in tasks
+    )
+
+    final = results[-1][0]
+    if not splits:
+        return final, {}
+    oof = np.empty(len(X))
+    for (_, test_idx), (_, proba) in zip(splits, results[:-1]):
+        oof[test_idx] = proba
+    y_true = y.to_numpy()
+    return final, _metrics(y_true, oof, [(y_true[t], p) for (_, t), (_, p) in zip(splits, results[:-1])])
+
+
+def _batch_iter(frames, transform, holdout, cache_prefix, columns):
+    """xgboost.DataIter over transformed batches; every `holdout`-th row is kept aside for evaluation."""
+    import numpy as np
+    import xgboost as xgb
+
+    class BatchIter(xgb.DataIter):
+        def __init__(self):
+            super().__init__(cache_prefix=cache_prefix)
+            self.held_X, self.held_y = [], []
+            self._it, self._row, self._passes = None, 0, 0
+
+        def reset(self):
+            self._it, self._row = None, 0
+
+        def next(self, input_data):
+            if self._it is None:
+                self._it = frames()
+            for df in self._it:
+                mask = (np.arange(self._row, self._row + len(df)) % holdout) == 0
+                self._row += len(df)
+                if self._passes == 0 and mask.any():
+                    self.held_X.append(df[mask][columns])
+                    self.held_y.append(df[mask][LABEL].to_numpy())
+                train = df[~mask]
+                if len(train):
+                    input_data(data=transform(train[columns]), label=train[LABEL].to_numpy())
+                    return True
+            self._passes += 1
+            return False
+
+    return BatchIter()
+
+
+def train_external(frames, columns=FEATURE_COLUMNS, sample_rows=200_000, holdout=5, **params):
+    """
+    Pipeline trained from `frames()` (a callable returning a fresh stream of
+    DataFrames) without holding the data in memory. Returns (pipeline, metrics).
+    """
+    import numpy as np
+    import pandas as pd
+    import xgboost as xgb
+    from sklearn.pipeline import Pipeline
+
+    # pass 1: categories, class balance and a reservoir sample to fit preprocessing on
+    rng = np.random.default_rng(42)
+    categories, counts, sample, seen = set(), np.zeros(2), [], 0
+    for df in frames():
+        categories.update(df["operation_type"].dropna().unique())
+        counts += np.bincount(df[LABEL].to_numpy(), minlength=2)[:2]
+        keep = rng.random(len(df)) < min(1.0, sample_rows / max(seen + len(df), 1))
+        sample.append(df[keep])
+        seen += len(df)
+    sample = pd.concat(sample, ignore_index=True)
+    if len(sample) > sample_rows:
+        sample = sample.sample(sample_rows, random_state=42)
+    preprocessor, scaler = build_preprocessing(sorted(categories))
+    scaler.fit(preprocessor.fit_transform(sample[columns]))
+    transform = lambda X: scaler.transform(preprocessor.transform(X))
+
+    # pass 2..n: xgboost pulls the transformed batches as often as it needs them
+    xgb_params = {**XGB_PARAMS, **params}
+    rounds = xgb_params.pop("n_estimators")
+    train_params = {k: v for k, v in xgb_params.items() if k not in ("random_state", "verbosity")}
+    train_params.update(objective="binary:logistic", seed=xgb_params["random_state"],
+                        scale_pos_weight=counts[0] / max(counts[1], 1))
+    with tempfile.TemporaryDirectory(prefix="hybridflow-extmem-") as cache:
+        it = _batch_iter(frames, transform, holdout, os.path.join(cache, "cache"), columns)
+        dtrain = xgb.ExtMemQuantileDMatrix(it, max_bin=train_params["max_bin"])
+        booster = xgb.train(train_params, dtrain, num_boost_round=rounds)
+        # the cache pages go with the directory
+        del dtrain
+
+    clf = xgb.XGBClassifier(**xgb_params, scale_pos_weight=train_params["scale_pos_weight"])
+    clf._Booster = booster
+    clf.n_classes_ = 2
+    pipeline = Pipeline(steps=[("preprocessing", preprocessor), ("scaler", scaler), ("classifier", clf)])
+
+    metrics = {}
+    if it.held_X:
+        held_X, held_y = pd.concat(it.held_X, ignore_index=True), np.concatenate(it.held_y)
+        metrics = _metrics(held_y, pipeline.predict_proba(held_X)[:, 1])
+    return pipeline, metrics
+
+
+def feature_schema(pipeline):
+    encoder = pipeline.steps[0][1].named_transformers_["op_type_encode"]
+    return {
+        "columns": [str(c) for c in pipeline.steps[0][1].feature_names_in_],
+        "categorical": {"operation_type": [str(c) for c in encoder.categories_[0]]},
+        "label": LABEL,
+    }
+
+
+def save_artifact(pipeline, manifest, root=ARTIFACTS_DIR):
+    """Write model.pkl + manifest.json under root/<version>/ and point root/LATEST at it."""
+    import joblib
+    directory = os.path.join(root, manifest["version"])
+    os.makedirs(directory, exist_ok=True)
+    joblib.dump(pipeline, os.path.join(directory, "model.pkl"), compress=3)
+    with open(os.path.join(directory, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, default=str)
+    with open(os.path.join(root, "LATEST"), "w", encoding="utf-8") as f:
+        f.write(manifest["version"] + "\n")
+    return directory
+
+
+def publish(directory):
+    """
+    Install an artifact as the model inference loads (atomic replace), manifest
+    alongside, and recompile the standalone predictor from it.
+    """
+    from model.export import export
+    from model.inference import COMPILED_MODEL_PATH, MODEL_PATH, MANIFEST_PATH
+    for src, dst in ((os.path.join(directory, "model.pkl"), MODEL_PATH),
+                     (os.path.join(directory, "manifest.json"), MANIFEST_PATH)):
+        tmp = f"{dst}.{os.getpid()}.tmp"
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    export(MODEL_PATH, COMPILED_MODEL_PATH)
+
+
+def register(directory, device_name=None, bus_type=None, is_edge=None, default=False):
+    """
+    Install an artifact as the model for one device (model.registry): files go to
+    model/devices/<slug>/, with a compiled predictor. Identity defaults to the manifest's data.
+    """
+    from model.export import export
+    from model.registry import DEVICE_MODELS_DIR, bus_type_of, device_slug, get_registry
+    with open(os.path.join(directory, "manifest.json"), encoding="utf-8") as f:
+        manifest = json.load(f)
+    devices = manifest["data"].get("device_names") or []
+    if device_name is None:
+        if len(devices) != 1:
+            raise ValueError(f"training data covers devices {devices}: pass --device-name")
+        device_name = devices[0]
+    if is_edge is None:
+        is_edge = int(manifest["data"].get("is_edge") or 0)
+    name = device_slug(device_name)
+    target = os.path.join(DEVICE_MODELS_DIR, name)
+    os.makedirs(target, exist_ok=True)
+    for fname in ("model.pkl", "manifest.json"):
+        shutil.copyfile(os.path.join(directory, fname), os.path.join(target, fname))
+    compiled = export(os.path.join(target, "model.pkl"), os.path.join(target, "compiled_model.py"))
+    entry = {"device_name": device_name, "bus_type": bus_type or bus_type_of(device_name), "is_edge": int(is_edge),
+             "model": os.path.join(target, "model.pkl"), "compiled": compiled}
+    # a runtime model registered for this device (model.runtime_model --register) stays attached
+    runtime = get_registry().entries.get(name, {}).get("runtime")
+    if runtime:
+        entry["runtime"] = runtime
+    get_registry().register(name, entry, default=default)
+    return name, entry
+
+
+def _data_fingerprint(paths):
+    h = hashlib.sha256()
+    for path in sorted(paths):
+        h.update(path.encode())
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+    return h.hexdigest()[:12]
+
+
+def _versions():
+    import sklearn
+    import xgboost
+    return {"sklearn": sklearn.__version__, "xgboost": xgboost.__version__}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Train the HybridFlow CPU/GPU classifier")
+    ap.add_argument("--data", nargs="*", default=[], help="benchmark CSV/parquet files")
+    ap.add_argument("--store", action="store_true", help="also read the Dataset benchmark store")
+    ap.add_argument("--device", action="append", help="store only: restrict to these device partitions")
+    ap.add_argument("--folds", type=int, default=5)
+    ap.add_argument("--jobs", type=int, default=-1, help="parallel fits (folds + final), -1 for all cores")
+    ap.add_argument("--no-smote", action="store_true")
+    ap.add_argument("--cost-features", action="store_true", help="also learn from flops / bytes_moved / intensity")
+    ap.add_argument("--roofline-feature", action="store_true", help="also learn from the roofline speedup estimate")
+    ap.add_argument("--external-memory", action="store_true", help="stream batches instead of loading all rows")
+    ap.add_argument("--n-estimators", type=int, default=XGB_PARAMS["n_estimators"])
+    ap.add_argument("--max-bin", type=int, default=XGB_PARAMS["max_bin"])
+    ap.add_argument("--out", default=ARTIFACTS_DIR)
+    ap.add_argument("--publish", action="store_true", help="install as the model inference loads")
+    ap.add_argument("--register", action="store_true", help="install as the model of the training data's device")
+    ap.add_argument("--device-name", help="--register: device identity (default: from the data)")
+    ap.add_argument("--bus-type", choices=["PCIe", "SoC", "CPU-only"], help="--register: default from the device name")
+    ap.add_argument("--is-edge", type=int, choices=[0, 1], help="--register: default from the data")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    params = {"n_estimators": args.n_estimators, "max_bin": args.max_bin}
+    columns = FEATURE_COLUMNS + (COST_COLUMNS if args.cost_features else []) + \
+        (ROOFLINE_COLUMNS if args.roofline_feature else [])
+    seen = {}
+    if args.external_memory:
+        def frames():
+            for df in iter_frames(args.data, args.store, args.device):
+                seen.update(df.groupby("device_name")["is_edge"].max().items())
+                yield df
+        pipeline, metrics = train_external(frames, columns, **params)
+        rows = None
+    else:
+        df = load_frame(args.data, args.store, args.device)
+        seen.update(df.groupby("device_name")["is_edge"].max().items())
+        pipeline, metrics = train_in_memory(df, columns, folds=args.folds, jobs=args.jobs, smote=not args.no_smote, **params)
+        rows = len(df)
+    elapsed = time.perf_counter() - t0
+
+    fingerprint = _data_fingerprint(args.data) if args.data else "store"
+    manifest = {
+        "version": time.strftime("%Y%m%d-%H%M%S", time.gmtime()) + f"-{fingerprint[:8]}",
+        "created_at": time.time(),
+        "feature_schema": feature_schema(pipeline),
+        "params": {**XGB_PARAMS, **params, "smote": not args.no_smote and not args.external_memory,
+                   "external_memory": args.external_memory},
+        "data": {"files": args.data, "store": args.store, "devices": args.device, "rows": rows,
+                 "fingerprint": fingerprint, "device_names": sorted(seen),
+                 "is_edge": int(max(seen.values(), default=0))},
+        "metrics": metrics,
+        "train_seconds": round(elapsed, 2),
+        "versions": _versions(),
+    }
+    directory = save_artifact(pipeline, manifest, args.out)
+
+    if metrics.get("fold_accuracies"):
+        print("Fold Accuracies:", [round(a, 4) for a in metrics["fold_accuracies"]])
+        print(f"Mean Accuracy: {metrics['accuracy_mean']:.4f} (std {metrics['accuracy_std']:.4f})")
+    elif metrics:
+        print(f"Hold-out Accuracy: {metrics['accuracy']:.4f}")
+    if "roc_auc" in metrics:
+        print(f"ROC AUC: {metrics['roc_auc']:.4f}")
+    print(f"Trained in {elapsed:.1f} s; artifact {manifest['version']} saved in {directory}")
+    if args.publish:
+        publish(directory)
+        print("Published as the inference model")
+    if args.register:
+        name, entry = register(directory, args.device_name, args.bus_type, args.is_edge)
+        print(f"Registered as {name}: {entry['device_name']} ({entry['bus_type']}, is_edge={entry['is_edge']})")
+
+
+if __name__ == "__main__":
+    main()
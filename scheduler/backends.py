@@ -0,0 +1,74 @@
+"""
+Device backends for the batch scheduler. A backend executes one job on one
+device queue and reports the measured milliseconds (None on failure).
+
+- LocalBackend: the real thing, through collector.device_runner.run_on_device
+- SimulatedBackend: sleeps for the job's estimate on a device, scaled; lets
+  the scheduler run and be tested without a GPU (or without compilers)
+"""
+import random
+import time
+
+
+class DeviceBackend:
+    """Base class: `name` is the queue name ("cpu", "gpu", ...), `device` the cost column used from job estimates."""
+
+    def __init__(self, name: str, device: str = None):
+        self.name = name
+        self.device = device or name
+
+    def supports(self, job) -> bool:
+        return True
+
+    def run(self, job):
+        raise NotImplementedError
+
+
+class LocalBackend(DeviceBackend):
+    """
+    Runs jobs with run_on_device. `target` overrides what is executed, e.g.
+    LocalBackend("gpu", target="cpu") is a CPU stand-in for the GPU queue.
+    The CPU queue uses the job's refined CPU target (cpu-parallel(N), cpu-vectorized).
+    """
+
+    def __init__(self, name: str, device: str = None, target: str = None):
+        super().__init__(name, device)
+        self.target = target
+
+    def supports(self, job) -> bool:
+        if self.device == "gpu" and self.target is None:
+            from collector.device_runner import cuda_source_for
+            return not job.source_file.endswith(".py") and cuda_source_for(job.source_file) is not None
+        return True
+
+    def run(self, job):
+        from collector.device_runner import run_on_device
+        target = self.target or (job.cpu_target if self.device == "cpu" else self.device)
+        ms = run_on_device(job.source_file, target, extra_info=job.analysis)
+        return ms or None
+
+
+class SimulatedBackend(DeviceBackend):
+    """
+    Sleeps for `scale` x the job's estimate on `device` (ms), with optional
+    multiplicative jitter, and reports that time. No kernel is executed.
+    """
+
+    def __init__(self, name: str, device: str = None, scale: float = 1.0, jitter: float = 0.0, seed: int = None):
+        super().__init__(name, device)
+        self.scale = scale
+        self.jitter = jitter
+        self._rng = random.Random(seed)
+
+    def run(self, job):
+        ms = job.estimates[self.device] * self.scale
+        if self.jitter:
+            ms *= max(0.0, 1.0 + self._rng.uniform(-self.jitter, self.jitter))
+        time.sleep(ms / 1000.0)
+        return ms
+
+
+def local_backends(gpu_stand_in: bool = False):
+    """{"cpu": ..., "gpu": ...} executing for real; gpu_stand_in runs the GPU queue on the CPU."""
+    gpu = LocalBackend("gpu", target="cpu") if gpu_stand_in else LocalBackend("gpu")
+    return {"cpu": LocalBackend("cpu"), "gpu": gpu}
@@ -0,0 +1,229 @@
+"""
+Makespan-minimizing scheduling of a batch of kernels over concurrently
+running device queues (one worker per backend, e.g. CPU and GPU).
+
+- estimate_jobs(): analysis + predicted per-device runtimes for each file
+- plan(): static list schedule. Jobs are ranked by their mean cost over the
+  devices that can run them (HEFT's upward rank for independent tasks) and
+  each goes to the queue where it would *finish* first given what is already
+  queued there, not to the device that is fastest in isolation.
+- BatchScheduler.run(): executes the plan and rebalances as jobs finish. Each
+  device's ratio of wall time occupied per job to estimate is tracked,
+  remaining estimates are rescaled by it (into queue-occupancy time, like
+  busy_until), and an idle worker takes a job queued elsewhere whenever it
+  would finish that job sooner than its planned device would.
+"""
+import logging
+import threading
+import time
+
+log = logging.getLogger("scheduler")
+log.setLevel(logging.INFO)
+
+# cost of running a job on the device the classifier did not pick, relative to
+# the picked one, when neither the runtime model nor the roofline can estimate them
+FALLBACK_PENALTY = 1.5
+MIN_COST_MS = 1e-3
+
+
+class Job:
+    """One kernel to run; `estimates` maps device -> expected ms."""
+
+    def __init__(self, job_id, source_file, estimates, analysis=None, features=None, cpu_target="cpu",
+                 decision=None):
+        self.job_id = job_id
+        self.source_file = source_file
+        self.estimates = {d: max(float(ms), MIN_COST_MS) for d, ms in estimates.items()}
+        self.analysis = analysis
+        self.features = features
+        self.cpu_target = cpu_target
+        self.decision = decision
+
+    def __repr__(self):
+        return f"Job({self.job_id}, {self.source_file}, {self.estimates})"
+
+
+def _estimates_from(result):
+    """{"cpu": ms, "gpu": ms} from a detailed decide() result."""
+    estimate = result.get("estimate") or {}
+    runtimes = estimate.get("runtimes")
+    if runtimes:
+        return {"cpu": runtimes["cpu_ms"]["ms"], "gpu": runtimes["gpu_total_ms"]["ms"]}
+    roofline = estimate.get("roofline")
+    if roofline and roofline["gpu_total_ms"] is not None:
+        return {"cpu": roofline["cpu_ms"], "gpu": roofline["gpu_total_ms"]}
+    preferred = "cpu" if result["decision"].startswith("cpu") else "gpu"
+    return {d: 1.0 if d == preferred else FALLBACK_PENALTY for d in ("cpu", "gpu")}
+
+
+def estimate_jobs(source_files, sys_state=None):
+    """Jobs for source_files, all estimated under one system-state snapshot."""
+    from main import decide
+    from collector.sys_state import get_system_state
+    from collector.device_runner import execution_target
+
+    sys_state = sys_state or get_system_state()
+    jobs = []
+    for i, path in enumerate(source_files):
+        result = decide(path, sys_state=sys_state, detailed=True)
+        decision = result["decision"]
+        cpu_target = decision if decision.startswith("cpu") else \
+            execution_target(path, "cpu", result["analysis"], sys_state)
+        jobs.append(Job(i, path, _estimates_from(result), analysis=result["analysis"],
+                        features=result["features"], cpu_target=cpu_target, decision=decision))
+    return jobs
+
+
+def plan(jobs, backends, ready=None, scale=None):
+    """
+    List schedule of `jobs` over `backends` ({name: DeviceBackend}).
+    ready: ms until each queue is free; scale: per-queue estimate correction.
+    Returns ({name: [job, ...]}, planned makespan ms, [unschedulable jobs]).
+    """
+    ready = {name: (ready or {}).get(name, 0.0) for name in backends}
+    scale = scale or {}
+    queues = {name: [] for name in backends}
+
+    def cost(job, name):
+        return job.estimates[backends[name].device] * scale.get(name, 1.0)
+
+    ranked, unschedulable = [], []
+    for job in jobs:
+        eligible = [name for name, b in backends.items() if b.supports(job)]
+        if eligible:
+            ranked.append((sum(cost(job, n) for n in eligible) / len(eligible), job, eligible))
+        else:
+            unschedulable.append(job)
+    ranked.sort(key=lambda r: -r[0])
+
+    for _, job, eligible in ranked:
+        name = min(eligible, key=lambda n: ready[n] + cost(job, n))
+        queues[name].append(job)
+        ready[name] += cost(job, name)
+    return queues, max(ready.values(), default=0.0), unschedulable
+
+
+class BatchScheduler:
+    """
+    Runs a batch over `backends` ({name: DeviceBackend}), one worker thread
+    per backend. steal=False runs the static plan as is; `alpha` is the EWMA
+    weight of each new wall-time/estimated ratio.
+    """
+
+    def __init__(self, backends, steal=True, alpha=0.5, poll_s=0.05):
+        self.backends = backends
+        self.steal = steal
+        self.alpha = alpha
+        self.poll_s = poll_s
+        self._cond = threading.Condition()
+
+    def _now(self):
+        return (time.perf_counter() - self._t0) * 1000
+
+    def _cost(self, job, name):
+        return job.estimates[self.backends[name].device] * self._scale[name]
+
+    def _take(self, name):
+        """Next job for queue `name` (own queue first, then the best steal); caller holds the lock."""
+        own = self._queues[name]
+        if own:
+            return own.pop(0), False
+        if not self.steal:
+            return None, False
+        backend, now = self.backends[name], self._now()
+        best = None
+        for other, queue in self._queues.items():
+            if other == name or not queue:
+                continue
+            # expected finish of each queued job where it is, vs. starting it here now
+            finish = max(now, self._busy_until[other])
+            for idx, job in enumerate(queue):
+                finish += self._cost(job, other)
+                if not backend.supports(job):
+                    continue
+                gain = finish - (now + self._cost(job, name))
+                if gain > 0 and (best is None or gain > best[0]):
+                    best = (gain, other, idx)
+        if best is None:
+            return None, False
+        return self._queues[best[1]].pop(best[2]), True
+
+    def _worker(self, name):
+        backend = self.backends[name]
+        while True:
+            with self._cond:
+                while True:
+                    job, stolen = self._take(name)
+                    if job is not None or not any(self._queues.values()):
+                        break
+                    # nothing worth taking yet; re-check as other queues drain or overrun
+                    self._cond.wait(self.poll_s)
+                if job is None:
+                    return
+                start = self._now()
+                estimate = self._cost(job, name)
+                self._busy_until[name] = start + estimate
+
+            try:
+                ms = backend.run(job)
+                error = None if ms else "execution failed"
+            except Exception as e:
+                ms, error = None, str(e)
+                log.warning(f"{name}: job {job.job_id} ({job.source_file}) failed: {e}")
+            end = self._now()
+
+            with self._cond:
+                self._busy_until[name] = end
+                if ms:
+                    # the queue is occupied for end - start (build, spawn and every rep), not the
+                    # per-rep median ms: scale estimates to that so they compare with busy_until
+                    ratio = (end - start) / job.estimates[backend.device]
+                    self._scale[name] = (1 - self.alpha) * self._scale[name] + self.alpha * ratio
+                self._results.append({
+                    "job_id": job.job_id,
+                    "source_file": job.source_file,
+                    "device": name,
+                    "planned_device": self._planned[job.job_id],
+                    "stolen": stolen,
+                    "estimate_ms": estimate,
+                    "actual_ms": ms or None,
+                    "start_ms": start,
+                    "end_ms": end,
+                    "error": error,
+                })
+                self._cond.notify_all()
+
+    def run(self, jobs):
+        """
+        Execute every job; returns {"planned_makespan_ms", "makespan_ms",
+        "results": [...per job, in completion order], "unschedulable": [...]}.
+        """
+        self._scale = {name: 1.0 for name in self.backends}
+        self._queues, planned, unschedulable = plan(jobs, self.backends)
+        self._planned = {job.job_id: name for name, queue in self._queues.items() for job in queue}
+        self._busy_until = {name: 0.0 for name in self.backends}
+        self._results = []
+        for job in unschedulable:
+            log.warning(f"No backend can run job {job.job_id} ({job.source_file})")
+
+        self._t0 = time.perf_counter()
+        workers = [threading.Thread(target=self._worker, args=(name,), name=f"hybridflow-{name}", daemon=True)
+                   for name in self.backends]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+
+        return {
+            "planned_makespan_ms": planned,
+            "makespan_ms": max((r["end_ms"] for r in self._results), default=0.0),
+            "results": self._results,
+            "unschedulable": [job.source_file for job in unschedulable],
+        }
+
+
+def run_batch(source_files, backends=None, steal=True, sys_state=None):
+    """Estimate, plan and execute source_files; backends default to the local CPU and GPU."""
+    from scheduler.backends import local_backends
+    jobs = estimate_jobs(source_files, sys_state=sys_state)
+    return BatchScheduler(backends or local_backends(), steal=steal).run(jobs)
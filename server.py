@@ -0,0 +1,249 @@
+"""
+Resident HybridFlow scheduler.
+
+Keeps the model, the libclang index and NVML initialized in one long-lived
+process and answers requests over a Unix socket, so submitting a kernel costs
+a socket round-trip instead of a Python start-up.
+
+Protocol: one JSON object per line in each direction.
+    {"op": "ping"}
+    {"op": "predict", "files": ["a.c", ...]}          -> decision + timings per file
+                                                         ("detailed": true adds expected runtimes)
+    {"op": "run", "files": [...], "compare": false}   -> predict, then execute on the predicted device
+    {"op": "submit", "files": [...]}                  -> queue runs in the background, returns job ids
+    {"op": "result", "jobs": [1, 2]}                  -> status/result of submitted jobs
+    {"op": "stats"}
+
+Usage:
+    python server.py serve [--socket PATH]
+    python server.py predict|run|submit FILE [FILE ...] [--socket PATH]
+"""
+import argparse
+import itertools
+import json
+import os
+import queue
+import socket
+import socketserver
+import sys
+import threading
+import time
+from utils.logger import get_logger
+
+logger = get_logger("server")
+
+DEFAULT_SOCKET = os.environ.get("HYBRIDFLOW_SOCKET", "/tmp/hybridflow.sock")
+
+
+def warm_up():
+    """Pay every one-time initialization cost up front."""
+    t0 = time.perf_counter()
+    import main
+    from analyzer.ast_parser import get_parser
+    from collector.sys_state import get_system_state
+    from model.inference import get_compiled_model, get_model
+    from model.runtime_model import get_runtime_model
+    from model.crossover_table import get_crossover_table
+    from model.roofline import profile_for
+
+    # heavy dependencies load lazily, so the daemon forces each of them here
+    # the compiled predictor, when current, makes the pickled pipeline unnecessary
+    if get_compiled_model() is None:
+        get_model()
+    get_runtime_model()
+    get_crossover_table()
+    profile_for()
+    try:
+        get_parser().index
+    except Exception as e:
+        logger.warning("libclang unavailable, C/C++ analysis will fail: %s", e)
+    # first psutil.cpu_percent(interval=None) sample is meaningless, take it now
+    get_system_state()
+    logger.info("Warm-up finished in %.1f ms", (time.perf_counter() - t0) * 1000)
+    return main
+
+
+def _jsonable(result):
+    analysis = result.get("analysis", {})
+    out = {
+        "source_file": result["source_file"],
+        "decision": result["decision"],
+        "operation_type": analysis.get("operation_type"),
+        "log_size": analysis.get("log_total_sizes"),
+        "features": result["features"],
+        "timings_ms": result["timings_ms"],
+    }
+    if "estimate" in result:
+        out["estimate"] = result["estimate"]
+    return out
+
+
+class SchedulerState:
+    """Warm pipeline plus the background job queue shared by all connections."""
+
+    def __init__(self):
+        from collector.sampler import start_sampler
+        from model.feedback import start_updater
+        self.pipeline = warm_up()
+        # measured comparisons from --compare runs keep training the model in the background
+        self.updater = start_updater()
+        # system state comes from the background sampler, never from a blocking probe
+        self.sampler = start_sampler()
+        self.sampler.wait_ready(timeout=2.0)
+        # executions are serialized so measured timings do not interfere
+        self.exec_lock = threading.Lock()
+        self.jobs = {}
+        self.job_ids = itertools.count(1)
+        self.queue = queue.Queue()
+        self.started = time.time()
+        self.served = 0
+        self.worker = threading.Thread(target=self._work, name="hybridflow-jobs", daemon=True)
+        self.worker.start()
+
+    def decide(self, path, detailed=False):
+        return self.pipeline.decide(path, sys_state=self.sampler.system_state(), detailed=detailed)
+
+    def predict(self, path, detailed=False):
+        return _jsonable(self.decide(path, detailed))
+
+    def run(self, path, compare=False):
+        from collector.device_runner import run_on_device, run_on_other_device
+        result = self.decide(path)
+        with self.exec_lock:
+            t0 = time.perf_counter()
+            stats = run_on_device(path, result["decision"], extra_info=result["analysis"], return_stats=True)
+            result["timings_ms"]["execute"] = stats["median_ms"] if stats else None
+            result["timings_ms"]["execute_wall"] = (time.perf_counter() - t0) * 1000
+            if compare:
+                run_on_other_device(path, result["decision"], result["analysis"], stats, features=result["features"])
+        return _jsonable(result)
+
+    def submit(self, path, compare=False):
+        job_id = next(self.job_ids)
+        self.jobs[job_id] = {"status": "queued", "source_file": path}
+        self.queue.put((job_id, path, compare))
+        return job_id
+
+    def _work(self):
+        while True:
+            job_id, path, compare = self.queue.get()
+            self.jobs[job_id]["status"] = "running"
+            try:
+                self.jobs[job_id] = {"status": "done", **self.run(path, compare)}
+            except Exception as e:
+                logger.exception("Job %s failed", job_id)
+                self.jobs[job_id] = {"status": "failed", "source_file": path, "error": str(e)}
+
+    def handle(self, request):
+        op = request.get("op")
+        files = request.get("files", [])
+        compare = bool(request.get("compare", False))
+        self.served += 1
+
+        if op == "ping":
+            return {"ok": True}
+        if op == "stats":
+            from model.inference import model_version
+            from model.crossover_table import get_crossover_table
+            table = get_crossover_table()
+            return {
+                "ok": True,
+                "system_state": self.sampler.snapshot(),
+                "uptime_s": round(time.time() - self.started, 1),
+                "requests": self.served,
+                "queued": self.queue.qsize(),
+                "jobs": len(self.jobs),
+                "model_version": model_version(),
+                "feedback_pending": self.updater.store.pending(),
+                "crossover_table": {"hits": table.hits, "misses": table.misses} if table else None,
+            }
+        if op in ("predict", "run"):
+            results = []
+            for path in files:
+                try:
+                    if op == "predict":
+                        results.append(self.predict(path, bool(request.get("detailed"))))
+                    else:
+                        results.append(self.run(path, compare))
+                except Exception as e:
+                    results.append({"source_file": path, "error": str(e)})
+            return {"ok": True, "results": results}
+        if op == "submit":
+            return {"ok": True, "jobs": [self.submit(path, compare) for path in files]}
+        if op == "result":
+            return {"ok": True, "jobs": {str(j): self.jobs.get(int(j), {"status": "unknown"}) for j in request.get("jobs", [])}}
+        return {"ok": False, "error": f"unknown op: {op}"}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                response = self.server.state.handle(json.loads(line))
+            except Exception as e:
+                response = {"ok": False, "error": str(e)}
+            self.wfile.write((json.dumps(response, default=str) + "\n").encode())
+            self.wfile.flush()
+
+
+class HybridFlowServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path=DEFAULT_SOCKET):
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        self.state = SchedulerState()
+        super().__init__(socket_path, _Handler)
+        self.socket_path = socket_path
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def serve(socket_path=DEFAULT_SOCKET):
+    with HybridFlowServer(socket_path) as server:
+        logger.info("HybridFlow server listening on %s", socket_path)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def request(payload, socket_path=DEFAULT_SOCKET):
+    """Send one request to a running server and return the decoded response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(socket_path)
+        s.sendall((json.dumps(payload) + "\n").encode())
+        buf = b""
+        while not buf.endswith(b"\n"):
+            chunk = s.recv(65536)
+            if not chunk:
+                break
+            buf += chunk
+    return json.loads(buf)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HybridFlow scheduler daemon")
+    parser.add_argument("command", choices=["serve", "ping", "stats", "predict", "run", "submit", "result"])
+    parser.add_argument("items", nargs="*", help="source files, or job ids for 'result'")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET)
+    parser.add_argument("--compare", action="store_true", help="also run on the other device")
+    parser.add_argument("--detailed", action="store_true", help="predict: include expected runtimes and speedup")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.socket)
+        sys.exit(0)
+
+    payload = {"op": args.command, "compare": args.compare, "detailed": args.detailed}
+    if args.command == "result":
+        payload["jobs"] = [int(j) for j in args.items]
+    else:
+        payload["files"] = [os.path.abspath(f) for f in args.items]
+    print(json.dumps(request(payload, args.socket), indent=2, default=str))
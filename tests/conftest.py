@@ -0,0 +1,31 @@
+import os
+import shutil
+import tempfile
+
+# every cache (compiled binaries, analyses, harnesses) goes to a throwaway directory
+os.environ.setdefault("HYBRIDFLOW_CACHE_DIR", tempfile.mkdtemp(prefix="hybridflow-tests-"))
+
+import pytest
+
+
+def _has_libclang():
+    try:
+        from analyzer.ast_parser import load_clang, LIBCLANG_PATH
+        load_clang()
+        return os.path.exists(LIBCLANG_PATH)
+    except Exception:
+        return False
+
+
+requires_clang = pytest.mark.skipif(not _has_libclang(), reason="libclang not available")
+requires_gcc = pytest.mark.skipif(shutil.which("gcc") is None, reason="gcc not available")
+
+
+@pytest.fixture
+def write_source(tmp_path):
+    """write_source(name, text) -> path of a new file under tmp_path."""
+    def write(name, text):
+        path = tmp_path / name
+        path.write_text(text)
+        return str(path)
+    return write
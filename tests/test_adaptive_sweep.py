@@ -0,0 +1,46 @@
+import importlib
+import sys
+
+import pytest
+
+from utils.dataset_modules import DATASET_DIR
+
+
+@pytest.fixture
+def search_line(monkeypatch):
+    # appended, not prepended: Dataset/collector must not shadow the root collector package
+    monkeypatch.setattr(sys, "path", sys.path + [DATASET_DIR])
+    return importlib.import_module("sweeps.adaptive").search_line
+
+
+def _synthetic(crossover, calls):
+    """CPU time linear in size, constant GPU time: the GPU wins from `crossover` on."""
+    def measure_point(size):
+        calls.append(size)
+        cpu, gpu = size / 100.0, crossover / 100.0
+        return {"cpu_runtime_ms": cpu, "gpu_runtime_ms": gpu * 0.8, "transfer_time_ms": gpu * 0.2,
+                "winner": int(gpu < cpu)}
+    return measure_point
+
+
+def test_brackets_the_crossover_within_tolerance(search_line):
+    calls = []
+    rows = search_line(_synthetic(3000, calls), (256, 65536), multiple=16, coarse=5, tolerance=0.1, budget=16)
+    assert len(calls) == len(set(calls)) == len(rows) <= 16
+    below = max(s for s, r in rows.items() if r["winner"] == 0)
+    above = min(s for s, r in rows.items() if r["winner"] == 1)
+    assert below < 3000 <= above
+    assert above / below <= 1.1
+    assert all(s % 16 == 0 and 256 <= s <= 65536 for s in rows)
+
+
+def test_no_flip_stops_after_coarse_pass(search_line):
+    calls = []
+    rows = search_line(_synthetic(10 ** 9, calls), (256, 65536), coarse=5)
+    assert sorted(rows) == [256, 1024, 4096, 16384, 65536]
+
+
+def test_budget_caps_measurements(search_line):
+    calls = []
+    search_line(_synthetic(3000, calls), (256, 65536), coarse=5, tolerance=0.0, budget=7)
+    assert len(calls) == 7
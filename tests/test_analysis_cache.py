@@ -0,0 +1,40 @@
+from conftest import requires_clang
+
+KERNEL = """
+#include "sizes.h"
+void scale(float *x) {
+    for (int i = 0; i < N; i++)
+        x[i] *= 2.0f;
+}
+"""
+
+
+def _key(path):
+    from analyzer.analysis_cache import get_analysis_cache
+    return get_analysis_cache().key(path, [])
+
+
+def test_key_covers_nested_local_headers(write_source):
+    sizes = write_source("sizes.h", '#include "base.h"\n#define N (BASE * 2)\n')
+    base = write_source("base.h", "#define BASE 16\n")
+    path = write_source("scale.c", KERNEL)
+    before = _key(path)
+    assert _key(path) == before
+    with open(base, "w") as f:
+        f.write("#define BASE 32\n")
+    after = _key(path)
+    assert after != before
+    with open(sizes, "a") as f:
+        f.write("/* edited */\n")
+    assert _key(path) != after
+
+
+@requires_clang
+def test_header_edit_invalidates_analysis(write_source):
+    from analyzer.ast_parser import parse_and_detect
+    header = write_source("sizes.h", "#define N 100\n")
+    path = write_source("buf.c", '#include "sizes.h"\nfloat buf[N];\n' + KERNEL.replace('#include "sizes.h"\n', ""))
+    assert [100] in parse_and_detect(path)["raw_analysis"]["array_dimensions"]
+    with open(header, "w") as f:
+        f.write("#define N 5000\n")
+    assert [5000] in parse_and_detect(path)["raw_analysis"]["array_dimensions"]
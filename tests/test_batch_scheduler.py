@@ -0,0 +1,19 @@
+import time
+
+from scheduler.backends import DeviceBackend
+from scheduler.batch_scheduler import BatchScheduler, Job
+
+
+class SpawningBackend(DeviceBackend):
+    """Reports a 1 ms kernel median but occupies the queue for 20 ms, like a build + process spawn."""
+
+    def run(self, job):
+        time.sleep(0.02)
+        return 1.0
+
+
+def test_rescale_ratio_uses_occupied_wall_time():
+    scheduler = BatchScheduler({"cpu": SpawningBackend("cpu")}, steal=False, alpha=1.0)
+    scheduler.run([Job(0, "a.c", {"cpu": 1.0, "gpu": 1.0})])
+    # estimates are rescaled into queue time (>= 20 ms per 1 ms estimated), not the 1 ms median
+    assert scheduler._scale["cpu"] >= 19.0
@@ -0,0 +1,42 @@
+import csv
+
+FIELDS = ["operation_type", "dtype", "device_name", "cpu_load_pct", "gpu_load_pct", "log_size", "winner"]
+
+
+def _write(path, devices):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        for device in devices:
+            for i in range(10):
+                size = 2 + i * 0.5
+                writer.writerow({"operation_type": "matmul", "dtype": "float32", "device_name": device,
+                                 "cpu_load_pct": 5, "gpu_load_pct": 0, "log_size": size, "winner": int(size > 4)})
+    return str(path)
+
+
+def _features(log_size):
+    return {"operation_type": "matmul", "log_size": log_size, "cpu_load_pct": 5, "gpu_load_pct": 0,
+            "is_battery_powered": 0, "gpu_temp_C": 40, "gpu_mem_pressure": 0.1}
+
+
+def test_pooled_cells_need_several_devices(tmp_path):
+    from model.crossover_table import ANY_DEVICE, CrossoverTable, build
+    single = build([_write(tmp_path / "one.csv", ["GPU A"])])
+    assert all(key.split("|")[2] != ANY_DEVICE for key in single["entries"])
+    # an unknown machine gets no table answer: the model decides
+    assert CrossoverTable(single, device=ANY_DEVICE).lookup(_features(5.0)) is None
+    assert CrossoverTable(single, device="GPU A").lookup(_features(5.0)) == "gpu"
+
+    pooled = build([_write(tmp_path / "two.csv", ["GPU A", "GPU B"])])
+    (key,) = [k for k in pooled["entries"] if k.split("|")[2] == ANY_DEVICE]
+    assert pooled["entries"][key]["devices"] == 2
+    assert CrossoverTable(pooled, device=ANY_DEVICE).lookup(_features(2.5)) == "cpu"
+
+
+def test_single_device_pooled_cells_of_old_tables_are_ignored(tmp_path):
+    from model.crossover_table import ANY_DEVICE, CrossoverTable, build
+    artifact = build([_write(tmp_path / "one.csv", ["GPU A"])])
+    for key, entry in list(artifact["entries"].items()):
+        artifact["entries"][key.replace("GPU A", ANY_DEVICE)] = {k: v for k, v in entry.items() if k != "devices"}
+    assert CrossoverTable(artifact, device=ANY_DEVICE).entries == {}
@@ -0,0 +1,29 @@
+from conftest import requires_clang
+
+SYS_STATE = {"cpu_load_pct": 10.0, "gpu_load_pct": 0.0, "gpu_temp_C": 40.0, "gpu_mem_pressure": 0.1,
+             "is_battery_powered": 0}
+
+
+@requires_clang
+def test_reduce_kernel_is_decided_by_the_model(write_source):
+    from main import decide
+    from model.inference import model_operation_types
+    path = write_source("sum.c", """
+float total(float *a, int n) {
+    float s = 0.0f;
+    for (int i = 0; i < n; i++)
+        s += a[i];
+    return s;
+}
+""")
+    result = decide(path, sys_state=dict(SYS_STATE), detailed=True)
+    assert result["analysis"]["operation_type"] == "reduce"
+    assert result["features"]["operation_type"] == "reduce_sum" in model_operation_types()
+    # the roofline-only path (ops the model has no category for) tags its estimate
+    assert result["estimate"].get("source") != "roofline"
+
+
+def test_analyzer_names_map_onto_model_categories():
+    from analyzer.feature_builder import build_feature_dict
+    assert build_feature_dict("reduce", 3.0, SYS_STATE)["operation_type"] == "reduce_sum"
+    assert build_feature_dict("matmul", 3.0, SYS_STATE)["operation_type"] == "matmul"
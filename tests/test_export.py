@@ -0,0 +1,54 @@
+import pytest
+
+OPS = ["matmul", "elementwise", "conv2d", "reduce_sum"]
+
+
+def _frame(n, seed):
+    import numpy as np
+    import pandas as pd
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "operation_type": rng.choice(OPS, n),
+        "log_size": rng.uniform(2, 8, n).round(4),
+        "cpu_load_pct": rng.uniform(0, 100, n),
+        "gpu_load_pct": rng.uniform(0, 100, n),
+        "gpu_temp_C": rng.uniform(30, 90, n),
+        "gpu_mem_pressure": rng.uniform(0, 1, n),
+        "is_battery_powered": rng.integers(0, 2, n),
+    })
+    df.loc[rng.random(n) < 0.2, "gpu_mem_pressure"] = np.nan
+    return df
+
+
+@pytest.fixture(scope="module")
+def pipeline():
+    pytest.importorskip("xgboost")
+    pytest.importorskip("imblearn")
+    from model.train import build_pipeline
+    df = _frame(400, 0)
+    y = ((df["log_size"] > 5) & (df["operation_type"] != "reduce_sum")).astype(int)
+    return build_pipeline(y, smote=False, n_estimators=20).fit(df, y)
+
+
+def test_compiled_module_matches_pipeline(pipeline, tmp_path):
+    from model.export import check, compile_source, load_compiled
+    path = tmp_path / "compiled.py"
+    path.write_text(compile_source(pipeline, source_sha256="test"))
+    module = load_compiled(str(path))
+    assert module.SOURCE_SHA256 == "test"
+    # unseen rows, including missing gpu_mem_pressure and an operation type outside the training set
+    df = _frame(300, 1)
+    df.loc[:9, "operation_type"] = "sort"
+    mismatches, max_diff = check(pipeline, module, df)
+    assert mismatches == 0
+    assert max_diff < 1e-6
+
+
+def test_check_reports_disagreement(pipeline, tmp_path):
+    from model.export import check, compile_source, load_compiled
+    path = tmp_path / "compiled.py"
+    path.write_text(compile_source(pipeline))
+    module = load_compiled(str(path))
+    module.BASE_MARGIN += 5.0
+    mismatches, max_diff = check(pipeline, module, _frame(300, 2))
+    assert mismatches > 0 and max_diff > 0.1
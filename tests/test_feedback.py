@@ -0,0 +1,58 @@
+def _store(tmp_path):
+    from model.feedback import FeedbackStore
+    return FeedbackStore(str(tmp_path))
+
+
+def test_mismatched_timers_are_not_trained_on(tmp_path):
+    from model.feedback import comparable, update_model
+    store = _store(tmp_path)
+    base = {"features": {}, "cpu_ms": 1.0, "gpu_ms": 2.0, "winner": 0}
+    store.append({**base, "cpu_timer": "clock_gettime", "gpu_timer": "wall"})
+    store.append(base)  # recorded before timers were stored
+    assert not any(comparable(r) for r in store.read())
+    assert update_model(store, force=True) is None
+    assert store.pending() == 0
+
+
+def test_same_timer_is_comparable():
+    from model.feedback import comparable
+    assert comparable({"cpu_timer": "wall", "gpu_timer": "wall"})
+    assert not comparable({"cpu_timer": None, "gpu_timer": None})
+
+
+def test_holdout_is_never_trained_on():
+    from model.feedback import split_holdout
+    records = [{"n": n, "cpu_timer": "wall", "gpu_timer": "wall"} for n in range(20)]
+    records[3] = {"n": 3}  # not comparable: neither trained on nor held out
+    batch, holdout = split_holdout(records, start=0, every=5)
+    assert [r["n"] for r in holdout] == [5, 10, 15]
+    assert not {r["n"] for r in batch} & {3, 5, 10, 15}
+    # later updates see the same split
+    more = records + [{"n": n, "cpu_timer": "wall", "gpu_timer": "wall"} for n in (20, 21)]
+    later, again = split_holdout(more, start=20, every=5)
+    assert [r["n"] for r in later] == [21] and [r["n"] for r in again] == [5, 10, 15, 20]
+
+
+def test_update_scores_candidate_on_holdout_only(tmp_path, monkeypatch):
+    import model.inference
+    from model.feedback import update_model
+    swapped = []
+    monkeypatch.setattr(model.inference, "swap_model", swapped.append)
+    store = _store(tmp_path)
+    for n in range(40):
+        features = {"operation_type": "matmul", "log_size": 2 + n / 8, "cpu_load_pct": 10.0, "gpu_load_pct": 5.0,
+                    "gpu_temp_C": 45.0, "gpu_mem_pressure": 0.2, "is_battery_powered": 0}
+        store.append({"features": features, "cpu_ms": 1.0, "gpu_ms": 2.0, "winner": int(n >= 20),
+                      "cpu_timer": "wall", "gpu_timer": "wall"})
+    summary = update_model(store, min_batch=1, rounds=2)
+    assert summary["observations"] == 32 and summary["held_out"] == 8
+    assert summary["accepted"] == (summary["accuracy_after"] >= summary["accuracy_before"])
+    assert len(swapped) == int(summary["accepted"])
+
+
+def test_single_cold_runs_are_not_evidence():
+    from collector.device_runner import _repeated
+    assert not _repeated({"timer": "wall", "warmup": 0, "reps": 1})
+    assert _repeated({"timer": "wall", "warmup": 3, "reps": 9})
+    assert _repeated({"timer": "clock_gettime", "warmup": 3, "reps": 9})
+    assert not _repeated(None)
@@ -0,0 +1,63 @@
+from conftest import requires_clang, requires_gcc
+
+SAXPY = """
+#define N 1000000
+void saxpy(float a, float *x, float *y) {
+    for (int i = 0; i < N; i++)
+        y[i] = a * x[i] + y[i];
+}
+"""
+
+
+def _analyze(path):
+    from analyzer.ast_parser import get_parser
+    return get_parser().parse_file(path)
+
+
+@requires_clang
+def test_buffers_sized_from_define_bounds(write_source):
+    from collector.device_runner import normalize_params
+    analysis = _analyze(write_source("saxpy.c", SAXPY))
+    extents = analysis["raw_analysis"]["param_extents"]["saxpy"]
+    assert extents == {"x": [1000000], "y": [1000000]}
+    params = normalize_params(analysis["primary_function_params"], extents)
+    assert params == [("float", "a", []), ("float", "x", [1000000]), ("float", "y", [1000000])]
+
+
+@requires_clang
+def test_row_major_index_with_int_parameter(write_source):
+    from analyzer.ast_parser import HARNESS_INT_ARG
+    from collector.device_runner import normalize_params
+    analysis = _analyze(write_source("mm.c", """
+#define M 64
+void mm(float (*B)[M], float *C, int n) {
+    for (int i = 0; i < n; i++)
+        for (int j = 0; j < n; j++)
+            C[i * n + j] = B[i][j % M];
+}
+"""))
+    params = normalize_params(analysis["primary_function_params"], analysis["raw_analysis"]["param_extents"]["mm"])
+    assert params == [("float", "B", [HARNESS_INT_ARG, 64]), ("float", "C", [HARNESS_INT_ARG ** 2]), ("int", "n", [])]
+
+
+@requires_clang
+def test_unprovable_extent_refuses_harness(write_source):
+    from collector.device_runner import write_harness
+    path = write_source("ptr.c", """
+void shift(float *x, int n) {
+    for (int i = 0; i < n; i++)
+        *(x + i + 7) = 0.0f;
+}
+""")
+    analysis = _analyze(path)
+    assert analysis["raw_analysis"]["param_extents"]["shift"]["x"] is None
+    assert write_harness(path, analysis) is None
+
+
+@requires_clang
+@requires_gcc
+def test_harness_runs_macro_bounded_kernel(write_source):
+    from collector.device_runner import run_on_device
+    path = write_source("saxpy.c", SAXPY)
+    stats = run_on_device(path, "cpu", extra_info=_analyze(path), reps=3, warmup=1, return_stats=True)
+    assert stats and stats["reps"] == 3 and stats["timer"] == "clock_gettime"
@@ -0,0 +1,70 @@
+import pytest
+
+from conftest import requires_clang, requires_gcc
+
+SAXPY = """
+#define N 4096
+void saxpy(float a, float *x, float *y) {
+    for (int i = 0; i < N; i++)
+        y[i] = a * x[i] + y[i];
+}
+"""
+
+
+def _analyze(path):
+    from analyzer.ast_parser import get_parser
+    return get_parser().parse_file(path)
+
+
+@requires_clang
+@requires_gcc
+def test_macro_bounded_kernel_runs_in_process(write_source):
+    import numpy as np
+    from collector.inproc_runner import load_kernel
+    path = write_source("saxpy.c", SAXPY)
+    kernel = load_kernel(path, _analyze(path))
+    args = kernel.make_args({"a": 2.0})
+    assert args[1].size == args[2].size == 4096
+    kernel(*args)
+    assert np.all(args[2] == 3.0)
+
+
+@requires_clang
+@requires_gcc
+def test_short_inputs_rejected_before_call(write_source):
+    import numpy as np
+    from collector.inproc_runner import load_kernel
+    path = write_source("saxpy.c", SAXPY)
+    kernel = load_kernel(path, _analyze(path))
+    with pytest.raises(ValueError):
+        kernel.make_args({"x": np.ones(16, dtype=np.float64)})
+
+
+@requires_clang
+def test_unprovable_extent_refuses_inproc(write_source):
+    from collector.inproc_runner import load_kernel
+    path = write_source("ptr.c", """
+void shift(float *x, int n) {
+    for (int i = 0; i < n; i++)
+        *(x + i + 7) = 0.0f;
+}
+""")
+    with pytest.raises(ValueError):
+        load_kernel(path, _analyze(path))
+
+
+@requires_clang
+@requires_gcc
+def test_int_argument_must_match_proven_sizes(write_source):
+    from analyzer.ast_parser import HARNESS_INT_ARG
+    from collector.inproc_runner import load_kernel
+    path = write_source("scale.c", """
+void scale(float *x, int n) {
+    for (int i = 0; i < n; i++)
+        x[i] *= 2.0f;
+}
+""")
+    kernel = load_kernel(path, _analyze(path))
+    assert len(kernel.make_args({"n": HARNESS_INT_ARG})[0]) == HARNESS_INT_ARG
+    with pytest.raises(ValueError):
+        kernel.make_args({"n": HARNESS_INT_ARG * 4})
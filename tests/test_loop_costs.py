@@ -0,0 +1,46 @@
+from conftest import requires_clang
+
+
+def _analyze(path):
+    from analyzer.ast_parser import get_parser
+    return get_parser().parse_file(path)
+
+
+@requires_clang
+def test_parameter_bounded_nest_uses_harness_extent(write_source):
+    from analyzer.ast_parser import HARNESS_INT_ARG
+    n = HARNESS_INT_ARG
+    analysis = _analyze(write_source("matmul.c", """
+void matmul(float *A, float *B, float *C, int n) {
+    for (int i = 0; i < n; i++)
+        for (int j = 0; j < n; j++) {
+            float acc = 0.0f;
+            for (int k = 0; k < n; k++)
+                acc += A[i * n + k] * B[k * n + j];
+            C[i * n + j] = acc;
+        }
+}
+"""))
+    (nest,) = analysis["raw_analysis"]["loop_nests"]
+    assert nest["trip_counts"] == {"i": n, "j": n, "k": n}
+    assert not nest["exact"]
+    assert nest["flops"] == 2 * n ** 3
+    assert nest["bytes"] == 3 * n * n * 4
+
+
+@requires_clang
+def test_constant_and_reassigned_bounds(write_source):
+    analysis = _analyze(write_source("scale.c", """
+#define N 300
+void scale(float *x, int n) {
+    for (int i = 0; i < N; i++)
+        x[i] *= 2.0f;
+    n = n / 2;
+    for (int i = 0; i < n; i++)
+        x[i] += 1.0f;
+}
+"""))
+    first, second = analysis["raw_analysis"]["loop_nests"]
+    assert first["trip_counts"] == {"i": 300} and first["exact"] and first["flops"] == 300
+    # n changes inside the kernel: its value is not the harness argument any more
+    assert second["trip_counts"]["i"] != 1024 and not second["exact"]
@@ -0,0 +1,37 @@
+import pytest
+
+from conftest import requires_clang
+
+
+def _parallel(write_source, body, params="float *out, const float *in, int n"):
+    from analyzer.ast_parser import get_parser
+    path = write_source("k.c", f"void k({params}) {{\n{body}\n}}\n")
+    return get_parser().parse_file(path)["raw_analysis"]["parallel_loops"]
+
+
+@requires_clang
+@pytest.mark.parametrize("body", [
+    "for (int i = 0; i < n; i++) out[i] = in[i] * 2.0f;",
+    "for (int i = 0; i < n; i++) for (int j = 0; j < 4; j++) out[i * 4 + j] = in[j];",
+    "for (int i = 0; i < n; i++) for (int j = 0; j < 4; j++) out[j + 4 * i] = in[j];",
+    "for (int i = 0; i < n; i++) for (int j = 0; j < n; j++) out[i * n + j] = in[j];",
+])
+def test_disjoint_writes_are_parallel(write_source, body):
+    loops = _parallel(write_source, body)
+    assert [loop["var"] for loop in loops] == ["i"]
+
+
+@requires_clang
+@pytest.mark.parametrize("body", [
+    # iteration i writes out[2i .. 2i+3]: neighbours overlap
+    "for (int i = 0; i < n; i++) for (int j = 0; j < 4; j++) out[i * 2 + j] = in[j];",
+    "for (int i = 0; i < n; i++) for (int j = 0; j <= 4; j++) out[i * 4 + j] = in[j];",
+    "for (int i = 0; i < n; i++) for (int j = 0; j < n + 1; j++) out[i * n + j] = in[j];",
+    "for (int i = 0; i < n; i++) for (int j = 0; j < n; j++) out[i * n + j + 1] = in[j];",
+    "for (int i = 0; i < n; i++) out[i * 2 - 1] = in[i];",
+    "for (int i = 0; i < n; i++) out[i / 2] = in[i];",
+])
+def test_overlapping_writes_are_not_parallel(write_source, body):
+    # the inner j loops are themselves independent, only the outer i loop is under test
+    assert "i" not in [loop["var"] for loop in _parallel(write_source, body)]
+
@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+ENTRIES = {
+    "nvidia_geforce_rtx_2050": {"device_name": "NVIDIA GeForce RTX 2050", "bus_type": "PCIe", "is_edge": 0,
+                                "model": "model/preprocesing_model.pkl", "runtime": "model/runtime_model.pkl"},
+    "nvidia_jetson_nano": {"device_name": "NVIDIA Jetson Nano Developer Kit", "bus_type": "SoC", "is_edge": 1,
+                           "model": "model/preprocesing_model.pkl"},
+}
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    import model.registry as registry
+    path = tmp_path / "registry.json"
+    path.write_text(json.dumps({"version": 1, "default": "nvidia_geforce_rtx_2050", "models": ENTRIES}))
+    monkeypatch.setattr(registry, "_registry", registry.ModelRegistry(str(path)))
+    monkeypatch.setattr(registry, "FORCED_MODEL", None)
+
+    def on(profile):
+        monkeypatch.setattr(registry, "_profile", profile)
+    return on
+
+
+def test_runtime_model_follows_the_selected_entry(registry):
+    from model.runtime_model import runtime_model_path
+    registry({"device_name": "NVIDIA GeForce RTX 2050", "bus_type": "PCIe", "is_edge": 0})
+    assert runtime_model_path() == "model/runtime_model.pkl"
+    registry({"device_name": "NVIDIA Jetson Orin", "bus_type": "SoC", "is_edge": 1})
+    assert runtime_model_path() is None
+
+
+def test_no_estimates_from_another_device_class(registry):
+    from model.runtime_model import predict_runtimes
+    registry({"device_name": "NVIDIA Jetson Nano Developer Kit", "bus_type": "SoC", "is_edge": 1})
+    assert predict_runtimes([{"operation_type": "matmul", "log_size": 5.0}]) is None
@@ -0,0 +1,17 @@
+from collections import namedtuple
+
+import pytest
+
+Battery = namedtuple("Battery", "percent secsleft power_plugged")
+
+
+@pytest.mark.parametrize("battery, expected", [
+    (Battery(80, 3600, False), 1),
+    (Battery(80, 3600, True), 0),
+    (None, 0),  # desktop without a battery
+])
+def test_battery_powered_only_when_unplugged(monkeypatch, battery, expected):
+    import psutil
+    from collector.sys_state import get_system_state
+    monkeypatch.setattr(psutil, "sensors_battery", lambda: battery)
+    assert get_system_state()["is_battery_powered"] == expected
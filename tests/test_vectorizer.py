@@ -0,0 +1,79 @@
+import pytest
+
+KERNELS = '''
+def square(a, out, n):
+    for i in range(n):
+        out[i] = a[i] * a[i]
+
+def dot(a, b, n):
+    acc = 0
+    for i in range(n):
+        acc += a[i] * b[i]
+    return acc
+
+def matmul(A, B, C, n):
+    for i in range(n):
+        for j in range(n):
+            for k in range(n):
+                C[i][j] += A[i][k] * B[k][j]
+
+def prefix(a, out, n):
+    acc = 0
+    for i in range(n):
+        acc += a[i]
+        out[i] = acc
+    return acc
+'''
+
+
+def _load(source):
+    namespace = {}
+    exec(compile(source, "<kernel>", "exec"), namespace)
+    return namespace
+
+
+@pytest.fixture(scope="module")
+def kernels():
+    from collector.vectorizer import vectorize_source
+    rewritten, rewrites = vectorize_source(KERNELS)
+    assert len(rewrites) == 4
+    return _load(KERNELS), _load(rewritten)
+
+
+def _flat(x):
+    if isinstance(x, (list, tuple)):
+        return [y for item in x for y in _flat(item)]
+    return [x]
+
+
+CASES = {
+    "square": lambda v, c: ([v, 2 * v, c(3)], [c(0)] * 3, 3),
+    "dot": lambda v, c: ([v, v, c(1)], [v, v, c(2)], 3),
+    "matmul": lambda v, c: ([[v, c(1)], [c(1), v]], [[v, c(0)], [c(0), v]], [[c(0), c(0)], [c(0), c(0)]], 2),
+    "prefix": lambda v, c: ([v * v, v * v, v], [c(0)] * 3, 3),
+}
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+@pytest.mark.parametrize("value", [3, 3037000500, 1.5, 3037000500.0])
+def test_rewrite_matches_loops(kernels, name, value):
+    runs = []
+    for ns in kernels:
+        args = CASES[name](value, type(value))
+        result = ns[name](*args)
+        runs.append(_flat([result, args]))
+    expected, got = runs
+    if isinstance(value, int):
+        # Python ints stay exact, including results past the int64 range
+        assert got == expected
+        assert all(type(x) is int for x in got if x is not None)
+    else:
+        assert got == pytest.approx(expected, rel=1e-12)
+
+
+def test_int_lists_take_the_loop():
+    from collector import np_kernels
+    big = [([3037000500, 1], ("i",)), ([3037000500, 1], ("i",))]
+    assert np_kernels.reduce(("i",), {"i": 2}, lambda a, b: a * b, big) is np_kernels.FALLBACK
+    floats = [([1.5, 2.0], ("i",)), ([2.0, 2.0], ("i",))]
+    assert np_kernels.reduce(("i",), {"i": 2}, lambda a, b: a * b, floats) == 7.0
@@ -0,0 +1,24 @@
+import importlib.util
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATASET_DIR = os.path.join(REPO_ROOT, "Dataset")
+
+
+def load_dataset_module(relpath: str):
+    """
+    Import a single module from the Dataset/ tree by file path.
+
+    Dataset/collector/__init__.py eagerly imports every torch collector and
+    expects Dataset/ to be the working directory, so its dependency-free
+    helpers (feature_bins, device_profile, ...) are loaded standalone instead.
+    """
+    name = "hybridflow_dataset." + relpath[:-3].replace("/", ".").replace(os.sep, ".")
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(DATASET_DIR, relpath))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
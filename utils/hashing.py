@@ -0,0 +1,45 @@
+"""Content digests shared by the compile and analysis caches."""
+import hashlib
+import os
+import re
+
+_INCLUDE_RE = re.compile(r'^\s*#\s*include\s*"([^"]+)"', re.MULTILINE)
+
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def include_dirs(flags) -> list:
+    """Directories of the -I flags in a compiler / libclang argument list ("-I dir" and "-Idir")."""
+    flags = list(flags or [])
+    dirs = [flags[i + 1] for i, f in enumerate(flags[:-1]) if f == "-I"]
+    return dirs + [f[2:] for f in flags if f.startswith("-I") and len(f) > 2]
+
+
+def local_headers(path: str, include_dirs, seen=None):
+    """
+    Recursively resolve quoted #include "..." headers of a source file.
+    System headers (<...>) are left out: they come with the toolchain.
+    """
+    seen = set() if seen is None else seen
+    try:
+        with open(path, "r", errors="ignore") as f:
+            text = f.read()
+    except OSError:
+        return seen
+
+    search = [os.path.dirname(os.path.abspath(path))] + list(include_dirs)
+    for name in _INCLUDE_RE.findall(text):
+        for d in search:
+            cand = os.path.abspath(os.path.join(d, name))
+            if os.path.isfile(cand):
+                if cand not in seen:
+                    seen.add(cand)
+                    local_headers(cand, include_dirs, seen)
+                break
+    return seen
@@ -0,0 +1,13 @@
+import os
+
+# Root for everything HybridFlow keeps between runs (compiled binaries, analysis results, ...).
+CACHE_DIR = os.environ.get(
+    "HYBRIDFLOW_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "hybridflow")
+)
+
+
+def cache_subdir(name: str) -> str:
+    path = os.path.join(CACHE_DIR, name)
+    os.makedirs(path, exist_ok=True)
+    return path